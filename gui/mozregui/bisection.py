@@ -5,16 +5,11 @@ from PySide6.QtCore import QObject, QTimer, Signal, Slot
 from PySide6.QtWidgets import QMessageBox
 
 from mozregression.approx_persist import ApproxPersistChooser
-from mozregression.bisector import (
-    Bisection,
-    Bisector,
-    IndexPromise,
-    IntegrationHandler,
-    NightlyHandler,
-)
+from mozregression.bisector import Bisection, Bisector, IntegrationHandler, NightlyHandler
 from mozregression.config import DEFAULT_EXPAND
 from mozregression.dates import is_date_or_datetime
 from mozregression.errors import MozRegressionError
+from mozregression.preinstall import PreInstaller
 from mozregui.build_runner import AbstractBuildRunner
 from mozregui.log_report import log
 from mozregui.skip_chooser import SkipDialog
@@ -22,7 +17,85 @@ from mozregui.skip_chooser import SkipDialog
 Bisection.EXCEPTION = -1  # new possible value of bisection end
 
 
+class Prefetch(object):
+    """
+    Find the next builds to test and download them in background, in a
+    thread, while the current build is downloaded and evaluated.
+
+    The build infos of the next candidates are looked up right away, but
+    their downloads only start once the download of the current build
+    (*download*, if any) is finished, so it is not slowed down.
+
+    Once done, :attr:`index` is the index of the current build in the
+    bisection range (it may change, since invalid builds are removed), and
+    *callback* is called with this instance.
+    """
+
+    def __init__(self, bisection, index, persist_files=(), download=None, interrupt=None):
+        self.bisection = bisection
+        self.index = index
+        self.done = False
+        self._canceled = threading.Event()
+        self._interrupt = interrupt
+        self._persist_files = persist_files
+        self._download = download
+
+    def start(self, callback):
+        thread = threading.Thread(target=self._run, args=(callback,))
+        thread.daemon = True
+        thread.start()
+
+    def cancel(self):
+        self._canceled.set()
+
+    def is_canceled(self):
+        return self._canceled.is_set() or bool(self._interrupt and self._interrupt())
+
+    def _run(self, callback):
+        bisection, index = self.bisection, self.index
+        try:
+            for build_range in (
+                bisection.build_range[index:],
+                bisection.build_range[: index + 1],
+            ):
+                build_range.mid_point(interrupt=self.is_canceled)
+            if self._download is not None:
+                self._download.wait(raise_if_error=False)
+            if not self.is_canceled():
+                self.index = bisection._download_next_builds(index, self._persist_files)
+        except StopIteration:
+            pass
+        except Exception as exc:
+            log("Unable to prepare the next builds: %s" % exc)
+        self.done = True
+        callback(self)
+
+
 class GuiBisector(QObject, Bisector):
+    """
+    The bisection, driven by events.
+
+    Each bisection step goes through these states:
+
+     - FINDING_BUILD: the build to test is chosen (in the worker thread),
+       and its download is started. The next builds are looked up and
+       prepared in background (see :class:`Prefetch`) from now on.
+     - DOWNLOADING: waiting for the download of the build.
+     - EVALUATING: the build is installed and launched, then waiting for
+       the verdict of the user.
+     - WAITING_PREFETCH: a verdict was given, but the background
+       preparation of the next builds is not done yet.
+
+    Nothing blocks the worker thread while waiting: each state is left when
+    a signal is received.
+    """
+
+    IDLE = 0
+    FINDING_BUILD = 1
+    DOWNLOADING = 2
+    EVALUATING = 3
+    WAITING_PREFETCH = 4
+
     started = Signal()
     finished = Signal(object, int)
     choose_next_build = Signal()
@@ -31,6 +104,7 @@ class GuiBisector(QObject, Bisector):
     step_testing = Signal(object, object)
     step_finished = Signal(object, str)
     handle_merge = Signal(object, str, str, str)
+    prefetch_finished = Signal(object)
 
     def __init__(self, fetch_config, test_runner, download_manager, download_in_background=True):
         super().__init__(
@@ -46,12 +120,14 @@ class GuiBisector(QObject, Bisector):
         self.error = None
         self._next_build_index = None
         self.download_in_background = download_in_background
-        self.index_promise = None
+        self.prefetch = None
+        self.state = self.IDLE
         self._persist_files = ()
         self.should_stop = threading.Event()
 
         self.download_manager.download_finished.connect(self._build_dl_finished)
         self.test_runner.evaluate_finished.connect(self._evaluate_finished)
+        self.prefetch_finished.connect(self._prefetch_finished)
 
     def _finish_on_exception(self, bisection):
         self.error = sys.exc_info()
@@ -108,12 +184,14 @@ class GuiBisector(QObject, Bisector):
             self.test_runner,
             dl_in_background=False,
             approx_chooser=self.approx_chooser,
+            preinstaller=self.preinstaller,
         )
         self._bisect_next()
 
     @Slot()
     def _bisect_next(self):
         # this is executed in the working thread
+        self.state = self.FINDING_BUILD
         if self.test_runner.verdict != "r":
             try:
                 self.mid = self.bisection.search_mid_point(interrupt=self.should_stop.is_set)
@@ -146,52 +224,62 @@ class GuiBisector(QObject, Bisector):
         self.step_started.emit(self.bisection)
         result = self.bisection.init_handler(self.mid)
         if result != Bisection.RUNNING:
+            self.state = self.IDLE
             self.finished.emit(self.bisection, result)
-        else:
-            self.build_infos = self.bisection.handler.build_range[self.mid]
-            (
-                found,
-                self.mid,
-                self.build_infos,
-                self._persist_files,
-            ) = self.bisection._find_approx_build(self.mid, self.build_infos)
-            if not found:
-                self.download_manager.focus_download(self.build_infos)
-            self.step_build_found.emit(self.bisection, self.build_infos)
-            if found:
-                # to continue the bisection, act as if it was downloaded
-                self._build_dl_finished(None, self.build_infos.build_file)
+            return
+        self.build_infos = self.bisection.handler.build_range[self.mid]
+        (
+            found,
+            self.mid,
+            self.build_infos,
+            self._persist_files,
+        ) = self.bisection._find_approx_build(self.mid, self.build_infos)
+        # before focus_download, which emits download_finished right away
+        # when the build was already downloaded
+        self.state = self.DOWNLOADING
+        download = None
+        if not found:
+            download = self.download_manager.focus_download(self.build_infos)
+        # prepare the next builds in background, if desired and that last
+        # verdict was not a skip.
+        if self.download_in_background and self.test_runner.verdict != "s":
+            self._start_prefetch(download)
+        self.step_build_found.emit(self.bisection, self.build_infos)
+        if found:
+            # to continue the bisection, act as if it was downloaded
+            self._build_dl_finished(None, self.build_infos.build_file)
+
+    def _start_prefetch(self, download):
+        self.prefetch = Prefetch(
+            self.bisection,
+            self.mid,
+            self._persist_files,
+            download=download,
+            interrupt=self.should_stop.is_set,
+        )
+        self.prefetch.start(self.prefetch_finished.emit)
+
+    def _cancel_prefetch(self):
+        if self.prefetch is not None:
+            self.prefetch.cancel()
 
     @Slot()
     def _evaluate(self):
         # this is called in the working thread, so installation does not
         # block the ui.
-
-        # download in background, if desired and that last verdict was not
-        # a skip.
-        if self.download_in_background and self.test_runner.verdict != "s":
-            self.index_promise = IndexPromise(
-                self.mid,
-                self.bisection._download_next_builds,
-                args=(self._persist_files,),
-            )
+        self.state = self.EVALUATING
         # run the build evaluation
         self.bisection.evaluate(self.build_infos)
-        # wait for the next index in the thread if any
-        if self.index_promise:
-            self.index_promise()
-            # if there was an error, stop the possible downloads
-            if self.test_runner.run_error:
-                self.download_manager.cancel()
-                self.download_manager.wait(raise_if_error=False)
-        if not self.test_runner.run_error:
+        if self.test_runner.run_error:
+            # stop the possible downloads
+            self._cancel_prefetch()
+            self.download_manager.cancel()
+        else:
             self.step_testing.emit(self.bisection, self.build_infos)
 
     @Slot(object, str)
     def _build_dl_finished(self, dl, dest):
-        # here we are not in the working thread, since the connection was
-        # done in the constructor
-        if not dest == self.build_infos.build_file:
+        if self.state != self.DOWNLOADING or dest != self.build_infos.build_file:
             return
         if dl is not None and (dl.is_canceled() or dl.error()):
             # todo handle this
@@ -201,11 +289,25 @@ class GuiBisector(QObject, Bisector):
 
     @Slot()
     def _evaluate_finished(self):
-        # here we are not in the working thread, since the connection was
-        # done in the constructor
-        if self.index_promise:
-            self.mid = self.index_promise()
-            self.index_promise = None
+        if self.prefetch is not None and not self.prefetch.done:
+            # the index of the build may change once the next builds are
+            # known: the verdict is handled when the prefetch is done.
+            self.state = self.WAITING_PREFETCH
+            return
+        self._handle_verdict()
+
+    @Slot(object)
+    def _prefetch_finished(self, prefetch):
+        if prefetch is not self.prefetch:
+            return  # from a previous step
+        if self.state == self.WAITING_PREFETCH:
+            self._handle_verdict()
+
+    def _handle_verdict(self):
+        if self.prefetch is not None:
+            self.mid = self.prefetch.index
+            self.prefetch = None
+        self.state = self.IDLE
 
         self.step_finished.emit(self.bisection, self.test_runner.verdict)
         result = self.bisection.handle_verdict(self.mid, self.test_runner.verdict)
@@ -215,6 +317,15 @@ class GuiBisector(QObject, Bisector):
             # call this in the thread
             QTimer.singleShot(0, self._bisect_next)
 
+    def stop(self):
+        """
+        Stop the bisection work running in background.
+        """
+        self.should_stop.set()
+        self._cancel_prefetch()
+        if self.preinstaller is not None:
+            self.preinstaller.cleanup()
+
 
 class BisectRunner(AbstractBuildRunner):
     worker_class = GuiBisector
@@ -238,13 +349,18 @@ class BisectRunner(AbstractBuildRunner):
 
         self.worker._bisect_args = (handler, good, bad)
         self.worker.download_in_background = self.global_prefs["background_downloads"]
+        if self.worker.download_in_background:
+            # install the next builds in background, so they can be
+            # launched as soon as a verdict is given.
+            self.worker.preinstaller = PreInstaller(self.test_runner.launcher_kwargs)
+            self.test_runner.preinstaller = self.worker.preinstaller
         if self.global_prefs["approx_policy"]:
             self.worker.approx_chooser = ApproxPersistChooser(7)
         return self.worker.bisect
 
     def stop(self, wait=True):
         if self.worker:
-            self.worker.should_stop.set()
+            self.worker.stop()
         AbstractBuildRunner.stop(self, wait=wait)
 
     @Slot(str)
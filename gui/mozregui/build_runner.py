@@ -2,10 +2,13 @@ from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot
 
 from mozregression.download_manager import BuildDownloadManager
 from mozregression.errors import LauncherError, MozRegressionError
+from mozregression.launchers import AndroidLauncher
 from mozregression.network import get_http_session
 from mozregression.persist_limit import PersistLimit
+from mozregression.profile_cache import PROFILE_TEMPLATES
 from mozregression.telemetry import UsageMetrics, get_system_info, send_telemetry_ping
 from mozregression.test_runner import create_launcher
+from mozregression.tracing import NOOP_SPAN, TRACER, span
 from mozregui.global_prefs import apply_prefs, get_prefs
 from mozregui.log_report import log
 
@@ -20,6 +23,11 @@ class GuiBuildDownloadManager(QObject, BuildDownloadManager):
             destdir=destdir, session=get_http_session(), persist_limit=persist_limit, **kwargs
         )
 
+    def _report_progress(self, transfers):
+        # called from the download threads, at most 10 times per second
+        for transfer in transfers:
+            self.download_progress.emit(transfer.key, transfer.current, transfer.total)
+
     def _download_started(self, task):
         self.download_started.emit(task)
         BuildDownloadManager._download_started(self, task)
@@ -42,11 +50,14 @@ class GuiBuildDownloadManager(QObject, BuildDownloadManager):
         # build if any)
         self.cancel(cancel_if=lambda dl: dest != dl.get_dest())
 
-        dl = self.download(build_url, fname, progress=self.download_progress.emit)
-        if not dl:
+        dl = self.download(build_url, fname, progress=self.progress.update)
+        if dl:
+            dl.set_progress(self.progress.update)
+        else:
             # file already downloaded.
             # emit the finished signal so bisection goes on
             self.download_finished.emit(None, dest)
+        return dl
 
 
 class GuiTestRunner(QObject):
@@ -59,20 +70,34 @@ class GuiTestRunner(QObject):
         self.launcher = None
         self.launcher_kwargs = {}
         self.run_error = False
+        # a PreInstaller, to reuse the builds installed in background
+        self.preinstaller = None
+        self._verdict_span = NOOP_SPAN
+
+    def _create_launcher(self, build_info):
+        if self.preinstaller is not None:
+            launcher = self.preinstaller.take(build_info)
+            if launcher is not None:
+                return launcher
+        return create_launcher(build_info)
 
     def evaluate(self, build_info, allow_back=False):
         try:
-            self.launcher = create_launcher(build_info)
+            self.launcher = self._create_launcher(build_info)
             self.launcher.start(**self.launcher_kwargs)
             build_info.update_from_app_info(self.launcher.get_app_info())
         except Exception as exc:
             self.run_error = True
             self.evaluate_started.emit(str(exc))
         else:
+            # the verdict is given later, in finish()
+            self._verdict_span = span("test_runner.verdict", "test").start()
             self.evaluate_started.emit("")
             self.run_error = False
 
     def finish(self, verdict):
+        self._verdict_span.finish()
+        self._verdict_span = NOOP_SPAN
         if self.launcher:
             try:
                 self.launcher.stop()
@@ -116,6 +141,10 @@ class AbstractBuildRunner(QObject):
         """
         self.options = options
 
+        # record the timings of this run, for the report
+        TRACER.reset()
+        TRACER.enable()
+
         # global preferences
         global_prefs = get_prefs()
         self.global_prefs = global_prefs
@@ -197,6 +226,8 @@ class AbstractBuildRunner(QObject):
         if self.options:
             if self.options["profile"] and self.options["profile_persistence"] == "clone-first":
                 self.options["profile"].cleanup()
+            PROFILE_TEMPLATES.clear()
+            AndroidLauncher.remove_remote_profiles()
         if self.download_manager:
             self.download_manager.cancel()
         if self.thread:
@@ -1,17 +1,12 @@
+import bisect
+import os
 from datetime import datetime
 
 from mozlog import get_default_logger
 from mozlog.structuredlog import log_levels
-from PySide6.QtCore import QObject, Signal, Slot
-from PySide6.QtGui import (
-    QAction,
-    QActionGroup,
-    QColor,
-    QTextBlockUserData,
-    QTextCharFormat,
-    QTextCursor,
-)
-from PySide6.QtWidgets import QMenu, QPlainTextEdit
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt, QTimer, QUrl, Signal, Slot
+from PySide6.QtGui import QAction, QActionGroup, QColor, QDesktopServices
+from PySide6.QtWidgets import QListView, QMenu
 
 COLORS = {
     "DEBUG": QColor(6, 146, 6),  # green
@@ -21,17 +16,160 @@ COLORS = {
     "ERROR": QColor(255, 0, 0, 127),
 }
 
+# the full logs of the last session
+LOG_FILE = os.path.expanduser(
+    os.path.join("~", ".mozilla", "mozregression", "mozregression-gui.log")
+)
+
+# number of log lines kept in memory
+MAX_LOG_LINES = 10000
 
-class LogLevelData(QTextBlockUserData):
-    def __init__(self, log_lvl):
-        QTextBlockUserData.__init__(self)
-        self.log_lvl = log_lvl
 
+class LogRecordsModel(QAbstractListModel):
+    """
+    The log lines, stored in a bounded buffer.
 
-class LogView(QPlainTextEdit):
+    For every log level, the line numbers of the lines shown at that level
+    are indexed, so changing the level does not look at every line. Lines
+    are added by batches (at most once per *flush_interval* ms), so a lot
+    of logging does not stall the UI.
+
+    If a log file is set, every line is written in it, including the ones
+    that are dropped from the buffer.
+    """
+
+    def __init__(self, parent=None, capacity=MAX_LOG_LINES, flush_interval=16):
+        QAbstractListModel.__init__(self, parent)
+        self.capacity = capacity
+        self.log_lvl = log_levels["INFO"]
+        # (log level, level name, text) for each line; the first one is the
+        # line number self._first
+        self._lines = []
+        self._first = 0
+        # for each log level, the numbers of the lines shown at that level
+        self._shown = {lvl: [] for lvl in log_levels.values()}
+        self._pending = []
+        self._log_file = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flush_interval)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def log_file(self):
+        return self._log_file.name if self._log_file else None
+
+    def set_log_file(self, path):
+        """
+        Write the log lines in *path*. A previous file is kept with an
+        added .1 extension.
+        """
+        if self._log_file:
+            self._log_file.close()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path):
+            os.replace(path, path + ".1")
+        self._log_file = open(path, "w", encoding="utf-8")
+
+    def append(self, data):
+        """
+        Add a log record (a mozlog dict). It is shown on the next flush.
+        """
+        self._pending.append(data)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @Slot()
+    def flush(self):
+        """
+        Add the pending log records.
+        """
+        self._timer.stop()
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        number = self._first + len(self._lines)
+        new_numbers = {lvl: [] for lvl in self._shown}
+        for data in pending:
+            level = data["level"].upper()
+            lvl = log_levels.get(level, log_levels["INFO"])
+            time_info = datetime.fromtimestamp(data["time"] / 1000).isoformat()
+            text = "%s: %s : %s" % (time_info, data["level"], data["message"])
+            self._lines.append((lvl, level, text))
+            for index_lvl, numbers in new_numbers.items():
+                if lvl <= index_lvl:
+                    numbers.append(number)
+            number += 1
+            if self._log_file:
+                self._log_file.write(text + "\n")
+        if self._log_file:
+            self._log_file.flush()
+
+        for lvl, numbers in new_numbers.items():
+            shown = self._shown[lvl]
+            if lvl == self.log_lvl and numbers:
+                self.beginInsertRows(QModelIndex(), len(shown), len(shown) + len(numbers) - 1)
+                shown.extend(numbers)
+                self.endInsertRows()
+            else:
+                shown.extend(numbers)
+        self._drop_oldest(len(self._lines) - self.capacity)
+
+    def _drop_oldest(self, count):
+        if count <= 0:
+            return
+        first = self._first + count
+        for lvl, numbers in self._shown.items():
+            dropped = bisect.bisect_left(numbers, first)
+            if lvl == self.log_lvl and dropped:
+                self.beginRemoveRows(QModelIndex(), 0, dropped - 1)
+                del numbers[:dropped]
+                self.endRemoveRows()
+            else:
+                del numbers[:dropped]
+        del self._lines[:count]
+        self._first = first
+
+    def set_log_level(self, log_lvl):
+        """
+        Only show the lines of the given level or more important.
+        """
+        if log_lvl == self.log_lvl:
+            return
+        self.beginResetModel()
+        self.log_lvl = log_lvl
+        self.endResetModel()
+
+    def line(self, row):
+        """
+        Returns (log level, level name, text) for the given row.
+        """
+        return self._lines[self._shown[self.log_lvl][row] - self._first]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._shown[self.log_lvl])
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.line(index.row())[2]
+        if role == Qt.ForegroundRole:
+            return COLORS.get(self.line(index.row())[1])
+        return None
+
+
+class LogView(QListView):
     def __init__(self, parent=None):
-        QPlainTextEdit.__init__(self, parent)
-        self.setMaximumBlockCount(1000)
+        QListView.__init__(self, parent)
+        self.setModel(LogRecordsModel(self))
+        # all the rows have the same height: only the visible ones are
+        # looked at
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QListView.ExtendedSelection)
+        self.model().rowsInserted.connect(self.scrollToBottom)
 
         self.group = QActionGroup(self)
         self.actions = [QAction(log_lvl, self.group) for log_lvl in ["Debug", "Info"]]
@@ -40,57 +178,41 @@ class LogView(QPlainTextEdit):
             action.setCheckable(True)
             action.triggered.connect(self.on_log_filter)
         self.actions[1].setChecked(True)
+        self.open_log_file_action = QAction("Open the full log", self)
+        self.open_log_file_action.triggered.connect(self.open_log_file)
 
         self.customContextMenuRequested.connect(self.on_custom_context_menu_requested)
 
-        self.log_lvl = log_levels["INFO"]
+    @property
+    def log_lvl(self):
+        return self.model().log_lvl
 
-    def text_blocks(self):
-        current_block = QTextCursor(self.document()).block()
-        while current_block.isValid and current_block.text():
-            yield current_block
-            current_block = current_block.next()
+    @log_lvl.setter
+    def log_lvl(self, log_lvl):
+        self.model().set_log_level(log_lvl)
 
     @Slot(dict)
     def on_log_received(self, data):
-        time_info = datetime.fromtimestamp((data["time"] / 1000)).isoformat()
-        log_message = "%s: %s : %s" % (time_info, data["level"], data["message"])
-        message_document = self.document()
-        cursor_to_add = QTextCursor(message_document)
-        cursor_to_add.movePosition(QTextCursor.End)
-        cursor_to_add.insertText(log_message + "\n")
-
-        if data["level"] in COLORS:
-            fmt = QTextCharFormat()
-            fmt.setForeground(COLORS[data["level"]])
-            cursor_to_add.movePosition(QTextCursor.PreviousBlock)
-            log_lvl_data = LogLevelData(log_levels[data["level"].upper()])
-            cursor_to_add.block().setUserData(log_lvl_data)
-            cursor_to_add_fmt = message_document.find(data["level"], cursor_to_add.position())
-            cursor_to_add_fmt.mergeCharFormat(fmt)
-            if log_levels[data["level"]] > self.log_lvl:
-                cursor_to_add.block().setVisible(False)
-        self.ensureCursorVisible()
+        self.model().append(data)
 
     @Slot()
     def on_custom_context_menu_requested(self):
         menu = QMenu(self)
         for action in self.actions:
             menu.addAction(action)
+        if self.model().log_file:
+            menu.addSeparator()
+            menu.addAction(self.open_log_file_action)
         menu.popup(self.cursor().pos())
 
     @Slot()
     def on_log_filter(self):
         log_lvl_name = str(self.sender().iconText()).upper()
         self.log_lvl = log_levels[log_lvl_name]
-        it = self.document().begin()
-        while it != self.document().end():
-            userdata = it.userData()
-            if userdata:
-                block_log_lvl = userdata.log_lvl
-                it.setVisible(block_log_lvl <= self.log_lvl)
-            it = it.next()
-        self.viewport().update()
+
+    @Slot()
+    def open_log_file(self):
+        QDesktopServices.openUrl(QUrl.fromLocalFile(self.model().log_file))
 
 
 class LogModel(QObject):
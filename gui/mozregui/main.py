@@ -9,11 +9,11 @@ from mozregression.log import init_python_redirect_logger
 from .check_release import CheckRelease
 from .crash_reporter import CrashReporter
 from .global_prefs import set_default_prefs
-from .log_report import LogModel
+from .log_report import LOG_FILE, LogModel
 from .mainwindow import MainWindow
 
 
-def main():
+def main(log_file=LOG_FILE):
     logger = StructuredLogger("mozregression-gui")
     init_python_redirect_logger(logger)
     set_default_logger(logger)
@@ -41,6 +41,10 @@ def main():
     release_checker = CheckRelease(win)
     release_checker.check()
     log_model.log.connect(win.ui.log_view.on_log_received)
+    try:
+        win.ui.log_view.model().set_log_file(log_file)
+    except OSError as exc:
+        logger.warning("Unable to write the log file %s: %s" % (log_file, exc))
     win.show()
     # Enter Qt application main loop
     sys.exit(app.exec())
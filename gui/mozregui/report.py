@@ -1,8 +1,11 @@
+from html import escape
+
 from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QUrl, Signal, Slot
 from PySide6.QtGui import QColor, QDesktopServices
 from PySide6.QtWidgets import QTableView, QTextBrowser
 
 from mozregression.bisector import NightlyHandler
+from mozregression.tracing import TRACER
 from mozregui.utils import is_dark_mode_enabled
 
 # Custom colors
@@ -153,10 +156,12 @@ class ReportModel(QAbstractTableModel):
     @Slot(object, int, int)
     def download_progress(self, dl, current, total):
         item = self.items[-1]
+        repaint = not item.downloading or int(item.progress) != int(current * 100 / total)
         item.state_text = "Downloading"
         item.downloading = True
         item.set_progress(current, total)
-        self.update_item(item)
+        if repaint:
+            self.update_item(item)
 
     def get_item(self, index):
         return self.items[index.row()]
@@ -271,6 +276,11 @@ class ReportModel(QAbstractTableModel):
             self.beginRemoveRows(QModelIndex(), index, index)
             self.items.pop(index)
             self.endRemoveRows()
+        if TRACER.enabled and self.items:
+            # show where the time was spent in the first item
+            item = self.items[0]
+            item.data["time_spent"] = "<pre>%s</pre>" % escape(TRACER.format_summary())
+            self.update_item(item)
 
 
 class ReportView(QTableView):
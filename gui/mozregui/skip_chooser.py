@@ -1,14 +1,29 @@
-from PySide6.QtCore import QEvent, Qt, Signal
-from PySide6.QtGui import QBrush, QPen
+import math
+import threading
+from collections import deque
+
+from PySide6.QtCore import QEvent, QObject, QRectF, Qt, Signal, Slot
+from PySide6.QtGui import QBrush, QColor, QPen
 from PySide6.QtWidgets import (
     QDialog,
+    QGraphicsItem,
     QGraphicsRectItem,
     QGraphicsScene,
     QGraphicsView,
     QMessageBox,
+    QStyleOptionGraphicsItem,
     QToolTip,
 )
 
+# availability of the builds
+UNKNOWN = 0
+AVAILABLE = 1
+MISSING = 2
+
+AVAILABLE_COLOR = QColor(170, 200, 255)
+MISSING_COLOR = QColor(250, 113, 113)
+UNKNOWN_COLOR = QColor(200, 200, 200)
+
 
 class BuildItem(QGraphicsRectItem):
     WIDTH = 30
@@ -16,18 +31,157 @@ class BuildItem(QGraphicsRectItem):
     def __init__(self, future_build_info, x=0, y=0, selectable=True):
         QGraphicsRectItem.__init__(self, x, y, self.WIDTH, self.WIDTH)
         self.future_build_info = future_build_info
+        self.set_selectable(selectable)
+
+    def set_selectable(self, selectable):
         if selectable:
             self.setFlags(BuildItem.ItemIsSelectable | BuildItem.ItemIsFocusable)
         else:
             self.setFlags(BuildItem.ItemIsFocusable)
 
+    def set_status(self, status):
+        if status == MISSING:
+            self.setBrush(QBrush(MISSING_COLOR, Qt.BDiagPattern))
+            self.set_selectable(False)
+        elif status == AVAILABLE:
+            self.setBrush(QBrush(AVAILABLE_COLOR))
+        else:
+            self.setBrush(QBrush(UNKNOWN_COLOR, Qt.Dense6Pattern))
+
     def __str__(self):
         return "Build %s" % self.future_build_info.data
 
 
+class DensityItem(QGraphicsItem):
+    """
+    The overview of the whole range, shown when zoomed out.
+
+    Consecutive rows of builds are aggregated in bins, colored by the ratio
+    of the missing builds. Only the bins in the exposed area are painted.
+    """
+
+    # minimum height of a bin on the screen, in pixels
+    BIN_HEIGHT = 4
+
+    def __init__(self, scene):
+        QGraphicsItem.__init__(self)
+        self._scene = scene
+        self.setFlags(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+    def boundingRect(self):
+        return self._scene.grid_rect()
+
+    def rows_per_bin(self, lod):
+        return max(1, int(math.ceil(self.BIN_HEIGHT / (self._scene.ROW_HEIGHT * max(lod, 1e-6)))))
+
+    def bin_color(self, start, end):
+        counts = self._scene.count_statuses(start, end)
+        known = counts[AVAILABLE] + counts[MISSING]
+        if not known:
+            return UNKNOWN_COLOR
+        ratio = float(counts[MISSING]) / known
+        return QColor(
+            *[
+                int(a + (m - a) * ratio)
+                for a, m in zip(AVAILABLE_COLOR.getRgb()[:3], MISSING_COLOR.getRgb()[:3])
+            ]
+        )
+
+    def paint(self, painter, option, widget=None):
+        scene = self._scene
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        rows_per_bin = self.rows_per_bin(lod)
+        bin_height = rows_per_bin * scene.ROW_HEIGHT
+        width = scene.grid_rect().width()
+        exposed = option.exposedRect
+        first_bin = max(0, int(exposed.top() // bin_height))
+        last_bin = min((scene.nb_rows() - 1) // rows_per_bin, int(exposed.bottom() // bin_height))
+        mid_row = scene.mid // scene.COLUMNS
+        painter.setPen(Qt.NoPen)
+        for bin_index in range(first_bin, last_bin + 1):
+            start = bin_index * rows_per_bin * scene.COLUMNS
+            end = min(start + rows_per_bin * scene.COLUMNS, len(scene.build_range))
+            rect = QRectF(0, bin_index * bin_height, width, bin_height)
+            painter.fillRect(rect, self.bin_color(start, end))
+            if bin_index == mid_row // rows_per_bin:
+                painter.fillRect(rect, QBrush(Qt.blue, Qt.Dense4Pattern))
+
+    def builds_at(self, pos, lod):
+        """
+        Returns the (start, end) indexes of the builds in the bin at *pos*.
+        """
+        scene = self._scene
+        rows_per_bin = self.rows_per_bin(lod)
+        bin_index = int(pos.y() // (rows_per_bin * scene.ROW_HEIGHT))
+        start = bin_index * rows_per_bin * scene.COLUMNS
+        return start, min(start + rows_per_bin * scene.COLUMNS, len(scene.build_range))
+
+
+class AvailabilityLoader(QObject):
+    """
+    Find out in background threads if builds are available.
+
+    :meth:`request` may be called with the indexes of the visible builds,
+    the latest requested ones are loaded first. :attr:`loaded` is emitted
+    with the index and True if the build is available.
+    """
+
+    loaded = Signal(int, bool)
+
+    def __init__(self, build_range, workers=4):
+        QObject.__init__(self)
+        self.build_range = build_range
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._queue = deque()
+        self._requested = set()
+        self._threads = []
+        self._stopped = False
+
+    def request(self, indexes):
+        with self._lock:
+            if self._stopped:
+                return
+            for index in indexes:
+                if index not in self._requested:
+                    self._requested.add(index)
+                    self._queue.append(index)
+            while len(self._threads) < min(self.workers, len(self._queue)):
+                thread = threading.Thread(target=self._run)
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+            self._wakeup.notify_all()
+
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+            self._queue.clear()
+            self._wakeup.notify_all()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._queue and not self._stopped:
+                    self._wakeup.wait()
+                if self._stopped:
+                    return
+                index = self._queue.pop()
+            try:
+                available = self.build_range.get_future(index).build_info is not False
+            except Exception:
+                continue  # unknown
+            if not self._stopped:
+                self.loaded.emit(index, available)
+
+
 class SkipChooserScene(QGraphicsScene):
     COLUMNS = 7
     SPACE = 10
+    ROW_HEIGHT = BuildItem.WIDTH + SPACE
+    # under this zoom level, the density overview is shown
+    DETAIL_SCALE = 0.4
 
     def __init__(self, build_range):
         QGraphicsScene.__init__(self)
@@ -35,32 +189,111 @@ class SkipChooserScene(QGraphicsScene):
 
     def from_range(self, build_range):
         self.build_range = build_range
-        mid = build_range.mid_point()
-        bounds = (0, len(build_range) - 1)
-        row = -1
-        for i, future in enumerate(build_range.future_build_infos):
-            column = i % self.COLUMNS
-            if column == 0:
-                row += 1
-            item = BuildItem(
-                future,
-                column * BuildItem.WIDTH + self.SPACE * column,
-                row * BuildItem.WIDTH + self.SPACE * row,
-                selectable=i not in bounds,
-            )
-            if i == mid:
-                item.setBrush(QBrush(Qt.blue))
-                self.mid_build = item
-            elif i in bounds:
-                item.setBrush(QBrush(Qt.lightGray))
-
-            pen = QPen(self.palette().windowText().color())
-            item.setPen(pen)
-            self.addItem(item)
+        # the mid point is not searched (this could require to load build
+        # infos), the builds are loaded in background instead.
+        self.mid = int(len(build_range) / 2)
+        self.bounds = (0, len(build_range) - 1)
+        self.build_items = {}
+        self.statuses = [self._known_status(f) for f in build_range.future_build_infos]
+        self.detailed = True
+        self.loader = AvailabilityLoader(build_range)
+        self.loader.loaded.connect(self.on_build_loaded)
+        self.density = DensityItem(self)
+        self.density.setVisible(False)
+        self.addItem(self.density)
+        self.setSceneRect(self.grid_rect())
+        self.mid_build = self.build_item(self.mid)
+        self.mid_build.setBrush(QBrush(Qt.blue))
+
+    @staticmethod
+    def _known_status(future):
+        if future.is_available():
+            return AVAILABLE if future.is_valid() else MISSING
+        if future.known_missing() is not None:
+            return MISSING
+        return UNKNOWN
+
+    def nb_rows(self):
+        return int(math.ceil(len(self.build_range) / float(self.COLUMNS)))
+
+    def grid_rect(self):
+        return QRectF(
+            0,
+            0,
+            self.COLUMNS * self.ROW_HEIGHT - self.SPACE,
+            self.nb_rows() * self.ROW_HEIGHT - self.SPACE,
+        )
+
+    def count_statuses(self, start, end):
+        counts = [0, 0, 0]
+        for status in self.statuses[start:end]:
+            counts[status] += 1
+        return counts
+
+    def build_item(self, index):
+        """
+        Returns the item of the build at *index*, creating it if needed.
+        """
+        item = self.build_items.get(index)
+        if item is not None:
+            return item
+        row, column = divmod(index, self.COLUMNS)
+        item = BuildItem(
+            self.build_range.get_future(index),
+            column * self.ROW_HEIGHT,
+            row * self.ROW_HEIGHT,
+            selectable=index not in self.bounds,
+        )
+        if index in self.bounds:
+            item.setBrush(QBrush(Qt.lightGray))
+        elif index != self.mid:
+            item.set_status(self.statuses[index])
+        item.setPen(QPen(self.palette().windowText().color()))
+        item.setVisible(self.detailed)
+        self.build_items[index] = item
+        self.addItem(item)
+        return item
+
+    def show_rect(self, rect, scale):
+        """
+        Called by the view with the visible part of the scene and the zoom
+        level: the visible items are created and their build infos loaded.
+        """
+        detailed = scale >= self.DETAIL_SCALE
+        if detailed != self.detailed:
+            self.detailed = detailed
+            self.density.setVisible(not detailed)
+            for item in self.build_items.values():
+                item.setVisible(detailed)
+        if not detailed:
+            return
+        first_row = max(0, int(rect.top() // self.ROW_HEIGHT))
+        last_row = min(self.nb_rows() - 1, int(rect.bottom() // self.ROW_HEIGHT))
+        first_column = max(0, int(rect.left() // self.ROW_HEIGHT))
+        last_column = min(self.COLUMNS - 1, int(rect.right() // self.ROW_HEIGHT))
+        to_load = []
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                index = row * self.COLUMNS + column
+                if index >= len(self.build_range):
+                    break
+                self.build_item(index)
+                if self.statuses[index] == UNKNOWN:
+                    to_load.append(index)
+        self.loader.request(to_load)
+
+    @Slot(int, bool)
+    def on_build_loaded(self, index, available):
+        self.statuses[index] = AVAILABLE if available else MISSING
+        item = self.build_items.get(index)
+        if item is not None and index not in self.bounds and index != self.mid:
+            item.set_status(self.statuses[index])
+        if not self.detailed:
+            self.density.update()
 
     def _update_palette(self):
-        for item in self.items():
-            pen = QPen(self.palette().windowText().color())
+        pen = QPen(self.palette().windowText().color())
+        for item in self.build_items.values():
             item.setPen(pen)
 
     def event(self, event: QEvent) -> bool:
@@ -72,6 +305,7 @@ class SkipChooserScene(QGraphicsScene):
 
 class SkipChooserView(QGraphicsView):
     build_choosen = Signal()
+    ZOOM_FACTOR = 1.25
 
     def __init__(self, parent=None):
         QGraphicsView.__init__(self, parent)
@@ -81,12 +315,44 @@ class SkipChooserView(QGraphicsView):
         QGraphicsView.setScene(self, scene)
         self.centerOn(scene.mid_build)
         scene.mid_build.setSelected(True)
+        self.update_visible_items()
+
+    def update_visible_items(self):
+        scene = self.scene()
+        if scene is not None:
+            rect = self.mapToScene(self.viewport().rect()).boundingRect()
+            scene.show_rect(rect, self.transform().m11())
+
+    def scrollContentsBy(self, dx, dy):
+        QGraphicsView.scrollContentsBy(self, dx, dy)
+        self.update_visible_items()
+
+    def resizeEvent(self, evt):
+        QGraphicsView.resizeEvent(self, evt)
+        self.update_visible_items()
+
+    def zoom(self, factor, center=None):
+        self.scale(factor, factor)
+        if center is not None:
+            self.centerOn(center)
+        self.update_visible_items()
+
+    def wheelEvent(self, evt):
+        if evt.modifiers() & Qt.ControlModifier:
+            self.zoom(self.ZOOM_FACTOR if evt.angleDelta().y() > 0 else 1 / self.ZOOM_FACTOR)
+        else:
+            QGraphicsView.wheelEvent(self, evt)
 
     def mousePressEvent(self, evt):
         item = self.itemAt(evt.pos())
         # do nothing if we don't click on an item
         if not item:
             return
+        if isinstance(item, DensityItem):
+            # zoom in the clicked area, to show the builds
+            scale = self.scene().DETAIL_SCALE / self.transform().m11()
+            self.zoom(scale, center=self.mapToScene(evt.pos()))
+            return
         # do nothing if we click on a bound
         if not (item.flags() & QGraphicsRectItem.ItemIsSelectable):
             return
@@ -99,13 +365,19 @@ class SkipChooserView(QGraphicsView):
         QGraphicsView.mouseMoveEvent(self, evt)
         # implement a real time tooltip
         item = self.itemAt(evt.pos())
-        if item:
+        if isinstance(item, DensityItem):
+            start, end = item.builds_at(self.mapToScene(evt.pos()), self.transform().m11())
+            futures = self.scene().build_range.future_build_infos
+            QToolTip.showText(
+                evt.globalPos(), "Builds %s to %s" % (futures[start].data, futures[end - 1].data)
+            )
+        elif item:
             QToolTip.showText(evt.globalPos(), str(item))
 
     def mouseDoubleClickEvent(self, evt):
         item = self.itemAt(evt.pos())
         # do nothing if we click on a bound
-        if item and item.flags() & QGraphicsRectItem.ItemIsSelectable:
+        if isinstance(item, BuildItem) and item.flags() & QGraphicsRectItem.ItemIsSelectable:
             self.build_choosen.emit()
 
 
@@ -121,6 +393,7 @@ class SkipDialog(QDialog):
         self.scene.selectionChanged.connect(self.on_selection_changed)
         self.ui.gview.setScene(self.scene)
         self.ui.gview.build_choosen.connect(self.accept)
+        self.finished.connect(self.scene.loader.stop)
 
     def on_selection_changed(self):
         items = self.scene.selectedItems()
@@ -160,7 +433,7 @@ if __name__ == "__main__":
         def _fetch(self):
             return self.data
 
-    build_range = BuildRange(None, [FInfo(None, i) for i in range(420)])
+    build_range = BuildRange(None, [FInfo(None, i) for i in range(5000)])
 
     from PySide6.QtWidgets import QApplication, QMainWindow
 
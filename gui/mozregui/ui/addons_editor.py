@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'addons_editor.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QHBoxLayout, QListView, QPushButton,
+    QScrollArea, QSizePolicy, QSpacerItem, QVBoxLayout,
+    QWidget)
+
+class Ui_AddonsEditor(object):
+    def setupUi(self, AddonsEditor):
+        if not AddonsEditor.objectName():
+            AddonsEditor.setObjectName(u"AddonsEditor")
+        AddonsEditor.resize(679, 354)
+        self.horizontalLayout_4 = QHBoxLayout(AddonsEditor)
+        self.horizontalLayout_4.setSpacing(0)
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.horizontalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.addons_view = QScrollArea(AddonsEditor)
+        self.addons_view.setObjectName(u"addons_view")
+        self.addons_view.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 586, 352))
+        self.verticalLayout_2 = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_2.setSpacing(0)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.list_view = QListView(self.scrollAreaWidgetContents)
+        self.list_view.setObjectName(u"list_view")
+
+        self.verticalLayout_2.addWidget(self.list_view)
+
+        self.addons_view.setWidget(self.scrollAreaWidgetContents)
+
+        self.horizontalLayout_4.addWidget(self.addons_view)
+
+        self.verticalLayout = QVBoxLayout()
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.add_addon = QPushButton(AddonsEditor)
+        self.add_addon.setObjectName(u"add_addon")
+
+        self.verticalLayout.addWidget(self.add_addon)
+
+        self.remove_addon = QPushButton(AddonsEditor)
+        self.remove_addon.setObjectName(u"remove_addon")
+
+        self.verticalLayout.addWidget(self.remove_addon)
+
+
+        self.horizontalLayout_4.addLayout(self.verticalLayout)
+
+
+        self.retranslateUi(AddonsEditor)
+        self.add_addon.clicked.connect(AddonsEditor.add_addon)
+        self.remove_addon.clicked.connect(AddonsEditor.remove_selected_addons)
+
+        QMetaObject.connectSlotsByName(AddonsEditor)
+    # setupUi
+
+    def retranslateUi(self, AddonsEditor):
+        AddonsEditor.setWindowTitle(QCoreApplication.translate("AddonsEditor", u"Form", None))
+        self.add_addon.setText(QCoreApplication.translate("AddonsEditor", u"Add", None))
+        self.remove_addon.setText(QCoreApplication.translate("AddonsEditor", u"Remove", None))
+    # retranslateUi
+
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'ask_verdict.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QHBoxLayout, QPushButton,
+    QSizePolicy, QSpacerItem, QWidget)
+
+class Ui_AskVerdict(object):
+    def setupUi(self, AskVerdict):
+        if not AskVerdict.objectName():
+            AskVerdict.setObjectName(u"AskVerdict")
+        AskVerdict.resize(494, 38)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(AskVerdict.sizePolicy().hasHeightForWidth())
+        AskVerdict.setSizePolicy(sizePolicy)
+        self.horizontalLayout = QHBoxLayout(AskVerdict)
+        self.horizontalLayout.setSpacing(1)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(1, 0, 1, 0)
+        self.horizontalSpacer = QSpacerItem(245, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.goodVerdict = QPushButton(AskVerdict)
+        self.goodVerdict.setObjectName(u"goodVerdict")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.goodVerdict.sizePolicy().hasHeightForWidth())
+        self.goodVerdict.setSizePolicy(sizePolicy1)
+        self.goodVerdict.setMinimumSize(QSize(80, 0))
+        self.goodVerdict.setMaximumSize(QSize(70, 16777215))
+        font = QFont()
+        font.setPointSize(12)
+        self.goodVerdict.setFont(font)
+
+        self.horizontalLayout.addWidget(self.goodVerdict, 0, Qt.AlignVCenter)
+
+        self.badVerdict = QPushButton(AskVerdict)
+        self.badVerdict.setObjectName(u"badVerdict")
+        sizePolicy1.setHeightForWidth(self.badVerdict.sizePolicy().hasHeightForWidth())
+        self.badVerdict.setSizePolicy(sizePolicy1)
+        self.badVerdict.setMinimumSize(QSize(80, 0))
+        self.badVerdict.setMaximumSize(QSize(70, 16777215))
+        self.badVerdict.setFont(font)
+
+        self.horizontalLayout.addWidget(self.badVerdict, 0, Qt.AlignVCenter)
+
+        self.comboVerdict = QComboBox(AskVerdict)
+        self.comboVerdict.setObjectName(u"comboVerdict")
+        sizePolicy1.setHeightForWidth(self.comboVerdict.sizePolicy().hasHeightForWidth())
+        self.comboVerdict.setSizePolicy(sizePolicy1)
+        self.comboVerdict.setMinimumSize(QSize(92, 0))
+        self.comboVerdict.setFont(font)
+        self.comboVerdict.setFrame(True)
+
+        self.horizontalLayout.addWidget(self.comboVerdict, 0, Qt.AlignVCenter)
+
+
+        self.retranslateUi(AskVerdict)
+
+        QMetaObject.connectSlotsByName(AskVerdict)
+    # setupUi
+
+    def retranslateUi(self, AskVerdict):
+        AskVerdict.setWindowTitle(QCoreApplication.translate("AskVerdict", u"Form", None))
+        self.goodVerdict.setText(QCoreApplication.translate("AskVerdict", u"Good", None))
+        self.badVerdict.setText(QCoreApplication.translate("AskVerdict", u"Bad", None))
+    # retranslateUi
+
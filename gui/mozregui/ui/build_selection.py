@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'build_selection.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QCheckBox, QFormLayout, QLabel,
+    QSizePolicy, QWidget)
+
+from mozregui.utils import BuildSelection
+
+class Ui_BuildSelectionPage(object):
+    def setupUi(self, BuildSelectionPage):
+        if not BuildSelectionPage.objectName():
+            BuildSelectionPage.setObjectName(u"BuildSelectionPage")
+        BuildSelectionPage.resize(558, 384)
+        self.formLayout = QFormLayout(BuildSelectionPage)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_4 = QLabel(BuildSelectionPage)
+        self.label_4.setObjectName(u"label_4")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_4.sizePolicy().hasHeightForWidth())
+        self.label_4.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.LabelRole, self.label_4)
+
+        self.find_fix = QCheckBox(BuildSelectionPage)
+        self.find_fix.setObjectName(u"find_fix")
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.FieldRole, self.find_fix)
+
+        self.label = QLabel(BuildSelectionPage)
+        self.label.setObjectName(u"label")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy1)
+        self.label.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.formLayout.setWidget(1, QFormLayout.ItemRole.LabelRole, self.label)
+
+        self.start = BuildSelection(BuildSelectionPage)
+        self.start.setObjectName(u"start")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.start.sizePolicy().hasHeightForWidth())
+        self.start.setSizePolicy(sizePolicy2)
+
+        self.formLayout.setWidget(1, QFormLayout.ItemRole.FieldRole, self.start)
+
+        self.label_2 = QLabel(BuildSelectionPage)
+        self.label_2.setObjectName(u"label_2")
+        sizePolicy1.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy1)
+
+        self.formLayout.setWidget(2, QFormLayout.ItemRole.LabelRole, self.label_2)
+
+        self.end = BuildSelection(BuildSelectionPage)
+        self.end.setObjectName(u"end")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.end.sizePolicy().hasHeightForWidth())
+        self.end.setSizePolicy(sizePolicy3)
+
+        self.formLayout.setWidget(2, QFormLayout.ItemRole.FieldRole, self.end)
+
+
+        self.retranslateUi(BuildSelectionPage)
+
+        QMetaObject.connectSlotsByName(BuildSelectionPage)
+    # setupUi
+
+    def retranslateUi(self, BuildSelectionPage):
+        BuildSelectionPage.setWindowTitle(QCoreApplication.translate("BuildSelectionPage", u"Form", None))
+#if QT_CONFIG(tooltip)
+        self.label_4.setToolTip(QCoreApplication.translate("BuildSelectionPage", u"Search a fix instead of a regression", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_4.setText(QCoreApplication.translate("BuildSelectionPage", u"Search for fix:", None))
+        self.find_fix.setText(QCoreApplication.translate("BuildSelectionPage", u"(Search for a bug fix instead of a regression)", None))
+        self.label.setText(QCoreApplication.translate("BuildSelectionPage", u"Last known good build:", None))
+        self.label_2.setText(QCoreApplication.translate("BuildSelectionPage", u"First known bad build:", None))
+    # retranslateUi
+
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'build_selection_helper.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QDateEdit, QHBoxLayout,
+    QLineEdit, QSizePolicy, QStackedWidget, QVBoxLayout,
+    QWidget)
+
+class Ui_BuildSelectionHelper(object):
+    def setupUi(self, BuildSelectionHelper):
+        if not BuildSelectionHelper.objectName():
+            BuildSelectionHelper.setObjectName(u"BuildSelectionHelper")
+        BuildSelectionHelper.resize(655, 78)
+        self.horizontalLayout = QHBoxLayout(BuildSelectionHelper)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.stackedWidget = QStackedWidget(BuildSelectionHelper)
+        self.stackedWidget.setObjectName(u"stackedWidget")
+        self.s_date = QWidget()
+        self.s_date.setObjectName(u"s_date")
+        self.verticalLayout = QVBoxLayout(self.s_date)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.date = QDateEdit(self.s_date)
+        self.date.setObjectName(u"date")
+        self.date.setCalendarPopup(True)
+
+        self.verticalLayout.addWidget(self.date)
+
+        self.stackedWidget.addWidget(self.s_date)
+        self.s_release = QWidget()
+        self.s_release.setObjectName(u"s_release")
+        self.verticalLayout_2 = QVBoxLayout(self.s_release)
+        self.verticalLayout_2.setSpacing(0)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.release = QComboBox(self.s_release)
+        self.release.setObjectName(u"release")
+
+        self.verticalLayout_2.addWidget(self.release)
+
+        self.stackedWidget.addWidget(self.s_release)
+        self.s_buildid = QWidget()
+        self.s_buildid.setObjectName(u"s_buildid")
+        self.verticalLayout_3 = QVBoxLayout(self.s_buildid)
+        self.verticalLayout_3.setSpacing(0)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.buildid = QLineEdit(self.s_buildid)
+        self.buildid.setObjectName(u"buildid")
+
+        self.verticalLayout_3.addWidget(self.buildid)
+
+        self.stackedWidget.addWidget(self.s_buildid)
+        self.s_changeset = QWidget()
+        self.s_changeset.setObjectName(u"s_changeset")
+        self.verticalLayout_4 = QVBoxLayout(self.s_changeset)
+        self.verticalLayout_4.setSpacing(0)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.changeset = QLineEdit(self.s_changeset)
+        self.changeset.setObjectName(u"changeset")
+
+        self.verticalLayout_4.addWidget(self.changeset)
+
+        self.stackedWidget.addWidget(self.s_changeset)
+
+        self.horizontalLayout.addWidget(self.stackedWidget)
+
+        self.combo_helper = QComboBox(BuildSelectionHelper)
+        self.combo_helper.addItem("")
+        self.combo_helper.addItem("")
+        self.combo_helper.addItem("")
+        self.combo_helper.addItem("")
+        self.combo_helper.setObjectName(u"combo_helper")
+
+        self.horizontalLayout.addWidget(self.combo_helper)
+
+        QWidget.setTabOrder(self.date, self.combo_helper)
+        QWidget.setTabOrder(self.combo_helper, self.buildid)
+        QWidget.setTabOrder(self.buildid, self.changeset)
+        QWidget.setTabOrder(self.changeset, self.release)
+
+        self.retranslateUi(BuildSelectionHelper)
+
+        self.stackedWidget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(BuildSelectionHelper)
+    # setupUi
+
+    def retranslateUi(self, BuildSelectionHelper):
+        BuildSelectionHelper.setWindowTitle(QCoreApplication.translate("BuildSelectionHelper", u"Form", None))
+        self.date.setDisplayFormat(QCoreApplication.translate("BuildSelectionHelper", u"yyyy-MM-dd", None))
+        self.combo_helper.setItemText(0, QCoreApplication.translate("BuildSelectionHelper", u"date", None))
+        self.combo_helper.setItemText(1, QCoreApplication.translate("BuildSelectionHelper", u"release", None))
+        self.combo_helper.setItemText(2, QCoreApplication.translate("BuildSelectionHelper", u"buildid", None))
+        self.combo_helper.setItemText(3, QCoreApplication.translate("BuildSelectionHelper", u"changeset", None))
+
+    # retranslateUi
+
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'crash_reporter.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QCheckBox, QDialog,
+    QDialogButtonBox, QHBoxLayout, QLabel, QPlainTextEdit,
+    QSizePolicy, QVBoxLayout, QWidget)
+
+class Ui_CrashDialog(object):
+    def setupUi(self, CrashDialog):
+        if not CrashDialog.objectName():
+            CrashDialog.setObjectName(u"CrashDialog")
+        CrashDialog.resize(615, 448)
+        self.verticalLayout = QVBoxLayout(CrashDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.label = QLabel(CrashDialog)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout.addWidget(self.label)
+
+        self.information = QPlainTextEdit(CrashDialog)
+        self.information.setObjectName(u"information")
+        self.information.setUndoRedoEnabled(False)
+        self.information.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.information.setReadOnly(True)
+
+        self.verticalLayout.addWidget(self.information)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.check_hide_dialog = QCheckBox(CrashDialog)
+        self.check_hide_dialog.setObjectName(u"check_hide_dialog")
+
+        self.horizontalLayout.addWidget(self.check_hide_dialog)
+
+        self.buttonBox = QDialogButtonBox(CrashDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Ok)
+
+        self.horizontalLayout.addWidget(self.buttonBox)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+
+        self.retranslateUi(CrashDialog)
+        self.buttonBox.accepted.connect(CrashDialog.accept)
+        self.buttonBox.rejected.connect(CrashDialog.reject)
+
+        QMetaObject.connectSlotsByName(CrashDialog)
+    # setupUi
+
+    def retranslateUi(self, CrashDialog):
+        CrashDialog.setWindowTitle(QCoreApplication.translate("CrashDialog", u"Crash Dialog", None))
+        self.label.setText(QCoreApplication.translate("CrashDialog", u"<html><head/><body><p>Sorry, the mozregression GUI encountered an error...</p><p>Please consider <a href=\"https://wiki.mozilla.org/Auto-tools/Projects/Mozregression#Issue_.2F_feature_tracking\"><span style=\" text-decoration: underline; color:#0000ff;\">filing a bug</span></a> with the following information:</p></body></html>", None))
+        self.check_hide_dialog.setText(QCoreApplication.translate("CrashDialog", u"Prevent this dialog from opening again", None))
+    # retranslateUi
+
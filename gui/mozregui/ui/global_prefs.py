@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'global_prefs.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QCheckBox, QDialog,
+    QDialogButtonBox, QDoubleSpinBox, QFormLayout, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget)
+
+from mozregui.utils import DirectorySelectWidget
+
+class Ui_GlobalPrefs(object):
+    def setupUi(self, GlobalPrefs):
+        if not GlobalPrefs.objectName():
+            GlobalPrefs.setObjectName(u"GlobalPrefs")
+        GlobalPrefs.resize(689, 299)
+        self.verticalLayout = QVBoxLayout(GlobalPrefs)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.formLayout = QFormLayout()
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        self.persist_directory_label = QLabel(GlobalPrefs)
+        self.persist_directory_label.setObjectName(u"persist_directory_label")
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.LabelRole, self.persist_directory_label)
+
+        self.persist = DirectorySelectWidget(GlobalPrefs)
+        self.persist.setObjectName(u"persist")
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.FieldRole, self.persist)
+
+        self.size_limit_persist_label = QLabel(GlobalPrefs)
+        self.size_limit_persist_label.setObjectName(u"size_limit_persist_label")
+
+        self.formLayout.setWidget(1, QFormLayout.ItemRole.LabelRole, self.size_limit_persist_label)
+
+        self.persist_size_limit = QDoubleSpinBox(GlobalPrefs)
+        self.persist_size_limit.setObjectName(u"persist_size_limit")
+        self.persist_size_limit.setMinimum(0.000000000000000)
+        self.persist_size_limit.setMaximum(999.990000000000009)
+
+        self.formLayout.setWidget(1, QFormLayout.ItemRole.FieldRole, self.persist_size_limit)
+
+        self.label_4 = QLabel(GlobalPrefs)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout.setWidget(2, QFormLayout.ItemRole.LabelRole, self.label_4)
+
+        self.approx = QCheckBox(GlobalPrefs)
+        self.approx.setObjectName(u"approx")
+
+        self.formLayout.setWidget(2, QFormLayout.ItemRole.FieldRole, self.approx)
+
+        self.label_3 = QLabel(GlobalPrefs)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(3, QFormLayout.ItemRole.LabelRole, self.label_3)
+
+        self.http_timeout = QDoubleSpinBox(GlobalPrefs)
+        self.http_timeout.setObjectName(u"http_timeout")
+        self.http_timeout.setMinimum(1.000000000000000)
+
+        self.formLayout.setWidget(3, QFormLayout.ItemRole.FieldRole, self.http_timeout)
+
+        self.label_2 = QLabel(GlobalPrefs)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(4, QFormLayout.ItemRole.LabelRole, self.label_2)
+
+        self.bg_downloads = QCheckBox(GlobalPrefs)
+        self.bg_downloads.setObjectName(u"bg_downloads")
+
+        self.formLayout.setWidget(4, QFormLayout.ItemRole.FieldRole, self.bg_downloads)
+
+        self.label_5 = QLabel(GlobalPrefs)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout.setWidget(5, QFormLayout.ItemRole.LabelRole, self.label_5)
+
+        self.archive_base_url = QLineEdit(GlobalPrefs)
+        self.archive_base_url.setObjectName(u"archive_base_url")
+
+        self.formLayout.setWidget(5, QFormLayout.ItemRole.FieldRole, self.archive_base_url)
+
+        self.telemetryLabel = QLabel(GlobalPrefs)
+        self.telemetryLabel.setObjectName(u"telemetryLabel")
+
+        self.formLayout.setWidget(6, QFormLayout.ItemRole.LabelRole, self.telemetryLabel)
+
+        self.enable_telemetry = QCheckBox(GlobalPrefs)
+        self.enable_telemetry.setObjectName(u"enable_telemetry")
+
+        self.formLayout.setWidget(6, QFormLayout.ItemRole.FieldRole, self.enable_telemetry)
+
+
+        self.verticalLayout.addLayout(self.formLayout)
+
+        self.verticalSpacer = QSpacerItem(20, 54, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.advanced_options = QPushButton(GlobalPrefs)
+        self.advanced_options.setObjectName(u"advanced_options")
+
+        self.horizontalLayout.addWidget(self.advanced_options)
+
+        self.buttonBox = QDialogButtonBox(GlobalPrefs)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.horizontalLayout.addWidget(self.buttonBox)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+
+        self.retranslateUi(GlobalPrefs)
+        self.buttonBox.accepted.connect(GlobalPrefs.accept)
+        self.buttonBox.rejected.connect(GlobalPrefs.reject)
+
+        QMetaObject.connectSlotsByName(GlobalPrefs)
+    # setupUi
+
+    def retranslateUi(self, GlobalPrefs):
+        GlobalPrefs.setWindowTitle(QCoreApplication.translate("GlobalPrefs", u"Global Preferences", None))
+#if QT_CONFIG(tooltip)
+        self.persist_directory_label.setToolTip(QCoreApplication.translate("GlobalPrefs", u"The directory in which downloaded files are to persist.", None))
+#endif // QT_CONFIG(tooltip)
+        self.persist_directory_label.setText(QCoreApplication.translate("GlobalPrefs", u"Persist Directory", None))
+#if QT_CONFIG(tooltip)
+        self.size_limit_persist_label.setToolTip(QCoreApplication.translate("GlobalPrefs", u"Size limit of the persist directory, in GiB. 0 means no limit.", None))
+#endif // QT_CONFIG(tooltip)
+        self.size_limit_persist_label.setText(QCoreApplication.translate("GlobalPrefs", u"Persist Size Limit", None))
+#if QT_CONFIG(tooltip)
+        self.label_4.setToolTip(QCoreApplication.translate("GlobalPrefs", u"reuse approximate persistent builds instead of downloading the accurate ones.", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_4.setText(QCoreApplication.translate("GlobalPrefs", u"Approximative Builds", None))
+        self.approx.setText("")
+#if QT_CONFIG(tooltip)
+        self.label_3.setToolTip(QCoreApplication.translate("GlobalPrefs", u"Timeout in seconds to abort requests when there is no activity from the server. Default to 30.0 seconds - increase this if you are under a really slow network.", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_3.setText(QCoreApplication.translate("GlobalPrefs", u"HTTP timeout", None))
+#if QT_CONFIG(tooltip)
+        self.label_2.setToolTip(QCoreApplication.translate("GlobalPrefs", u"If checked, background downloads of the next builds will start while you are evaluating a build.", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_2.setText(QCoreApplication.translate("GlobalPrefs", u"Background Downloads", None))
+        self.bg_downloads.setText("")
+#if QT_CONFIG(tooltip)
+        self.label_5.setToolTip(QCoreApplication.translate("GlobalPrefs", u"<html><head/><body><p>Base url used to find the archived builds. You can set it blank to revert to the default value.</p></body></html>", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_5.setText(QCoreApplication.translate("GlobalPrefs", u"Archives URL", None))
+#if QT_CONFIG(tooltip)
+        self.telemetryLabel.setToolTip(QCoreApplication.translate("GlobalPrefs", u"Send anonymized data on mozregression usage to Mozilla", None))
+#endif // QT_CONFIG(tooltip)
+        self.telemetryLabel.setText(QCoreApplication.translate("GlobalPrefs", u"Enable Telemetry", None))
+        self.advanced_options.setText(QCoreApplication.translate("GlobalPrefs", u"Show Advanced Options", None))
+    # retranslateUi
+
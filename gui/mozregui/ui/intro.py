@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'intro.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QFormLayout, QLabel,
+    QLineEdit, QSizePolicy, QWidget)
+
+class Ui_Intro(object):
+    def setupUi(self, Intro):
+        if not Intro.objectName():
+            Intro.setObjectName(u"Intro")
+        Intro.resize(464, 357)
+        self.formLayout = QFormLayout(Intro)
+        self.formLayout.setObjectName(u"formLayout")
+        self.formLayout.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
+        self.label = QLabel(Intro)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.LabelRole, self.label)
+
+        self.app_combo = QComboBox(Intro)
+        self.app_combo.setObjectName(u"app_combo")
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.FieldRole, self.app_combo)
+
+        self.label_4 = QLabel(Intro)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout.setWidget(1, QFormLayout.ItemRole.LabelRole, self.label_4)
+
+        self.bits_combo = QComboBox(Intro)
+        self.bits_combo.setObjectName(u"bits_combo")
+
+        self.formLayout.setWidget(1, QFormLayout.ItemRole.FieldRole, self.bits_combo)
+
+        self.arch_label = QLabel(Intro)
+        self.arch_label.setObjectName(u"arch_label")
+
+        self.formLayout.setWidget(2, QFormLayout.ItemRole.LabelRole, self.arch_label)
+
+        self.arch_combo = QComboBox(Intro)
+        self.arch_combo.setObjectName(u"arch_combo")
+
+        self.formLayout.setWidget(2, QFormLayout.ItemRole.FieldRole, self.arch_combo)
+
+        self.label_5 = QLabel(Intro)
+        self.label_5.setObjectName(u"label_5")
+
+        self.formLayout.setWidget(3, QFormLayout.ItemRole.LabelRole, self.label_5)
+
+        self.build_type = QComboBox(Intro)
+        self.build_type.setObjectName(u"build_type")
+
+        self.formLayout.setWidget(3, QFormLayout.ItemRole.FieldRole, self.build_type)
+
+        self.repository_label = QLabel(Intro)
+        self.repository_label.setObjectName(u"repository_label")
+
+        self.formLayout.setWidget(4, QFormLayout.ItemRole.LabelRole, self.repository_label)
+
+        self.repository = QLineEdit(Intro)
+        self.repository.setObjectName(u"repository")
+
+        self.formLayout.setWidget(4, QFormLayout.ItemRole.FieldRole, self.repository)
+
+        self.lang_label = QLabel(Intro)
+        self.lang_label.setObjectName(u"lang_label")
+
+        self.formLayout.setWidget(5, QFormLayout.ItemRole.LabelRole, self.lang_label)
+
+        self.lang = QLineEdit(Intro)
+        self.lang.setObjectName(u"lang")
+
+        self.formLayout.setWidget(5, QFormLayout.ItemRole.FieldRole, self.lang)
+
+        self.url_label = QLabel(Intro)
+        self.url_label.setObjectName(u"url_label")
+
+        self.formLayout.setWidget(6, QFormLayout.ItemRole.LabelRole, self.url_label)
+
+        self.url = QLineEdit(Intro)
+        self.url.setObjectName(u"url")
+
+        self.formLayout.setWidget(6, QFormLayout.ItemRole.FieldRole, self.url)
+
+
+        self.retranslateUi(Intro)
+
+        QMetaObject.connectSlotsByName(Intro)
+    # setupUi
+
+    def retranslateUi(self, Intro):
+        Intro.setWindowTitle(QCoreApplication.translate("Intro", u"Form", None))
+        self.label.setText(QCoreApplication.translate("Intro", u"Application", None))
+        self.label_4.setText(QCoreApplication.translate("Intro", u"Bits", None))
+        self.arch_label.setText(QCoreApplication.translate("Intro", u"Build architecture", None))
+        self.label_5.setText(QCoreApplication.translate("Intro", u"Build Type", None))
+#if QT_CONFIG(tooltip)
+        self.build_type.setToolTip(QCoreApplication.translate("Intro", u"Choose a build type you want.", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.repository_label.setToolTip(QCoreApplication.translate("Intro", u"you can choose a specific repository name here", None))
+#endif // QT_CONFIG(tooltip)
+        self.repository_label.setText(QCoreApplication.translate("Intro", u"Repository", None))
+#if QT_CONFIG(tooltip)
+        self.repository.setToolTip(QCoreApplication.translate("Intro", u"repository like autoland|mozilla-beta|...", None))
+#endif // QT_CONFIG(tooltip)
+        self.repository.setPlaceholderText(QCoreApplication.translate("Intro", u"you can choose a specific repository name here", None))
+#if QT_CONFIG(tooltip)
+        self.lang_label.setToolTip(QCoreApplication.translate("Intro", u"enter the code of the lang you want a build for", None))
+#endif // QT_CONFIG(tooltip)
+        self.lang_label.setText(QCoreApplication.translate("Intro", u"Lang", None))
+#if QT_CONFIG(tooltip)
+        self.lang.setToolTip(QCoreApplication.translate("Intro", u"Lang code such as he, ar, zh-TW", None))
+#endif // QT_CONFIG(tooltip)
+        self.lang.setPlaceholderText(QCoreApplication.translate("Intro", u"The lang code (e.g. de)", None))
+#if QT_CONFIG(tooltip)
+        self.url_label.setToolTip(QCoreApplication.translate("Intro", u"enter a URL to pass to the app", None))
+#endif // QT_CONFIG(tooltip)
+        self.url_label.setText(QCoreApplication.translate("Intro", u"URL", None))
+#if QT_CONFIG(tooltip)
+        self.url.setToolTip(QCoreApplication.translate("Intro", u"URL such as example.org, https://mozilla.org, about:logo", None))
+#endif // QT_CONFIG(tooltip)
+        self.url.setPlaceholderText(QCoreApplication.translate("Intro", u"Open the app to a specific URL", None))
+    # retranslateUi
+
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'mainwindow.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
+    QCursor, QFont, QFontDatabase, QGradient,
+    QIcon, QImage, QKeySequence, QLinearGradient,
+    QPainter, QPalette, QPixmap, QRadialGradient,
+    QTransform)
+from PySide6.QtWidgets import (QApplication, QDockWidget, QGridLayout, QHeaderView,
+    QLabel, QMainWindow, QMenu, QMenuBar,
+    QSizePolicy, QStatusBar, QTextEdit, QToolBar,
+    QVBoxLayout, QWidget)
+
+from mozregui.log_report import LogView
+from mozregui.report import (BuildInfoTextBrowser, ReportView)
+import resources_rc
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(1024, 768)
+        MainWindow.setContextMenuPolicy(Qt.NoContextMenu)
+        icon = QIcon()
+        icon.addFile(u":/app_icon.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        MainWindow.setWindowIcon(icon)
+        self.actionStart_a_new_bisection = QAction(MainWindow)
+        self.actionStart_a_new_bisection.setObjectName(u"actionStart_a_new_bisection")
+        self.actionStart_a_new_bisection.setCheckable(False)
+        self.actionStart_a_new_bisection.setChecked(False)
+        icon1 = QIcon()
+        icon1.addFile(u":/cutting.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.actionStart_a_new_bisection.setIcon(icon1)
+        self.actionStart_a_new_bisection.setIconVisibleInMenu(False)
+        self.actionQuit = QAction(MainWindow)
+        self.actionQuit.setObjectName(u"actionQuit")
+        self.actionAbout = QAction(MainWindow)
+        self.actionAbout.setObjectName(u"actionAbout")
+        self.actionStop_the_bisection = QAction(MainWindow)
+        self.actionStop_the_bisection.setObjectName(u"actionStop_the_bisection")
+        self.actionStop_the_bisection.setEnabled(False)
+        icon2 = QIcon()
+        icon2.addFile(u":/stop.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.actionStop_the_bisection.setIcon(icon2)
+        self.actionStop_the_bisection.setIconVisibleInMenu(True)
+        self.actionGlobal_preferences = QAction(MainWindow)
+        self.actionGlobal_preferences.setObjectName(u"actionGlobal_preferences")
+        self.actionRun_a_single_build = QAction(MainWindow)
+        self.actionRun_a_single_build.setObjectName(u"actionRun_a_single_build")
+        icon3 = QIcon()
+        icon3.addFile(u":/s.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.actionRun_a_single_build.setIcon(icon3)
+        self.actionRun_a_single_build.setIconVisibleInMenu(True)
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.verticalLayout = QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setSpacing(9)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.build_info_browser = BuildInfoTextBrowser(self.centralwidget)
+        self.build_info_browser.setObjectName(u"build_info_browser")
+        self.build_info_browser.setLineWrapMode(QTextEdit.NoWrap)
+        self.build_info_browser.setOpenExternalLinks(False)
+        self.build_info_browser.setOpenLinks(False)
+
+        self.gridLayout.addWidget(self.build_info_browser, 1, 1, 1, 1)
+
+        self.report_view = ReportView(self.centralwidget)
+        self.report_view.setObjectName(u"report_view")
+        self.report_view.horizontalHeader().setVisible(False)
+        self.report_view.horizontalHeader().setStretchLastSection(True)
+        self.report_view.verticalHeader().setVisible(False)
+
+        self.gridLayout.addWidget(self.report_view, 1, 0, 1, 1)
+
+        self.label = QLabel(self.centralwidget)
+        self.label.setObjectName(u"label")
+        self.label.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.label_2 = QLabel(self.centralwidget)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setAlignment(Qt.AlignCenter)
+
+        self.gridLayout.addWidget(self.label_2, 0, 1, 1, 1)
+
+
+        self.verticalLayout.addLayout(self.gridLayout)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 1024, 22))
+        self.menuFile = QMenu(self.menubar)
+        self.menuFile.setObjectName(u"menuFile")
+        self.menuHelp = QMenu(self.menubar)
+        self.menuHelp.setObjectName(u"menuHelp")
+        MainWindow.setMenuBar(self.menubar)
+        self.toolBar = QToolBar(MainWindow)
+        self.toolBar.setObjectName(u"toolBar")
+        self.toolBar.setEnabled(True)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.toolBar.sizePolicy().hasHeightForWidth())
+        self.toolBar.setSizePolicy(sizePolicy)
+        self.toolBar.setContextMenuPolicy(Qt.NoContextMenu)
+        self.toolBar.setMovable(False)
+        self.toolBar.setFloatable(False)
+        MainWindow.addToolBar(Qt.ToolBarArea.TopToolBarArea, self.toolBar)
+        self.logDockWidget = QDockWidget(MainWindow)
+        self.logDockWidget.setObjectName(u"logDockWidget")
+        self.logDockWidget.setFeatures(QDockWidget.NoDockWidgetFeatures)
+        self.LogWidget = QWidget()
+        self.LogWidget.setObjectName(u"LogWidget")
+        self.verticalLayout_3 = QVBoxLayout(self.LogWidget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.log_view = LogView(self.LogWidget)
+        self.log_view.setObjectName(u"log_view")
+        self.log_view.setContextMenuPolicy(Qt.CustomContextMenu)
+
+        self.verticalLayout_3.addWidget(self.log_view)
+
+        self.logDockWidget.setWidget(self.LogWidget)
+        MainWindow.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.logDockWidget)
+        self.status_bar = QStatusBar(MainWindow)
+        self.status_bar.setObjectName(u"status_bar")
+        MainWindow.setStatusBar(self.status_bar)
+
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+        self.menuFile.addAction(self.actionGlobal_preferences)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionQuit)
+        self.menuHelp.addAction(self.actionAbout)
+        self.toolBar.addAction(self.actionStart_a_new_bisection)
+        self.toolBar.addSeparator()
+        self.toolBar.addAction(self.actionRun_a_single_build)
+        self.toolBar.addSeparator()
+        self.toolBar.addAction(self.actionStop_the_bisection)
+
+        self.retranslateUi(MainWindow)
+        self.actionQuit.triggered.connect(MainWindow.close)
+        self.actionStart_a_new_bisection.triggered.connect(MainWindow.start_bisection_wizard)
+        self.actionAbout.triggered.connect(MainWindow.show_about)
+        self.actionStop_the_bisection.triggered.connect(MainWindow.stop_bisection)
+        self.actionGlobal_preferences.triggered.connect(MainWindow.edit_global_prefs)
+        self.actionRun_a_single_build.triggered.connect(MainWindow.single_run)
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"mozregression GUI", None))
+        self.actionStart_a_new_bisection.setText(QCoreApplication.translate("MainWindow", u"&Run a new bisection", None))
+#if QT_CONFIG(shortcut)
+        self.actionStart_a_new_bisection.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+R", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionQuit.setText(QCoreApplication.translate("MainWindow", u"&Quit", None))
+#if QT_CONFIG(shortcut)
+        self.actionQuit.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+Q", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionAbout.setText(QCoreApplication.translate("MainWindow", u"&About", None))
+        self.actionStop_the_bisection.setText(QCoreApplication.translate("MainWindow", u"&Stop", None))
+#if QT_CONFIG(tooltip)
+        self.actionStop_the_bisection.setToolTip(QCoreApplication.translate("MainWindow", u"Stop bisection or single build run", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(shortcut)
+        self.actionStop_the_bisection.setShortcut(QCoreApplication.translate("MainWindow", u"Esc", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionGlobal_preferences.setText(QCoreApplication.translate("MainWindow", u"Preferences...", None))
+        self.actionRun_a_single_build.setText(QCoreApplication.translate("MainWindow", u"Run &a single build", None))
+#if QT_CONFIG(tooltip)
+        self.actionRun_a_single_build.setToolTip(QCoreApplication.translate("MainWindow", u"Run a single build", None))
+#endif // QT_CONFIG(tooltip)
+        self.label.setText(QCoreApplication.translate("MainWindow", u"Progress", None))
+        self.label_2.setText(QCoreApplication.translate("MainWindow", u"Build Info", None))
+        self.menuFile.setTitle(QCoreApplication.translate("MainWindow", u"&File", None))
+        self.menuHelp.setTitle(QCoreApplication.translate("MainWindow", u"&Help", None))
+        self.toolBar.setWindowTitle(QCoreApplication.translate("MainWindow", u"toolBar", None))
+        self.logDockWidget.setWindowTitle(QCoreApplication.translate("MainWindow", u"Log", None))
+    # retranslateUi
+
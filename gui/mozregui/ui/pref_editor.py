@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'pref_editor.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QHBoxLayout, QHeaderView,
+    QPushButton, QScrollArea, QSizePolicy, QSpacerItem,
+    QTableView, QVBoxLayout, QWidget)
+
+class Ui_PrefEditor(object):
+    def setupUi(self, PrefEditor):
+        if not PrefEditor.objectName():
+            PrefEditor.setObjectName(u"PrefEditor")
+        PrefEditor.resize(670, 348)
+        self.horizontalLayout = QHBoxLayout(PrefEditor)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.scrollArea = QScrollArea(PrefEditor)
+        self.scrollArea.setObjectName(u"scrollArea")
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollAreaWidgetContents = QWidget()
+        self.scrollAreaWidgetContents.setObjectName(u"scrollAreaWidgetContents")
+        self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 545, 346))
+        self.verticalLayout = QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.pref_view = QTableView(self.scrollAreaWidgetContents)
+        self.pref_view.setObjectName(u"pref_view")
+        self.pref_view.setAlternatingRowColors(True)
+        self.pref_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.pref_view.horizontalHeader().setStretchLastSection(True)
+        self.pref_view.verticalHeader().setVisible(False)
+
+        self.verticalLayout.addWidget(self.pref_view)
+
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+
+        self.horizontalLayout.addWidget(self.scrollArea)
+
+        self.verticalLayout_2 = QVBoxLayout()
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_2.addItem(self.verticalSpacer)
+
+        self.add_pref = QPushButton(PrefEditor)
+        self.add_pref.setObjectName(u"add_pref")
+
+        self.verticalLayout_2.addWidget(self.add_pref)
+
+        self.remove_selected_prefs = QPushButton(PrefEditor)
+        self.remove_selected_prefs.setObjectName(u"remove_selected_prefs")
+
+        self.verticalLayout_2.addWidget(self.remove_selected_prefs)
+
+        self.add_prefs_from_file = QPushButton(PrefEditor)
+        self.add_prefs_from_file.setObjectName(u"add_prefs_from_file")
+
+        self.verticalLayout_2.addWidget(self.add_prefs_from_file)
+
+
+        self.horizontalLayout.addLayout(self.verticalLayout_2)
+
+
+        self.retranslateUi(PrefEditor)
+        self.add_pref.clicked.connect(PrefEditor.add_pref)
+        self.add_prefs_from_file.clicked.connect(PrefEditor.add_prefs_from_file)
+        self.remove_selected_prefs.clicked.connect(PrefEditor.remove_selected_prefs)
+
+        QMetaObject.connectSlotsByName(PrefEditor)
+    # setupUi
+
+    def retranslateUi(self, PrefEditor):
+        PrefEditor.setWindowTitle(QCoreApplication.translate("PrefEditor", u"Form", None))
+        self.add_pref.setText(QCoreApplication.translate("PrefEditor", u"Add", None))
+        self.remove_selected_prefs.setText(QCoreApplication.translate("PrefEditor", u"Remove", None))
+        self.add_prefs_from_file.setText(QCoreApplication.translate("PrefEditor", u"Add from File", None))
+    # retranslateUi
+
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'profile.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QFormLayout, QLabel,
+    QSizePolicy, QWidget)
+
+from mozregui.addons_editor import AddonsWidgetEditor
+from mozregui.pref_editor import PreferencesWidgetEditor
+from mozregui.utils import DirectorySelectWidget
+
+class Ui_Profile(object):
+    def setupUi(self, Profile):
+        if not Profile.objectName():
+            Profile.setObjectName(u"Profile")
+        Profile.resize(626, 493)
+        self.formLayout = QFormLayout(Profile)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(Profile)
+        self.label.setObjectName(u"label")
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.LabelRole, self.label)
+
+        self.profile_widget = DirectorySelectWidget(Profile)
+        self.profile_widget.setObjectName(u"profile_widget")
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.FieldRole, self.profile_widget)
+
+        self.label_4 = QLabel(Profile)
+        self.label_4.setObjectName(u"label_4")
+
+        self.formLayout.setWidget(1, QFormLayout.ItemRole.LabelRole, self.label_4)
+
+        self.profile_persistence_combo = QComboBox(Profile)
+        self.profile_persistence_combo.setObjectName(u"profile_persistence_combo")
+
+        self.formLayout.setWidget(1, QFormLayout.ItemRole.FieldRole, self.profile_persistence_combo)
+
+        self.label_2 = QLabel(Profile)
+        self.label_2.setObjectName(u"label_2")
+
+        self.formLayout.setWidget(2, QFormLayout.ItemRole.LabelRole, self.label_2)
+
+        self.pref_widget = PreferencesWidgetEditor(Profile)
+        self.pref_widget.setObjectName(u"pref_widget")
+
+        self.formLayout.setWidget(2, QFormLayout.ItemRole.FieldRole, self.pref_widget)
+
+        self.label_3 = QLabel(Profile)
+        self.label_3.setObjectName(u"label_3")
+
+        self.formLayout.setWidget(3, QFormLayout.ItemRole.LabelRole, self.label_3)
+
+        self.addons_widget = AddonsWidgetEditor(Profile)
+        self.addons_widget.setObjectName(u"addons_widget")
+
+        self.formLayout.setWidget(3, QFormLayout.ItemRole.FieldRole, self.addons_widget)
+
+
+        self.retranslateUi(Profile)
+
+        QMetaObject.connectSlotsByName(Profile)
+    # setupUi
+
+    def retranslateUi(self, Profile):
+        Profile.setWindowTitle(QCoreApplication.translate("Profile", u"Form", None))
+        self.label.setText(QCoreApplication.translate("Profile", u"Profile", None))
+        self.label_4.setText(QCoreApplication.translate("Profile", u"Profile Persistence", None))
+        self.label_2.setText(QCoreApplication.translate("Profile", u"Custom Preferences", None))
+        self.label_3.setText(QCoreApplication.translate("Profile", u"Custom Addons", None))
+    # retranslateUi
+
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'single_build_selection.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QLabel, QSizePolicy,
+    QWidget)
+
+from mozregui.utils import BuildSelection
+
+class Ui_SingleBuildSelectionPage(object):
+    def setupUi(self, SingleBuildSelectionPage):
+        if not SingleBuildSelectionPage.objectName():
+            SingleBuildSelectionPage.setObjectName(u"SingleBuildSelectionPage")
+        SingleBuildSelectionPage.resize(510, 335)
+        self.formLayout = QFormLayout(SingleBuildSelectionPage)
+        self.formLayout.setObjectName(u"formLayout")
+        self.label = QLabel(SingleBuildSelectionPage)
+        self.label.setObjectName(u"label")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.LabelRole, self.label)
+
+        self.build = BuildSelection(SingleBuildSelectionPage)
+        self.build.setObjectName(u"build")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.build.sizePolicy().hasHeightForWidth())
+        self.build.setSizePolicy(sizePolicy1)
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.FieldRole, self.build)
+
+
+        self.retranslateUi(SingleBuildSelectionPage)
+
+        QMetaObject.connectSlotsByName(SingleBuildSelectionPage)
+    # setupUi
+
+    def retranslateUi(self, SingleBuildSelectionPage):
+        SingleBuildSelectionPage.setWindowTitle(QCoreApplication.translate("SingleBuildSelectionPage", u"Form", None))
+        self.label.setText(QCoreApplication.translate("SingleBuildSelectionPage", u"Build from:", None))
+    # retranslateUi
+
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'skip_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.9.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QHBoxLayout, QLabel, QSizePolicy, QVBoxLayout,
+    QWidget)
+
+from mozregui.skip_chooser import SkipChooserView
+
+class Ui_SkipDialog(object):
+    def setupUi(self, SkipDialog):
+        if not SkipDialog.objectName():
+            SkipDialog.setObjectName(u"SkipDialog")
+        SkipDialog.resize(508, 353)
+        self.verticalLayout = QVBoxLayout(SkipDialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.label = QLabel(SkipDialog)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout.addWidget(self.label)
+
+        self.gview = SkipChooserView(SkipDialog)
+        self.gview.setObjectName(u"gview")
+        self.gview.setMouseTracking(True)
+
+        self.verticalLayout.addWidget(self.gview)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.lbl_status = QLabel(SkipDialog)
+        self.lbl_status.setObjectName(u"lbl_status")
+
+        self.horizontalLayout.addWidget(self.lbl_status)
+
+        self.buttonBox = QDialogButtonBox(SkipDialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Ok)
+
+        self.horizontalLayout.addWidget(self.buttonBox)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+
+        self.retranslateUi(SkipDialog)
+        self.buttonBox.accepted.connect(SkipDialog.accept)
+        self.buttonBox.rejected.connect(SkipDialog.reject)
+
+        QMetaObject.connectSlotsByName(SkipDialog)
+    # setupUi
+
+    def retranslateUi(self, SkipDialog):
+        SkipDialog.setWindowTitle(QCoreApplication.translate("SkipDialog", u"Build skipped", None))
+        self.label.setText(QCoreApplication.translate("SkipDialog", u"<html><head/><body><p>Your build was skipped!</p><p>Please choose a new one to test (default is the mid build):</p></body></html>", None))
+        self.lbl_status.setText("")
+    # retranslateUi
+
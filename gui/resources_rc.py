@@ -0,0 +1,1319 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.9.3
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x13\x04\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\xc3zTXtRaw prof\
+ile type exif\x00\x00x\
+\xdamPA\x12\xc3 \x08\xbc\xf3\x8a>A\x01\x15\x9f\
+c\x9at\xa6?\xe8\xf3\x0b\x81db\xd3u\x5c\x81u\
+V\x04\xb6\xcf\xfb\x05\x0f\x03f\x06.Mj\xaf5)\
+\xb8s\xc7\xa1\x81$\xc7\xd89'\xdey\x07\x86\xa4\xf9\
+T\x87S@-\x91\x9e\xe4\xa9\xd4\xb8\x7f\xd4\xf3i\xe0\
+\xc7\xd0\xa8\x5c\x8c\xe4\x19\xc22\x0b\x9d\xc3_~\x8c\xe2\
+e\xb2\x8e,^\xc3\xa8\x87\x11\xa1\x0b9\x0c\x86\x7f+\
+\xd5.\xed\xfa\x85eK3\xc47\x18\xb1\xccm\xdf\xf2\
+\xa6\xd3[\x8b\xbeC\x88\x1beJ\xcaD\xec\x0d\x90m\
+\x02\x1a\x1a\xb02\x92\xd8E]\x83\x8a.\xab\xb40\xd3\
+\x81\xfc\x9b\xd3\x01\xf8\x02\xda\x1fY\x14\xa5\x98\x97\xc7\x00\
+\x00\x01\x83iCCPICC profi\
+le\x00\x00x\x9c}\x91=H\xc3@\x1c\xc5_\xd3\
+J\x8bT\x1c\xec \xa2\x90\xa1:\xd9E\xa58\xd6*\
+\x14\xa1B\xa8\x15Zu0\xb9\xf4\x0b\x9a\xb4$).\
+\x8e\x82k\xc1\xc1\x8f\xc5\xaa\x83\x8b\xb3\xae\x0e\xae\x82 \
+\xf8\x01\xe2\xea\xe2\xa4\xe8\x22%\xfe/)\xb4\x88\xf1\xe0\
+\xb8\x1f\xef\xee=\xee\xde\x01B\xab\xca43\x90\x004\
+\xdd22\xa9\xa4\x98\xcb\xaf\x8a\xc1W\x040\x06\x01q\
+\x84df\xd6\xe7$)\x0d\xcf\xf1u\x0f\x1f_\xefb\
+<\xcb\xfb\xdc\x9fc@-\x98\x0c\xf0\x89\xc4\x09V7\
+,\xe2\x0d\xe2\xf8\xa6U\xe7\xbcO\x1caeY%>\
+'\x9e4\xe8\x82\xc4\x8f\x5cW\x5c~\xe3\x5crX\xe0\
+\x99\x11#\x9b\x99'\x8e\x10\x8b\xa5\x1eVz\x98\x95\x0d\
+\x8dx\x868\xaaj:\xe5\x0b9\x97U\xce[\x9c\xb5\
+j\x83u\xee\xc9_\x18.\xe8+\xcb\x5c\xa79\x8a\x14\
+\x16\xb1\x04\x09\x22\x144PA\x15\x16b\xb4\xea\xa4\x98\
+\xc8\xd0~\xd2\xc3?\xe2\xf8%r)\xe4\xaa\x80\x91c\
+\x015h\x90\x1d?\xf8\x1f\xfc\xee\xd6,NO\xb9I\
+\xe1$\xd0\xf7b\xdb\x1f\xe3@p\x17h7m\xfb\xfb\
+\xd8\xb6\xdb'\x80\xff\x19\xb8\xd2\xbb\xfeZ\x0b\x98\xfd$\
+\xbd\xd9\xd5\xa2G\xc0\xe06pq\xdd\xd5\x94=\xe0r\
+\x07\x18~\xaa\xcb\x86\xecH~\x9aB\xb1\x08\xbc\x9f\xd1\
+7\xe5\x81\xa1[\xa0\x7f\xcd\xed\xad\xb3\x8f\xd3\x07 K\
+]\xa5o\x80\x83C`\xa2D\xd9\xeb\x1e\xef\x0e\xf5\xf6\
+\xf6\xef\x99N\x7f?\x8d\xc3r\xb1\xbe\x8d\xac\xad\x00\x00\
+\x0dziTXtXML:com.ad\
+obe.xmp\x00\x00\x00\x00\x00<?xp\
+acket begin=\x22\xef\xbb\xbf\
+\x22 id=\x22W5M0MpCehi\
+HzreSzNTczkc9d\x22?\
+>\x0a<x:xmpmeta xml\
+ns:x=\x22adobe:ns:m\
+eta/\x22 x:xmptk=\x22X\
+MP Core 4.4.0-Ex\
+iv2\x22>\x0a <rdf:RDF \
+xmlns:rdf=\x22http:\
+//www.w3.org/199\
+9/02/22-rdf-synt\
+ax-ns#\x22>\x0a  <rdf:\
+Description rdf:\
+about=\x22\x22\x0a    xml\
+ns:xmpMM=\x22http:/\
+/ns.adobe.com/xa\
+p/1.0/mm/\x22\x0a    x\
+mlns:stEvt=\x22http\
+://ns.adobe.com/\
+xap/1.0/sType/Re\
+sourceEvent#\x22\x0a  \
+  xmlns:GIMP=\x22ht\
+tp://www.gimp.or\
+g/xmp/\x22\x0a    xmln\
+s:dc=\x22http://pur\
+l.org/dc/element\
+s/1.1/\x22\x0a    xmln\
+s:tiff=\x22http://n\
+s.adobe.com/tiff\
+/1.0/\x22\x0a    xmlns\
+:xmp=\x22http://ns.\
+adobe.com/xap/1.\
+0/\x22\x0a   xmpMM:Doc\
+umentID=\x22gimp:do\
+cid:gimp:73d660e\
+c-3722-40bb-aa80\
+-651dd30f947f\x22\x0a \
+  xmpMM:Instance\
+ID=\x22xmp.iid:f2ee\
+a8b1-cc05-4198-a\
+820-cfab03ce1a7b\
+\x22\x0a   xmpMM:Origi\
+nalDocumentID=\x22x\
+mp.did:e04227e8-\
+caa2-4f8f-b784-d\
+250436e7ea6\x22\x0a   \
+GIMP:API=\x222.0\x22\x0a \
+  GIMP:Platform=\
+\x22Mac OS\x22\x0a   GIMP\
+:TimeStamp=\x221682\
+736929370631\x22\x0a  \
+ GIMP:Version=\x222\
+.10.34\x22\x0a   dc:Fo\
+rmat=\x22image/png\x22\
+\x0a   tiff:Orienta\
+tion=\x221\x22\x0a   xmp:\
+CreatorTool=\x22GIM\
+P 2.10\x22\x0a   xmp:M\
+etadataDate=\x22202\
+3:04:28T22:55:27\
+-04:00\x22\x0a   xmp:M\
+odifyDate=\x222023:\
+04:28T22:55:27-0\
+4:00\x22>\x0a   <xmpMM\
+:History>\x0a    <r\
+df:Seq>\x0a     <rd\
+f:li\x0a      stEvt\
+:action=\x22saved\x22\x0a\
+      stEvt:chan\
+ged=\x22/\x22\x0a      st\
+Evt:instanceID=\x22\
+xmp.iid:baedab9f\
+-4104-498e-9d91-\
+975f2bb1358d\x22\x0a  \
+    stEvt:softwa\
+reAgent=\x22Gimp 2.\
+10 (Mac OS)\x22\x0a   \
+   stEvt:when=\x222\
+023-04-28T22:55:\
+29-04:00\x22/>\x0a    \
+</rdf:Seq>\x0a   </\
+xmpMM:History>\x0a \
+ </rdf:Descripti\
+on>\x0a </rdf:RDF>\x0a\
+</x:xmpmeta>\x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+                \
+                \
+                \
+                \
+                \
+\x0a               \
+                \
+                \
+                \
+                \
+                \
+     \x0a          \
+                \
+                \
+                \
+                \
+                \
+          \x0a     \
+                \
+                \
+                \
+                \
+                \
+               \x0a\
+                \
+                \
+                \
+                \
+                \
+                \
+    \x0a           \
+                \
+                \
+                \
+                \
+                \
+         \x0a      \
+                \
+                \
+                \
+                \
+                \
+              \x0a \
+                \
+                \
+                \
+                \
+                \
+                \
+   \x0a            \
+                \
+                \
+                \
+                \
+                \
+        \x0a       \
+                \
+                \
+                \
+                \
+                \
+             \x0a  \
+                \
+                \
+                \
+                \
+                \
+                \
+  \x0a             \
+                \
+                \
+                \
+                \
+                \
+       \x0a        \
+                \
+                \
+                \
+                \
+                \
+            \x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+                \
+                \
+                \
+                \
+                \
+\x0a               \
+            \x0a<?x\
+packet end=\x22w\x22?>\
+\xd2\xb0\xd0\x0a\x00\x00\x00\x06bKGD\x00\xff\x00\xff\
+\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\
+\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07t\
+IME\x07\xe7\x04\x1d\x027\x1d`\xe3\xb0\x9b\x00\x00\
+\x02\xadIDATX\xc3\xcd\x97M\x88\x8e]\x18\xc7\
+\x7f\xd7\xc3;\xd3d43\x98\x94\xc2\x86\xb7\x97\xc9g\
+D\x92\x8f\x94\xb7\xac\xde\x8d(\xab\xd7\xc6N\x16J\xb1\
+ba#\x85\xa2|\x95l\x94\x0d\x0b\x0b\xb3\x91\x85|\
+l&f^\xea%\x0b\x12\x92\xafY\xf8\x18f\xfcl\
+nu\xcfq\xcf\xf3\xdc\xb7\x1eq\xed\xce9\xffs\x9d\
+\xff9\xd7\xff\x5c\xe7:\xf0\x8b-\xf2\x0d\xb5\x0b\x98\x07\
+\xb4\xe4\xba\xbf\x00\xfd\x11\xf1\xb2\x8acu\x0a0\x1f\xa8\
+\xe5\xba?\x01\x03\x11\xf1&\x05\xb7\xab\xa7\xd4\xcf\x16\xdb\
+k\xf5\xaf\x0a\x8b\xcf\xc9\xe6\x14\xd9'\xf5\xb8\xda\xfe\x0d\
+\xdc\xa6\xde\xb4\xb1\xed\xad@`_\x09\x7f7\xd4\xd6\x1a\
+\xb0\x03XV\xc2\xef\xdd\x0a\x11(\x83]\x0el\x0f\xf5\
+.077p\x1f\xb8\x93h\xe0JD\x9c\xa8p\x02\
+\x01l\x03\xd6$\x1aX\x08\xcc\xce\xb5\xff\x0bu(\x11\
+]gD\x0c6X`.\xf0'0\x05\x18\x06^\x00\
+\xb7#\xe2i\x83y]\xc0\xebQ\xa2L\x03Sgr\
+M\xdd\xaa>\xac\x13\xd7k\xea\xca\x06$F\xafW\x81\
+\xc01\xcb\xd9\x88\xba\xa5,\x81H\x17\x8d\x88(\x98\xf4\
+\x0fp!\xe9\xee\x03\x1e\x03\x13\x80\xa5@gn\xec#\
+0;\x22\x9e\x14\x11\xa8\x7f$\xc5\xac/\xe7 \xaf\xd4\
+%\xc9\xf8D\xf5R\xe2jw\xd3B\x90\xc4\xfd\xc2\x18\
+\x98\xa9\xea\xb3\x0c3\xac\xaek&\x81\xfe\x1c\xe4\x9d\xba\
+a\x0c\x5c\x87\xbaB\x9d\xd6T\x11\xaa\x07\x0a\xc4\xd6\xaf\
+\xeeWW\xa9\xe3+\xe4\x88\x1f\x22\xd0\xad>\xa9\xa3\xfc\
+A\xf5\xa2\xbaI\xfd\xe3g]\xc3\x1e\xf5\xff\x12\xd7\xf0\
+\x91\xba\xb6\xe9\x04\xb2\xc9-Y2\xea\xcd^\xb5\xb1l\
+H]\xd5t\x02iZU7\xab\xa7\xd5\xc7\x05$\x06\
+~*\x81\x02\xc7\x7f\xab\xcf\x13w=\x8d\x08\xd4J8\
+nQ\xcf\xabo\xd5>\xb5\xbb\xb0\xb4\x8a\xe8\x05\x0e&\
+\xdd3\x1b\xf9\xaf\x95\xd8\xdc\x12`#\xd0\x01,\x02\xf6\
+\xd4\xc1v%\xedw\xd5\xef\xe5\xf7\xe3\xed\xea\x9b\x1cd\
+8\x13bZO\xae\xce\x92T^\x88\x93\x9b\x95\x07\x8a\
+J\xac{\xea9\xf5\xacz\xab`\xfcd3\x13\xd1\xb8\
+\x82\xc7\xa6\x9e\xf5\xab\x1d\xcdND-\xea\xde$\x1c\xa9\
+}P\x0f\xab\x9dU\xea\x81\xb4$\x9b\xf4]\xdd>\xda\
+A\x1b\xb0\x02X\x00L\x02F\x80\x97\xc0C\xe0jD\
+\xbc\xafR\x92\x15\x15\xa5\x0f\x80\xdb\xb9\xf6\x08\xd0\x1b\x11\
+g*\xe6\x85\x7f\x81\xf5\xc0\xb8\x5c\xf7\x22`V\xae=\
+\x80\xba\xabd\x5c\xd7WLJelg\x0d8\x04\xdc\
+,\xe1\xb7\xa7\xc2\x01\xcc)\x81\xb9\x0e\x1c\xc9\xdf\xf5\xe3\
+u\x1e\x98g\xea\xf4\x0a'0#W\x1d\x15=TG\
+\xd5\x09E\x9f\xd3\xce\xecs\xda\x9ah\xa0\xaf\xd1_\xa1\
+\xa8:\x02\x16'\x1a\x18\xca>\xba\x83\xfc.\xf6\x15\x7f\
+M\x04\xf7\x81\x80\x9dD\x00\x00\x00\x00IEND\xae\
+B`\x82\
+\x00\x00\x01\xb0\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
+\x00\x00\x00\x09pHYs\x00\x00\x0bP\x00\x00\x0bP\
+\x01R\x02\xf8\x1c\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x01-ID\
+ATX\x85\xcd\x97=\x0e\xc20\x0cF\x1f\x5c\x802\
+\x00\xe2\x1e\xc0M\xf99I\xcb9\xa0\x12\x0b*\x5c\x00\
+\x18\x19\xcb\x90F\x02\x04\x8d\x13\x1b\x15K\x9e\xe2\xfa}\
+\x89\x93&\x06g\x0b`\x0b\xdc\x80\x0aX\x01\x19v\x96\
+\x01k\xe0\xd40\x0a`\xe6\x07\xe7\xc0\x1d\xa8\xdf|\x0f\
+\x8c\x0d\xe0c\xa0\xfc\x90\xff\xde\xb0)>\x0cz/\x95\
+\x22\xbe\xc1\xbd\x17\x00\xd7\x96\x00\x8d\x88\x10\xbc\x06.\xe0\
+\xea\xd2\x16T\x03\x07`\x1a\x09\xdf\x0b\xf2\x1e\xc1m\xb8\
+P`\xccJHf\xee}\x09n\x87J?\x08\x89\x88\
+\x81\x97<\x9d4\xe9\x92\xb5\x95C\x9dC\x93\xc0b\x02\
+\xc9\x89\xcc\xe0\xde&\xc4\xd51&v\x12\x82?\xaf\xc4\
+N\x98\xd8l\xe6\xef62\x12\x91\x04\xb7\x12\xa1\x82k\
+E\x98\xc0SE\x88\xe1}\xa1\x80^\xe3\x9dX\xcc9\
+7/A*\xdcD\x84\x16\xae\x12a\x05O\x12\xf1\xcb\
+_q\xf0=\x91r\xb1\xc4\x1cQ\xf3\x9b\xd0\x9bZ\x84\
+\xc5\x95\x9a,bH\xc7O\xb2\x8d\x11<E\xc4\x0a\xe0\
+\x1c\xbbd\x02\x93\x96\xa3\x82?hL\xbal\xcdrp\
+]jW\xcd\xe9K\x87\x9c\xe3\xcaQ\xe1:\x96\x81\x01\
+\xdc[\x86\xdbpU\xc3\xc8=\xfc\x01\xbd\xfd\x22.w\
+\x1a\x8eo\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x11\x92\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\xc6zTXtRaw prof\
+ile type exif\x00\x00x\
+\xdamP\xc1\x0d\xc30\x08\xfc{\x8a\x8e`s\xd8\x81\
+q\x9c&\x95\xbaA\xc7/6$J\xaa^d\x0cw\
+\xd6\x05H\xfb\xe7\xfdJ\x8f\x01*\x9c\xb8.\xd2\xb4\xb5\
+l`e\xa5n\x89dG\x9f\xb1d\x9eq\x82B\xb2\
+\xfa\xc6\xa7S \xa3`7\xbc\x94\x16\xef\x0f\xbe\x9c\x06\
+~u\xcb\xea\xc5H\x9e!\xacwA9\xfc\xe5\xc7(\
+~\x84\xd1\xd1\xe8b\x0b#\x0d#\x90\x0b%\x0c\xba\x8f\
+\x95\x9b\xcar\x1da\xdd\xf3\x1d\xe2'\x8d\xb0\xb1\x8f^\
+\xd4\xb5\xdf\x9a\x17\xdb\xdeV\x8d\x04\xd1\x8e\x82l\x11`\
+o\x00\xe3 \xa1[\xc2\x16\x092\x1e\xda\xd7Q\xd1&\
+\x7f\x8cj\x0b\xf9\xb7\xa7\x03\xe9\x0b\x11\xdfY\x80O\xa1\
+\x06A\x00\x00\x01\x83iCCPICC pr\
+ofile\x00\x00x\x9c}\x91=H\xc3@\x1c\
+\xc5_\xd3J\x8bT\x1c\xec \xa2\x90\xa1:\xd9E\xa5\
+8\xd6*\x14\xa1B\xa8\x15Zu0\xb9\xf4\x0b\x9a\xb4\
+$).\x8e\x82k\xc1\xc1\x8f\xc5\xaa\x83\x8b\xb3\xae\x0e\
+\xae\x82 \xf8\x01\xe2\xea\xe2\xa4\xe8\x22%\xfe/)\xb4\
+\x88\xf1\xe0\xb8\x1f\xef\xee=\xee\xde\x01B\xab\xca43\
+\x90\x004\xdd22\xa9\xa4\x98\xcb\xaf\x8a\xc1W\x040\
+\x06\x01q\x84df\xd6\xe7$)\x0d\xcf\xf1u\x0f\x1f\
+_\xefb<\xcb\xfb\xdc\x9fc@-\x98\x0c\xf0\x89\xc4\
+\x09V7,\xe2\x0d\xe2\xf8\xa6U\xe7\xbcO\x1cae\
+Y%>'\x9e4\xe8\x82\xc4\x8f\x5cW\x5c~\xe3\x5c\
+rX\xe0\x99\x11#\x9b\x99'\x8e\x10\x8b\xa5\x1eVz\
+\x98\x95\x0d\x8dx\x868\xaaj:\xe5\x0b9\x97U\xce\
+[\x9c\xb5j\x83u\xee\xc9_\x18.\xe8+\xcb\x5c\xa7\
+9\x8a\x14\x16\xb1\x04\x09\x22\x144PA\x15\x16b\xb4\
+\xea\xa4\x98\xc8\xd0~\xd2\xc3?\xe2\xf8%r)\xe4\xaa\
+\x80\x91c\x015h\x90\x1d?\xf8\x1f\xfc\xee\xd6,N\
+O\xb9I\xe1$\xd0\xf7b\xdb\x1f\xe3@p\x17h7\
+m\xfb\xfb\xd8\xb6\xdb'\x80\xff\x19\xb8\xd2\xbb\xfeZ\x0b\
+\x98\xfd$\xbd\xd9\xd5\xa2G\xc0\xe06pq\xdd\xd5\x94\
+=\xe0r\x07\x18~\xaa\xcb\x86\xecH~\x9aB\xb1\x08\
+\xbc\x9f\xd17\xe5\x81\xa1[\xa0\x7f\xcd\xed\xad\xb3\x8f\xd3\
+\x07 K]\xa5o\x80\x83C`\xa2D\xd9\xeb\x1e\xef\
+\x0e\xf5\xf6\xf6\xef\x99N\x7f?\x8d\xc3r\xb1\xbe\x8d\xac\
+\xad\x00\x00\x0dziTXtXML:com\
+.adobe.xmp\x00\x00\x00\x00\x00<\
+?xpacket begin=\x22\
+\xef\xbb\xbf\x22 id=\x22W5M0MpC\
+ehiHzreSzNTczkc9\
+d\x22?>\x0a<x:xmpmeta \
+xmlns:x=\x22adobe:n\
+s:meta/\x22 x:xmptk\
+=\x22XMP Core 4.4.0\
+-Exiv2\x22>\x0a <rdf:R\
+DF xmlns:rdf=\x22ht\
+tp://www.w3.org/\
+1999/02/22-rdf-s\
+yntax-ns#\x22>\x0a  <r\
+df:Description r\
+df:about=\x22\x22\x0a    \
+xmlns:xmpMM=\x22htt\
+p://ns.adobe.com\
+/xap/1.0/mm/\x22\x0a  \
+  xmlns:stEvt=\x22h\
+ttp://ns.adobe.c\
+om/xap/1.0/sType\
+/ResourceEvent#\x22\
+\x0a    xmlns:GIMP=\
+\x22http://www.gimp\
+.org/xmp/\x22\x0a    x\
+mlns:dc=\x22http://\
+purl.org/dc/elem\
+ents/1.1/\x22\x0a    x\
+mlns:tiff=\x22http:\
+//ns.adobe.com/t\
+iff/1.0/\x22\x0a    xm\
+lns:xmp=\x22http://\
+ns.adobe.com/xap\
+/1.0/\x22\x0a   xmpMM:\
+DocumentID=\x22gimp\
+:docid:gimp:24db\
+ac8d-ee73-46b1-9\
+9f6-7a99c1f20a4d\
+\x22\x0a   xmpMM:Insta\
+nceID=\x22xmp.iid:b\
+9bb39af-8f9d-44d\
+b-a467-866f2c5f6\
+8bc\x22\x0a   xmpMM:Or\
+iginalDocumentID\
+=\x22xmp.did:b9532e\
+87-11d7-4068-acf\
+5-9fe699d425d3\x22\x0a\
+   GIMP:API=\x222.0\
+\x22\x0a   GIMP:Platfo\
+rm=\x22Mac OS\x22\x0a   G\
+IMP:TimeStamp=\x221\
+682736967109049\x22\
+\x0a   GIMP:Version\
+=\x222.10.34\x22\x0a   dc\
+:Format=\x22image/p\
+ng\x22\x0a   tiff:Orie\
+ntation=\x221\x22\x0a   x\
+mp:CreatorTool=\x22\
+GIMP 2.10\x22\x0a   xm\
+p:MetadataDate=\x22\
+2023:04:28T22:56\
+:05-04:00\x22\x0a   xm\
+p:ModifyDate=\x2220\
+23:04:28T22:56:0\
+5-04:00\x22>\x0a   <xm\
+pMM:History>\x0a   \
+ <rdf:Seq>\x0a     \
+<rdf:li\x0a      st\
+Evt:action=\x22save\
+d\x22\x0a      stEvt:c\
+hanged=\x22/\x22\x0a     \
+ stEvt:instanceI\
+D=\x22xmp.iid:a93a8\
+7ab-3ae8-499b-96\
+fc-0c69fb7548e7\x22\
+\x0a      stEvt:sof\
+twareAgent=\x22Gimp\
+ 2.10 (Mac OS)\x22\x0a\
+      stEvt:when\
+=\x222023-04-28T22:\
+56:07-04:00\x22/>\x0a \
+   </rdf:Seq>\x0a  \
+ </xmpMM:History\
+>\x0a  </rdf:Descri\
+ption>\x0a </rdf:RD\
+F>\x0a</x:xmpmeta>\x0a\
+                \
+                \
+                \
+                \
+                \
+                \
+    \x0a           \
+                \
+                \
+                \
+                \
+                \
+         \x0a      \
+                \
+                \
+                \
+                \
+                \
+              \x0a \
+                \
+                \
+                \
+                \
+                \
+                \
+   \x0a            \
+                \
+                \
+                \
+                \
+                \
+        \x0a       \
+                \
+                \
+                \
+                \
+                \
+             \x0a  \
+                \
+                \
+                \
+                \
+                \
+                \
+  \x0a             \
+                \
+                \
+                \
+                \
+                \
+       \x0a        \
+                \
+                \
+                \
+                \
+                \
+            \x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+                \
+                \
+                \
+                \
+                \
+\x0a               \
+                \
+                \
+                \
+                \
+                \
+     \x0a          \
+                \
+                \
+                \
+                \
+                \
+          \x0a     \
+                \
+                \
+                \
+                \
+                \
+               \x0a\
+                \
+                \
+                \
+                \
+                \
+                \
+    \x0a           \
+                \
+                \
+                \
+                \
+                \
+         \x0a      \
+                \
+                \
+                \
+                \
+                \
+              \x0a \
+                \
+                \
+                \
+                \
+                \
+                \
+   \x0a            \
+               \x0a\
+<?xpacket end=\x22w\
+\x22?>\x92BN\xd7\x00\x00\x00\x06bKGD\x00\
+\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pHY\
+s\x00\x00\x0bP\x00\x00\x0bP\x01R\x02\xf8\x1c\x00\x00\
+\x00\x07tIME\x07\xe7\x04\x1d\x028\x07\x1a\x19U\
+.\x00\x00\x018IDATX\xc3\xcd\x97AN\xc3\
+0\x14D\x87^\x80\xb0 \x157`\xc12\xe5\xa6\xa4\
+\x9c\xa4\x01!q\x08\x1a\x89\x0dJ\xb9\x00e\xd9\xe5\xeb\
+\xc6\x96\x8a\xa0\xc1\xdf\xfe%\x8c\x94U\xac\x99\xb1\xc7\xdf\
+\xf6\x97$\x01\xb7\xc0\x03\xf0\x09\x0c@\x0bTr\x02P\
+\x01K`\x134:\xa0\x89?\x17\xc0\x8e\xefX\x03\xb5\
+\x83x\x0d\xf4?\xf0\xef\x80\x85\x82\x9bc\xe8KL\x8c\
+\x88Gt\x02\xb6\x8c#\xcbD\x828\xc0\x87B.\xbf\
+\xe1\x15\xb82\x8a\xaf\x13x\xdff\x92\xba\x04\xcekI\
+O)+\x11\xc6<K\xbaI\xe0}\x8c;\xb4'\x0d\
+\xa3q$.\xfb!We]\xb2\xa3q\x14s\x94\x10\
+xL \x9b\xc8M\xfc\xc0\xc4\xdc\x98\xa3e\xec\xdcR\
+F/\xf8\xc1T\xc6\xd1\xc4\xa5\x93\x09\xbb\xb8\xa3\x89|\
+q\x07\x13\xe5\xe2\x05&\x92\xc5g\x89\x1e\xce\xc2\xf7\xf7\
+0\xd6\xb9{\xfe\xb9\xe2.\x15P*^t\x06x\x89\
+\xdbM\x9c\xf8(\xae=g\x1e/#K\x89\xfa\xde\x84\
+\x99\xe7\x84\xef[\xa0\xd8\x04p1\xe9\x93\x0c\xb8w\xdb\
+Dv\x13\xad\x80\xf7\x13<\xcbS\xe3\x18\xfeEc2\
+ek\xb6\x12\xd0L\xd8\x9c~\xe9\x90W!\x8e\x01\xb8\
+\x03\xce\x9d\xdb\xf36po\x83V#I{\xbe\xbdY\
+\xc5\xa5\xa3\xd3P\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x02\x0c\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x01\xd3IDATX\x85\xed\x95M(\x05Q\
+\x14\xc7\x0fy\xe4\xa3\xa8\x87\x90W\xc8G$\x0b6\x8a\
+\xb2P\xde\xc6BYX\xd8X\xbc\x94\x05\x1bzIR\
+\x8a\xb0\xb2\xb0\xe1e\xc1\x86\x92,lQ\x16JJ)\
+\x92b\xa9,\xc8G\xc2\xc2\xc7\xe3\x7f\xdc3\xcd}\x13\
+\x9aW\xcf]\xcd\xbf~5\xf7\x9c\x99\xfb?s\xef\xb9\
+3D\x9e<y\xfa?\x95\x82Z\x90d\xda\xb8\x0c\xec\
+\x81O\xe1\x04\x94\x982\xcf\x00\x17b|\x03.\xe5\xfa\
+\xc0T\x01\x03bx\x082\xa5\xa0[\x89\x05L\x14\xb0\
+.f\xddZ\xec\x5cb5&\x0b\xe8\x91q\x93\x8c\x9f\
+@\xaa\x89\x02\xfa\xc4\xf0\x0a,\x81\x07\x19\x0f\x9b0g\
+\xf9\xc0\x16\xd9'\x80\xd9!Coo)B\xb1G0\
+\x9b\xd4\xb7\xa0\x15\xcc\x80\x05\xd0\x0f\xb2\xfe\xc3<\x17\xbc\
+\x88\xf9\x07h\x03!pJ\xb1\xabbmSU\x22L\
+\x8bA\x10\x84I-\xb7e\xf0\x06\xde\xb5\xf1\x1d\x18\x05\
+\xbd`Wb\xdb\xf1\x18\xa5\x80F\x99`N&\xb1\xce\
+\xb8\x1b:\xb5\xb9\xf2%\xf6\xec\xd6\x9c\xf7k?\x0e3\
+\xfd\xad\xad\x930A\xaa\x17\xf8E\xc6\xc9\xee\x11W\x0a\
+\xffb\xf0\x08\x8e\xc1&\xb8\xd6\xe2\xab\xa4\x9a\x8f\xc5\xdb\
+cm\xc5\xbd<\xc3\xd7Q\xd0\xe1\xb6\x80!R\xcb>\
+Hj)\x1b\x80_\xcb\x17\x82W\xb2\x9b\xcf\xf9\xd5c\
+\xa33\xad@.\xba\xdd\xad\xb9\x1b\x8di\x93o\xfcq\
+_\x1e\xc8I\xa4\xb1\xa5Y\xb0&\xd4\xc7\xfb\xf0\x88\xf6\
+\xf0\xa4\xc4\xb8\xcay-\xce,\x92\xfa\xbb\xb1\xa6\x1d\xb9\
+\x15\xb2\xff\xf9!G\x8ei\x96\x5cP\x8b-\x93:\x0d\
+\xdf\x1f\x04k\xf9\xb8I\x92I\xedq\x94b\x1b\x8e\xc7\
+\x15 \x8d\xd4\xf1q6d\x97\x98\x1c\xfd\x90\x9b\x92\x5c\
+\xc4\x11o\xe1`\x81\x182E\xda\xcaTjq\xa6\x5c\
+\xcb\x05\x1c\xb9:-\xe7w\xe4xK|\x92K\xd7\xe2\
+\xd5\xe4\xc9\x93'\xe8\x0b&\xd0\xa7hd\xfe\xfcQ\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x02\x9d\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x02dIDATX\x85\xcd\x97?lOQ\
+\x14\xc7O\x8b\x8a\x22m\xa3\x22i0\xa3\xab\xa9\xd1\x9f\
+\xf8\x13ML\x9dhb)\x11\xb1H\x10\x8d\xb0\x91\xa6\
+\x8b\x85\x81D\xb0X\x88\xa5\x06Ck&e\xd0AC\
+\x82\x18\x88\x84\xc5\xbf\xa1\x91\x16\xe1\xfb\xed\xbd\x8d\xe3\xbc\
+{\xdf\xef\xbe\x97\xf7\x92\x9e\xe4\xb3\xbc{\xfe|\xf3\xde\
+\xbd\xe7\x9e'\xb2\xc4\xac\x0b4\xc0^\xc5n\xd0]\x22\
+W\xb7\x8f\xd5\xb9\x1a\xbeF\xc6\xd6\x80\x9b\xe0'\xf8\x13\
+\xe0\x0b\xd8R\xa0\xf8V\x1f\x13\xca5\x0f\xae\xfb\x9a\x0b\
+\xb6\x0a<\x898k.\x14\x10p1!\xdf\x14XI\
+\xe7s\x09\xce\xe4@\x01\x01\x07\x13s\x8e\xd0\xf9\x85y\
+\xf8\x0a\xdcS\xdc\x05\xc7\x0a\x14\xa7\xb5\x80\xe3>V\xe7\
+zmj\xcd\xd0y\xce<\xecH(\xb0\x0d\x0c\x82\xa3\
+`\x18\xec\x07=\x09q]\xa6\x16kg^K\xccZ\
+\xc1\x11\xf06\x10\xb3\xc8#\xb0\xa3\x89\x88L\xbdT\x01\
+\xd7r\x0ak~\x83CU\x0b\x18\x0c\xf8=\x03\xe3\xe0\
+!\xf8j\xd6~\x80\x8dU\x0a\x98P\xeb\x9f\xc1v\xb3\
+\xbe\x16<0y\xceW)@\x7f\xf7\xf1\x88\xcf\x06\xf0\
+\xd1\xfb\xfc\x02{\xaa\x14\xf0\x5c\xad\xcf\x8a\xdb\xf5!\xe3\
+\x09\xea\x93\xfc\x13QJ\xc0\xa5\x80\x1fE\x8d\x89\xeb\xef\
+\xcbs\x0aV\x22`=\xf8\x10\xf0]\xe4;\xb8/\xae\
+\x03\xae\xa8C\x00\xadW\x5c\x97lv\x0c\xdf\x81]u\
+\x08\xa0\xb5\x89kF\x93\xe2n\xb5\x98\x08v\xb8F\x1d\
+\x02\xb4\xb1\xad\x0e\x81[\xe0} \xcfL\xdd\x02\xac\x0d\
+\x80O&Wo\x15\x02\xf8\xday\x93}\x03\xd3\xe26\
+d\xccFL\xae\xd0q-,\xa0\xcf\xac_\xce\x110\
+f|wV!\x80\xa3\x93\xee\xf5\xecr\xdc\x88-\xc6\
+\x8f\xc5f\x95\x1f7\xe2\xba*\x04\xd0B#\xd6Kp\
+\x07\xdc\x06O\x03\xeb7\x22\xb9J\x09X&\xd9\xcb&\
+\x0fv\xc9\xd8`S\xfa\x14p3r0\xb5W\xaf\x86\
+\xd7\xf0\x15\xd0\x99\x93'S\xcf\x8ed\xc1\xb9]\x19\xa7\
+h\xdet\xa7\xc1\xa8\x17uB\xdc\x8eoo\x12\x1b\x1c\
+\xc9\xecP\xca\xc1Q\x0f\x92\xfc\xce\xc3M\x12\x87\xec\xb0\
+\x8f\xd5\xb9\xdeH\xf6S\xc9Y\x89\xbfR\xcd\xbe\x02\xc5\
+\x07\x12s\x9e\xa13\x7f\x0e\xa6\x12\x9cO\x15\x10p2\
+!\xdfcq\xfbj\xc1x\xd6\xf9\xbb\x14\xbb`8\xe9\
+l* `\xb3\xfc\x9b\x8e,\xfc\xeeW\xc1\xeaP \
+wo\xbf\xfc\xffC\xc9\xab5\xe5_\xc1Z\x87\x8f\xd5\
+\xb9\xfaK\xe6\xaa\xcf\xfe\x02]\xa1\xc9-\x80\xe4\x89\xd5\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x0f\xbf\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\
+\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\
+\xe1\x07\x1f\x0e:\x1ay\xc3\xf3W\x00\x00\x00\x1diT\
+XtComment\x00\x00\x00\x00\x00Cr\
+eated with GIMPd\
+.e\x07\x00\x00\x0f#IDATx\xda\xed\x9by\
+tTU\x9e\xc7?\xef\xd5\x96\xaaTe\x83$\x10@\
+\xc0\xb0\xf4\x00\x19G!-M\xc3@\xa3\x22;\xdd\x0d\
+\x82\xdd\xa32\xda\xa2\xfd\xc7\x18\xf4\x08\xb6\x8c\x0b\xeaQ\
+\x10\xfb\xd8\xd3\x88\x08\x1c\xa5\x95\x01\x8dBO\x0b4\x8a\
+@\xbb\x80\x0c&n\x80\x80\x11\x8c,\x091\x90\xa5\xb2\
+\xd7\xfa\xde\xbb\xf3\xc7{U\xa9$\x95TU\x88\xcc8\
+\xed\xf7\x9c:\xc9\xbd\xef\xd6\xbd\xf7\xf7\xbb\xbf\xfd\xbe\x82\
+\x1f\xf0\x03~\xc0\xdf3\xa4\xcb\xb8\xd65\x0e\xbbt\x95\
+\xc7+\xb2\x814 \xc5$\xe3\xd1\x04\x0e!\xe8\x05\xa4\
+\x03Y@\x06`\x06\xdc\x80\x004\xc0\x02$\x19m7\
+\xf0-p\x0e\xf8\x04\xd8\xfc}`\x80\x0c\xa8\xf1\x0eN\
+\xb2IX,2\xb2\x04-^\x0dE\x11\x00\xf4J7\
+\xe1r\x9a\x90\x803\xe5\x01\x80[\x81-Q\xa6\x18i\
+|\x06\x01\x03\x0c\xe6:\x81z\xa0\x1ax\x0b\xf8\xe0;\
+a\xc0\xd8\xa1f\xa9\xe8kc\xc7\xad\x18\x02|=n\
+L2\x93\x7f\xea\xc2f\x93\x19\x93\xe7\xa0o\xb6\x85\xa0\
+\x22Hu\x99Hv\xc8\xa48M8]&\x90%\x10\
+\xc6\x14R\xc4\x165\x01\x02v\xbf\xdb\xc0\xf4\xdbJ\xbf\
+\x02\xfe\xc1\x90\x96\xb9\xc0\x14`<0,\xce\xadz\x80\
+\xc5\xe6\x9e$~\xce\x18\x0b;>\x0d\x8a(\x8fL\x00\
+\xfd\xfaXy\xe4\xde\x1cTUt:\x87\xd7\xa3\xc5\x5c\
+\xe7\xe7w~\x03\xf0\xa6\xa1\x02c\xba\xb9]\x07\xb0\xac\
+G\x19p\xf3\xb8$v|\x1al\xdf=\x17x\x01\xa0\
+\xb1IE\x96AU\xbb\xa9G2<\xb9\xba\x92@@\
+p\xddx\xd7\xb2\xdc\x816\xea\x1bUlV\x09\xafO\
+\xf0\xf5\x19\x1f\xdf^\x0cR]\xab\xc4;\xe5\xbe\x1eW\
+\x81\xc2\x02\x17\xbfz\xae\x09\xa0\x0f\xb0\x17\xc8\xeb\xdf\xdb\
+\xc2\xf9\x9a 3\xafO\xe5//\xe5\x86u\xba;\xa8\
+kPHO5c\xb5J(\x8a@\x96%\x84\xd05\
+\xc5l\x96\x90dt\x15\xd2\x04>\xaf\xc6\xf1\xaf\xbc\xbc\
+{\xa8I,[Q!\x89\xb6\xcb\xb6\x00N\xb9\xa7\x19\
+`\x10\xff[\xa0\x12\xc8\xbb{Z\x06\xdb\x1f\x19\x08@\
+\x83!\x01\x97\x82\xf4T]h\x03\x01\x81\xa6\x81\xa2\x08\
+TU\xa0(\x02\x9fO\xc3\xeb\xd1\xf06\xabx=\x1a\
+B\xc0\xc8\xe1v~95\xad=\xf1\x00K0\x0cH\
+O\xe3\x0d`\xbe\x04lX\xdc\x8f\x1b\xafqq\xb1N\
+\x17I\x7f@\xb4\xb1i\x97\x03&Y\xe2\xa5\xc2\x9a\xf6\
+\xdd\xa7\x80\xf5=\xcd\x00\x19x\x17\x98te_+;\
+\x1e\x1d\x88\xdd*\x13T\x04Vc\x15\x8fGC\x96$\
+\xc3\x9d_\x1e\x04\x14\x8dg^\xb8\xd8\xbe\xfb\x96\xc8M\
+\xf7\x14>\x02&\xddp\xb5\x93\x03\xcf\xe4b\xb7\xb6N\
+\x9d\x92l\xd2\x95\xce\xab^\xd6\xd0K\x92\xe0O\x85\xb5\
+\xed\xbb\xb7\x1a\xde\xa3G\x19\xf0\x07\xe0\xc7c\x86\xd9y\
+\xe5\xfe\x01\xf8\x02m]Y\x92E\xc6a\x93\xf0\xf9\xc5\
+ee\x80\xc5,\xb1xyydW3\xb0\xa0\xbd\xd8\
+^*\xae\x06\xeeKq\xc8l[v\x05^\x7fG?\
+\xae\x09AV\x9aY\xb7\xfe\x97\x91\x01[w\xd5\xb5\xd9\
+\x060\x22\x9a\xde^*v\x01\xac\xbf\xa7\x1fj'1\
+\x8c\x10\xe0H\x92\xb9\x9c\x90e\xb8k\xe9\xb9\xc8\xae\x89\
+@yO3`9\x903{\xac\x8b\xf1#\x92cZ\
+HM\x88\xb8\xf4\xd6b\x968\xf2\xa5\x97\xc2\x1dn>\
+\xfb\xc2\x83)\x81]\xb6x5\xec.\x13\x0f<y\x9e\
+\xe6\xd6\xa8\xf2^\xe0`\xb4\xf1\x97\xe2\x05\x9c\xc0c\x00\
+\xab\xee\xe8K Fpc6I47kz\x90\xd2\
+\x99\xceZ$\x1e\xfd\xfd\xb7\xacz\xe1\x02Z\x844\xd9\
+\xac\x12\xff\xf5b.S&\xa6\xc4\x0c\xa2\x82\x01A\xff\
+\x7f:JEe8\x22-\x02Vwu0\xdd\xc5Z\
+\x80\x95\xb7\xf7\xc1j\xeaZ\xb15\x01\xa9N\x13\xb2,\
+u\xea\x01%`\xcc\xb4\x12V>\xdf\x96\xf8P\xfc0\
+sa)o\xect\xc7\xdcTF\xba\x89\xa7\x1e\xc8\x89\
+\xec\x1a\x17K2\xbb\x83L\xe0\xb6$\xab\xc4o\xa6\xa4\
+\xc7\xf4\xeaB@\xb2M\xd6\xc3\xd4NN\xfe\xb7\xcb\xca\
+8\xfa\xa5\x97\x9c\x9c\x1c\xf6\xec\xd9\x83\x10\x02!\x04G\
+\x8f\x1ee\xf6\xec\xd9\x00\xfc\xeb\xbdg\xb1\x98c0[\
+\x83[\xe7\xf5b\xea\xa4\x94P\xd7\x84\xef\x82\x01\xb7\x03\
+L\x18\x99\x8c\xc7\x1f\x7fP\xe3\xf1hQW<w>\
+\xc0\xa6m\xb5dffRQQ\xc1\x94)S\xd8\xba\
+u+\x0f=\xf4\x10\x95\x95\x95\xec\xd8\xb1\x83\xbb\xee\xba\
+\x0bU\x83\xbb\x1e8\x87)\x86\xc4\xf9\xfd\x82\x97\xff0\
+(\xd2\xef\xf78\x03\x1e\x04\xf8\xc5\xb8\x14\x145\x0e\xc3\
+\x06\xad\x1e\x22J\xb6\xbcso=\x00\xabV\xad\xd2'\
+\x7f\xf0A\x16,X\xc0\x8a\x15+\x98:u*/\xbe\
+\xf8\x22\x1b6l@\x92$^\xdeZ\x1bW8\x9d\x91\
+n\xe6\xbeEY\x00\xd9\xc0\x9c\x9ed\xc0\x08\xa3\xc2\xc2\
+\xec\xb1)\x09Ee\x00Z;\x86\x99L\x12'\xbf\xf1\
+\xe9\xb2:aB\x1bF\x84\xf0\xd4SO\x010u\xea\
+T\x00>?\xe6\x89\xb9\x9e\xaa\x0a~9-=\xd4|\
+\xb8S\xe3\x1cRC\xa0\xafQMI3\x8a\x05N@\
+1\xb2\xbaR\xa0\x0a\xa8\x05&\x03\xfcx\xb8\xbd\x83\xb1\
+\xeaJ\x04\x82\x86\xf5n\x1f+h\x9a`@\x8eU7\
+,\x99\x99hQ&-/\xd7\xddwVV\x16\x00y\
+?\xb2cO\x92\xc1\x04j@ \x80\x86F\x15U\x03\
+W\xb2L0(8\xf0q3\x9f\x1ci\x09M1\xc6\
+8\xb8/\xa31\xa0\x10\xb89NR\x82\xc0Y\x80\x9f\
+\xfd\xa33\xa6\xebk\x1f\x0d\x02x\xbc\x1aV\x8b\xd4\xc6\
+@N\xfe\xa9K\xf7WEE\xdcx\xe3\x8d\xdct\xd3\
+Ml\xdb\xb6-<f\xd2\xa4I\x00\x1c8p@\x0f\
+=\xa7|\x81\xd9l\xe6tY@\x0f\xaf\xe3\xc3c\xc0\
+\xfch\x0c\x18\x97Hx\x0d\x0c\x05\x18?\xd2\x91\x90\xde\
+\x84b\xa0\x1aw\x90\x9clk\xdb:\xe25Nz\xa5\
+\x9b\x99?\x7f>%%%l\xdd\xba\x955k\xd6P\
+\x5c\x5c\xcc\xe8\xd1\xa3\xb9\xef\xbe\xfbx\xfb\xed\xb79s\
+\xe6\x0c\xfdG\x8de\xd4\xaf\xee\xa7\xae\xfck2\xfc\x1e\
+4%\x88\xaa\x04\x91\x90\xb08\x92q\xa4\xf6\xc6\x91\x9e\
+Ej\xdfA\x98\xadIT\x95\x1ee\xe7\x13\x0b\x01\xc6\
+vf\x9f^o\x9f \xc4+\xd6\xef\xaf\xbc\x92\x01\x99\
+\x96\xb8r\xf2e\xafT\xf2\xfa\xfe\x06>|s8\xa3\
+\xf3:2\xef|e\x80Q\x93\xbf\xc4d\xb6\xb1e\xcb\
+\xab\xe4\xe5\xe5\xe1t:\x11B\xb0n\xdd:\x9e|\xf2\
+I\xec)\xe9\xdc\xf9\x9fG\xb1:\x5cm7\x22\x19\x7f\
+\x85\xe8\x90j\xfb\x9a\xeaX;\xf7\xcaN\xab\xe0f\xa3\
+<\xdc\x86\x01\xd3\x86'\xe3\xb4\xca\xf4O\xb5\xe0\x09j\
+ @\x92%\xb2\x9d&\xae\xeak#\xbf\x9f\x1d\xb3C\
+\xe2l\x93\x82\x94\x1du\xddv\xa7/Hw\xea)q\
+M'\xf5\xba\xfe}\xad|u`$\xe3\xe6|\xc5\xdc\
+\xb9s;<\xef3\xfcj\x16n8\x84\x12\xf0\xb5\x9f\
+\xddX;\xfa\x06\x9c\xbd\xfaF6G\x03\x9f\xb5g\xc0\
+z`]\x9b*\xe6\xa8\x14\xae\xcfu\xa0\x8aV\xe6\x86\
+\xd7\x01\x02\xaa \xd0$\xc8B\x86\x12\x05\xc9*!\xb2\
+eH\x8e\x1e\xe9\x09\x01\xa9FM\xc0f\xed\xdc\x87\xf5\
+\xc9\xb4P\xf9\xf9Ul\xdaV\xcb\xfe\xe2&>9\xec\
+\xe1\xf8I/\x00\x8b6\x7f\x8e\xa7\xbe\xbe[E\x01G\
+Z/<\xf5\xb5\xc8f\xcb\x0d\x9a\x12\xfc,\x9a\x1b\xdc\
+\x10\xd9\xf9\xe7\xe3\x8dH\x86\xdf\x12\x06\x01\x9d\x1e\xb0\x00\
+\xfc\x02\xe9\x9c\x8aT\xa6\xea~C\xea8$\xa4*.\
+\x97\xa9\xcb\xfdz}\x1a\xf3g\xa5\xb3~\xc5@\x8e\xed\
+\x1fI\xaft3\x92,\xa3v\xb7\x90*\x04IN\xdd\
+\x1djJ0\xa7\xb38`md\xe7;'[t\xd1\
+O\xd0&\xd0\x22\x90N)HgU\xa8\xd2\xc0kp\
+N\x86\xac4\xdd\xe3&\xd9\xe2+\x08\xa8\x9a@\x0bj\
+\x0c\xbe\xc2\x8a\xd0\xb4V+\x9a(\xfd\x9aJj\xbf\xf0\
+]\xc9\xd0\xce\x18p\xcc\xf8\x84\xf1\xec\x87\xb5]%n\
+]\xc7\x96^\x81\xe4\xd6\x90\xce\xaaH%\x0aR\x89B\
+R\xbdN\x80\xbb.\x81K\x01A\xcc\xd8?\x16|\x9e\
+\x00\x92)lt\x07t\x15\x09\xde\x11\xf9\xe0\xa5O\x1a\
+h\xf2k\xdd^8l;d\x9d\x90$_k\xa1\x22\
+\xd1\xaan\x9bP2!\xf5\x97\xa8\xabj\xc4\x95=8\
+\xd4e\xef\x8a\x01\x9f\x02\xbb#\x1f>\xb4\xb7\x1aK\x9c\
+b K\xd0\x1c\xd0x\xe7T3\xaf\x7f\xd1\xc83\x07\
+\xdc\xec(i\xc2n\x04=\x0e\xa3H\xear\x9a\x12\x8a\
+\x1d\xd2RM\x86('~\x18\x9e&\x1fJP#\xe8\
+i\x0c\x0bD\xac\x82\xc8o\xd0\xaf\x9e\x01\xf8kI3\
+\xf7O\x080 \xb5k_o5I\xac+\xaec\xc5\
+\xfb\x1d*\xb0\xfc\xf1\xa0\x9b\xdd\xb7_A\xb6S_\xca\
+f\x8b\xff$5M\xf7\x0c!]N\xa8\x1c\xeeSp\
+_lB6Y\xf07\x87\xeb\x08\x17c%C\x95\xc0\
+\xcc\xc8\x8e{v^\xc4n\x96\xbb<\xf9\xcd\x87\x1b\xc2\
+\xc4O\x9f>\x9d\xe5\xcb\x97SPP\x80\xd9l\xa6\xac\
+^a\xfa+\xe5\xd8M\xd0\xb0w\x02#\x86\xd8\x13\xd2\
+#\xbfa\x8c[j+\xe3\xfe\x9a\x12T\xa9\xae\xa8G\
+\x92$$I\xc2\xdbX\x13I_\xccl\xf0-\xe0w\
+\xa1\xc6\xb1\x0b~\x0e\x9ek\xe9t\xb1\xb3\xf5A\xfe}\
+O5\x00\xc5\xc5\xc5\xbc\xf5\xd6[<\xf6\xd8c\xac^\
+\xbd\x9a`0\xc8\x94)S8W\x17d\xe3\xa7nT\
+\xfa\xa2&p\x92\x12\x104\xd2g-\x81\x1b\xd5\x9a\x8a\
+\x86\xb0\x1b\x97d\x99\xe6\xea\xb2\xd0\xa3\x92x\xd3\xe1g\
+\x80\x9d\xa1\xc6\x92\xb7\xab\x88&\x04\xb2\x04\x85G\x1a\xc3\
+9|~~>\xb7\xddv\x1b\x99\x99\x99\xd8l6\xd6\
+\xacY\xc3\x9e={\xb0\xdb\xedl\xfa\xbc\x09\x9b\xd6\x1b\
+D\xb0[9D\x5c\xaeS\xd1\xb8p\xae\x0eMk\xfd\
+\x92\xa6*4^\xf8&!\x09\x08\xe1\x17@\x03@Y\
+\xbd\xc2\xbc\xd7*H\xb6\xca\x1d,\xf4\xc9\x9a\x00\x00+\
+W\xae\xe4\xe9\xa7\x9ff\xf3\xe6\xcd\xd4\xd4\xd4\x10\x08\x04\
+(((@\x08\xc1\x8a\x15+\xf8\xc6\xad\xd0\xe8\xeb\x83\
+H\x90\x01\xad\x05\x17\xd1\xa5\xb5\xf74\xf9\xb9x\xae\x0e\
+\xad]\xbe\xedqWD6\xbfJ\x84\x01\x1a08T\
+K\xff\xa4\xdc\xc7\x82\xc2\xf3\x98#\xbc\x82\x04\xb4\x044\
+\x5c.=9\xa9\xac\xec\xa8\xa7\x87\x0f\x1ff\xd4\xa8Q\
+z^\xefKC\xb6^\x99\x10\x03Bq\x80-95\
+*\xe1~O\x90\x0b\xe7\xdc\xd4W5G\xbdt\x898\
+}\x80/\x12\xad\x08\xd5\x01W\x00\x7f\x01\xd8\x7f\xda\xcb\
+\xf4W\xca\xdb\xc4\x07\x16\x93DSS\x13\x00\xb9\xb9\xb9\
+\x1d&\xc8\xcb\xcb\xa3\xaa\xaa\x0a\x80\xf4+G ;~\
+\x92H\x1cD\x92!u\xb2\xd9\xd2\xa6\xba\xa4\x045\xaa\
+\xcf\xd7SS\xd9\x80\xaahQ\x89\x97\xcd\x16J\xf6\xbd\
+\x14\xbe2\x00\x9a\xba[\x12\x9b\x0b\xcc\x008q\xd1\xcf\
+\xc3{\xab1IzR\xb4 \xcf\x15\xb6\x01\x8b\x17/\
+f\xc6\x8c\x19\xe1/m\xdb\xb6\x0d\x8b\xc5\xc2\xde\xbd{\
+\x01\xe8;r\x1c&{\xbe!\x5c\xd1m\x8aI\x96Z\
+c\x1e\xa1W\x8c\x01<\xf5\xd5\x86;\x14\xb8/6s\
+\xb1\xccM\xc0\xaf\x84\x8d]T\xf5\xf1{\xa9<\xf1a\
+\xa8y\xe8R/F\xde\x06~\x0f,\xfd\xa8\xdc\x8b\xdd\
+\x22\xd3\x1c\xd0\xf8\xf9H\x17\xab\x0e\xd4\xb2j\xd5*F\
+\x8c\x18\xc1\xae]\xbb\xda|\xe9\xc8\x91#l\xda\xb4\x89\
+\x193f\x88d\x87]B\xdc\x80\xd5|?\xfe\xa0\x9d\
+\xf2o\x0346\xa9\x9c.\xf3s\xe2\x94\x8f\xfa\x06\x15\
+\x8fW%-\xd5\xcc\xd8k\x92\x99;=]/}\x01\
+\xb5egI\xed\x9fL\xa3\xbb%\xec\xdeb\xf9\x90\xb2\
+O\xdb\xececO\xdc\x0c}\x00,\xadmQ9]\
+\x17 +\xd9\x8c\xaa\xc1\xab\x0b\xfa1\xf9\xc52\x16.\
+\x5c\xc8\x86\x0d\x1b\x987o\x1e)))x<\x1e\x0a\
+\x0a\x0aHIIa\xd7\xae]A\xc0\x8ada\xd6\xdd\
+\xe9\xec\xde\xf3Q\xcc\xc5J\x8b\xae#\xc5\xa5\x1b1\xf7\
+\x85:\xe4dO\x1c\x84\x1b\x06\xdaj\xe3\xd8_WG\
+\x06@o\xf4\x04\x03\x0e\x87\xfe\xd9|Ba\xe9?\xa7\
+\xa0y\x9b\xb9\xc2\x1e`\xff\xed\xbdY\xba\xaf\x89C\x87\
+\x0eq\xe8P\xab\xb4\x8d\x1e=Z\x14\x15\x15I@\xb8\
+\x0e\xb6f\xedf\x86\x0c\x19\xd2\xe5B\xc3\x86\x0d%\xf7\
+\xda\xbf\xd1\xbbx-\xf0ohj \xa1\x8dV\x9d,\
+\xa2\xb9&|\x17\xfaD\xac\xaap\xbc\xa84B\xe5\x9c\
+\xfd\xee^\xac}\xe2\xa8\xae\x97\x8a\x9fA\xbef\x8a\x9d\
+\xbdp\xbb\xdd\xbc\xf7\xde{\xf8|>\x86\x0e\x1d*\xae\
+\xbd\xf6\xda\x0eG\x96\x9b\x9bKiii\xa7L\x983\
+g\x0e\xdb\xb7o7\x04Y\x0f\x80:V\x82\xba\x8a\x1d\
+4\xde\x7f\xee\xf6P\xf3\x14\xc6[j=\xc1\x00\x80W\
+\x81\xa5'\x8e}\x81\xaa\xaa\x98L&$\xb3\x0d\x93\xd3\
+\xa6_Hdd0o\xde\xbcNkp\x91L8u\
+\xea\x14\xc3\x86\xb5}\xafq\xe7\xce\x9d\xcc\x9a5+\xdc\
+v8\xf4TV\x0d\xc6\xc7\x00\x93\xc5\xc6\xfe\xb5\x8b\x08\
+z\xc3\x06?\xbf\xa7o\x86^\x0d[\x95\x8d\x1b/)\
+W\x1f:t(g\xce\x9c!##\x03\x80-[\xb6\
+\xb4!\x1e \xc9\xae3\xc0\x9e\x96\x1d;#5[9\
+\xfc\xe7\x15\x94\x7f\xfeN\xa8\xebq\xa0\xb1\xa7\x19p\x14\
+\xfd5S^{\xed5.\x15\x83\x06\x0d\xe2\xee\xbb\xef\
+f\xf2\xe4\xc9\xdc|\xf3\xcd\xa8\xaa\x8a\xc7\xe3\xa1\xb6\xb6\
+\x96\xca\xcaJN\x1c\xd7\xeb4\xce\xde\x03b\x12\xff\xf1\
+\xe6\x079\xb1;\x5c\xde\x5ck\xdc\x05t\x89\xee\xbe\x1f\
+\xf0&\xf0/\xfb\xf7\xef\x0f\xabAW\xd8\xbd{7\x1b\
+7n\xa4\xa2\xa2\x02M\xd3\xa8\xa9\xa9\xe1\xec\xd9\xb3\x1d\
+n\x81\xcc\xe6\xce\xb7c\xb5\xbb:wx\xb2\xcc{\xff\
+q\x0b\x95'\x0e\x84\xd3\x17\xe0\xd9x\x0bX\xddAX\
+\xf6\x0b\x0b\x0bc\x0e\x9e6m\x1a\x83\x07\x0f\xa6\xa8\xa8\
+\x88\x8f?\xfe\x98\xd3\xa7OG\xbd\x02\xeb\x0c\xbd3R\
+Ir\xa6E\xf5\xf5j\xd0\xcf\xaeG\xae\x8b$~v\
+\xbc\xc4wi\xa4\xe2\x8cT\x998q\x22\x1f|\xf0A\
+\xdc_:~\xfc8\xa7O\x9f\xe6\xe4\xc9\x93\x94\x94\x94\
+P^^Nuu5\x8a\xa2\x10\x08\x04\x08\x06\x83\x98\
+L&\x1c\x0e\x876|\xf8p9??\x9f[\x7f\xbd\
+\x80\x07v+m\xee\x15M\x96$\xbe9\xf8:\xc5\x9b\
+~\x87\xa6\xa7\xd8\x02\xf8\x09P\x9cp\xe9\xae\x9bx\x0e\
+\xb8't\xf1\xf1]\xe3\x8e\x97\xcf\xe8\xaf\xdfI\x12Z\
+\xd0\xcf\xbb\xcf\xfe\x9a\x9a3GB\x8f\xcb\x80k\x81\x0b\
+\xdd\xa9\xe1v\x17\x9bB\xff\xac_\xbf\xbe5\xfeV\x14\
+\x16-Z\x84$I\xdcy\xe7\x9d=\xc6\x00!\xf4S\
+\xffr\xf7:\xb6\x16\x8c\x8a$\xfey``w\x88\xef\
+\x09\xd4\x01b\xfc\xf8\xf1B\x08!6n\xdc\x18\xba$\
+\x0b\x7f\x96,Y\x22ba\xdf\xbe}BQ\x94.\xc7\
+\xdcSx^\xe4\xe4\xfd,r\xee\x80\xa1\xef\xff\xabx\
+$\xb4\xa1\x993gFn\xeeQ\xf4\x97(\x04 \x0e\
+\x1e<\xd8\x81\xa0@  \x1e\x7f\xfcq\xe1p8\x04\
+ RRRDmmmT\xe2\xeb\xeb\xebD\xaf>\
+\x03\x22\xe7\x7f\x90\xcb\xfb{\xa7.\xe1\x8f\xd8\xd8S\xed\
+6v\x0d \x1c\x0e\x87p\xbb\xdda\x82\x1e~\xf8\xe1\
+\xf6\x92\xa2\x00Zfff\x07\xe2KKK\x85\xddn\
+\x0f\x8d\xabB\xff\x1d\xc2\xff),\x01\xde\x01:s\xd4\
+\x8b\x011p\xe0@q\xf0\xe0A\x91\x95\x95\x15I\xf8\
+\x7f\x03?2\xe2\x91Z@\xe4\xe7\xe7\x87\x89/..\
+\x8e\x1c[\x1d\xedb\xe3\xfb\x82\xbf\xb5;\xf1\xa3\x86\xd5\
+\x8eDv\xe8\xf9-\xb7\xdc\x22\x96/_\x1e9~;\
+\xdfs$\x1b\x844\x03\xd3\xbb\x18w};F\xf9\x80\
+Y\xfc?\xc1`\x8c_\x8f\xc5\xc0\xf3\x06\xf1'\x0d\xc6\
+\xfd]b\x22?\xe0\xf2\xe0\x7f\x00\x01\xe6\x87_7\x8a\
+\xa5\xa9\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x12t\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\xc3zTXtRaw prof\
+ile type exif\x00\x00x\
+\xdamPA\x12\xc3 \x08\xbc\xfb\x8a>A\x01\x0d>\
+\xc7\xb4\xe9L\x7f\xd0\xe7w\x09$\x13\xdb\xae\xe3\x0a\xac\
+\xb3\x22i{\xbf\x9e\xe9f\xa0\x22I\xea\xa2\xad\xb7\x96\
+\x01\xe9\xd2i \xd0\xec\x18;\x97,;\xef\xa0\x90\x90\
+O\xf5t\x0a\x84\x12\xe3dO\xb5\xc5\xfd\xa3^N\x03\
+?\x06\xa2z1\xd2{\x08\xeb,t\x09\x7f\xfd2\x8a\
+\x97\xd9:\xb2\xf8\x11F=\x8c\x98\x5c(a0\xfc[\
+\xb9u]\xae_X\xb7<C}'#\xd1\xb9\xed\x9f\
+|\xc1\xf4\x1e\x15\xef0\xd1\xc6\x853\x98Y\xbc\x01\xb6\
+\xcd\x89\x07\x02\x01\x13\xab]\xc4\x1a\x5c\xb1\x8cK\x98a\
+ \xff\xe6t }\x00\xd9\xadY\x11h\xd88\x06\x00\
+\x00\x01\x83iCCPICC profi\
+le\x00\x00x\x9c}\x91=H\xc3@\x1c\xc5_\xd3\
+J\x8bT\x1c\xec \xa2\x90\xa1:\xd9E\xa58\xd6*\
+\x14\xa1B\xa8\x15Zu0\xb9\xf4\x0b\x9a\xb4$).\
+\x8e\x82k\xc1\xc1\x8f\xc5\xaa\x83\x8b\xb3\xae\x0e\xae\x82 \
+\xf8\x01\xe2\xea\xe2\xa4\xe8\x22%\xfe/)\xb4\x88\xf1\xe0\
+\xb8\x1f\xef\xee=\xee\xde\x01B\xab\xca43\x90\x004\
+\xdd22\xa9\xa4\x98\xcb\xaf\x8a\xc1W\x040\x06\x01q\
+\x84df\xd6\xe7$)\x0d\xcf\xf1u\x0f\x1f_\xefb\
+<\xcb\xfb\xdc\x9fc@-\x98\x0c\xf0\x89\xc4\x09V7\
+,\xe2\x0d\xe2\xf8\xa6U\xe7\xbcO\x1caeY%>\
+'\x9e4\xe8\x82\xc4\x8f\x5cW\x5c~\xe3\x5crX\xe0\
+\x99\x11#\x9b\x99'\x8e\x10\x8b\xa5\x1eVz\x98\x95\x0d\
+\x8dx\x868\xaaj:\xe5\x0b9\x97U\xce[\x9c\xb5\
+j\x83u\xee\xc9_\x18.\xe8+\xcb\x5c\xa79\x8a\x14\
+\x16\xb1\x04\x09\x22\x144PA\x15\x16b\xb4\xea\xa4\x98\
+\xc8\xd0~\xd2\xc3?\xe2\xf8%r)\xe4\xaa\x80\x91c\
+\x015h\x90\x1d?\xf8\x1f\xfc\xee\xd6,NO\xb9I\
+\xe1$\xd0\xf7b\xdb\x1f\xe3@p\x17h7m\xfb\xfb\
+\xd8\xb6\xdb'\x80\xff\x19\xb8\xd2\xbb\xfeZ\x0b\x98\xfd$\
+\xbd\xd9\xd5\xa2G\xc0\xe06pq\xdd\xd5\x94=\xe0r\
+\x07\x18~\xaa\xcb\x86\xecH~\x9aB\xb1\x08\xbc\x9f\xd1\
+7\xe5\x81\xa1[\xa0\x7f\xcd\xed\xad\xb3\x8f\xd3\x07 K\
+]\xa5o\x80\x83C`\xa2D\xd9\xeb\x1e\xef\x0e\xf5\xf6\
+\xf6\xef\x99N\x7f?\x8d\xc3r\xb1\xbe\x8d\xac\xad\x00\x00\
+\x0dziTXtXML:com.ad\
+obe.xmp\x00\x00\x00\x00\x00<?xp\
+acket begin=\x22\xef\xbb\xbf\
+\x22 id=\x22W5M0MpCehi\
+HzreSzNTczkc9d\x22?\
+>\x0a<x:xmpmeta xml\
+ns:x=\x22adobe:ns:m\
+eta/\x22 x:xmptk=\x22X\
+MP Core 4.4.0-Ex\
+iv2\x22>\x0a <rdf:RDF \
+xmlns:rdf=\x22http:\
+//www.w3.org/199\
+9/02/22-rdf-synt\
+ax-ns#\x22>\x0a  <rdf:\
+Description rdf:\
+about=\x22\x22\x0a    xml\
+ns:xmpMM=\x22http:/\
+/ns.adobe.com/xa\
+p/1.0/mm/\x22\x0a    x\
+mlns:stEvt=\x22http\
+://ns.adobe.com/\
+xap/1.0/sType/Re\
+sourceEvent#\x22\x0a  \
+  xmlns:GIMP=\x22ht\
+tp://www.gimp.or\
+g/xmp/\x22\x0a    xmln\
+s:dc=\x22http://pur\
+l.org/dc/element\
+s/1.1/\x22\x0a    xmln\
+s:tiff=\x22http://n\
+s.adobe.com/tiff\
+/1.0/\x22\x0a    xmlns\
+:xmp=\x22http://ns.\
+adobe.com/xap/1.\
+0/\x22\x0a   xmpMM:Doc\
+umentID=\x22gimp:do\
+cid:gimp:9685199\
+a-c45d-4508-92ea\
+-c4f7acffbfed\x22\x0a \
+  xmpMM:Instance\
+ID=\x22xmp.iid:30a1\
+b0f3-d871-4cbe-a\
+65f-056d227235a4\
+\x22\x0a   xmpMM:Origi\
+nalDocumentID=\x22x\
+mp.did:1cf7ac12-\
+30ff-4082-957e-9\
+63ff0976107\x22\x0a   \
+GIMP:API=\x222.0\x22\x0a \
+  GIMP:Platform=\
+\x22Mac OS\x22\x0a   GIMP\
+:TimeStamp=\x221682\
+736952107890\x22\x0a  \
+ GIMP:Version=\x222\
+.10.34\x22\x0a   dc:Fo\
+rmat=\x22image/png\x22\
+\x0a   tiff:Orienta\
+tion=\x221\x22\x0a   xmp:\
+CreatorTool=\x22GIM\
+P 2.10\x22\x0a   xmp:M\
+etadataDate=\x22202\
+3:04:28T22:55:51\
+-04:00\x22\x0a   xmp:M\
+odifyDate=\x222023:\
+04:28T22:55:51-0\
+4:00\x22>\x0a   <xmpMM\
+:History>\x0a    <r\
+df:Seq>\x0a     <rd\
+f:li\x0a      stEvt\
+:action=\x22saved\x22\x0a\
+      stEvt:chan\
+ged=\x22/\x22\x0a      st\
+Evt:instanceID=\x22\
+xmp.iid:1164c842\
+-b6d4-4568-8ccb-\
+0b43311490cc\x22\x0a  \
+    stEvt:softwa\
+reAgent=\x22Gimp 2.\
+10 (Mac OS)\x22\x0a   \
+   stEvt:when=\x222\
+023-04-28T22:55:\
+52-04:00\x22/>\x0a    \
+</rdf:Seq>\x0a   </\
+xmpMM:History>\x0a \
+ </rdf:Descripti\
+on>\x0a </rdf:RDF>\x0a\
+</x:xmpmeta>\x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+                \
+                \
+                \
+                \
+                \
+\x0a               \
+                \
+                \
+                \
+                \
+                \
+     \x0a          \
+                \
+                \
+                \
+                \
+                \
+          \x0a     \
+                \
+                \
+                \
+                \
+                \
+               \x0a\
+                \
+                \
+                \
+                \
+                \
+                \
+    \x0a           \
+                \
+                \
+                \
+                \
+                \
+         \x0a      \
+                \
+                \
+                \
+                \
+                \
+              \x0a \
+                \
+                \
+                \
+                \
+                \
+                \
+   \x0a            \
+                \
+                \
+                \
+                \
+                \
+        \x0a       \
+                \
+                \
+                \
+                \
+                \
+             \x0a  \
+                \
+                \
+                \
+                \
+                \
+                \
+  \x0a             \
+                \
+                \
+                \
+                \
+                \
+       \x0a        \
+                \
+                \
+                \
+                \
+                \
+            \x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+                \
+                \
+                \
+                \
+                \
+\x0a               \
+            \x0a<?x\
+packet end=\x22w\x22?>\
+<\xee\x0cM\x00\x00\x00\x06bKGD\x00\xff\x00\xff\
+\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\
+\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07t\
+IME\x07\xe7\x04\x1d\x0274\x22Q(\xf7\x00\x00\
+\x02\x1dIDATX\xc3\xed\x96KHUa\x14\x85\
+\xbf]V\xf4\xa2\x87%E\x09%T\xd0;j\x10\x04\
+\x09\x05:i \x15\x04Mk\x12A\x93\x1e\x84A\xd3\
+\x1c\x15\xd4\xacI\xcd\x1aD\x0e\x9a\x8a3'A\x10h\
+\xe1@\xa9 0R\xc4\x8a\xbcA\x9a_\x93-\x9d\xae\
+&\x0a\xd7;\xba\x0b\x0e\xe7\xfck\x9d\xfd\xefu\xf6\xd9\
+w\xdf\x035\xd4P\xc3\x22A\xdd\xa9\xeeW\xa3\xda\x89\
+\x9b\xd4\x1e\xff\xa2O\xddQ\xad\xe4\xab\xd4\x81L<\xa2\
+~\xca\xebW\xd52p-\x13\xbeVW\xa7\xa1\xd1\xe4\
+\x1ag\x8bYRa\x0f'\xf3\xfc \x22\xc6#\xa2\x04\
+\x8c&\xb7\xb6\x1a\x06\xa6\xb1,+r\x02\xd8\x05\x8c\x03\
+\x83\xd5x\x05W\xb2\xdcC\xeaS\xf5k\xaeoW\xab\
+\x07\x96\xa9]\xfe\x8bnu\xf9\xffb\xea*i \x22\
+&\xd4\x0f\x05\xea-p\x16\x98PO\x03-\xc0\xfa\xe4\
+\x9fD\xc4\x8fJW`\x93Z\xca'\xff\xad\xb6\xa8\x97\
+\xd5w\xce\xc4\x90\xba'*\x90t;\xb0\x0f8\x04\xb4\
+\x02\xa7R\x9a\x04\x02X\x9a\xeb1\xe0>0\x0c\x5c\x04\
+\x9a\x81\xeeX@\xa2:\xe0\x18p\x108P86\xce\
+s\x8b\xf3\x11\xf1\x22\xf7j\x00\xbe\x00\xa5\xbay&_\
+\x03t\x01\xc7\x17X\xa0\xb1\xfc\xa9\xaf\x03\x8e\xa8\x9dY\
+\x91\xab\xa9\xbf\x9f\xef\xd3\xdfrv|W{\xd5\x97\xea\
+p\x81\x7f\xa6\xae\xcb\xd8Vu2\xf9\xb1\x8cQ\x9dR\
+\xdb\xe6k\xe0\x86\xfaH\xbd\xae\x9eS\x8f\xaa\xf5\x05}\
+\xab\xfa\xab\xd0|{\xcb\xe2\xdb\xd4\xfe\x82\xc1^\xf5L\
+%\xbb\xffna\xf3\xce9\xee\xdb\xac\xae_\x8c9\xb0\
+\x01x\x9e\xd7\x1ds\xcc\x89\x91\x19\x9c\xda\x0e\x1c\xce\xf5\
+@D\xdcI\x97\x1de\x1d\xfe\x1d\xb8\x16\x11%\xb5\x03\
+h*h\x93@{D|T/\xe7\xc0)\xe2aD\
+\xf4\xa8\xad\xc0\xa5\xe4~\x027\xc9\x81`\xa1I\x96\xe4\
+;\x9e*k\xb8)u\x97\xbaB\x1d\x9f\xa5!/d\
+\x99\xdf\xcc\xa2\xddK\xedq\x19\xdf\x1c\xea\x16`[\xba\
+\xfa\x1c\x11Cy\xf3\xee\xb2\xbf\xd0o\x111\x98Z#\
+\xd0P\xd0&\x22\xa27\xb5z\xa0\xf8\x05$\xd0\x97c\
+z%0\xdd\xa0\xa5\x88\xe8\xaf}\xbc\xd6P\xc3\x1f\x82\
+\x1a:|\xf5\x0a\xfcD\x00\x00\x00\x00IEND\xae\
+B`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x0b\
+\x00V\x8c\xa7\
+\x00s\
+\x00_\x00w\x00h\x00i\x00t\x00e\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x0bcX\x07\
+\x00s\
+\x00t\x00o\x00p\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x06l\x92\x07\
+\x00s\
+\x00t\x00o\x00p\x00_\x00w\x00h\x00i\x00t\x00e\x00.\x00p\x00n\x00g\
+\x00\x0b\
+\x00\x9f\xc0'\
+\x00c\
+\x00u\x00t\x00t\x00i\x00n\x00g\x00.\x00p\x00n\x00g\
+\x00\x05\
+\x00vWG\
+\x00s\
+\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x07o\x9c\xa7\
+\x00a\
+\x00p\x00p\x00_\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+\x00\x11\
+\x01\x99\xa2g\
+\x00c\
+\x00u\x00t\x00t\x00i\x00n\x00g\x00_\x00w\x00h\x00i\x00t\x00e\x00.\x00p\x00n\x00g\
+\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x07\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9cl\xff\x07\xf8\
+\x00\x00\x00p\x00\x00\x00\x00\x00\x01\x00\x00(b\
+\x00\x00\x01\x9cl\xff\x07\xf8\
+\x00\x00\x00T\x00\x00\x00\x00\x00\x01\x00\x00&R\
+\x00\x00\x01\x9cl\xff\x07\xf8\
+\x00\x00\x00\x9e\x00\x00\x00\x00\x00\x01\x00\x00:\xc6\
+\x00\x00\x01\x9cl\xff\x07\xf8\
+\x00\x00\x002\x00\x00\x00\x00\x00\x01\x00\x00\x14\xbc\
+\x00\x00\x01\x9cl\xff\x07\xf8\
+\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00+\x03\
+\x00\x00\x01\x9cl\xff\x07\xf8\
+\x00\x00\x00\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x13\x08\
+\x00\x00\x01\x9cl\xff\x07\xf8\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
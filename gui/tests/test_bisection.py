@@ -0,0 +1,123 @@
+import threading
+
+import pytest
+from mock import MagicMock, Mock
+from PySide6.QtCore import QObject, Signal
+
+from mozregression.bisector import Bisection
+from mozregui.bisection import GuiBisector
+
+
+class FakeDownloadManager(QObject):
+    download_finished = Signal(object, str)
+
+    def __init__(self):
+        super().__init__()
+        self.focus_download = Mock(return_value=None)
+        self.cancel = Mock()
+
+
+class FakeTestRunner(QObject):
+    evaluate_finished = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self.verdict = None
+        self.run_error = False
+
+
+@pytest.fixture
+def bisector(qtbot):
+    bisector = GuiBisector(Mock(), FakeTestRunner(), FakeDownloadManager())
+    build_info = Mock(build_file="/builds/5")
+    bisection = bisector.bisection = MagicMock()
+    bisection.search_mid_point.return_value = 5
+    bisection.init_handler.return_value = Bisection.RUNNING
+    bisection._find_approx_build.return_value = (False, 5, build_info, ())
+    bisection.handle_verdict.return_value = Bisection.FINISHED
+    # the next builds are prepared once this is set
+    bisector.prefetch_allowed = threading.Event()
+
+    def download_next_builds(index, persist_files):
+        bisector.prefetch_allowed.wait(5)
+        return index - 1  # a build was found invalid before the mid point
+
+    bisection._download_next_builds.side_effect = download_next_builds
+    yield bisector
+    bisector.prefetch_allowed.set()
+
+
+def start_evaluation(qtbot, bisector):
+    bisector._bisect_next()
+    assert bisector.state == GuiBisector.DOWNLOADING
+    assert bisector.download_manager.focus_download.call_count == 1
+    # the next builds are being prepared while the build is downloaded
+    assert bisector.prefetch is not None
+
+    with qtbot.waitSignal(bisector.step_testing):
+        bisector.download_manager.download_finished.emit(None, "/builds/5")
+    assert bisector.state == GuiBisector.EVALUATING
+    bisector.bisection.evaluate.assert_called_once_with(bisector.build_infos)
+
+
+def test_verdict_given_before_next_builds_are_prepared(qtbot, bisector):
+    start_evaluation(qtbot, bisector)
+
+    bisector.test_runner.verdict = "g"
+    bisector.test_runner.evaluate_finished.emit()
+    # the verdict is not handled yet, but nothing blocks
+    assert bisector.state == GuiBisector.WAITING_PREFETCH
+    assert not bisector.bisection.handle_verdict.called
+
+    with qtbot.waitSignal(bisector.finished):
+        bisector.prefetch_allowed.set()
+    bisector.bisection.handle_verdict.assert_called_once_with(4, "g")
+    assert bisector.prefetch is None
+
+
+def test_verdict_given_after_next_builds_are_prepared(qtbot, bisector):
+    bisector.prefetch_allowed.set()
+    start_evaluation(qtbot, bisector)
+    qtbot.waitUntil(lambda: bisector.prefetch.done)
+
+    bisector.test_runner.verdict = "b"
+    with qtbot.waitSignal(bisector.finished):
+        bisector.test_runner.evaluate_finished.emit()
+    bisector.bisection.handle_verdict.assert_called_once_with(4, "b")
+
+
+def test_no_prefetch_after_skip(qtbot, bisector):
+    bisector.test_runner.verdict = "s"
+    bisector.bisection.build_range.__len__.return_value = 3
+    bisector._bisect_next()
+    assert bisector.prefetch is None
+    assert bisector.state == GuiBisector.DOWNLOADING
+
+
+def test_build_already_downloaded(qtbot, bisector):
+    download_manager = bisector.download_manager
+
+    def focus_download(build_info):
+        # the build is in the persist directory
+        download_manager.download_finished.emit(None, build_info.build_file)
+        return None
+
+    download_manager.focus_download.side_effect = focus_download
+    with qtbot.waitSignal(bisector.step_testing):
+        bisector._bisect_next()
+    bisector.bisection.evaluate.assert_called_once_with(bisector.build_infos)
+
+
+def test_other_downloads_are_ignored(qtbot, bisector):
+    bisector._bisect_next()
+    bisector.download_manager.download_finished.emit(None, "/builds/6")
+    qtbot.wait(10)
+    assert bisector.state == GuiBisector.DOWNLOADING
+
+
+def test_stop_cancels_prefetch(qtbot, bisector):
+    bisector.preinstaller = Mock()
+    bisector._bisect_next()
+    bisector.stop()
+    assert bisector.prefetch.is_canceled()
+    bisector.preinstaller.cleanup.assert_called_once_with()
@@ -1,6 +1,8 @@
+import os
 import time
 
 import pytest
+from PySide6.QtCore import Qt
 
 from mozregui import log_report
 
@@ -17,58 +19,90 @@ def log_view(qtbot):
     return widget
 
 
+def send(log_view, message, level="INFO"):
+    log_view.log_model({"message": message, "level": level, "time": time.time() * 1000})
+
+
+def lines(log_view):
+    model = log_view.model()
+    return [model.data(model.index(row, 0)) for row in range(model.rowCount())]
+
+
 def test_log_report_report_log_line(log_view):
     # view is first empty
-    assert str(log_view.toPlainText()) == ""
-    assert log_view.blockCount() == 1  # 1 for an empty document
+    assert log_view.model().rowCount() == 0
 
     # send a log line
-    log_view.log_model({"message": "my message", "level": "INFO", "time": time.time()})
+    send(log_view, "my message")
+    # lines are added by batches
+    assert log_view.model().rowCount() == 0
+    log_view.model().flush()
 
-    assert log_view.blockCount() == 2
-    assert "INFO : my message" in str(log_view.toPlainText())
+    assert log_view.model().rowCount() == 1
+    assert "INFO : my message" in lines(log_view)[0]
 
 
-def test_log_report_report_no_more_than_1000_lines(log_view):
-    for i in range(1001):
-        log_view.log_model({"message": str(i), "level": "INFO", "time": time.time()})
+def test_log_report_lines_are_batched(qtbot, log_view):
+    inserted = []
+    log_view.model().rowsInserted.connect(lambda *args: inserted.append(args[1:]))
+    for i in range(50):
+        send(log_view, str(i))
+    qtbot.waitUntil(lambda: log_view.model().rowCount() == 50)
+    assert inserted == [(0, 49)]
 
-    assert log_view.blockCount() == 1000
-    lines = str(log_view.toPlainText()).splitlines()
-    assert len(lines) == 999
-    assert "INFO : 1000" in lines[-1]
-    assert "INFO : 2" in lines[0]  # 2 first lines were dropped
 
+def test_log_report_keeps_a_bounded_number_of_lines(log_view):
+    log_view.model().capacity = 10
+    for i in range(25):
+        send(log_view, str(i), level="DEBUG" if i % 2 else "INFO")
+    log_view.model().flush()
 
-def test_log_report_sets_correct_user_data(log_view):
-    """Assumes that only the correct log levels are entered"""
-    # Inserts a log message for each log user level
-    for log_level in log_report.log_levels.keys():
-        log_view.log_model(
-            {"message": "%s message" % log_level, "level": "%s" % log_level, "time": time.time()}
-        )
-    # Checks each log level message to make sure the correct
-    # user data is entered
-    for current_block in log_view.text_blocks():
-        for log_level in log_report.log_levels.keys():
-            if log_level in current_block.text():
-                assert current_block.userData().log_lvl == log_report.log_levels[log_level]
+    # only the 10 last lines are kept, 5 of them are shown at the INFO level
+    assert [line.split(" : ")[-1] for line in lines(log_view)] == ["16", "18", "20", "22", "24"]
+    log_view.log_lvl = log_report.log_levels["DEBUG"]
+    assert [line.split(" : ")[-1] for line in lines(log_view)] == [str(i) for i in range(15, 25)]
 
 
 def test_log_report_filters_data_below_current_log_level(log_view):
-    # Using the WARNING log level
     log_view.log_lvl = log_report.log_levels["WARNING"]
-    current_log_level = log_view.log_lvl
     # Inserts a log message for each log user level
     for log_level in log_report.log_levels.keys():
-        log_view.log_model(
-            {"message": "%s message" % log_level, "level": "%s" % log_level, "time": time.time()}
-        )
-    # Check that log messages above the current log level are visible
-    # and log messages below the log level are invisible
-    for current_block in log_view.text_blocks():
-        current_block_log_level = current_block.userData().log_lvl
-        if current_log_level < current_block_log_level:
-            assert current_block.isVisible() is False
-        else:
-            assert current_block.isVisible() is True
+        send(log_view, "%s message" % log_level, level=log_level)
+    log_view.model().flush()
+
+    shown = [line.split(" : ")[-1] for line in lines(log_view)]
+    assert shown == ["CRITICAL message", "ERROR message", "WARNING message"]
+
+    # changing the level shows the other lines
+    log_view.log_lvl = log_report.log_levels["DEBUG"]
+    assert len(lines(log_view)) == len(log_report.log_levels)
+
+
+def test_log_report_colors(log_view):
+    send(log_view, "debug", level="DEBUG")
+    send(log_view, "error", level="ERROR")
+    log_view.log_lvl = log_report.log_levels["DEBUG"]
+    log_view.model().flush()
+    model = log_view.model()
+    assert model.data(model.index(0, 0), Qt.ForegroundRole) == log_report.COLORS["DEBUG"]
+    assert model.data(model.index(1, 0), Qt.ForegroundRole) == log_report.COLORS["ERROR"]
+
+
+def test_log_report_log_file(log_view, tmpdir):
+    path = str(tmpdir.join("logs", "gui.log"))
+    log_view.model().capacity = 2
+    log_view.model().set_log_file(path)
+    assert log_view.model().log_file == path
+    for i in range(5):
+        send(log_view, str(i), level="DEBUG")
+    log_view.model().flush()
+
+    # every line is in the log file
+    with open(path) as f:
+        assert [line.split(" : ")[-1] for line in f.read().splitlines()] == [
+            str(i) for i in range(5)
+        ]
+
+    # the previous log file is kept
+    log_view.model().set_log_file(path)
+    assert os.path.exists(path + ".1")
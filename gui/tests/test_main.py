@@ -11,7 +11,7 @@ from . import APP
 @patch("mozregui.main.QApplication")
 @patch("mozregui.main.CheckRelease")
 @patch("mozregui.main.CrashReporter")
-def run_app(func, _1, _2, QApplication):
+def run_app(func, log_file, _1, _2, QApplication):
     QApplication.return_value = APP
 
     def _quit():
@@ -25,12 +25,12 @@ def run_app(func, _1, _2, QApplication):
     QTimer.singleShot(0, func)
     QTimer.singleShot(20, _quit)
     try:
-        main.main()
+        main.main(log_file=log_file)
     except SystemExit:
         pass
 
 
-def test_persist_is_created_and_deleted():
+def test_persist_is_created_and_deleted(tmp_path):
     data = {
         "persist_dir": None,
         "created": None,
@@ -48,7 +48,10 @@ def test_persist_is_created_and_deleted():
         data["persist_dir"] = main_win.persist
         data["created"] = os.path.isdir(data["persist_dir"])
 
-    run_app(check_persist_is_created)
+    log_file = str(tmp_path / "mozregression-gui.log")
+    run_app(check_persist_is_created, log_file)
+    # not in the home directory of the user
+    assert os.path.isfile(log_file)
     data["deleted"] = not os.path.isdir(data["persist_dir"])
 
     assert data["created"]
@@ -2,6 +2,7 @@ from mock import Mock
 from PySide6.QtCore import Qt
 
 from mozregression.build_info import NightlyBuildInfo
+from mozregression.tracing import Tracer
 from mozregui.report import ReportView
 
 
@@ -60,3 +61,38 @@ def test_report_basic(qtbot):
     view.model().finished(bisection, None)
     # this last row is removed now
     assert view.model().rowCount() == 2
+
+
+def test_report_time_spent(qtbot, mocker):
+    tracer = Tracer()
+    tracer.enable()
+    mocker.patch("mozregui.report.TRACER", tracer)
+    with tracer.span("download"):
+        pass
+
+    view = ReportView()
+    qtbot.addWidget(view)
+    view.model().started()
+    item = view.model().items[0]
+    item.data["repo_name"] = "mozilla-central"
+    view.model().finished(Mock(), None)
+    assert "download" in item.data["time_spent"]
+
+
+def test_report_download_progress(qtbot):
+    view = ReportView()
+    qtbot.addWidget(view)
+    model = view.model()
+    model.started()
+    changed = Mock()
+    model.dataChanged.connect(changed)
+
+    model.download_progress(None, 0, 1000)
+    assert model.items[0].downloading
+    assert changed.call_count == 1
+    # the row is only repainted when the percentage changes
+    model.download_progress(None, 5, 1000)
+    assert changed.call_count == 1
+    model.download_progress(None, 500, 1000)
+    assert changed.call_count == 2
+    assert model.items[0].progress == 50
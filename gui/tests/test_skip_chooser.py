@@ -1,19 +1,36 @@
+import threading
+
 import pytest
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import QMessageBox
 
 from mozregression.build_range import BuildRange, FutureBuildInfo
-from mozregui.skip_chooser import SkipDialog
+from mozregression.errors import BuildInfoNotFound
+from mozregui.skip_chooser import (
+    AVAILABLE,
+    AVAILABLE_COLOR,
+    MISSING,
+    MISSING_COLOR,
+    UNKNOWN,
+    UNKNOWN_COLOR,
+    BuildItem,
+    DensityItem,
+    SkipDialog,
+)
 
 
 class DialogBuilder(object):
     def __init__(self, qtbot):
         self.qtbot = qtbot
 
-    def build(self, nb_builds, return_execcode=SkipDialog.Accepted):
+    def build(self, nb_builds, return_execcode=SkipDialog.Accepted, missing=(), fetched=None):
         class FInfo(FutureBuildInfo):
             def _fetch(self):
+                if fetched is not None:
+                    fetched.wait(5)
+                if self.data in missing:
+                    raise BuildInfoNotFound("not found")
                 return self.data
 
         build_range = BuildRange(None, [FInfo(None, i) for i in range(nb_builds)])
@@ -33,7 +50,9 @@ def dialog_builder(qtbot):
 
 def test_skip_dialog_init(qtbot, dialog_builder):
     dialog = dialog_builder.build(79)
-    assert len(dialog.scene.items()) == 79
+    # only the visible builds have an item
+    assert 0 < len(dialog.scene.build_items) <= 79
+    assert all(isinstance(item, BuildItem) for item in dialog.scene.build_items.values())
     mid_item = dialog.scene.mid_build
     assert dialog.build_index(mid_item) == int(79 / 2)
     assert dialog.scene.selectedItems() == [mid_item]
@@ -48,14 +67,10 @@ def test_skip_dialog_ok(qtbot, dialog_builder):
 def test_dbl_click_btn(qtbot, dialog_builder):
     dialog = dialog_builder.build(50)
 
+    dialog.ui.gview.ensureVisible(dialog.scene.build_item(3))
     # find the build_item 3
-    build_item = None
-    for item in dialog.scene.items():
-        if dialog.build_index(item) == 3:
-            build_item = item
-            break
-    assert build_item
-    dialog.ui.gview.ensureVisible(build_item)
+    build_item = dialog.scene.build_items[3]
+    assert dialog.build_index(build_item) == 3
     spos = build_item.mapToScene(build_item.boundingRect().center())
     vpos = dialog.ui.gview.mapFromScene(spos)
     qtbot.mouseMove(dialog.ui.gview.viewport(), vpos)
@@ -68,6 +83,58 @@ def test_dbl_click_btn(qtbot, dialog_builder):
     assert dialog.choose_next_build() == 3
 
 
+def test_large_range_items_are_lazily_created(qtbot, dialog_builder):
+    fetched = threading.Event()
+    dialog = dialog_builder.build(5000, fetched=fetched)
+    scene = dialog.scene
+    # no build info is required to show the dialog
+    assert scene.statuses[scene.mid] == UNKNOWN
+    fetched.set()
+    assert len(scene.build_items) < 200
+    assert scene.mid in scene.build_items
+
+    # scrolling creates the items of the newly visible builds
+    view = dialog.ui.gview
+    view.verticalScrollBar().setValue(0)
+    assert 0 in scene.build_items
+    assert len(scene.build_items) < 400
+
+
+def test_build_availability_is_loaded_in_background(qtbot, mocker, dialog_builder):
+    mocker.patch("mozregression.build_range.LOG", mocker.Mock())
+    dialog = dialog_builder.build(50, missing=(24,))
+    scene = dialog.scene
+    qtbot.waitUntil(lambda: UNKNOWN not in [scene.statuses[i] for i in scene.build_items])
+    assert scene.statuses[24] == MISSING
+    assert scene.statuses[26] == AVAILABLE
+    # a missing build can not be chosen
+    assert not scene.build_items[24].flags() & BuildItem.ItemIsSelectable
+    assert scene.build_items[26].flags() & BuildItem.ItemIsSelectable
+
+
+def test_density_overview_when_zoomed_out(qtbot, dialog_builder):
+    dialog = dialog_builder.build(5000)
+    scene, view = dialog.scene, dialog.ui.gview
+    for index in range(4900, 5000):
+        scene.on_build_loaded(index, index < 4950)
+    view.zoom(0.1)
+    assert not scene.detailed
+    assert scene.density.isVisible()
+    assert not scene.mid_build.isVisible()
+    density = scene.density
+    assert density.bin_color(4950, 5000) == MISSING_COLOR
+    assert density.bin_color(4900, 4950) == AVAILABLE_COLOR
+    assert density.bin_color(4850, 4900) == UNKNOWN_COLOR
+
+    # clicking the overview zooms in the builds
+    view.centerOn(scene.mid_build)
+    pos = view.mapFromScene(scene.mid_build.sceneBoundingRect().center())
+    assert isinstance(view.itemAt(pos), DensityItem)
+    qtbot.mouseClick(view.viewport(), Qt.LeftButton, pos=pos)
+    assert scene.detailed
+    assert scene.mid_build.isVisible()
+
+
 @pytest.mark.parametrize("close", [True, False])
 def test_close_event(mocker, dialog_builder, close):
     dialog = dialog_builder.build(5)
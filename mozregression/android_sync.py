@@ -0,0 +1,170 @@
+"""
+Avoid sending again to an Android device what is already there.
+
+Installing an APK takes a while, and the same APK is often installed
+several times in a row (when a build is retried, or evaluated again). The
+installs are recorded with the sha256 of the APK and the version code and
+update time reported by ``dumpsys``: when they all match, the installed
+package is the same and only its data is cleared.
+
+The profile is kept on the device between launches, and only the files
+that differ (by md5) are pushed again.
+"""
+
+from __future__ import absolute_import
+
+import os
+import posixpath
+import re
+import shlex
+
+from mozdevice import ADBError
+from mozlog import get_proxy_logger
+
+from mozregression.disk_cache import JsonCache, file_digest
+
+LOG = get_proxy_logger("Android")
+
+INSTALLS = JsonCache("android-installs.json", ttl=30 * 24 * 3600)
+
+RE_VERSION_CODE = re.compile(r"versionCode=(\d+)")
+RE_LAST_UPDATE = re.compile(r"lastUpdateTime=(.+)")
+RE_CHECKSUM = re.compile(r"^([0-9a-f]{32})\s+(.+)$")
+
+# number of files removed by one shell command
+RM_BATCH = 100
+
+
+def installed_version(adb, package_name):
+    """
+    Returns the version code and the last update time of the installed
+    package, or None if it is not installed.
+    """
+    try:
+        output = adb.shell_output("dumpsys package %s" % shlex.quote(package_name))
+    except ADBError:
+        return None
+    if not isinstance(output, str):
+        return None
+    version_code = RE_VERSION_CODE.search(output)
+    last_update = RE_LAST_UPDATE.search(output)
+    if not version_code or not last_update:
+        return None
+    return {"versionCode": version_code.group(1), "lastUpdateTime": last_update.group(1).strip()}
+
+
+def is_installed(adb, package_name, apk_digest):
+    """
+    Returns True if the APK with the sha256 *apk_digest* is the one
+    installed as *package_name*.
+    """
+    record = INSTALLS.get(package_name)
+    if not record or record.get("sha256") != apk_digest:
+        return False
+    return record.get("version") == installed_version(adb, package_name)
+
+
+def record_install(adb, package_name, apk_digest):
+    version = installed_version(adb, package_name)
+    if version is not None:
+        INSTALLS.set(package_name, {"sha256": apk_digest, "version": version})
+
+
+def install(adb, apk, package_name):
+    """
+    Install the *apk* as *package_name*, unless it is already installed.
+    In that case, the application data is cleared instead, so that the
+    application starts as after a fresh install.
+
+    Returns the name of the installed package.
+    """
+    digest = file_digest(apk)
+    if is_installed(adb, package_name, digest):
+        try:
+            adb.shell_output("pm clear %s" % shlex.quote(package_name))
+            LOG.info("%s is already installed, skipping the installation" % package_name)
+            return package_name
+        except ADBError as exc:
+            LOG.debug("Unable to clear the data of %s: %s" % (package_name, exc))
+    try:
+        adb.uninstall_app(package_name)
+    except ADBError as msg:
+        LOG.warning(
+            "Failed to uninstall %s (%s)\nThis is normal if it is the"
+            " first time the application is installed." % (package_name, msg)
+        )
+    installed = adb.install_app(apk)
+    record_install(adb, package_name, digest)
+    return installed
+
+
+def local_checksums(path):
+    """
+    Returns the md5 of the files in the directory at *path*, by relative
+    path (with "/" as separator).
+    """
+    checksums = {}
+    for root, _, files in os.walk(path):
+        for fname in files:
+            fpath = os.path.join(root, fname)
+            relpath = os.path.relpath(fpath, path).replace(os.sep, "/")
+            checksums[relpath] = file_digest(fpath, "md5")
+    return checksums
+
+
+def remote_checksums(adb, path):
+    """
+    Returns the md5 of the files in the directory at *path* on the device,
+    by relative path, or None if they can not be computed.
+    """
+    if not adb.is_dir(path):
+        return None
+    try:
+        output = adb.shell_output("find %s -type f -exec md5sum {} +" % shlex.quote(path))
+    except ADBError as exc:
+        LOG.debug("Unable to list the files of %s: %s" % (path, exc))
+        return None
+    if not isinstance(output, str):
+        return None
+    checksums = {}
+    for line in output.splitlines():
+        match = RE_CHECKSUM.match(line.strip())
+        if not match:
+            return None  # md5sum is probably not available
+        checksums[posixpath.relpath(match.group(2), path)] = match.group(1)
+    return checksums
+
+
+def push_profile(adb, local, remote):
+    if adb.exists(remote):
+        adb.rm(remote, recursive=True)
+    adb.push(local, remote)
+
+
+def sync_profile(adb, local, remote):
+    """
+    Make the directory *remote* on the device a copy of the *local*
+    profile directory, pushing only the files that differ.
+
+    Returns the number of pushed files, or None if the whole profile was
+    pushed.
+    """
+    existing = remote_checksums(adb, remote)
+    wanted = local_checksums(local)
+    changed = sorted(f for f, checksum in wanted.items() if (existing or {}).get(f) != checksum)
+    if existing is None or len(changed) > len(wanted) // 2:
+        # one push is faster than many small ones
+        push_profile(adb, local, remote)
+        return None
+    extra = sorted(set(existing) - set(wanted))
+    for i in range(0, len(extra), RM_BATCH):
+        adb.shell_output(
+            "rm -f %s"
+            % " ".join(shlex.quote(posixpath.join(remote, f)) for f in extra[i : i + RM_BATCH])
+        )
+    for relpath in changed:
+        adb.push(os.path.join(local, *relpath.split("/")), posixpath.join(remote, relpath))
+    LOG.debug(
+        "Profile synced to %s: %d files pushed, %d removed" % (remote, len(changed), len(extra))
+    )
+    return len(changed)
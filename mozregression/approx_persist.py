@@ -1,6 +1,109 @@
 from __future__ import absolute_import
 
+import os
 import re
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+
+class PersistIndex(object):
+    """
+    An index of the build files of a persist directory, by persist key
+    (see :meth:`mozregression.build_info.BuildInfo.persist_key_for`).
+
+    This allows to find the files that may match a build without scanning
+    the whole directory. The index is updated when files are added or
+    removed (see :class:`mozregression.download_manager.DownloadManager`).
+    """
+
+    def __init__(self, filenames=()):
+        self._lock = threading.Lock()
+        self._files = defaultdict(set)
+        for fname in filenames:
+            self.add(fname)
+
+    @classmethod
+    def from_dir(cls, directory):
+        try:
+            return cls(os.listdir(directory))
+        except OSError:
+            return cls()
+
+    @staticmethod
+    def key(filename):
+        return filename.split("--", 1)[0]
+
+    def add(self, filename):
+        with self._lock:
+            self._files[self.key(filename)].add(filename)
+
+    def discard(self, filename):
+        key = self.key(filename)
+        with self._lock:
+            files = self._files.get(key)
+            if files is not None:
+                files.discard(filename)
+                if not files:
+                    del self._files[key]
+
+    def files_for(self, key):
+        """
+        Returns the list of files having the given persist key.
+        """
+        with self._lock:
+            return list(self._files.get(key, ()))
+
+    def __contains__(self, filename):
+        return filename in self.files_for(self.key(filename))
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(files) for files in self._files.values())
+
+
+class PersistIndexCache(object):
+    """
+    Keeps the :class:`PersistIndex` of the last used persist directories,
+    so that a directory is only listed again when it was modified since.
+
+    A directory whose modification time is too recent is not cached, since
+    the file system resolution may not be enough to see the changes that
+    follow the listing.
+    """
+
+    MTIME_MARGIN = 2
+
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, directory):
+        """
+        Returns the index of *directory*, up to date with its content.
+        """
+        directory = os.path.abspath(directory)
+        try:
+            # before the listing, so that changes made during it are seen
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            return PersistIndex()
+        with self._lock:
+            entry = self._indexes.get(directory)
+            if entry is not None and entry[0] == mtime:
+                self._indexes.move_to_end(directory)
+                return entry[1]
+        index = PersistIndex.from_dir(directory)
+        with self._lock:
+            if time.time() - mtime > self.MTIME_MARGIN:
+                self._indexes[directory] = (mtime, index)
+                self._indexes.move_to_end(directory)
+                while len(self._indexes) > self.maxsize:
+                    self._indexes.popitem(last=False)
+            else:
+                self._indexes.pop(directory, None)
+        return index
 
 
 class ApproxPersistChooser(object):
@@ -29,8 +132,8 @@ class ApproxPersistChooser(object):
 
     def _iter(self, build_range, build_info):
         """
-        iterate over the possible file name regexes that can match
-        an approx build, without the exact filename
+        iterate over the indexes and the date or changeset of the builds
+        that can be used as an approx build
         """
         around = len(build_range) // self.one_every
         index = build_range.index(build_info)
@@ -39,10 +142,8 @@ class ApproxPersistChooser(object):
             # Return the date (for nightlies) or the changeset (for
             # taskcluster) associated with the FutureBuildInfo at the
             # given index.
-            return build_info.persist_filename_for(
-                # get_future can raise IndexError if we are out of bounds
-                build_range.get_future(next_index).date_or_changeset()
-            )
+            # get_future can raise IndexError if we are out of bounds
+            return build_range.get_future(next_index).date_or_changeset()
 
         first, last = 0, len(build_range) - 1
         for i in range(1, around + 1):
@@ -63,9 +164,18 @@ class ApproxPersistChooser(object):
         """
         Return the index in the build range that can be used to locate
         the approx build_info, or None if none can be found.
+
+        *filenames* is a :class:`PersistIndex` or a list of file names.
         """
-        for index, fname in self._iter(build_range, build_info):
-            reg = re.compile(fname)
-            for other in filenames:
-                if reg.match(other):
-                    return index
+        if not isinstance(filenames, PersistIndex):
+            filenames = PersistIndex(filenames)
+        if not len(filenames):
+            return None
+        for index, data in self._iter(build_range, build_info):
+            # only the files with the right key may match
+            candidates = filenames.files_for(build_info.persist_key_for(data))
+            if candidates:
+                reg = re.compile(build_info.persist_filename_for(data))
+                for other in candidates:
+                    if reg.match(other):
+                        return index
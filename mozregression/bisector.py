@@ -1,5 +1,6 @@
 from __future__ import absolute_import
 
+import functools
 import math
 import os
 import threading
@@ -10,6 +11,7 @@ from mozlog import get_proxy_logger
 from mozregression.branches import find_branch_in_merge_commit, get_name
 from mozregression.build_range import get_integration_range, get_nightly_range
 from mozregression.dates import to_datetime
+from mozregression.disk_cache import JsonCache
 from mozregression.errors import (
     EmptyPushlogError,
     GoodBadExpectationError,
@@ -17,10 +19,40 @@ from mozregression.errors import (
     MozRegressionError,
 )
 from mozregression.history import BisectionHistory
-from mozregression.json_pushes import JsonPushes
+from mozregression.json_pushes import JsonPushes, Push
 
 LOG = get_proxy_logger("Bisector")
 
+# resolutions of merge pushes, by repo and merge changeset (see
+# IntegrationHandler.handle_merge). Pushes never change, so the entries only
+# expire to keep the cache small.
+MERGE_CACHE = JsonCache("merges.json", ttl=90 * 24 * 3600)
+
+
+def call_in_threads(*funcs):
+    """
+    Call the given functions in parallel threads, and returns the list of
+    their results. If a call raised an exception, it is raised again.
+    """
+    results = [None] * len(funcs)
+    errors = []
+
+    def call(i, func):
+        try:
+            results[i] = func()
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call, args=(i, func)) for i, func in enumerate(funcs)]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
 
 def compute_steps_left(steps):
     if steps <= 1:
@@ -255,16 +287,17 @@ class IntegrationHandler(BisectorHandler):
         originated from by checking the date the changeset first showed up
         in each repo. The repo with the earliest date is chosen.
         """
-        landings = {}
-        for k in ("autoland", "mozilla-inbound"):
-            jp = JsonPushes(k)
+        branches = ("autoland", "mozilla-inbound")
 
+        def landing(branch):
             try:
-                push = jp.push(changeset, full="1")
-                landings[k] = push.timestamp
+                return JsonPushes(branch).push(changeset, full="1").timestamp
             except EmptyPushlogError:
-                LOG.debug("Didn't find %s in %s" % (changeset, k))
+                LOG.debug("Didn't find %s in %s" % (changeset, branch))
 
+        # look in all the branches at the same time
+        timestamps = call_in_threads(*[functools.partial(landing, b) for b in branches])
+        landings = {b: t for b, t in zip(branches, timestamps) if t is not None}
         repo = min(landings, key=landings.get)
         LOG.debug("Repo '%s' seems to have the earliest push" % repo)
         return repo
@@ -272,11 +305,36 @@ class IntegrationHandler(BisectorHandler):
     def handle_merge(self):
         # let's check if we are facing a merge, and in that case,
         # continue the bisection from the merged branch.
-        result = None
-
         LOG.debug("Starting merge handling...")
         # we have to check the commit of the most recent push
+        range_push = self.build_range.future_build_infos[1].data
+        if isinstance(range_push, Push) and len(range_push.changesets) < 2:
+            # a merge push has at least two changesets: no need to ask
+            # hg.mozilla.org for the details of this one.
+            LOG.debug("The most recent push has only one changeset, this is not a merge")
+            return
         most_recent_push = self.build_range[1]
+        cache_key = "%s %s" % (most_recent_push.repo_name, most_recent_push.changeset)
+        merge = MERGE_CACHE.get(cache_key)
+        if merge is None:
+            merge = self._resolve_merge(most_recent_push)
+            MERGE_CACHE.set(cache_key, merge)
+        elif merge:
+            LOG.info("************* Switching to %s" % merge[0])
+        LOG.debug("End merge handling")
+        if not merge:
+            return
+        branch, older, youngest = merge
+        # we are ready to bisect further
+        gr, br = self._reverse_if_find_fix(older, youngest)
+        return (branch, gr, br)
+
+    def _resolve_merge(self, most_recent_push):
+        """
+        Returns a list [branch, older, youngest] giving the changesets of the
+        branch merged in the most recent push, or an empty list if this is
+        not a merge that can be bisected further.
+        """
         jp = JsonPushes(most_recent_push.repo_name)
         push = jp.push(most_recent_push.changeset, full="1")
         msg = push.changeset["desc"]
@@ -298,7 +356,7 @@ class IntegrationHandler(BisectorHandler):
                     " commit message)" % branch
                 )
             else:
-                return
+                return []
         else:
             # so, this is a merge. see how many changesets are in it, if it
             # is just one, we have our answer
@@ -307,7 +365,7 @@ class IntegrationHandler(BisectorHandler):
                     "Merge commit has only two revisions (one of which "
                     "is the merge): we are done"
                 )
-                return
+                return []
 
             # Otherwise, we can find the oldest and youngest
             # changesets, and the branch where the merge comes from.
@@ -327,18 +385,17 @@ class IntegrationHandler(BisectorHandler):
         # changeset. This needs to be done on the right branch.
         try:
             jp2 = JsonPushes(branch)
-            raw = [int(p.push_id) for p in jp2.pushes_within_changes(oldest, youngest)]
+            # the pushes of the oldest and youngest changesets are looked
+            # up at the same time
+            raw = [
+                int(p.push_id)
+                for p in call_in_threads(lambda: jp2.push(oldest), lambda: jp2.push(youngest))
+            ]
             data = jp2.pushes(
                 startID=str(min(raw) - 2),
                 endID=str(max(raw)),
             )
-
-            older = data[0].changeset
-            youngest = data[-1].changeset
-
-            # we are ready to bisect further
-            gr, br = self._reverse_if_find_fix(older, youngest)
-            result = (branch, gr, br)
+            return [branch, data[0].changeset, data[-1].changeset]
         except MozRegressionError:
             LOG.debug("Got exception", exc_info=True)
             raise MozRegressionError(
@@ -347,8 +404,6 @@ class IntegrationHandler(BisectorHandler):
                     most_recent_push.repo_name, most_recent_push.short_changeset, msg
                 )
             )
-        LOG.debug("End merge handling")
-        return result
 
 
 class IndexPromise(object):
@@ -388,6 +443,7 @@ class Bisection(object):
         test_runner,
         dl_in_background=True,
         approx_chooser=None,
+        preinstaller=None,
     ):
         self.handler = handler
         self.build_range = build_range
@@ -396,6 +452,7 @@ class Bisection(object):
         self.dl_in_background = dl_in_background
         self.history = BisectionHistory()
         self.approx_chooser = approx_chooser
+        self.preinstaller = preinstaller
 
     def search_mid_point(self, interrupt=None):
         self.handler.set_build_range(self.build_range)
@@ -434,13 +491,19 @@ class Bisection(object):
         approx_index, persist_files = None, ()
         if self.approx_chooser:
             # try to find an approx build
-            persist_files = os.listdir(self.download_manager.destdir)
+            persist_files = self.download_manager.persist_index
             # first test if we have the exact file - if we do,
             # just act as usual, the downloader will take care of it.
             if build_infos.persist_filename not in persist_files:
                 approx_index = self.approx_chooser.index(
                     self.build_range, build_infos, persist_files
                 )
+        if approx_index is not None:
+            approx_fname = self.build_range[approx_index].persist_filename
+            if not os.path.isfile(self.download_manager.get_dest(approx_fname)):
+                # removed since it was indexed
+                persist_files.discard(approx_fname)
+                approx_index = None
         if approx_index is not None:
             # we found an approx build. First, stop possible background
             # downloads, then update the mid point and build info.
@@ -489,7 +552,12 @@ class Bisection(object):
                 ):
                     pass  # nothing to download, we have an approx build
                 else:
-                    self.download_manager.download_in_background(r[m])
+                    dl = self.download_manager.download_in_background(r[m])
+                    if self.preinstaller:
+                        # install the build once downloaded, so it is ready
+                        # to be launched if it is the next one to test.
+                        dest = self.download_manager.get_dest(r[m].persist_filename)
+                        self.preinstaller.schedule(r[m], dest, dl)
 
         bdata = self.build_range[mid_point]
         # download next left mid point
@@ -502,6 +570,16 @@ class Bisection(object):
         self.build_range.filter_invalid_builds()
         return self.build_range.index(bdata)
 
+    def _discard_preinstalls(self):
+        # throw away the pre-installed builds that are not in the
+        # bisection range anymore.
+        keep = [
+            self.download_manager.get_dest(future.build_info.persist_filename)
+            for future in self.build_range.future_build_infos
+            if future.is_available() and future.is_valid()
+        ]
+        self.preinstaller.discard(keep=keep)
+
     def evaluate(self, build_infos):
         verdict = self.test_runner.evaluate(build_infos, allow_back=bool(self.history))
         # old builds do not have metadata about the repo. But once
@@ -583,6 +661,8 @@ class Bisection(object):
             # user exit
             self.handler.user_exit(mid_point)
             return self.USER_EXIT
+        if self.preinstaller:
+            self._discard_preinstalls()
         return self.RUNNING
 
 
@@ -599,12 +679,14 @@ class Bisector(object):
         download_manager,
         dl_in_background=True,
         approx_chooser=None,
+        preinstaller=None,
     ):
         self.fetch_config = fetch_config
         self.test_runner = test_runner
         self.download_manager = download_manager
         self.dl_in_background = dl_in_background
         self.approx_chooser = approx_chooser
+        self.preinstaller = preinstaller
 
     def bisect(self, handler, good, bad, **kwargs):
         if handler.find_fix:
@@ -625,6 +707,7 @@ class Bisector(object):
             self.test_runner,
             dl_in_background=self.dl_in_background,
             approx_chooser=self.approx_chooser,
+            preinstaller=self.preinstaller,
         )
 
         previous_verdict = None
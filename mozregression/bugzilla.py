@@ -1,21 +1,14 @@
 from __future__ import absolute_import
 
-import re
-
 from mozregression.json_pushes import JsonPushes
 
-RE_BUG_ID = re.compile(r"bug\s+(\d+)", re.I)
-
 
 def find_bugids_in_push(branch, changeset):
-    jp = JsonPushes(branch)
-    push = jp.push(changeset, full="1")
-    branches = set()
-    for chset in push.changesets:
-        res = RE_BUG_ID.search(chset["desc"])
-        if res:
-            branches.add(res.group(1))
-    return [b for b in branches]
+    """
+    Returns the bug ids found in the push of the given changeset. The push
+    is usually already in the push cache (see handle_merge).
+    """
+    return list(JsonPushes(branch).push(changeset, full="1").bug_ids)
 
 
 def bug_url(bugid):
@@ -141,19 +141,13 @@ class BuildInfo(object):
         if self._repo_url is None:
             self._repo_url = app_info.get("application_repository")
 
-    def persist_filename_for(self, data, regex=True):
+    def persist_key_for(self, data):
         """
-        Returns the persistent filename for the given data.
+        Returns the first part of the persistent filename for the given data
+        (see :meth:`persist_filename_for`), up to the first "--".
 
-        `data` should be a date or datetime object if the build type is
-        'nightly', else a changeset.
-
-        if `regex` is True, instead of returning the persistent filename
-        it is returned a string (regex pattern) that can match a filename.
-        The pattern only allows the build name to be different, by using
-        the fetch_config.build_regex() value. For example, it can return:
-
-        '2015-01-11--mozilla-central--firefox.*linux-x86_64\\.tar.bz2$'
+        This is the date or changeset, and the integration persist part if
+        any. For example '2015-01-11' or 'a1b2c3d4e5f6-debug'.
         """
         if self.build_type == "nightly":
             if isinstance(data, datetime.datetime):
@@ -166,10 +160,26 @@ class BuildInfo(object):
             persist_part = self._fetch_config.integration_persist_part()
         if persist_part:
             persist_part = "-" + persist_part
+        return prefix + persist_part
+
+    def persist_filename_for(self, data, regex=True):
+        """
+        Returns the persistent filename for the given data.
+
+        `data` should be a date or datetime object if the build type is
+        'nightly', else a changeset.
+
+        if `regex` is True, instead of returning the persistent filename
+        it is returned a string (regex pattern) that can match a filename.
+        The pattern only allows the build name to be different, by using
+        the fetch_config.build_regex() value. For example, it can return:
+
+        '2015-01-11--mozilla-central--firefox.*linux-x86_64\\.tar.bz2$'
+        """
         extra = self._fetch_config.extra_persist_part()
         if extra:
             extra = extra + "--"
-        full_prefix = "{}{}--{}--{}".format(prefix, persist_part, self.repo_name, extra)
+        full_prefix = "{}--{}--{}".format(self.persist_key_for(data), self.repo_name, extra)
         if regex:
             full_prefix = re.escape(full_prefix)
             appname = self._fetch_config.build_regex()
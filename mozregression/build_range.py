@@ -7,6 +7,7 @@ from __future__ import absolute_import
 
 import copy
 import datetime
+from concurrent.futures import wait
 from threading import Thread
 
 from mozlog import get_proxy_logger
@@ -14,6 +15,8 @@ from mozlog import get_proxy_logger
 from mozregression.dates import is_date_or_datetime, to_date, to_datetime
 from mozregression.errors import BuildInfoNotFound
 from mozregression.fetch_build_info import IntegrationInfoFetcher, NightlyInfoFetcher
+from mozregression.missing_builds import MISSING_BUILDS
+from mozregression.tracing import traced
 
 LOG = get_proxy_logger("Bisector")
 
@@ -30,14 +33,44 @@ class FutureBuildInfo(object):
     def _fetch(self):
         return self.build_info_fetcher.find_build_info(self.data)
 
+    @property
+    def fetch_config(self):
+        return getattr(self.build_info_fetcher, "fetch_config", None)
+
+    def known_missing(self):
+        """
+        Returns the reason why this build is known to be missing from a
+        previous run, or None.
+        """
+        if self.fetch_config is None:
+            return None
+        return MISSING_BUILDS.reason(self.fetch_config, self.data)
+
+    def mark_known_missing(self):
+        """
+        Mark the build invalid if it is known to be missing, without trying
+        to fetch it. Returns True if it was marked.
+        """
+        if self._build_info is not None:
+            return False
+        reason = self.known_missing()
+        if reason is None:
+            return False
+        LOG.warning("Skipping build %s (known missing): %s" % (self.data, reason))
+        self._build_info = False
+        return True
+
     @property
     def build_info(self):
-        if self._build_info is None:
+        if self._build_info is None and not self.mark_known_missing():
             try:
                 self._build_info = self._fetch()
             except BuildInfoNotFound as exc:
                 LOG.warning("Skipping build %s: %s" % (self.data, exc))
                 self._build_info = False
+                # not for errors that may be temporary
+                if self.fetch_config is not None and exc.permanent:
+                    MISSING_BUILDS.add(self.fetch_config, self.data, str(exc))
         return self._build_info
 
     def is_available(self):
@@ -69,8 +102,14 @@ class BuildRange(object):
      - build_range[0]  # item access, will load the build_info if needed
      - build_range[0:5]  # slice operation, return a new build_range object
      - build_range.deleted(5)  # return a new build_range without item 5
+
+    The build infos are fetched in new threads, unless **executor** is set
+    to a :class:`concurrent.futures.Executor`, e.g. to share a bounded
+    pool between several ranges.
     """
 
+    executor = None
+
     def __init__(self, build_info_fetcher, future_build_infos):
         self.build_info_fetcher = build_info_fetcher
         self._future_build_infos = future_build_infos
@@ -105,11 +144,22 @@ class BuildRange(object):
         """
         self._future_build_infos = [b for b in self._future_build_infos if b.is_valid()]
 
+    def filter_known_missing(self):
+        """
+        Remove the items known to be missing from a previous run, so that
+        they are not probed again.
+        """
+        if any([b.mark_known_missing() for b in self._future_build_infos]):
+            self.filter_invalid_builds()
+
     def _fetch(self, indexes):
         indexes = set(indexes)
         need_fetch = any(not self._future_build_infos[i].is_available() for i in indexes)
         if not need_fetch:
             return
+        if self.executor is not None:
+            wait([self.executor.submit(self.__getitem__, i) for i in indexes])
+            return
         threads = [Thread(target=self.__getitem__, args=(i,)) for i in indexes]
         for thread in threads:
             thread.daemon = True
@@ -118,6 +168,7 @@ class BuildRange(object):
             while thread.is_alive():
                 thread.join(0.1)
 
+    @traced("build_range.mid_point", "bisection", lambda self, *a, **kw: {"size": len(self)})
     def mid_point(self, interrupt=None):
         """
         Return the mid point of the range.
@@ -133,6 +184,7 @@ class BuildRange(object):
         because this methods may take a long time to finish, and callers may
         want to end it at some point.
         """
+        self.filter_known_missing()
         while True:
             if interrupt and interrupt():
                 raise StopIteration
@@ -260,15 +312,11 @@ def tc_range_before(future_tc, size):
     return _tc_build_range(future_tc, p_id - size, p_id)
 
 
-def get_integration_range(
-    fetch_config, start_rev, end_rev, time_limit=None, expand=0, interrupt=None
-):
+def integration_pushes(jpushes, start_rev, end_rev, time_limit=None):
     """
-    Creates a BuildRange for integration builds.
+    Returns the pushes between two changesets or dates, for which there
+    may be integration builds.
     """
-    info_fetcher = IntegrationInfoFetcher(fetch_config)
-    jpushes = info_fetcher.jpushes
-
     time_limit = time_limit or (datetime.datetime.now() + datetime.timedelta(days=-365))
 
     def _check_date(obj):
@@ -281,14 +329,33 @@ def get_integration_range(
                 obj = time_limit
         return obj
 
-    start_rev = _check_date(start_rev)
-    end_rev = _check_date(end_rev)
+    return jpushes.pushes_within_changes(_check_date(start_rev), _check_date(end_rev))
 
-    futures_builds = [
-        TCFutureBuildInfo(info_fetcher, push)
-        for push in jpushes.pushes_within_changes(start_rev, end_rev)
-    ]
+
+def get_integration_range(
+    fetch_config,
+    start_rev,
+    end_rev,
+    time_limit=None,
+    expand=0,
+    interrupt=None,
+    pushes=None,
+    executor=None,
+):
+    """
+    Creates a BuildRange for integration builds.
+
+    If **pushes** is given, it is used instead of querying the pushes
+    between start_rev and end_rev. **executor** is set on the range (see
+    :class:`BuildRange`).
+    """
+    info_fetcher = IntegrationInfoFetcher(fetch_config)
+    if pushes is None:
+        pushes = integration_pushes(info_fetcher.jpushes, start_rev, end_rev, time_limit)
+
+    futures_builds = [TCFutureBuildInfo(info_fetcher, push) for push in pushes]
     br = BuildRange(info_fetcher, futures_builds)
+    br.executor = executor
     if expand > 0:
         br.check_expand(expand, tc_range_before, tc_range_after, interrupt=interrupt)
     return br
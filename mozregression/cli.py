@@ -14,12 +14,16 @@ import re
 from argparse import SUPPRESS, Action, ArgumentParser
 
 import mozinfo
-import mozprofile
 from mozlog.structuredlog import get_default_logger
 
 from mozregression import __version__
 from mozregression.branches import get_name
-from mozregression.config import DEFAULT_CONF_FNAME, get_config, write_config
+from mozregression.config import (
+    DEFAULT_CONF_FNAME,
+    DEFAULT_HEADLESS_TIMEOUT,
+    get_config,
+    write_config,
+)
 from mozregression.dates import is_date_or_datetime, parse_date, to_datetime
 from mozregression.errors import DateFormatError, MozRegressionError, UnavailableRelease
 from mozregression.fetch_configs import REGISTRY as FC_REGISTRY
@@ -50,6 +54,8 @@ class _StopAction(Action):
 
 class ListReleasesAction(_StopAction):
     def __call__(self, parser, namespace, values, option_string=None):
+        # the releases may be listed from the cache, with a warning
+        init_logger(debug=False)
         print(formatted_valid_release_dates())
         parser.exit()
 
@@ -301,6 +307,74 @@ def create_parser(defaults):
         ),
     )
 
+    parser.add_argument(
+        "--command-timeout",
+        type=float,
+        metavar="SECONDS",
+        help=(
+            "Kill the --command (and all the processes it started) if it"
+            " is still running after SECONDS. See --timeout-verdict."
+        ),
+    )
+
+    parser.add_argument(
+        "--timeout-verdict",
+        choices=("skip", "bad", "retry"),
+        default="skip",
+        help="Verdict of the builds whose --command timed out. Defaults to %(default)s.",
+    )
+
+    parser.add_argument(
+        "--command-log-dir",
+        metavar="DIR",
+        help=(
+            "Write the output of the --command in a log file per build in"
+            " DIR, instead of the terminal."
+        ),
+    )
+
+    parser.add_argument(
+        "--headless",
+        metavar="URL",
+        help=(
+            "Evaluate desktop builds automatically by loading URL (or a"
+            " local file) in a headless application. See --good-pattern,"
+            " --bad-pattern and --headless-timeout for how the builds are"
+            " evaluated; a crash always makes the build bad."
+        ),
+    )
+
+    parser.add_argument(
+        "--good-pattern",
+        metavar="REGEX",
+        help=(
+            "With --headless, the build is good when a line of the"
+            " application output matches REGEX (e.g. written by the page"
+            " with dump() or console.log()), and bad if no line matched."
+        ),
+    )
+
+    parser.add_argument(
+        "--bad-pattern",
+        metavar="REGEX",
+        help=(
+            "With --headless, the build is bad when a line of the"
+            " application output matches REGEX."
+        ),
+    )
+
+    parser.add_argument(
+        "--headless-timeout",
+        type=float,
+        help=(
+            "With --headless, stop the application after this many seconds"
+            " if it is still running. Defaults to %d. The application does"
+            " not exit by itself, so this must be given if no pattern is:"
+            " each build then runs until the timeout, and is good unless it"
+            " crashed." % DEFAULT_HEADLESS_TIMEOUT
+        ),
+    )
+
     parser.add_argument(
         "--persist",
         default=defaults["persist"],
@@ -335,6 +409,36 @@ def create_parser(defaults):
         ),
     )
 
+    parser.add_argument(
+        "--http-record",
+        metavar="DIR",
+        help=(
+            "Record every HTTP response (build infos, pushlogs and builds)"
+            " in the DIR session archive, to replay them later with"
+            " --http-replay."
+        ),
+    )
+
+    parser.add_argument(
+        "--http-replay",
+        metavar="DIR",
+        help=(
+            "Serve the HTTP responses recorded in the DIR session archive"
+            " (see --http-record) instead of using the network."
+        ),
+    )
+
+    parser.add_argument(
+        "--replay-latency-scale",
+        type=float,
+        default=1.0,
+        help=(
+            "Factor applied to the recorded latencies when replaying HTTP"
+            " responses. Use 0 to serve them as fast as possible."
+            " Defaults to %(default)s."
+        ),
+    )
+
     parser.add_argument(
         "--no-background-dl",
         action="store_false",
@@ -375,12 +479,66 @@ def create_parser(defaults):
         ),
     )
 
+    parser.add_argument(
+        "--retry-missing-builds",
+        action="store_true",
+        help=(
+            "Forget the builds that previous runs could not find, so they are"
+            " probed again. Otherwise such builds are skipped for 7 days."
+        ),
+    )
+
     parser.add_argument(
         "--launch",
         metavar="DATE|BUILDID|RELEASE|CHANGESET",
         help=("Launch only one specific build. Same possible" " values as the --bad option."),
     )
 
+    parser.add_argument(
+        "--variant",
+        dest="variants",
+        metavar="SPEC",
+        action="append",
+        default=[],
+        help=(
+            "Also bisect another platform at the same time, defined by SPEC:"
+            " comma separated bits=, arch= and build-type= values (e.g."
+            " bits=32,build-type=debug), the other values being the ones of"
+            " --bits, --arch and --build-type. Can be given several times."
+            " The bisections run in parallel on the same integration pushes,"
+            " so builds must be evaluated with --command or --headless."
+        ),
+    )
+
+    parser.add_argument(
+        "--sweep",
+        metavar="PATH",
+        help=(
+            "Instead of bisecting, evaluate every build between --good and"
+            " --bad with the --command, several at a time, and write the"
+            " results to PATH as they come: a CSV table if PATH ends with"
+            " .csv, else JSON lines. Use - for stdout. Only for jsshell."
+        ),
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help=(
+            "Number of builds evaluated at the same time by --sweep."
+            " Defaults to the number of cores."
+        ),
+    )
+
+    parser.add_argument(
+        "--download-jobs",
+        type=int,
+        default=4,
+        help="Number of builds downloaded at the same time by --sweep. Defaults to %(default)s.",
+    )
+
     parser.add_argument(
         "-P",
         "--process-output",
@@ -417,6 +575,17 @@ def create_parser(defaults):
         help="Helps to write the configuration file.",
     )
 
+    parser.add_argument(
+        "--trace-out",
+        metavar="PATH",
+        help=(
+            "Record the time spent in the bisection steps (build info"
+            " lookups, downloads, installs, launches and verdicts), write"
+            " them to PATH as a Chrome trace-event JSON file and print a"
+            " summary at exit."
+        ),
+    )
+
     parser.add_argument("--debug", "-d", action="store_true", help="Show the debug output.")
 
     return parser
@@ -433,10 +602,30 @@ def parse_bits(option_bits):
         return mozinfo.bits
 
 
+def parse_variant(spec):
+    """
+    Parse a --variant value, e.g. 'bits=32,build-type=debug', and returns a
+    dict.
+    """
+    variant = {}
+    for item in spec.split(","):
+        key, sep, value = item.partition("=")
+        key = key.strip()
+        if not sep or key not in ("bits", "arch", "build-type"):
+            raise MozRegressionError(
+                "Invalid --variant %r: expected comma separated bits=, arch= or"
+                " build-type= values" % spec
+            )
+        variant[key] = value.strip()
+    return variant
+
+
 def preferences(prefs_files, prefs_args, logger):
     """
     profile preferences
     """
+    import mozprofile.prefs
+
     # object that will hold the preferences
     prefs = mozprofile.prefs.Preferences()
 
@@ -518,6 +707,7 @@ class Configuration(object):
 
         self.action = None
         self.fetch_config = None
+        self.fetch_configs = None
 
     def _convert_to_bisect_arg(self, value):
         """
@@ -554,6 +744,28 @@ class Configuration(object):
                 self.logger.info("%s is not a release, assuming it's a hash..." % value)
         return value
 
+    def _create_variant_config(self, variant, arch_options):
+        """
+        Create the fetch config of a --variant, the values that are not
+        given being the ones of the main fetch config.
+        """
+        options = self.options
+        bits = parse_bits(variant["bits"]) if "bits" in variant else options.bits
+        arch = variant.get("arch", options.arch)
+        if arch is not None and arch not in arch_options.get(options.app, ()):
+            raise MozRegressionError(
+                "Invalid arch (%s) specified for app (%s) in --variant." % (arch, options.app)
+            )
+        fetch_config = create_config(options.app, mozinfo.os, bits, mozinfo.processor, arch)
+        if options.lang:
+            fetch_config.set_lang(options.lang)
+        build_type = variant.get("build-type", options.build_type)
+        if build_type:
+            fetch_config.set_build_type(build_type)
+        fetch_config.set_repo(self.fetch_config.repo)
+        fetch_config.set_base_url(options.archive_base_url)
+        return fetch_config
+
     def validate(self):
         """
         Validate the options, define the `action` and `fetch_config` that
@@ -652,6 +864,7 @@ class Configuration(object):
         if options.bits == 32 and mozinfo.os == "mac":
             self.logger.info("only 64-bit builds available for mac, using 64-bit builds.")
 
+        creds = None
         if fetch_config.is_integration() and fetch_config.tk_needs_auth():
             creds = tc_authenticate(self.logger)
             fetch_config.set_tk_credentials(creds)
@@ -710,6 +923,63 @@ class Configuration(object):
             raise MozRegressionError(
                 "Unable to bisect integration for `%s`" % fetch_config.app_name
             )
+        if options.command is None:
+            for flag in ("command_timeout", "command_log_dir"):
+                if getattr(options, flag) is not None:
+                    raise MozRegressionError("--%s requires --command" % flag.replace("_", "-"))
+        elif options.command_timeout is not None and options.command_timeout <= 0:
+            raise MozRegressionError("--command-timeout must be a positive number")
+        if options.headless:
+            if options.command is not None:
+                raise MozRegressionError("--headless and --command can not be used together")
+            if fetch_config.app_name not in ("firefox", "thunderbird"):
+                raise MozRegressionError("--headless is only supported for firefox and thunderbird")
+            if options.headless_timeout is None:
+                if options.good_pattern is None and options.bad_pattern is None:
+                    raise MozRegressionError(
+                        "--headless requires --good-pattern, --bad-pattern or"
+                        " --headless-timeout: without a pattern, every build"
+                        " runs until the timeout"
+                    )
+                options.headless_timeout = DEFAULT_HEADLESS_TIMEOUT
+            elif options.headless_timeout <= 0:
+                raise MozRegressionError("--headless-timeout must be a positive number")
+        for flag in ("good_pattern", "bad_pattern"):
+            pattern = getattr(options, flag)
+            if pattern is None:
+                continue
+            if not options.headless:
+                raise MozRegressionError("--%s requires --headless" % flag.replace("_", "-"))
+            try:
+                re.compile(pattern)
+            except re.error as exc:
+                raise MozRegressionError(
+                    "Invalid --%s %r: %s" % (flag.replace("_", "-"), pattern, exc)
+                )
+        if options.sweep:
+            if options.launch:
+                raise MozRegressionError("--sweep and --launch can not be used together")
+            if fetch_config.app_name != "jsshell" or options.command is None:
+                raise MozRegressionError("--sweep is only supported for jsshell with a --command")
+            self.action = self.action.replace("bisect_", "sweep_")
+        self.fetch_configs = [fetch_config]
+        if options.variants:
+            if self.action not in ("bisect_integration", "bisect_nightlies"):
+                raise MozRegressionError("--variant can only be used to bisect")
+            if not fetch_config.is_integration():
+                raise MozRegressionError(
+                    "Unable to bisect integration for `%s`" % fetch_config.app_name
+                )
+            if options.command is None and not options.headless:
+                raise MozRegressionError("--variant requires --command or --headless")
+            for spec in options.variants:
+                variant_config = self._create_variant_config(parse_variant(spec), arch_options)
+                if variant_config.tk_needs_auth():
+                    variant_config.set_tk_credentials(creds or tc_authenticate(self.logger))
+                self.fetch_configs.append(variant_config)
+            # a bisection must not cancel the downloads of the others
+            options.background_dl_policy = "keep"
+            self.action = "multi_bisect"
         options.preferences = preferences(options.prefs_files, options.prefs, self.logger)
         # convert GiB to bytes.
         options.persist_size_limit = int(abs(float(options.persist_size_limit)) * 1073741824)
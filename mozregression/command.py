@@ -0,0 +1,159 @@
+"""
+Run test commands with a timeout.
+
+A test command usually starts a browser, which may start other processes.
+The command is run in its own process group (a new session on POSIX), so
+that on timeout, or when mozregression is interrupted, the whole process
+tree can be killed and not only the shell that started it.
+
+On POSIX the command is waited with wait4(), which also returns the
+resources it used (CPU time and max RSS, including the ones of the
+processes it waited for).
+"""
+
+from __future__ import absolute_import
+
+import os
+import signal
+import subprocess
+import sys
+import time
+
+from mozlog import get_proxy_logger
+
+LOG = get_proxy_logger("Test Runner")
+
+# seconds given to the processes to exit after SIGTERM, before SIGKILL
+KILL_GRACE = 5
+
+
+class CommandResult(object):
+    """
+    The result of a command run with :func:`run_command`.
+
+    :attr returncode: the exit code of the command, negative for a signal
+    :attr timed_out: True if the command was killed on timeout
+    :attr wall_time: the duration of the run, in seconds
+    :attr cpu_time: the user + system CPU time in seconds, or None
+    :attr max_rss: the maximum resident set size in bytes, or None
+    """
+
+    def __init__(self, returncode, timed_out=False, wall_time=0.0, cpu_time=None, max_rss=None):
+        self.returncode = returncode
+        self.timed_out = timed_out
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.max_rss = max_rss
+
+    def format_usage(self):
+        usage = "wall %.1fs" % self.wall_time
+        if self.cpu_time is not None:
+            usage += ", cpu %.1fs" % self.cpu_time
+        if self.max_rss is not None:
+            usage += ", max rss %.1f MiB" % (self.max_rss / 1048576.0)
+        return usage
+
+
+def _popen_kwargs():
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _wait(proc, timeout=None):
+    """
+    Wait for the process, and returns its resource usage if available.
+
+    :raises: subprocess.TimeoutExpired
+    """
+    if not hasattr(os, "wait4"):
+        proc.wait(timeout)
+        return None
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = 0.001
+    while True:
+        pid, status, rusage = os.wait4(proc.pid, os.WNOHANG)
+        if pid:
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            return rusage
+        if deadline is not None and time.monotonic() >= deadline:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.05)
+
+
+def _killpg(proc, sig):
+    try:
+        os.killpg(proc.pid, sig)
+    except OSError:
+        pass  # no process left in the group
+
+
+def kill_tree(proc):
+    """
+    Kill the process started by :func:`run_command` and its children, and
+    returns its resource usage if available.
+    """
+    if sys.platform == "win32":
+        subprocess.call(
+            ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return _wait(proc)
+    _killpg(proc, signal.SIGTERM)
+    try:
+        rusage = _wait(proc, KILL_GRACE)
+    except subprocess.TimeoutExpired:
+        _killpg(proc, signal.SIGKILL)
+        return _wait(proc)
+    # the children may have survived their parent
+    _killpg(proc, signal.SIGKILL)
+    return rusage
+
+
+def run_command(args, env=None, timeout=None, log_file=None):
+    """
+    Run the command *args* and returns a :class:`CommandResult`.
+
+    :param timeout: if not None, the command and its children are killed
+                    after this many seconds.
+    :param log_file: if not None, the output of the command is appended to
+                     this file instead of the terminal.
+    """
+    output = None
+    if log_file is not None:
+        output = open(log_file, "ab")
+        output.write(("$ %s\n" % (args if isinstance(args, str) else " ".join(args))).encode())
+        output.flush()
+    try:
+        start = time.monotonic()
+        proc = subprocess.Popen(
+            args,
+            env=env,
+            stdout=output,
+            stderr=subprocess.STDOUT if output else None,
+            **_popen_kwargs(),
+        )
+        timed_out = False
+        try:
+            rusage = _wait(proc, timeout)
+        except subprocess.TimeoutExpired:
+            LOG.warning("Test command timed out after %s seconds, killing it" % timeout)
+            timed_out = True
+            rusage = kill_tree(proc)
+        except BaseException:
+            # e.g. KeyboardInterrupt: the command is in its own process
+            # group, so it did not get the signal.
+            kill_tree(proc)
+            raise
+        wall_time = time.monotonic() - start
+    finally:
+        if output is not None:
+            output.close()
+    result = CommandResult(proc.returncode, timed_out=timed_out, wall_time=wall_time)
+    if rusage is not None:
+        result.cpu_time = rusage.ru_utime + rusage.ru_stime
+        # kilobytes on Linux, bytes on macOS
+        result.max_rss = rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    return result
@@ -19,11 +19,23 @@ DEFAULT_CONF_FNAME = os.path.expanduser(
 TC_CREDENTIALS_FNAME = os.path.expanduser(
     os.path.join("~", ".mozilla", "mozregression", "taskcluster-credentials.json")
 )
+# directory of the persistent caches (see mozregression.disk_cache)
+CACHE_DIR = os.path.expanduser(os.path.join("~", ".mozilla", "mozregression", "cache"))
+# usage pings waiting to be uploaded (see mozregression.telemetry)
+TELEMETRY_SPOOL_DIR = os.path.expanduser(
+    os.path.join("~", ".mozilla", "mozregression", "telemetry-spool")
+)
+# data of Glean, the telemetry library
+GLEAN_DATA_DIR = os.path.expanduser(os.path.join("~", ".mozilla", "mozregression", "data"))
+# socket of the mozregression daemon (see mozregression.daemon)
+DAEMON_SOCKET = os.path.expanduser(os.path.join("~", ".mozilla", "mozregression", "daemon.sock"))
 ARCHIVE_BASE_URL = "https://archive.mozilla.org/pub"
 # when a bisection range needs to be expanded, the following value is used to
 # specify how many builds we try (if 20, we will try 20 before the lower limit,
 # and another 20 after the higher limit)
 DEFAULT_EXPAND = 20
+# seconds after which an application evaluated with --headless is stopped
+DEFAULT_HEADLESS_TIMEOUT = 60
 
 # default values when not defined in config file.
 # Note that this is also the list of options that can be used in config file
@@ -0,0 +1,445 @@
+"""
+A long-running mozregression process, that runs the commands of the
+mozregression command line for it.
+
+Each mozregression invocation has to import its dependencies, open new
+HTTP connections and rebuild its caches. When the daemon is started
+(with ``mozregression-daemon``), it listens on a local Unix socket and the
+``mozregression`` command only forwards its arguments, working directory,
+environment and standard streams (the file descriptors themselves) to it,
+then exits with the exit code of the job. The daemon keeps between jobs:
+
+- the imported modules and the in-memory caches (pushes, merges...);
+- the HTTP connection pools;
+- the index of the persist directories, while they are not modified;
+- the installs of the last desktop builds that were run.
+
+Jobs are run one at a time, in the main thread of the daemon; the other
+clients wait for their turn. Interrupting a client (Ctrl-C) interrupts
+its job. The daemon is not used when the MOZREGRESSION_NO_DAEMON
+environment variable is set, or when the client and the daemon versions
+differ. MOZREGRESSION_DAEMON_SOCKET can be used to change the path of the
+socket.
+
+This is only available on POSIX systems, since the file descriptors are
+passed to the daemon through the socket.
+"""
+
+from __future__ import absolute_import
+
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+
+from mozlog import get_proxy_logger
+
+from mozregression import __version__
+from mozregression.config import DAEMON_SOCKET
+
+LOG = get_proxy_logger("Daemon")
+
+SUPPORTED = hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+def socket_path():
+    return os.environ.get("MOZREGRESSION_DAEMON_SOCKET") or DAEMON_SOCKET
+
+
+def _send_message(sock, message):
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def _read_message(stream):
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line.decode("utf-8"))
+
+
+def forward_to_daemon(argv):
+    """
+    Run the command line *argv* (including the program name) in the daemon,
+    if one is running, and returns its exit code.
+
+    Returns None if the command should be run by this process instead.
+    """
+    if not SUPPORTED or os.environ.get("MOZREGRESSION_NO_DAEMON"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path())
+    except OSError:
+        # no daemon running
+        sock.close()
+        return None
+    with sock:
+        for stream in (sys.stdout, sys.stderr):
+            stream.flush()
+        # the standard streams are given with the first byte
+        socket.send_fds(sock, [b"\0"], [0, 1, 2])
+        _send_message(
+            sock,
+            {
+                "version": __version__,
+                "argv": list(argv),
+                "cwd": os.getcwd(),
+                "env": dict(os.environ),
+            },
+        )
+        stream = sock.makefile("rb")
+        while True:
+            try:
+                reply = _read_message(stream)
+                break
+            except KeyboardInterrupt:
+                _send_message(sock, {"interrupt": True})
+    if reply is None:
+        sys.stderr.write("mozregression: the daemon stopped while running the command\n")
+        return 1
+    if "refused" in reply:
+        sys.stderr.write("mozregression: not using the daemon: %s\n" % reply["refused"])
+        return None
+    return reply["exit_code"]
+
+
+class Shutdown(BaseException):
+    """
+    Raised in the main thread of the daemon when it must stop.
+    """
+
+
+class JobInterrupted(KeyboardInterrupt):
+    """
+    Raised in the main thread of the daemon when a client interrupts its job.
+    """
+
+
+class Job(object):
+    """
+    A command run by the daemon for a client.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.running = True
+        self.interrupted = False
+
+
+class Daemon(object):
+    """
+    Run the jobs sent by the clients on the Unix socket at *path*.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._server = None
+        self._lock = threading.Lock()
+        # the job that should get the next SIGINT, if it is still running
+        self._interrupted_job = None
+        self._http_adapter = None
+        self._install_cache = None
+
+    def start(self):
+        """
+        Listen on the socket, and set up what is kept between the jobs.
+        """
+        import requests
+
+        from mozregression import download_manager
+        from mozregression.approx_persist import PersistIndexCache
+        from mozregression.errors import MozRegressionError
+        from mozregression.test_runner import InstallCache, TestRunner
+
+        if os.path.exists(self.path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                # left by a daemon that was killed
+                os.remove(self.path)
+            else:
+                raise MozRegressionError("A daemon is already running on %s" % self.path)
+            finally:
+                probe.close()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # only the user can connect
+        umask = os.umask(0o077)
+        try:
+            self._server.bind(self.path)
+        finally:
+            os.umask(umask)
+        self._server.listen(16)
+
+        self._http_adapter = requests.adapters.HTTPAdapter(pool_maxsize=16)
+        self._install_cache = TestRunner.install_cache = InstallCache()
+        download_manager.PERSIST_INDEXES = PersistIndexCache()
+
+    def close(self):
+        from mozregression import download_manager
+        from mozregression.test_runner import TestRunner
+
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+        if self._install_cache is not None:
+            TestRunner.install_cache = None
+            self._install_cache.clear()
+            self._install_cache = None
+        download_manager.PERSIST_INDEXES = None
+        if self._http_adapter is not None:
+            self._http_adapter.close()
+            self._http_adapter = None
+
+    def http_session(self):
+        """
+        Returns a new requests session, that uses the shared connection pools.
+        """
+        import requests
+
+        session = requests.Session()
+        session.mount("http://", self._http_adapter)
+        session.mount("https://", self._http_adapter)
+        return session
+
+    def interrupt(self, job):
+        """
+        Interrupt the job from another thread: it gets a KeyboardInterrupt,
+        as if Ctrl-C was hit.
+        """
+        with self._lock:
+            if job.running and not job.interrupted:
+                job.interrupted = True
+                self._interrupted_job = job
+                # a real signal, so that blocking calls are interrupted
+                signal.pthread_kill(threading.main_thread().ident, signal.SIGINT)
+
+    def _finish(self, job):
+        with self._lock:
+            job.running = False
+
+    def _on_sigint(self, signum, frame):
+        job, self._interrupted_job = self._interrupted_job, None
+        if job is not None and not job.running:
+            # interrupted by its client, but the job finished meanwhile
+            return
+        if job is not None:
+            raise JobInterrupted
+        raise KeyboardInterrupt
+
+    def _on_sigterm(self, signum, frame):
+        raise Shutdown()
+
+    def serve_forever(self):
+        """
+        Handle the clients until the daemon is interrupted. This must be
+        called from the main thread.
+        """
+        signal.signal(signal.SIGINT, self._on_sigint)
+        signal.signal(signal.SIGTERM, self._on_sigterm)
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except KeyboardInterrupt:
+                return
+            with conn:
+                try:
+                    self.handle(conn)
+                except JobInterrupted:
+                    # the client interrupted its job just as it finished
+                    LOG.debug("Job interrupted after its end")
+
+    def _watch(self, conn, job):
+        # the client sends a message when it is interrupted, and closes the
+        # connection if it is killed
+        try:
+            stream = conn.makefile("rb", buffering=0)
+            while _read_message(stream) is not None:
+                self.interrupt(job)
+        except (OSError, ValueError):
+            pass
+        self.interrupt(job)
+
+    def handle(self, conn):
+        """
+        Run the job sent on the connection *conn* and reply its exit code.
+        """
+        try:
+            _, fds, _, _ = socket.recv_fds(conn, 1, 3)
+        except OSError:
+            return
+        try:
+            request = _read_message(conn.makefile("rb", buffering=0))
+            if request is None or len(fds) != 3:
+                return
+            if request.get("version") != __version__:
+                _send_message(
+                    conn,
+                    {"refused": "the daemon runs version %s" % __version__},
+                )
+                return
+            job = Job(request)
+            watcher = threading.Thread(target=self._watch, args=(conn, job))
+            watcher.daemon = True
+            watcher.start()
+            start = time.time()
+            try:
+                exit_code = self.run_job(job, fds)
+            except JobInterrupted:
+                # the job was over when the interruption was received
+                exit_code = 1
+            finally:
+                self._finish(job)
+            LOG.info(
+                "%s: exit code %s, %.1fs"
+                % (" ".join(request["argv"][1:]), exit_code, time.time() - start)
+            )
+            _send_message(conn, {"exit_code": exit_code})
+        except (OSError, ValueError) as exc:
+            LOG.debug("Invalid or interrupted request: %s" % exc)
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def run_job(self, job, fds):
+        """
+        Run the mozregression command line of the job, with the working
+        directory, environment and standard streams of the client, and
+        returns its exit code.
+        """
+        import atexit
+        import logging
+
+        from mozlog.structuredlog import StructuredLogger, get_default_logger, set_default_logger
+
+        from mozregression import main
+        from mozregression.tracing import TRACER
+
+        request = job.request
+        saved_fds = [os.dup(fd) for fd in range(3)]
+        saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+        saved_env = dict(os.environ)
+        saved_argv = sys.argv
+        saved_cwd = os.getcwd()
+        saved_handlers = logging.root.handlers[:]
+        saved_logger = get_default_logger()
+        # the loggers of the same name share their handlers
+        shared_logger = StructuredLogger("mozregression")
+        saved_log_handlers = shared_logger.handlers[:]
+        saved_atexit = atexit.register
+        exit_callbacks = []
+        for stream in saved_streams[1:]:
+            stream.flush()
+        try:
+            for handler in saved_log_handlers:
+                shared_logger.remove_handler(handler)
+            for target, fd in enumerate(fds):
+                os.dup2(fd, target)
+            sys.stdin = open(0, closefd=False)
+            sys.stdout = open(1, "w", buffering=1, closefd=False)
+            sys.stderr = open(2, "w", buffering=1, closefd=False)
+            os.environ.clear()
+            os.environ.update(request["env"])
+            os.chdir(request["cwd"])
+            # used to print how to resume a bisection
+            sys.argv = request["argv"]
+            # the callbacks that would be called when the process exits are
+            # called at the end of the job instead
+            atexit.register = lambda func, *args, **kwargs: exit_callbacks.append(
+                (func, args, kwargs)
+            )
+            try:
+                main.main(
+                    request["argv"][1:],
+                    check_new_version=False,
+                    http_session=self.http_session(),
+                )
+                exit_code = 0
+            except SystemExit as exc:
+                exit_code = exc.code
+            except KeyboardInterrupt:
+                exit_code = "\nInterrupted."
+            except Exception:
+                # as the interpreter would do
+                traceback.print_exc()
+                exit_code = 1
+            self._finish(job)
+            atexit.register = saved_atexit
+            for func, args, kwargs in reversed(exit_callbacks):
+                func(*args, **kwargs)
+            if exit_code is None:
+                exit_code = 0
+            elif not isinstance(exit_code, int):
+                sys.stderr.write("%s\n" % exit_code)
+                exit_code = 1
+            return exit_code
+        finally:
+            atexit.register = saved_atexit
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except (OSError, ValueError):
+                    pass
+            sys.stdin, sys.stdout, sys.stderr = saved_streams
+            for target, fd in enumerate(saved_fds):
+                os.dup2(fd, target)
+                os.close(fd)
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+            sys.argv = saved_argv
+            logging.root.handlers[:] = saved_handlers
+            for handler in shared_logger.handlers[:]:
+                shared_logger.remove_handler(handler)
+            for handler in saved_log_handlers:
+                shared_logger.add_handler(handler)
+            if saved_logger is not None:
+                set_default_logger(saved_logger)
+            TRACER.enable(False)
+            TRACER.reset()
+
+
+def daemon_main(argv=None):
+    """
+    Entry point of the mozregression-daemon command.
+    """
+    from mozregression.errors import MozRegressionError
+    from mozregression.log import init_logger
+
+    parser = argparse.ArgumentParser(
+        description="Run mozregression commands faster: while this daemon is"
+        " running, the mozregression command line is run by it."
+    )
+    parser.add_argument("--debug", action="store_true", help="Show the debug output.")
+    options = parser.parse_args(argv)
+    if not SUPPORTED:
+        sys.exit("The mozregression daemon is not supported on this system.")
+
+    logger = init_logger(debug=options.debug)
+    daemon = Daemon(socket_path())
+    try:
+        daemon.start()
+    except MozRegressionError as exc:
+        sys.exit(str(exc))
+    logger.info("mozregression %s daemon listening on %s" % (__version__, daemon.path))
+    try:
+        daemon.serve_forever()
+    except Shutdown:
+        pass
+    finally:
+        daemon.close()
+    logger.info("Stopped.")
+
+
+if __name__ == "__main__":
+    daemon_main()
@@ -0,0 +1,127 @@
+"""
+Small persistent caches, stored as JSON files in the
+:data:`mozregression.config.CACHE_DIR` directory.
+
+A cache is never required to work: any error while reading or writing it
+is logged at debug level and the cache just behaves as if it was empty.
+"""
+
+from __future__ import absolute_import
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from mozlog import get_proxy_logger
+
+from mozregression import config
+
+LOG = get_proxy_logger("Cache")
+
+
+class JsonCache(object):
+    """
+    A key-value cache stored in a JSON file.
+
+    :param name: the file name of the cache, in the cache directory.
+    :param ttl: if given, the number of seconds after which an entry
+                expires.
+    """
+
+    def __init__(self, name, ttl=None):
+        self.name = name
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        return os.path.join(config.CACHE_DIR, self.name)
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError) as exc:
+            if not isinstance(exc, FileNotFoundError):
+                LOG.debug("Unable to read the cache %s: %s" % (self.path, exc))
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _dump(self, data):
+        path = self.path
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write in a temporary file first, so concurrent processes never
+            # read a partial file
+            with tempfile.NamedTemporaryFile(
+                "w", dir=os.path.dirname(path), suffix=".tmp", delete=False
+            ) as f:
+                json.dump(data, f)
+            os.replace(f.name, path)
+        except (IOError, OSError) as exc:
+            LOG.debug("Unable to write the cache %s: %s" % (path, exc))
+
+    def _expired(self, entry, now):
+        if not isinstance(entry, dict) or "time" not in entry or "value" not in entry:
+            return True  # invalid entry
+        return self.ttl is not None and now - entry["time"] > self.ttl
+
+    def get(self, key, default=None):
+        """
+        Returns the value stored for *key*, or *default* if there is none or
+        if it has expired.
+        """
+        with self._lock:
+            entry = self._load().get(key)
+        if entry is None or self._expired(entry, time.time()):
+            return default
+        return entry["value"]
+
+    def items(self):
+        """
+        Returns a dict of all the values that have not expired.
+        """
+        with self._lock:
+            data = self._load()
+        now = time.time()
+        return {k: e["value"] for k, e in data.items() if not self._expired(e, now)}
+
+    def set(self, key, value):
+        """
+        Store a JSON-serializable *value* for *key*. Expired entries are
+        removed.
+        """
+        self.update({key: value})
+
+    def update(self, values):
+        """
+        Store several values at once.
+        """
+        now = time.time()
+        with self._lock:
+            data = self._load()
+            data = {k: e for k, e in data.items() if not self._expired(e, now)}
+            for key, value in values.items():
+                data[key] = {"time": now, "value": value}
+            self._dump(data)
+
+    def clear(self):
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+def file_digest(path, algorithm="sha256", chunk_size=1024 * 1024):
+    """
+    Returns the hex digest of the content of the file at *path*.
+    """
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
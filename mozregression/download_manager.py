@@ -1,19 +1,32 @@
 from __future__ import absolute_import, print_function
 
+import errno
 import os
 import sys
 import tempfile
 import threading
+import time
 from contextlib import closing
 
 import mozfile
 import requests
 from mozlog import get_proxy_logger
 
+from mozregression.approx_persist import PersistIndex
+from mozregression.errors import MozRegressionError
 from mozregression.persist_limit import PersistLimit
+from mozregression.progress import ProgressAggregator, format_transfer
+from mozregression.tracing import NOOP_SPAN, span
 
 LOG = get_proxy_logger("Download")
 
+CHUNK_SIZE = 1024 * 1024
+
+# if set to a PersistIndexCache, the index of a persist dir is reused by the
+# next download managers (e.g. by the jobs of the daemon) while the
+# directory is not modified.
+PERSIST_INDEXES = None
+
 
 class DownloadInterrupt(Exception):
     pass
@@ -39,6 +52,8 @@ class Download(object):
                               instance as a parameter.
     :param chunk_size: size of the chunk that will be read. The thread can
                         not be stopped while we are reading that chunk size.
+                        Large chunks means less python work and less
+                        syscalls per byte downloaded.
     :param session: a requests.Session or the requests module that will do
                     do the real downloading work.
     :param progress: A callable to report the progress (default to None).
@@ -50,7 +65,7 @@ class Download(object):
         url,
         dest,
         finished_callback=None,
-        chunk_size=16 * 1024,
+        chunk_size=CHUNK_SIZE,
         session=requests,
         progress=None,
     ):
@@ -165,10 +180,32 @@ class Download(object):
             total_size = 0
         return total_size
 
+    @staticmethod
+    def _preallocate(fileobj, size):
+        """
+        Reserve *size* bytes on the disk for *fileobj*, so we fail early
+        when the disk is full (and the file is not fragmented).
+        """
+        if not hasattr(os, "posix_fallocate"):
+            return False
+        try:
+            os.posix_fallocate(fileobj.fileno(), 0, size)
+        except OSError as exc:
+            if exc.errno == errno.ENOSPC:
+                raise MozRegressionError(
+                    "Not enough disk space in %s to download %d bytes"
+                    % (os.path.dirname(fileobj.name), size)
+                )
+            # the file system may not support it, that is fine
+            LOG.debug("Unable to preallocate %s: %s" % (fileobj.name, exc))
+            return False
+        return True
+
     def _update_progress(self, current, total):
         with self._lock:
-            if self.__progress:
-                self.__progress(self, current, total)
+            progress = self.__progress
+        if progress:
+            progress(self, current, total)
 
     def _download(self, url, dest, finished_callback, chunk_size, session):
         # save the file under a temporary name
@@ -177,8 +214,11 @@ class Download(object):
         # abruptly)
         temp = None
         bytes_so_far = 0
+        trace = span("download", "download", url=url).start()
+        started = time.perf_counter()
         try:
             with closing(session.get(url, stream=True)) as response:
+                trace.set(ttfb=round(time.perf_counter() - started, 3))
                 # GCP storage does not always return a content-length header, check alternates.
                 total_size = self.get_total_size(response.headers)
 
@@ -190,6 +230,9 @@ class Download(object):
                 with tempfile.NamedTemporaryFile(
                     delete=False, mode="wb", suffix=".tmp", dir=os.path.dirname(dest)
                 ) as temp:
+                    preallocated = (
+                        total_size and response.ok and self._preallocate(temp, total_size)
+                    )
                     for chunk in response.iter_content(chunk_size):
                         if self.is_canceled():
                             break
@@ -198,9 +241,21 @@ class Download(object):
                         bytes_so_far += len(chunk)
                         if total_size:
                             self._update_progress(bytes_so_far, total_size)
+                    if preallocated:
+                        # in case less than expected was written
+                        temp.truncate()
             response.raise_for_status()
         except Exception:
             self.__error = sys.exc_info()
+        if trace is not NOOP_SPAN:
+            elapsed = time.perf_counter() - started
+            trace.set(
+                size=bytes_so_far,
+                throughput=round(bytes_so_far / elapsed) if elapsed else 0,
+                canceled=self.is_canceled(),
+                error=bool(self.__error),
+            )
+            trace.finish()
         try:
             if temp is None:
                 pass  # not even opened the temp file, nothing to do
@@ -249,6 +304,9 @@ class DownloadManager(object):
     :param persist_limit: an instance of :class:`PersistLimit`, to allow
                           limiting the size of the download dir. Defaults
                           to None, meaning no limit.
+
+    The files of the download dir are indexed in :attr:`persist_index` (a
+    :class:`PersistIndex`), that is kept up to date with the downloads.
     """
 
     def __init__(self, destdir, session=requests, persist_limit=None):
@@ -262,6 +320,10 @@ class DownloadManager(object):
         # if persist folder does not exist, create it
         if not os.path.isdir(destdir):
             os.makedirs(destdir)
+        if PERSIST_INDEXES is not None:
+            self.persist_index = PERSIST_INDEXES.get(destdir)
+        else:
+            self.persist_index = PersistIndex.from_dir(destdir)
 
     def get_dest(self, fname):
         return os.path.join(self.destdir, fname)
@@ -333,13 +395,21 @@ class DownloadManager(object):
         with self._lock:
             dest = dl.get_dest()
             del self._downloads[dest]
+            if os.path.isfile(dest):
+                self.persist_index.add(os.path.basename(dest))
             self.persist_limit.register_file(dest)
-            self.persist_limit.remove_old_files()
+            for path in self.persist_limit.remove_old_files():
+                self.persist_index.discard(os.path.basename(path))
 
 
-def download_progress(_dl, bytes_so_far, total_size):
-    percent = (float(bytes_so_far) / total_size) * 100
-    sys.stdout.write("===== Downloaded %d%% =====\r" % percent)
+def download_progress(transfers):
+    """
+    Print the progress of the downloads on a single console line. This is
+    the report function of the :class:`ProgressAggregator` of the
+    :class:`BuildDownloadManager`.
+    """
+    line = "===== Downloaded %s =====" % ", ".join(format_transfer(t) for t in transfers)
+    sys.stdout.write(line.ljust(79) + "\r")
     sys.stdout.flush()
 
 
@@ -359,6 +429,14 @@ class BuildDownloadManager(DownloadManager):
         self._downloads_bg = set()
         assert background_dl_policy in ("cancel", "keep")
         self.background_dl_policy = background_dl_policy
+        self.progress = ProgressAggregator(self._report_progress)
+
+    def _report_progress(self, transfers):
+        download_progress(transfers)
+
+    def _download_finished(self, dl):
+        self.progress.remove(dl)
+        DownloadManager._download_finished(self, dl)
 
     def _extract_download_info(self, build_info):
         return build_info.build_url, build_info.persist_filename
@@ -381,7 +459,9 @@ class BuildDownloadManager(DownloadManager):
 
         *focus* here means that if there are running downloads for other
         builds they will be canceled. Also, the progress is attached so
-        the user can see the download progress.
+        the user can see the download progress. The progress is reported
+        through :attr:`progress`, a :class:`ProgressAggregator` that calls
+        :meth:`_report_progress` at most 10 times per second.
 
         If the download of the build is already running, it will just
         attach the progress function. If the build has already been
@@ -401,8 +481,9 @@ class BuildDownloadManager(DownloadManager):
         if self.background_dl_policy == "cancel":
             self.cancel(cancel_if=lambda dl: dest != dl.get_dest())
 
-        dl = self.download(build_url, fname, progress=download_progress)
+        dl = self.download(build_url, fname, progress=self.progress.update)
         if dl:
+            dl.set_progress(self.progress.update)
             LOG.info("Downloading build from: %s" % build_url)
             try:
                 dl.wait()
@@ -67,8 +67,16 @@ class LauncherError(MozRegressionError):
 class BuildInfoNotFound(MozRegressionError):
     """
     Raised when we can't find information about a build.
+
+    **permanent** is True when the build is known not to exist (e.g. there
+    is no task or no artifact for it), and False when it may just be a
+    temporary failure (e.g. a network or server error).
     """
 
+    def __init__(self, message="", permanent=False):
+        MozRegressionError.__init__(self, message)
+        self.permanent = permanent
+
 
 class EmptyPushlogError(MozRegressionError):
     """
@@ -13,19 +13,34 @@ import re
 from datetime import datetime
 from threading import Lock, Thread
 
-import requests
-import taskcluster
 from mozlog import get_proxy_logger
-from taskcluster.exceptions import TaskclusterFailure
 
 from mozregression.build_info import IntegrationBuildInfo, NightlyBuildInfo
 from mozregression.errors import BuildInfoNotFound, MozRegressionError
 from mozregression.json_pushes import JsonPushes, Push
-from mozregression.network import retry_get, url_links
+from mozregression.network import get_http_session, retry_get, url_links
+from mozregression.tracing import traced
 
 LOG = get_proxy_logger(__name__)
 
 
+# the HTTP status codes telling that a build does not exist. Others (e.g.
+# 429 Too Many Requests) may be temporary.
+NOT_FOUND_STATUS_CODES = (404, 410)
+
+
+def _is_not_found(exc):
+    """
+    Returns True if the exception (from requests or taskcluster) is an HTTP
+    error telling that the resource does not exist.
+    """
+    response = getattr(exc, "response", None)
+    status_code = getattr(exc, "status_code", None)
+    if status_code is None and response is not None:
+        status_code = response.status_code
+    return status_code in NOT_FOUND_STATUS_CODES
+
+
 class InfoFetcher(object):
     def __init__(self, fetch_config):
         self.fetch_config = fetch_config
@@ -77,12 +92,23 @@ class InfoFetcher(object):
 
 class IntegrationInfoFetcher(InfoFetcher):
     def __init__(self, fetch_config):
+        # taskcluster is only needed (and imported) for integration builds
+        import requests
+        import taskcluster
+
         InfoFetcher.__init__(self, fetch_config)
         self.jpushes = JsonPushes(branch=fetch_config.integration_branch)
         options = fetch_config.tk_options()
-        self.index = taskcluster.Index(options)
-        self.queue = taskcluster.Queue(options)
-
+        kwargs = {}
+        session = get_http_session()
+        if isinstance(session, requests.Session):
+            # share the session, so taskcluster requests can be recorded
+            # and replayed (see mozregression.replay)
+            kwargs["session"] = session
+        self.index = taskcluster.Index(options, **kwargs)
+        self.queue = taskcluster.Queue(options, **kwargs)
+
+    @traced("fetch_build_info.integration", "fetch", lambda self, push: {"push": push})
     def find_build_info(self, push):
         """
         Find build info for an integration build, given a Push, a changeset or a
@@ -94,6 +120,8 @@ class IntegrationInfoFetcher(InfoFetcher):
 
         Return a :class:`IntegrationBuildInfo` instance.
         """
+        from taskcluster.exceptions import TaskclusterFailure
+
         if not isinstance(push, Push):
             try:
                 push = self.jpushes.push(push)
@@ -119,10 +147,11 @@ class IntegrationInfoFetcher(InfoFetcher):
                     break
             if not task_id:
                 raise stored_failure
-        except TaskclusterFailure:
+        except TaskclusterFailure as exc:
             raise BuildInfoNotFound(
                 "Unable to find build info using the"
-                " taskcluster route %r" % self.fetch_config.tk_route(push)
+                " taskcluster route %r" % self.fetch_config.tk_route(push),
+                permanent=_is_not_found(exc),
             )
 
         # find a completed run for that task
@@ -137,7 +166,9 @@ class IntegrationInfoFetcher(InfoFetcher):
                 break
 
         if run_id is None:
-            raise BuildInfoNotFound("Unable to find completed runs for task %s" % task_id)
+            raise BuildInfoNotFound(
+                "Unable to find completed runs for task %s" % task_id, permanent=True
+            )
         artifacts = self.queue.listArtifacts(task_id, run_id)["artifacts"]
 
         # look over the artifacts of that run
@@ -152,16 +183,16 @@ class IntegrationInfoFetcher(InfoFetcher):
                 break
         if build_url is None:
             raise BuildInfoNotFound(
-                "unable to find a build url for the" " changeset %r" % changeset
+                "unable to find a build url for the" " changeset %r" % changeset, permanent=True
             )
 
         if self.fetch_config.app_name == "gve":
             # Check taskcluster URL to make sure artifact is still around.
             # build_url is an alias that redirects via a 303 status code.
-            status_code = requests.head(build_url, allow_redirects=True).status_code
+            status_code = get_http_session().head(build_url, allow_redirects=True).status_code
             if status_code != 200:
                 error = f"Taskcluster file {build_url} not available (status code: {status_code})."
-                raise BuildInfoNotFound(error)
+                raise BuildInfoNotFound(error, permanent=status_code in NOT_FOUND_STATUS_CODES)
         return IntegrationBuildInfo(
             self.fetch_config,
             build_url=build_url,
@@ -206,7 +237,8 @@ class NightlyInfoFetcher(InfoFetcher):
             if "build_url" not in data:
                 raise BuildInfoNotFound(
                     "Failed to find a build file in directory {} that "
-                    "matches regex '{}'".format(url, self.build_regex.pattern)
+                    "matches regex '{}'".format(url, self.build_regex.pattern),
+                    permanent=True,
                 )
 
             with self._fetch_lock:
@@ -240,6 +272,7 @@ class NightlyInfoFetcher(InfoFetcher):
         matches.reverse()
         return matches
 
+    @traced("fetch_build_info.nightly", "fetch", lambda self, date, *a, **kw: {"date": date})
     def find_build_info(self, date, fetch_txt_info=True, max_workers=2):
         """
         Find build info for a nightly build, given a date.
@@ -252,20 +285,30 @@ class NightlyInfoFetcher(InfoFetcher):
 
         # to save time, we will try multiple build folders at the same
         # time in some threads. The first good one found is returned.
+        import requests
+
         try:
             build_urls = self._get_urls(date)
             LOG.debug("got build_urls %s" % build_urls)
         except requests.HTTPError as exc:
-            raise BuildInfoNotFound(str(exc))
+            raise BuildInfoNotFound(str(exc), permanent=_is_not_found(exc))
         build_info = None
 
         valid_builds = []
+        # the errors that may hide a valid build
+        failures = []
+
+        def fetch(url, index):
+            try:
+                self._fetch_build_info_from_url(url, index, valid_builds)
+            except Exception as exc:
+                if not getattr(exc, "permanent", False):
+                    LOG.debug("Unable to fetch build info from %s: %s" % (url, exc))
+                    failures.append(exc)
+
         while build_urls:
             some = build_urls[:max_workers]
-            threads = [
-                Thread(target=self._fetch_build_info_from_url, args=(url, i, valid_builds))
-                for i, url in enumerate(some)
-            ]
+            threads = [Thread(target=fetch, args=(url, i)) for i, url in enumerate(some)]
             for thread in threads:
                 thread.daemon = True
                 thread.start()
@@ -289,6 +332,8 @@ class NightlyInfoFetcher(InfoFetcher):
             build_urls = build_urls[max_workers:]
 
         if build_info is None:
-            raise BuildInfoNotFound("Unable to find build info for %s" % date)
+            raise BuildInfoNotFound(
+                "Unable to find build info for %s" % date, permanent=not failures
+            )
 
         return build_info
@@ -123,6 +123,7 @@ class CommonConfig(object):
     BUILD_TYPES = ("opt",)  # only opt allowed by default
     BUILD_TYPE_FALLBACKS = {}
     app_name = None
+    persist_platform = ""
 
     def __init__(self, os, bits, processor, arch):
         self.os = os
@@ -254,13 +255,22 @@ class CommonConfig(object):
             or self.build_type not in ("opt", "asan", "shippable")
         )
 
+    def set_persist_platform(self, platform):
+        """
+        Add the platform (e.g. '32bit' or 'aarch64') to the generated persist
+        file names, so that the builds of several platforms can be stored in
+        the same persist directory.
+        """
+        self.persist_platform = platform
+
     def extra_persist_part(self):
         """
         Allow to add a part in the generated persist file name to distinguish
-        different builds that might be produced by a single config. Returns an
-        empty string by default.
+        different builds that might be produced by a single config. Returns
+        the platform given to :meth:`set_persist_platform`, or an empty
+        string by default.
         """
-        return ""
+        return self.persist_platform
 
 
 class NightlyConfigMixin(metaclass=ABCMeta):
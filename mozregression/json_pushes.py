@@ -1,6 +1,9 @@
 from __future__ import absolute_import
 
 import datetime
+import re
+import threading
+from collections import OrderedDict
 
 from mozlog import get_proxy_logger
 
@@ -11,17 +14,20 @@ from mozregression.network import retry_get
 
 LOG = get_proxy_logger("JsonPushes")
 
+RE_BUG_ID = re.compile(r"bug\s+(\d+)", re.I)
+
 
 class Push(object):
     """
     Simple wrapper around a json push object from json-pushes API.
     """
 
-    __slots__ = ("_data", "_push_id")  # to save memory usage
+    __slots__ = ("_data", "_push_id", "_bug_ids")  # to save memory usage
 
     def __init__(self, push_id, data):
         self._data = data
         self._push_id = push_id
+        self._bug_ids = None
 
     @property
     def push_id(self):
@@ -46,10 +52,81 @@ class Push(object):
     def utc_date(self):
         return datetime.datetime.utcfromtimestamp(self.timestamp)
 
+    @property
+    def bug_ids(self):
+        """
+        Returns the bug ids found in the descriptions of the changesets (the
+        first one of each description), without duplicates.
+
+        This is always empty for pushes not obtained with full=1.
+        """
+        if self._bug_ids is None:
+            bug_ids = []
+            for chset in self.changesets:
+                if not isinstance(chset, dict):
+                    continue  # not a full push
+                res = RE_BUG_ID.search(chset.get("desc", ""))
+                if res and res.group(1) not in bug_ids:
+                    bug_ids.append(res.group(1))
+            self._bug_ids = bug_ids
+        return self._bug_ids
+
     def __str__(self):
         return self.changeset[:12]
 
 
+class PushCache(object):
+    """
+    A thread-safe cache of pushes, by repository, changeset and request
+    arguments (e.g. full=1).
+
+    The cache is bounded: the least recently used entries are dropped.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._pushes = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(repo_url, changeset, kwargs):
+        return (repo_url, changeset, tuple(sorted(kwargs.items())))
+
+    def get(self, repo_url, changeset, kwargs):
+        key = self._key(repo_url, changeset, kwargs)
+        with self._lock:
+            push = self._pushes.get(key)
+            if push is not None:
+                self._pushes.move_to_end(key)
+            return push
+
+    def add(self, repo_url, changeset, kwargs, push):
+        """
+        Store a push for the given changeset, and for all the changesets it
+        contains.
+        """
+        if kwargs.get("full"):
+            # extract the bug ids now, so they are ready for the final report
+            push.bug_ids
+        changesets = set(c["node"] if isinstance(c, dict) else c for c in push.changesets)
+        changesets.add(changeset)
+        with self._lock:
+            for chset in changesets:
+                key = self._key(repo_url, chset, kwargs)
+                self._pushes[key] = push
+                self._pushes.move_to_end(key)
+            while len(self._pushes) > self.maxsize:
+                self._pushes.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._pushes.clear()
+
+
+# the pushes returned by JsonPushes.push
+PUSH_CACHE = PushCache()
+
+
 class JsonPushes(object):
     """
     Find pushlog Push objects from a mozilla hg json-pushes api.
@@ -145,7 +222,8 @@ class JsonPushes(object):
         """
         Returns the Push object that match the given changeset or date.
 
-        A MozRegressionError is thrown if None is found.
+        A MozRegressionError is thrown if None is found. Pushes found by
+        changeset are cached in :data:`PUSH_CACHE`.
         """
         if is_date_or_datetime(changeset):
             try:
@@ -154,4 +232,8 @@ class JsonPushes(object):
                 raise EmptyPushlogError(
                     "No pushes available for the date %s on %s." % (changeset, self.branch)
                 )
-        return self.pushes(changeset=changeset, **kwargs)[0]
+        push = PUSH_CACHE.get(self.repo_url, changeset, kwargs)
+        if push is None:
+            push = self.pushes(changeset=changeset, **kwargs)[0]
+            PUSH_CACHE.add(self.repo_url, changeset, kwargs, push)
+        return push
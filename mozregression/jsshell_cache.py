@@ -0,0 +1,160 @@
+"""
+Cache of extracted jsshell builds.
+
+jsshell bisections are often run with a command over many builds, and the
+same builds are tested again and again. Instead of extracting the whole
+archive in a new temporary directory for each evaluation, only the shell
+binary and the shared libraries it needs are extracted, once, in a
+directory named after the sha256 of the archive content. Testing a build
+again then only costs a lookup.
+
+The archive digests are remembered by path, size and modification time,
+so that known archives are not even read again.
+"""
+
+from __future__ import absolute_import
+
+import os
+import re
+import shutil
+import stat
+import tempfile
+import threading
+import zipfile
+
+from mozlog import get_proxy_logger
+
+from mozregression import config
+from mozregression.disk_cache import JsonCache, file_digest
+
+LOG = get_proxy_logger("JsShell")
+
+# shared libraries shipped with the shell (nspr, mozglue, ...)
+LIBRARY_RE = re.compile(r"\.(so(\.\d+)*|dll|dylib)$")
+
+
+def binary_name(os_name):
+    return "js.exe" if os_name == "win" else "js"
+
+
+def needed_members(names, binary):
+    """
+    Returns the names of the archive members required to run the shell:
+    the *binary* at the root of the archive and the shared libraries.
+    """
+    if binary not in names:
+        raise ValueError("no %s binary in the archive" % binary)
+    return [binary] + [n for n in names if LIBRARY_RE.search(n)]
+
+
+def extract_shell(archive, dest, binary):
+    """
+    Extract the needed files of the jsshell *archive* in *dest*, and returns
+    the path of the executable binary.
+    """
+    with zipfile.ZipFile(archive, "r") as z:
+        for name in needed_members(z.namelist(), binary):
+            z.extract(name, dest)
+    path = os.path.join(dest, binary)
+    # set the file executable
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+class JsShellCache(object):
+    """
+    Extracted jsshell builds, by archive content.
+
+    :param max_entries: the number of extracted builds that are kept, the
+                        least recently used ones are removed first.
+    """
+
+    def __init__(self, name="jsshell", max_entries=50):
+        self.name = name
+        self.max_entries = max_entries
+        self.digests = JsonCache("%s-archives.json" % name, ttl=30 * 24 * 3600)
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        return os.path.join(config.CACHE_DIR, self.name)
+
+    def digest(self, archive):
+        """
+        Returns the sha256 of the *archive* content.
+        """
+        st = os.stat(archive)
+        key = "%s|%d|%d" % (os.path.realpath(archive), st.st_size, st.st_mtime_ns)
+        digest = self.digests.get(key)
+        if digest is None:
+            digest = file_digest(archive)
+            self.digests.set(key, digest)
+        return digest
+
+    def install(self, archive, binary):
+        """
+        Returns the path of the *binary* of the jsshell *archive*,
+        extracting it in the cache if needed.
+
+        :raises: OSError if the cache directory can not be written.
+        """
+        entry = os.path.join(self.path, self.digest(archive))
+        path = os.path.join(entry, binary)
+        with self._lock:
+            if os.access(path, os.X_OK):
+                LOG.debug("Using the cached jsshell %s" % entry)
+                # mark it as recently used
+                os.utime(entry)
+                return path
+            if os.path.isdir(entry):
+                LOG.debug("Removing the broken cached jsshell %s" % entry)
+                shutil.rmtree(entry, ignore_errors=True)
+            os.makedirs(self.path, exist_ok=True)
+            # extract in a temporary directory first, so that an entry is
+            # always complete, even with concurrent processes.
+            tmp = tempfile.mkdtemp(dir=self.path, prefix=".tmp-")
+            try:
+                extract_shell(archive, tmp, binary)
+                try:
+                    os.rename(tmp, entry)
+                except OSError:
+                    if not os.access(path, os.X_OK):
+                        raise
+                    # installed in the meantime by another process
+            finally:
+                shutil.rmtree(tmp, ignore_errors=True)
+            self._evict(keep=entry)
+        return path
+
+    def entries(self):
+        """
+        Returns the paths of the cached builds, the most recently used
+        first.
+        """
+        try:
+            names = os.listdir(self.path)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            path = os.path.join(self.path, name)
+            try:
+                if not name.startswith("."):
+                    entries.append((os.stat(path).st_mtime, path))
+            except OSError:
+                pass  # removed in the meantime
+        return [path for _, path in sorted(entries, reverse=True)]
+
+    def _evict(self, keep):
+        for entry in self.entries()[self.max_entries :]:
+            if entry != keep:
+                LOG.debug("Removing the cached jsshell %s" % entry)
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def clear(self):
+        with self._lock:
+            shutil.rmtree(self.path, ignore_errors=True)
+            self.digests.clear()
+
+
+JSSHELL_CACHE = JsShellCache()
@@ -6,10 +6,8 @@ from __future__ import absolute_import, print_function
 
 import json
 import os
-import stat
 import sys
 import time
-import zipfile
 from abc import ABCMeta, abstractmethod
 from enum import Enum
 from subprocess import STDOUT, CalledProcessError, call, check_output
@@ -24,9 +22,12 @@ from mozlog.structured import get_default_logger, get_proxy_logger
 from mozprofile import Profile, ThunderbirdProfile
 from mozrunner import Runner
 
+from mozregression import android_sync, jsshell_cache
 from mozregression.class_registry import ClassRegistry
 from mozregression.errors import LauncherError, LauncherNotRunnable
+from mozregression.profile_cache import PROFILE_TEMPLATES
 from mozregression.tempdir import safe_mkdtemp
+from mozregression.tracing import span
 
 LOG = get_proxy_logger("Test Runner")
 
@@ -41,6 +42,10 @@ class Launcher(metaclass=ABCMeta):
     """
 
     profile_class = Profile
+    _prepared_profile = None
+    # if False, builds must not be installed in background (see
+    # mozregression.preinstall) while another build is tested
+    supports_preinstall = True
 
     @classmethod
     def check_is_runnable(cls):
@@ -56,7 +61,8 @@ class Launcher(metaclass=ABCMeta):
         self._stopping = False
 
         try:
-            self._install(dest)
+            with span("launcher.install", "launcher", dest=dest):
+                self._install(dest)
         except Exception as e:
             msg = "Unable to install {} (error: {})".format(dest, e)
             LOG.error(msg)
@@ -68,7 +74,8 @@ class Launcher(metaclass=ABCMeta):
         """
         if not self._running:
             try:
-                self._start(**kwargs)
+                with span("launcher.start", "launcher"):
+                    self._start(**kwargs)
             except Exception as e:
                 msg = "Unable to start the application (error: {})".format(e)
                 LOG.error(msg)
@@ -88,6 +95,9 @@ class Launcher(metaclass=ABCMeta):
     def stop(self):
         """
         Stop the application.
+
+        If this fails, a LauncherError is raised, but the application is
+        considered stopped anyway: it will not be stopped again.
         """
         if self._running:
             self._stopping = True
@@ -97,8 +107,9 @@ class Launcher(metaclass=ABCMeta):
                 msg = "Unable to stop the application (error: {})".format(e)
                 LOG.error(msg)
                 raise LauncherError(msg).with_traceback(sys.exc_info()[2])
-            self._running = False
-            self._stopping = False
+            finally:
+                self._running = False
+                self._stopping = False
 
     def get_app_info(self):
         """
@@ -106,8 +117,21 @@ class Launcher(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def prepare_profile(self, profile=None, addons=(), preferences=None, **kwargs):
+        """
+        Create the profile that will be used by the next call to
+        :meth:`start`, ahead of time.
+
+        This takes the same keyword arguments as :meth:`start`, the ones
+        not related to the profile are ignored.
+        """
+        self._prepared_profile = self._create_profile(
+            profile=profile, addons=addons, preferences=preferences
+        )
+
     def cleanup(self):
         self.stop()
+        self._prepared_profile = None
 
     def __enter__(self):
         return self
@@ -132,10 +156,14 @@ class Launcher(metaclass=ABCMeta):
         raise NotImplementedError
 
     def _create_profile(self, profile=None, addons=(), preferences=None):
+        if self._prepared_profile is not None:
+            profile, self._prepared_profile = self._prepared_profile, None
+            return profile
         if isinstance(profile, Profile):
             return profile
         else:
-            return self.create_profile(profile=profile, addons=addons, preferences=preferences)
+            with span("launcher.create_profile", "launcher"):
+                return self.create_profile(profile=profile, addons=addons, preferences=preferences)
 
     @classmethod
     def create_profile(cls, profile=None, addons=(), preferences=None, clone=True):
@@ -151,7 +179,11 @@ class Launcher(metaclass=ABCMeta):
                 # be undone. Let's clone the profile to not have side effect
                 # on existing profile.
                 # see https://bugzilla.mozilla.org/show_bug.cgi?id=999009
-                profile = cls.profile_class.clone(profile, addons=addons, preferences=preferences)
+                # The clone is made from a prepared template, so the profile
+                # is copied and the addons installed only once.
+                profile = PROFILE_TEMPLATES.clone(
+                    cls.profile_class, profile, addons=addons, preferences=preferences
+                )
             else:
                 profile = cls.profile_class(profile, addons=addons, preferences=preferences)
         elif len(addons):
@@ -262,12 +294,16 @@ class MozRunnerLauncher(Launcher):
         cmdargs=(),
         preferences=None,
         adb_profile_dir=None,
+        env=None,
+        output=(),
     ):
         profile = self._create_profile(profile=profile, addons=addons, preferences=preferences)
 
         LOG.info("Launching %s" % self.binary)
         self.runner = Runner(binary=self.binary, cmdargs=cmdargs, profile=profile)
         self.runner.env.update(self.env)
+        if env:
+            self.runner.env.update(env)
 
         def _on_exit():
             # if we are stopping the process do not log anything.
@@ -299,7 +335,7 @@ class MozRunnerLauncher(Launcher):
         # also, don't stream to stdout: https://bugzilla.mozilla.org/show_bug.cgi?id=1653349
         devnull = open(os.devnull, "wb")
         self.runner.process_args = {
-            "processOutputLine": [get_default_logger("process").info],
+            "processOutputLine": [get_default_logger("process").info] + list(output),
             "stdin": devnull,
             "stream": None,
             "onFinish": _on_exit,
@@ -456,11 +492,15 @@ def adb_tool_path():
 
 
 class AndroidLauncher(Launcher):
+    # the device has only one install of the package
+    supports_preinstall = False
     app_info = None
     adb = None
     package_name = None
     profile_class = FirefoxRegressionProfile
     remote_profile = None
+    # the profiles kept on the devices between the launches, by path
+    _remote_profiles = {}
 
     @abstractmethod
     def _get_package_name(self):
@@ -486,14 +526,12 @@ class AndroidLauncher(Launcher):
         self.app_info = safe_get_version(binary=dest)
         self.package_name = self.app_info.get("package_name", self._get_package_name())
         self.adb = ADBDeviceFactory(adb=adb_tool_path())
-        try:
-            self.adb.uninstall_app(self.package_name)
-        except ADBError as msg:
-            LOG.warning(
-                "Failed to uninstall %s (%s)\nThis is normal if it is the"
-                " first time the application is installed." % (self.package_name, msg)
-            )
-        self.adb.run_as_package = self.adb.install_app(dest)
+        # the APK is not installed again if it is already there
+        self.adb.run_as_package = android_sync.install(self.adb, dest, self.package_name)
+
+    def prepare_profile(self, profile=None, addons=(), preferences=None, **kwargs):
+        # for now we don't handle addons on the profile for fennec
+        Launcher.prepare_profile(self, profile=profile, preferences=preferences)
 
     def _start(
         self,
@@ -508,11 +546,12 @@ class AndroidLauncher(Launcher):
         # send the profile on the device
         if not adb_profile_dir:
             adb_profile_dir = self.adb.test_root
-        self.remote_profile = "/".join([adb_profile_dir, os.path.basename(profile.profile)])
-        if self.adb.exists(self.remote_profile):
-            self.adb.rm(self.remote_profile, recursive=True)
+        # the profile is kept on the device, so only the files that changed
+        # since the last launch are pushed.
+        self.remote_profile = "/".join([adb_profile_dir, "mozregression-%s" % self.package_name])
         LOG.debug("Pushing profile to device (%s -> %s)" % (profile.profile, self.remote_profile))
-        self.adb.push(profile.profile, self.remote_profile)
+        android_sync.sync_profile(self.adb, profile.profile, self.remote_profile)
+        AndroidLauncher._remote_profiles[self.remote_profile] = self.adb
         if cmdargs and len(cmdargs) == 1 and not cmdargs[0].startswith("-"):
             url = cmdargs[0]
         else:
@@ -528,8 +567,19 @@ class AndroidLauncher(Launcher):
 
     def _stop(self):
         self.adb.stop_application(self.package_name)
-        if self.adb.exists(self.remote_profile):
-            self.adb.rm(self.remote_profile, recursive=True)
+
+    @classmethod
+    def remove_remote_profiles(cls):
+        """
+        Remove the profiles left on the devices, once the bisection is over.
+        """
+        profiles, AndroidLauncher._remote_profiles = AndroidLauncher._remote_profiles, {}
+        for path, adb in profiles.items():
+            try:
+                if adb.exists(path):
+                    adb.rm(path, recursive=True)
+            except ADBError as exc:
+                LOG.warning("Unable to remove the profile %s from the device: %s" % (path, exc))
 
     def launch_browser(
         self,
@@ -611,22 +661,27 @@ class GeckoViewExampleLauncher(AndroidLauncher):
 
 @REGISTRY.register("jsshell")
 class JsShellLauncher(Launcher):
-    temp_dir = None
+    tempdir = None
 
     def _install(self, dest):
+        binary = jsshell_cache.binary_name(mozinfo.os)
+        try:
+            self.binary = jsshell_cache.JSSHELL_CACHE.install(dest, binary)
+            return
+        except OSError as exc:
+            LOG.debug("Unable to use the jsshell cache: %s" % exc)
         self.tempdir = safe_mkdtemp()
         try:
-            with zipfile.ZipFile(dest, "r") as z:
-                z.extractall(self.tempdir)
-            self.binary = os.path.join(self.tempdir, "js" if mozinfo.os != "win" else "js.exe")
-            # set the file executable
-            os.chmod(self.binary, os.stat(self.binary).st_mode | stat.S_IEXEC)
+            self.binary = jsshell_cache.extract_shell(dest, self.tempdir, binary)
         except Exception:
             remove(self.tempdir)
             raise
 
     def _start(self, **kwargs):
         LOG.info("Launching %s" % self.binary)
+        if self.tempdir is None:
+            # do not let the shell write files in the cache
+            self.tempdir = safe_mkdtemp()
         res = call([self.binary], cwd=self.tempdir)
         if res != 0:
             LOG.warning("jsshell exited with code %d." % res)
@@ -4,12 +4,12 @@ Logging and outputting configuration and utilities.
 
 from __future__ import absolute_import
 
+import functools
 import logging
 import sys
 import time
 
 import mozinfo
-from colorama import Back, Fore, Style
 from mozlog.handlers import LogLevelFilter, StreamHandler
 from mozlog.structuredlog import StructuredLogger, set_default_logger
 
@@ -42,6 +42,8 @@ def init_logger(debug=True, allow_color=ALLOW_COLOR, output=None):
     """
     Initialize the mozlog logger. Must be called once before using logs.
     """
+    from colorama import Fore, Style
+
     # late binding of sys.stdout is required for windows color to work
     output = output or sys.stdout
     start = time.time() * 1000
@@ -78,13 +80,16 @@ def init_logger(debug=True, allow_color=ALLOW_COLOR, output=None):
     return logger
 
 
-COLORS = {}
-NO_COLORS = {}
+@functools.lru_cache(maxsize=None)
+def _colors(allow_color):
+    """Return the colorama names usable by colorize, built on first use."""
+    from colorama import Back, Fore, Style
 
-for prefix, st in (("b", Back), ("s", Style), ("f", Fore)):
-    for name, value in st.__dict__.items():
-        COLORS[prefix + name] = value
-        NO_COLORS[prefix + name] = ""
+    data = {}
+    for prefix, st in (("b", Back), ("s", Style), ("f", Fore)):
+        for name, value in st.__dict__.items():
+            data[prefix + name] = value if allow_color else ""
+    return data
 
 
 def colorize(text, allow_color=ALLOW_COLOR):
@@ -108,5 +113,4 @@ def colorize(text, allow_color=ALLOW_COLOR):
     If allow_color is False, no color special char will be added, thus the
     returned text will be "hello".
     """
-    data = COLORS if allow_color else NO_COLORS
-    return text.format(**data)
+    return text.format(**_colors(bool(allow_color)))
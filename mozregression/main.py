@@ -1,5 +1,9 @@
 """
 Entry point for the mozregression command line.
+
+Modules that are slow to import (requests, the launchers and their mozbase
+dependencies...) are only imported when a command is run, since mach
+imports this module on every invocation.
 """
 
 from __future__ import absolute_import
@@ -8,47 +12,66 @@ import atexit
 import os
 import shlex
 import sys
+import threading
 
-import colorama
 import mozfile
-import requests
 from mozlog import get_proxy_logger
-from requests.exceptions import HTTPError, RequestException
 
 from mozregression import __version__
 from mozregression.approx_persist import ApproxPersistChooser
 from mozregression.bisector import Bisection, Bisector, IntegrationHandler, NightlyHandler
 from mozregression.bugzilla import bug_url, find_bugids_in_push
+from mozregression.build_range import get_integration_range, get_nightly_range
 from mozregression.cli import cli
 from mozregression.config import DEFAULT_EXPAND, TC_CREDENTIALS_FNAME
-from mozregression.download_manager import BuildDownloadManager
+from mozregression.daemon import forward_to_daemon
+from mozregression.dates import to_datetime
+from mozregression.disk_cache import JsonCache
 from mozregression.errors import GoodBadExpectationError, MozRegressionError
 from mozregression.fetch_build_info import IntegrationInfoFetcher, NightlyInfoFetcher
 from mozregression.json_pushes import JsonPushes
-from mozregression.launchers import REGISTRY as APP_REGISTRY
-from mozregression.network import set_http_session
+from mozregression.missing_builds import MISSING_BUILDS
+from mozregression.multi_bisect import MultiBisector, print_report
+from mozregression.network import get_http_session, set_http_session
 from mozregression.persist_limit import PersistLimit
+from mozregression.profile_cache import PROFILE_TEMPLATES
+from mozregression.sweep import Sweep, close_result_writer, open_result_writer
 from mozregression.telemetry import UsageMetrics, get_system_info, send_telemetry_ping_oop
 from mozregression.tempdir import safe_mkdtemp
-from mozregression.test_runner import CommandTestRunner, ManualTestRunner
+from mozregression.tracing import TRACER, span
 
 LOG = get_proxy_logger("main")
 
 
 class Application(object):
-    def __init__(self, fetch_config, options):
+    def __init__(self, fetch_config, options, fetch_configs=None):
         self.fetch_config = fetch_config
+        self.fetch_configs = fetch_configs or [fetch_config]
         self.options = options
         self._test_runner = None
         self._bisector = None
         self._build_download_manager = None
+        self._preinstaller = None
         self._download_dir = options.persist
         self._rm_download_dir = False
         if not options.persist:
             self._download_dir = safe_mkdtemp()
             self._rm_download_dir = True
+        from mozregression.launchers import REGISTRY as APP_REGISTRY
+
         launcher_class = APP_REGISTRY.get(fetch_config.app_name)
         launcher_class.check_is_runnable()
+        self._headless_profile = None
+        if options.headless:
+            from mozregression.test_runner import HEADLESS_PREFERENCES
+
+            options.preferences = list(HEADLESS_PREFERENCES.items()) + list(
+                options.preferences or ()
+            )
+            if not options.profile:
+                # an empty profile, used as a template so that the addons
+                # are installed only once.
+                self._headless_profile = safe_mkdtemp()
         # init global profile if required
         self._global_profile = None
         if options.profile_persistence in ("clone-first", "reuse"):
@@ -63,6 +86,8 @@ class Application(object):
             options.cmdargs = options.cmdargs + ["--allow-downgrade"]
 
     def clear(self):
+        if self._preinstaller:
+            self._preinstaller.cleanup()
         if self._build_download_manager:
             # cancel all possible downloads
             self._build_download_manager.cancel()
@@ -77,24 +102,64 @@ class Application(object):
             mozfile.remove(self._download_dir)
         if self._global_profile and self.options.profile_persistence == "clone-first":
             self._global_profile.cleanup()
+        if self._headless_profile:
+            mozfile.remove(self._headless_profile)
+        PROFILE_TEMPLATES.clear()
+        from mozregression.launchers import AndroidLauncher
+
+        AndroidLauncher.remove_remote_profiles()
 
     @property
     def test_runner(self):
         if self._test_runner is None:
-            if self.options.command is None:
-                self._test_runner = ManualTestRunner(
-                    launcher_kwargs=dict(
-                        addons=self.options.addons,
-                        profile=self._global_profile or self.options.profile,
-                        cmdargs=self.options.cmdargs,
-                        preferences=self.options.preferences,
-                        adb_profile_dir=self.options.adb_profile_dir,
-                    )
+            from mozregression.test_runner import (
+                CommandTestRunner,
+                HeadlessTestRunner,
+                ManualTestRunner,
+            )
+
+            if self.options.headless:
+                self._test_runner = HeadlessTestRunner(
+                    self.options.headless,
+                    launcher_kwargs=self._launcher_kwargs(),
+                    timeout=self.options.headless_timeout,
+                    good_pattern=self.options.good_pattern,
+                    bad_pattern=self.options.bad_pattern,
                 )
+            elif self.options.command is None:
+                self._test_runner = ManualTestRunner(launcher_kwargs=self._launcher_kwargs())
             else:
-                self._test_runner = CommandTestRunner(self.options.command)
+                self._test_runner = CommandTestRunner(
+                    self.options.command,
+                    timeout=self.options.command_timeout,
+                    timeout_verdict=self.options.timeout_verdict[0],
+                    log_dir=self.options.command_log_dir,
+                )
+            self._test_runner.preinstaller = self.preinstaller
         return self._test_runner
 
+    def _launcher_kwargs(self):
+        return dict(
+            addons=self.options.addons,
+            profile=self._global_profile or self.options.profile or self._headless_profile,
+            cmdargs=self.options.cmdargs,
+            preferences=self.options.preferences,
+            adb_profile_dir=self.options.adb_profile_dir,
+        )
+
+    @property
+    def preinstaller(self):
+        if self._preinstaller is None and self.options.background_dl:
+            # profiles are only needed when the builds are launched
+            # by mozregression itself.
+            launcher_kwargs = None
+            if self.options.command is None:
+                launcher_kwargs = self._launcher_kwargs()
+            from mozregression.preinstall import PreInstaller
+
+            self._preinstaller = PreInstaller(launcher_kwargs)
+        return self._preinstaller
+
     @property
     def bisector(self):
         if self._bisector is None:
@@ -106,6 +171,7 @@ class Application(object):
                 approx_chooser=(
                     None if self.options.approx_policy != "auto" else ApproxPersistChooser(7)
                 ),
+                preinstaller=self.preinstaller,
             )
         return self._bisector
 
@@ -113,11 +179,15 @@ class Application(object):
     def build_download_manager(self):
         if self._build_download_manager is None:
             background_dl_policy = self.options.background_dl_policy
-            if not self.options.persist:
-                # cancel background downloads forced
+            if not self.options.persist and len(self.fetch_configs) == 1:
+                # cancel background downloads forced, unless the manager is
+                # shared by the bisections of several platforms
                 background_dl_policy = "cancel"
+            from mozregression.download_manager import BuildDownloadManager
+
             self._build_download_manager = BuildDownloadManager(
                 self._download_dir,
+                session=get_http_session(),
                 background_dl_policy=background_dl_policy,
                 persist_limit=PersistLimit(self.options.persist_size_limit),
             )
@@ -223,6 +293,8 @@ class Application(object):
         return 0
 
     def _do_bisect(self, handler, good, bad, **kwargs):
+        from requests.exceptions import RequestException
+
         try:
             return self.bisector.bisect(handler, good, bad, **kwargs)
         except (KeyboardInterrupt, MozRegressionError, RequestException) as exc:
@@ -271,6 +343,57 @@ class Application(object):
         handler.print_range()
         self._print_resume_info(handler)
 
+    def _sweep(self, build_range):
+        writer = open_result_writer(self.options.sweep)
+        try:
+            sweep = Sweep(
+                build_range,
+                self.test_runner,
+                self.build_download_manager,
+                writer,
+                jobs=self.options.jobs,
+                download_jobs=self.options.download_jobs,
+            )
+            sweep.run()
+        finally:
+            close_result_writer(writer)
+        sweep.print_summary()
+        return 0
+
+    def sweep_nightlies(self):
+        start, end = sorted((self.options.good, self.options.bad), key=to_datetime)
+        return self._sweep(get_nightly_range(self.fetch_config, start, end))
+
+    def sweep_integration(self):
+        return self._sweep(
+            get_integration_range(self.fetch_config, self.options.good, self.options.bad)
+        )
+
+    def multi_bisect(self):
+        bisector = MultiBisector(
+            self.fetch_configs,
+            self.test_runner,
+            self.build_download_manager,
+            find_fix=self.options.find_fix,
+            ensure_good_and_bad=self.options.mode != "no-first-check",
+            dl_in_background=self.options.background_dl,
+            approx_chooser=(
+                None if self.options.approx_policy != "auto" else ApproxPersistChooser(7)
+            ),
+        )
+        LOG.info(
+            "Bisecting %s between %s and %s on %d platforms"
+            % (
+                self.fetch_config.integration_branch,
+                self.options.good,
+                self.options.bad,
+                len(self.fetch_configs),
+            )
+        )
+        bisections = bisector.bisect(self.options.good, self.options.bad)
+        print_report(bisections)
+        return 0 if all(b.result == Bisection.FINISHED for b in bisections) else 1
+
     def _launch(self, fetcher_class):
         fetcher = fetcher_class(self.fetch_config)
         build_info = fetcher.find_build_info(self.options.launch)
@@ -284,12 +407,24 @@ class Application(object):
         self._launch(IntegrationInfoFetcher)
 
 
+# the latest version on pypi is checked at most once a day
+PYPI_CACHE = JsonCache("pypi.json", ttl=24 * 3600)
+
+
 def pypi_latest_version():
-    url = "https://pypi.python.org/pypi/mozregression/json"
-    return requests.get(url, timeout=10).json()["info"]["version"]
+    version = PYPI_CACHE.get("latest_version")
+    if version is None:
+        import requests
+
+        url = "https://pypi.python.org/pypi/mozregression/json"
+        version = requests.get(url, timeout=10).json()["info"]["version"]
+        PYPI_CACHE.set("latest_version", version)
+    return version
 
 
 def check_mozregression_version():
+    from requests.exceptions import RequestException
+
     try:
         mozregression_version = pypi_latest_version()
     except (RequestException, KeyError, ValueError):
@@ -308,43 +443,93 @@ def check_mozregression_version():
         )
 
 
+def start_thread(target, *args):
+    """
+    Run *target* with the given args in a new started daemon thread, and
+    returns the thread.
+    """
+    thread = threading.Thread(target=target, args=args)
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def send_usage_ping(config, mozregression_variant):
+    send_telemetry_ping_oop(
+        UsageMetrics(
+            variant=mozregression_variant,
+            appname=config.fetch_config.app_name,
+            build_type=config.fetch_config.build_type,
+            good=config.options.good,
+            bad=config.options.bad,
+            launch=config.options.launch,
+            **get_system_info(),
+        ),
+        config.enable_telemetry,
+    )
+
+
 def main(
     argv=None,
     namespace=None,
     check_new_version=True,
     mozregression_variant="console",
+    http_session=None,
 ):
     """
     main entry point of mozregression command line.
+
+    When run from the console and a daemon is running, the command is
+    run by the daemon (see :mod:`mozregression.daemon`). **http_session**
+    is the requests session to use, instead of a new one.
     """
+    if argv is None and namespace is None and mozregression_variant == "console":
+        exit_code = forward_to_daemon(sys.argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    import requests
+    from requests.exceptions import HTTPError, RequestException
+
+    from mozregression import replay
+
     # terminal color support on windows
     if os.name == "nt":
+        import colorama
+
         colorama.init()
 
     config, app = None, None
     try:
         config = cli(argv=argv, namespace=namespace)
-        if check_new_version:
-            check_mozregression_version()
+        if check_new_version and not config.options.http_replay:
+            # do not wait for pypi, the warning is logged when it answers
+            start_thread(check_mozregression_version)
+        if config.options.trace_out:
+            TRACER.enable()
+        options = config.options
+        if options.retry_missing_builds:
+            MISSING_BUILDS.clear()
+        session = http_session
+        if options.http_record or options.http_replay:
+            # must be done before validation, that may do requests
+            session = replay.install(
+                requests.Session(),
+                record=options.http_record,
+                replay=options.http_replay,
+                latency_scale=options.replay_latency_scale,
+            )
+        set_http_session(session, get_defaults={"timeout": options.http_timeout})
         config.validate()
-        set_http_session(get_defaults={"timeout": config.options.http_timeout})
-
-        app = Application(config.fetch_config, config.options)
-        send_telemetry_ping_oop(
-            UsageMetrics(
-                variant=mozregression_variant,
-                appname=config.fetch_config.app_name,
-                build_type=config.fetch_config.build_type,
-                good=config.options.good,
-                bad=config.options.bad,
-                launch=config.options.launch,
-                **get_system_info(),
-            ),
-            config.enable_telemetry,
-        )
+
+        app = Application(config.fetch_config, config.options, config.fetch_configs)
+        # the ping is only spooled here, and uploaded by another process
+        send_usage_ping(config, mozregression_variant)
 
         method = getattr(app, config.action)
-        sys.exit(method())
+        with span(config.action, "main"):
+            result = method()
+        sys.exit(result)
 
     except KeyboardInterrupt:
         sys.exit("\nInterrupted.")
@@ -358,6 +543,19 @@ def main(
     finally:
         if app:
             app.clear()
+        if config and config.options.trace_out:
+            write_trace(config.options.trace_out)
+
+
+def write_trace(path):
+    """
+    Write the recorded spans to *path* and log their summary.
+    """
+    try:
+        TRACER.write_chrome_trace(path)
+    except IOError as exc:
+        LOG.error("Unable to write the trace to %s: %s" % (path, exc))
+    LOG.info("Time spent:\n%s" % TRACER.format_summary())
 
 
 if __name__ == "__main__":
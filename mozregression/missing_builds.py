@@ -0,0 +1,109 @@
+"""
+Persistent record of the builds known to be missing.
+
+When the build info of a build can not be found (e.g. an expired
+Taskcluster artifact or a busted nightly), it is recorded here with the
+reason, so that later bisections over the same period skip it without
+probing the servers again. Records expire after some time.
+"""
+
+from __future__ import absolute_import
+
+import datetime
+import threading
+
+from mozlog import get_proxy_logger
+
+from mozregression.dates import is_date_or_datetime, to_datetime
+from mozregression.disk_cache import JsonCache
+
+LOG = get_proxy_logger("Bisector")
+
+# builds more recent than that may just not be available yet, they are not
+# recorded.
+MIN_AGE = datetime.timedelta(days=1)
+
+
+class MissingBuilds(object):
+    """
+    Builds known to be missing, by fetch config and date or push.
+
+    The records are read once from the disk cache, and written as soon as
+    a new missing build is found.
+
+    :param ttl: the number of seconds a record is kept.
+    """
+
+    def __init__(self, name="missing-builds.json", ttl=7 * 24 * 3600):
+        self.cache = JsonCache(name, ttl=ttl)
+        self._lock = threading.Lock()
+        self._known = None
+
+    @staticmethod
+    def key(fetch_config, data):
+        """
+        Returns the key of a build, or None if it can not be recorded.
+
+        *data* is a date (nightlies) or a Push (integration builds).
+        """
+        if is_date_or_datetime(data):
+            build = data.isoformat()
+        elif hasattr(data, "changeset") and hasattr(data, "push_id"):
+            build = data.changeset
+        else:
+            return None
+        return "|".join(
+            str(part)
+            for part in (
+                fetch_config.app_name,
+                fetch_config.os,
+                fetch_config.bits,
+                fetch_config.arch,
+                fetch_config.build_type,
+                fetch_config.repo,
+                build,
+            )
+        )
+
+    @staticmethod
+    def _is_old_enough(data):
+        if is_date_or_datetime(data):
+            date = to_datetime(data)
+        else:
+            date = data.utc_date
+        return datetime.datetime.utcnow() - date > MIN_AGE
+
+    def _records(self):
+        if self._known is None:
+            self._known = self.cache.items()
+        return self._known
+
+    def reason(self, fetch_config, data):
+        """
+        Returns the reason why a build is missing, or None if it is not known
+        to be missing.
+        """
+        key = self.key(fetch_config, data)
+        if key is None:
+            return None
+        with self._lock:
+            return self._records().get(key)
+
+    def add(self, fetch_config, data, reason):
+        """
+        Record a missing build.
+        """
+        key = self.key(fetch_config, data)
+        if key is None or not self._is_old_enough(data):
+            return
+        with self._lock:
+            self._records()[key] = reason
+        self.cache.set(key, reason)
+
+    def clear(self):
+        with self._lock:
+            self._known = None
+        self.cache.clear()
+
+
+MISSING_BUILDS = MissingBuilds()
@@ -0,0 +1,219 @@
+"""
+Bisect the same regression on several platforms at once.
+
+Each platform (a fetch config, e.g. linux 64 bits opt and linux aarch64
+debug) gets its own bisection, run in its own thread with an automatic
+test runner. The bisections share what does not depend on the platform:
+
+- the pushes of the range, fetched once from the pushlog (and the merge
+  resolutions, that are cached anyway);
+- a bounded pool of threads to fetch the build infos, instead of threads
+  started by each range;
+- the download manager, thus one persist directory.
+
+The results are then reported side by side.
+"""
+
+from __future__ import absolute_import
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from mozlog import get_proxy_logger
+
+from mozregression.bisector import Bisection, Bisector, IntegrationHandler
+from mozregression.build_range import integration_pushes
+from mozregression.config import DEFAULT_EXPAND
+from mozregression.json_pushes import JsonPushes
+
+LOG = get_proxy_logger("Bisector")
+
+
+def platform_name(fetch_config):
+    """
+    Returns a short name for the platform of a fetch config, e.g.
+    'linux64 opt' or 'linux-aarch64 debug'.
+    """
+    if fetch_config.arch:
+        platform = "%s-%s" % (fetch_config.os, fetch_config.arch)
+    else:
+        platform = "%s%s" % (fetch_config.os, fetch_config.bits or "")
+    return "%s %s" % (platform, fetch_config.build_type)
+
+
+class PlatformBisection(object):
+    """
+    The state and outcome of the bisection of one platform.
+    """
+
+    def __init__(self, fetch_config, handler):
+        self.fetch_config = fetch_config
+        self.handler = handler
+        self.name = platform_name(fetch_config)
+        self.result = None
+        self.error = None
+        # the branches merged in the regressing push, that were bisected too
+        self.merges = []
+
+    @property
+    def status(self):
+        if self.error is not None:
+            return "error: %s" % self.error
+        return {
+            Bisection.FINISHED: "found",
+            Bisection.NO_DATA: "no builds",
+            Bisection.USER_EXIT: "stopped",
+        }.get(self.result, "not finished")
+
+
+class MultiBisector(object):
+    """
+    Run one bisection per fetch config, in parallel.
+
+    :param fetch_configs: the fetch configs of the platforms, for the same
+                          application and repository.
+    :param test_runner: the (automatic) test runner shared by the bisections.
+    :param download_manager: the download manager shared by the bisections.
+                             Its background_dl_policy should be 'keep'.
+    :param info_workers: the number of threads used to fetch build infos.
+    """
+
+    def __init__(
+        self,
+        fetch_configs,
+        test_runner,
+        download_manager,
+        find_fix=False,
+        ensure_good_and_bad=False,
+        dl_in_background=True,
+        approx_chooser=None,
+        info_workers=8,
+    ):
+        self.fetch_configs = fetch_configs
+        self.test_runner = test_runner
+        self.download_manager = download_manager
+        self.find_fix = find_fix
+        self.ensure_good_and_bad = ensure_good_and_bad
+        self.dl_in_background = dl_in_background
+        self.approx_chooser = approx_chooser
+        self.info_workers = info_workers
+        self.executor = None
+        self._pushes = {}
+        self._pushes_lock = threading.Lock()
+        if len(set((fc.bits, fc.arch) for fc in fetch_configs)) > 1:
+            # builds of different platforms may have the same file name
+            for fetch_config in fetch_configs:
+                fetch_config.set_persist_platform(
+                    str(fetch_config.arch or "%sbit" % fetch_config.bits)
+                )
+
+    def pushes(self, branch, good, bad):
+        """
+        Returns the pushes between good and bad on the given branch, only
+        querying the pushlog the first time.
+        """
+        with self._pushes_lock:
+            key = (branch, good, bad)
+            if key not in self._pushes:
+                self._pushes[key] = integration_pushes(JsonPushes(branch), good, bad)
+            return self._pushes[key]
+
+    def _bisect(self, bisection, bisector, good, bad, expand=0):
+        fetch_config = bisection.fetch_config
+        start, end = (bad, good) if self.find_fix else (good, bad)
+        bisection.result = bisector.bisect(
+            bisection.handler,
+            good,
+            bad,
+            expand=expand,
+            pushes=self.pushes(fetch_config.integration_branch, start, end),
+            executor=self.executor,
+        )
+        handler = bisection.handler
+        if bisection.result == Bisection.FINISHED and len(handler.build_range) == 2:
+            merge = handler.handle_merge()
+            if merge:
+                branch, good, bad = merge
+                LOG.info("%s: bisecting the %s branch" % (bisection.name, branch))
+                bisection.merges.append(branch)
+                fetch_config.set_repo(branch)
+                bisection.handler = IntegrationHandler(find_fix=self.find_fix)
+                self._bisect(bisection, bisector, good, bad, expand=DEFAULT_EXPAND)
+
+    def _run(self, bisection, good, bad):
+        bisector = Bisector(
+            bisection.fetch_config,
+            self.test_runner,
+            self.download_manager,
+            dl_in_background=self.dl_in_background,
+            approx_chooser=self.approx_chooser,
+        )
+        try:
+            self._bisect(bisection, bisector, good, bad)
+        except Exception as exc:
+            LOG.error("%s: bisection failed: %s" % (bisection.name, exc))
+            bisection.error = exc
+
+    def bisect(self, good, bad):
+        """
+        Bisect every platform between good and bad, and returns the list of
+        :class:`PlatformBisection`.
+        """
+        bisections = [
+            PlatformBisection(
+                fetch_config,
+                IntegrationHandler(
+                    find_fix=self.find_fix, ensure_good_and_bad=self.ensure_good_and_bad
+                ),
+            )
+            for fetch_config in self.fetch_configs
+        ]
+        self.executor = ThreadPoolExecutor(max_workers=self.info_workers)
+        try:
+            threads = [
+                threading.Thread(target=self._run, args=(bisection, good, bad))
+                for bisection in bisections
+            ]
+            for thread in threads:
+                thread.daemon = True
+                thread.start()
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.1)
+        finally:
+            # do not wait for the pending fetches when interrupted
+            self.executor.shutdown(wait=False)
+        return bisections
+
+
+def print_report(bisections):
+    """
+    Log the results of the bisections side by side.
+    """
+    rows = [("Platform", "Result", "Good", "Bad", "Pushlog")]
+    for bisection in bisections:
+        handler = bisection.handler
+        status = bisection.status
+        if bisection.merges:
+            status += " (in %s)" % ", ".join(bisection.merges)
+        found = bisection.error is None and handler.good_revision is not None
+        rows.append(
+            (
+                bisection.name,
+                status,
+                (handler.good_revision or "")[:12],
+                (handler.bad_revision or "")[:12],
+                handler.get_pushlog_url() if found else "",
+            )
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]) - 1)]
+    for row in rows:
+        LOG.info("  ".join(col.ljust(width) for col, width in zip(row, widths)) + "  " + row[-1])
+
+    ranges = set(
+        (b.handler.good_revision, b.handler.bad_revision)
+        for b in bisections
+        if b.result == Bisection.FINISHED
+    )
+    if len(ranges) == 1 and all(b.result == Bisection.FINISHED for b in bisections):
+        LOG.info("The same range was found on every platform.")
@@ -1,5 +1,8 @@
 """
 network functions utilities for mozregression.
+
+requests, redo and bs4 are only imported when first needed, so that
+importing this module (e.g. to parse the command line) stays cheap.
 """
 
 from __future__ import absolute_import
@@ -7,10 +10,6 @@ from __future__ import absolute_import
 import re
 from urllib.parse import urljoin
 
-import redo
-import requests
-from bs4 import BeautifulSoup
-
 
 def retry_get(url, **karwgs):
     """
@@ -20,6 +19,9 @@ def retry_get(url, **karwgs):
     it will retry the requests call three times in case of HTTPError or
     ConnectionError.
     """
+    import redo
+    import requests
+
     return redo.retry(
         get_http_session().get,
         attempts=3,
@@ -49,6 +51,8 @@ def set_http_session(session=None, get_defaults=None):
     global SESSION
     if get_defaults:
         if session is None:
+            import requests
+
             session = requests.Session()
         # monkey patch to set default values to a session.get calls
         # I don't see other ways to do this globally for timeout for example
@@ -67,13 +71,19 @@ def get_http_session():
     """
     Returns the defined http session.
     """
-    return SESSION or requests
+    if SESSION is not None:
+        return SESSION
+    import requests
+
+    return requests
 
 
 def url_links(url, regex=None, auth=None):
     """
     Returns a list of links that can be found on a given web page.
     """
+    from bs4 import BeautifulSoup
+
     response = retry_get(url, auth=auth)
     response.raise_for_status()
 
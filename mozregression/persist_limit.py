@@ -52,14 +52,17 @@ class PersistLimit(object):
 
     def remove_old_files(self):
         """
-        remove oldest registered files.
+        remove oldest registered files, and returns the list of their paths.
         """
         if self.size_limit <= 0 or self.file_limit <= 0:
-            return
+            return []
         # sort by creation time, oldest first
         files = sorted(self.files, key=lambda f: f.stat.st_atime)
+        removed = []
         while len(files) > self.file_limit and self._files_size >= self.size_limit:
             f = files.pop(0)
             mozfile.remove(f.path)
             self._files_size -= f.stat.st_size
+            removed.append(f.path)
         self.files = files
+        return removed
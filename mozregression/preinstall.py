@@ -0,0 +1,192 @@
+"""
+This module provides a :class:`PreInstaller` class, able to install builds
+(and prepare their profiles) in a background thread once they have been
+downloaded, so that launching them later only requires to spawn the
+application process.
+"""
+
+from __future__ import absolute_import
+
+import os
+import threading
+from collections import deque
+
+from mozlog import get_proxy_logger
+
+from mozregression.errors import LauncherError
+from mozregression.launchers import REGISTRY, create_launcher
+
+LOG = get_proxy_logger("PreInstaller")
+
+
+class PreInstall(object):
+    """
+    State of the pre-installation of one build file.
+    """
+
+    PENDING = 0
+    RUNNING = 1
+    DONE = 2
+
+    def __init__(self, build_info, dest, download=None):
+        self.build_info = build_info
+        self.dest = dest
+        self.download = download
+        self.launcher = None
+        self.state = self.PENDING
+        self.discarded = False
+        self.finished = threading.Event()
+
+
+class PreInstaller(object):
+    """
+    PreInstaller installs builds in a background worker thread.
+
+    Builds are scheduled with :meth:`schedule`, usually when their download
+    is started in background. The worker waits for the download to finish,
+    then creates the :class:`mozregression.launchers.Launcher` (which
+    installs the build) and prepares its profile.
+
+    The launcher can then be retrieved with :meth:`take`. Pre-installs that
+    are not needed anymore (e.g. builds that are out of the bisection range)
+    should be thrown away with :meth:`discard`.
+
+    :param launcher_kwargs: the keyword arguments that will be given to
+                            :meth:`mozregression.launchers.Launcher.start`.
+                            They are used to create the profile in
+                            advance. If None, no profile is created.
+    """
+
+    def __init__(self, launcher_kwargs=None):
+        self.launcher_kwargs = launcher_kwargs
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._queue = deque()
+        self._installs = {}
+        self._thread = None
+        self._stopped = False
+
+    def schedule(self, build_info, dest, download=None):
+        """
+        Schedule the installation of the build that is (or will be) stored
+        in *dest*.
+
+        :param download: the :class:`mozregression.download_manager.Download`
+                         instance that is downloading the build, or None
+                         if the file is already there.
+
+        Nothing is done for applications whose launcher does not support
+        pre-installs (e.g. the Android ones, since installing a build
+        replaces the one under test on the device).
+        """
+        if not REGISTRY.get(build_info.app_name).supports_preinstall:
+            return
+        with self._lock:
+            if self._stopped or dest in self._installs:
+                return
+            install = PreInstall(build_info, dest, download)
+            self._installs[dest] = install
+            self._queue.append(install)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+            self._wakeup.notify()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._queue and not self._stopped:
+                    self._wakeup.wait()
+                if self._stopped:
+                    return
+                install = self._queue.popleft()
+                install.state = PreInstall.RUNNING
+            launcher = None
+            try:
+                launcher = self._install(install)
+            except Exception:
+                LOG.debug("Unable to pre-install %s" % install.dest, exc_info=True)
+            with self._lock:
+                install.state = PreInstall.DONE
+                if not install.discarded:
+                    install.launcher = launcher
+            if install.discarded:
+                self._cleanup_launcher(launcher)
+            install.finished.set()
+
+    def _install(self, install):
+        if install.download is not None:
+            install.download.wait(raise_if_error=False)
+            if install.download.is_canceled() or install.download.error():
+                return
+        if install.discarded or not os.path.exists(install.dest):
+            return
+        install.build_info.build_file = install.dest
+        LOG.debug("Pre-installing %s" % install.dest)
+        try:
+            launcher = create_launcher(install.build_info)
+        except LauncherError:
+            # this will be reported when the build is really evaluated
+            return
+        if self.launcher_kwargs is not None:
+            try:
+                launcher.prepare_profile(**self.launcher_kwargs)
+            except Exception:
+                LOG.debug("Unable to prepare the profile", exc_info=True)
+        return launcher
+
+    @staticmethod
+    def _cleanup_launcher(launcher):
+        if launcher is not None:
+            try:
+                launcher.cleanup()
+            except Exception:
+                LOG.debug("Error while removing a pre-install", exc_info=True)
+
+    def take(self, build_info):
+        """
+        Returns the pre-installed launcher for the given build info, or None
+        if there is none.
+
+        If the installation is running, this blocks until it is done. The
+        caller is then responsible for the launcher cleanup.
+        """
+        with self._lock:
+            install = self._installs.pop(build_info.build_file, None)
+            if install is None:
+                return None
+            if install.state == PreInstall.PENDING:
+                self._queue.remove(install)
+                return None
+        install.finished.wait()
+        return install.launcher
+
+    def discard(self, keep=()):
+        """
+        Throw away the pre-installs whose destination is not in *keep*.
+        """
+        keep = set(keep)
+        launchers = []
+        with self._lock:
+            for dest in list(self._installs):
+                if dest in keep:
+                    continue
+                install = self._installs.pop(dest)
+                if install.state == PreInstall.PENDING:
+                    self._queue.remove(install)
+                elif install.state == PreInstall.RUNNING:
+                    install.discarded = True
+                else:
+                    launchers.append(install.launcher)
+        for launcher in launchers:
+            self._cleanup_launcher(launcher)
+
+    def cleanup(self):
+        """
+        Stop the worker thread and throw away every pre-install.
+        """
+        self.discard()
+        with self._lock:
+            self._stopped = True
+            self._wakeup.notify()
@@ -0,0 +1,154 @@
+"""
+Cache of prepared profile templates.
+
+Cloning a user profile for each tested build is slow when the profile is
+big, and addons have to be installed again in each clone. Instead, a
+template is prepared once (a clone of the profile with the addons
+installed) and each launch gets a cheap clone of that template, using
+reflinks (copy-on-write) when the filesystem supports it, hardlinks for
+files that the application does not write and real copies for the others.
+"""
+
+from __future__ import absolute_import
+
+import errno
+import fnmatch
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+import mozfile
+from mozlog import get_proxy_logger
+
+LOG = get_proxy_logger("Profile")
+
+# FICLONE ioctl request number, see ioctl_ficlone(2)
+FICLONE = 0x40049409
+
+# files (relative to the profile dir, with "/" as separator) that are only
+# read by the application, so they can be shared with the template.
+READ_ONLY_PATTERNS = (
+    "extensions/*",
+    "features/*",
+    "*.xpi",
+)
+
+
+def is_read_only(relpath):
+    """
+    Returns True if the file at relpath (relative to the profile dir) is not
+    written by the application.
+    """
+    relpath = relpath.replace(os.sep, "/")
+    return any(fnmatch.fnmatch(relpath, pattern) for pattern in READ_ONLY_PATTERNS)
+
+
+def _reflink(src, dst):
+    import fcntl
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+
+class TreeCloner(object):
+    """
+    Clone directory trees as fast as possible.
+
+    Reflinks are tried first; on the first failure meaning that they are
+    not supported, they are not tried anymore and files are copied, except
+    read-only files (see :func:`is_read_only`) that are hardlinked.
+    """
+
+    def __init__(self):
+        self.use_reflink = sys.platform.startswith("linux")
+
+    def clone_file(self, src, dst, relpath):
+        if self.use_reflink:
+            try:
+                _reflink(src, dst)
+                shutil.copystat(src, dst)
+                return
+            except OSError as exc:
+                mozfile.remove(dst)
+                if exc.errno in (errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY):
+                    LOG.debug("reflinks not supported, falling back to copies")
+                    self.use_reflink = False
+        if is_read_only(relpath):
+            try:
+                os.link(src, dst)
+                return
+            except OSError:
+                pass
+        shutil.copy2(src, dst)
+
+    def clone_tree(self, src, dst):
+        """
+        Clone the *src* directory to *dst*, which must not exist.
+        """
+        for root, dirs, files in os.walk(src, followlinks=True):
+            reldir = os.path.relpath(root, src)
+            destdir = os.path.normpath(os.path.join(dst, reldir))
+            os.makedirs(destdir)
+            for fname in files:
+                path = os.path.join(root, fname)
+                if not os.path.exists(path):
+                    # dangling symlink
+                    continue
+                relpath = os.path.normpath(os.path.join(reldir, fname))
+                self.clone_file(path, os.path.join(destdir, fname), relpath)
+
+
+class ProfileTemplates(object):
+    """
+    Keep prepared profile templates, and create profiles by cloning them.
+
+    A template is created the first time a given profile is cloned with a
+    given set of addons. Preferences are not part of the template, as they
+    are cheap to write for each clone.
+    """
+
+    def __init__(self):
+        self._templates = {}
+        self._lock = threading.Lock()
+        self._cloner = TreeCloner()
+
+    def _get_template(self, profile_class, path, addons):
+        key = (profile_class, os.path.realpath(path), tuple(addons))
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                LOG.debug("Preparing a profile template from %s" % path)
+                template = profile_class.clone(path, addons=addons, restore=False)
+                # only keep the addons in the template
+                template.clean_preferences()
+                self._templates[key] = template
+            return template
+
+    def clone(self, profile_class, path, addons=(), preferences=None):
+        """
+        Returns a new temporary profile instance of *profile_class*, with
+        the content of the profile at *path* and the given addons and
+        preferences. The profile is removed on cleanup.
+        """
+        template = self._get_template(profile_class, path, addons)
+        path_to = tempfile.mkdtemp()
+        # clone_tree requires that dest does not exist
+        mozfile.remove(path_to)
+        self._cloner.clone_tree(template.profile, path_to)
+        profile = profile_class(path_to, preferences=preferences)
+        profile.create_new = True
+        return profile
+
+    def clear(self):
+        """
+        Remove every prepared template.
+        """
+        with self._lock:
+            for template in self._templates.values():
+                mozfile.remove(template.profile)
+            self._templates.clear()
+
+
+PROFILE_TEMPLATES = ProfileTemplates()
@@ -0,0 +1,142 @@
+"""
+Throttled reporting of the progress of downloads.
+
+A download reports its progress for every chunk read, which is way more
+often than anyone can see. A :class:`ProgressAggregator` keeps the
+progress of the running downloads and only calls its report function at
+a fixed rate, with the throughput and the estimated remaining time of
+each download.
+"""
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+
+class Transfer(object):
+    """
+    The progress of one download.
+    """
+
+    def __init__(self, key, total, started):
+        self.key = key
+        self.current = 0
+        self.total = total
+        self.started = started
+        self.updated = started
+
+    @property
+    def percent(self):
+        return (self.current * 100.0) / self.total if self.total else 0.0
+
+    @property
+    def rate(self):
+        """
+        The average throughput, in bytes per second (or None if unknown).
+        """
+        elapsed = self.updated - self.started
+        if elapsed <= 0:
+            return None
+        return self.current / elapsed
+
+    @property
+    def eta(self):
+        """
+        The estimated remaining time in seconds (or None if unknown).
+        """
+        rate = self.rate
+        if not rate or not self.total:
+            return None
+        return max(self.total - self.current, 0) / rate
+
+    @property
+    def done(self):
+        return bool(self.total) and self.current >= self.total
+
+
+class ProgressAggregator(object):
+    """
+    Collect the progress of several downloads, and report them at most
+    every *interval* seconds.
+
+    :param report: a callable that takes the list of the running
+                   :class:`Transfer` instances. It is called in the thread
+                   of the download that reports its progress, when a
+                   download starts, finishes, or when *interval* seconds
+                   passed since the last report.
+    :param interval: the minimum time between two reports.
+    :param clock: the time function.
+
+    :meth:`update` has the signature of a download progress callback (see
+    :meth:`mozregression.download_manager.Download.set_progress`).
+    """
+
+    def __init__(self, report, interval=0.1, clock=time.monotonic):
+        self.report = report
+        self.interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._transfers = {}
+        self._last_report = None
+
+    def update(self, key, current, total):
+        """
+        Record the progress of the download *key*.
+        """
+        now = self._clock()
+        with self._lock:
+            transfer = self._transfers.get(key)
+            new = transfer is None
+            if new:
+                transfer = self._transfers[key] = Transfer(key, total, now)
+            transfer.current, transfer.total, transfer.updated = current, total, now
+            if not (
+                new
+                or transfer.done
+                or self._last_report is None
+                or now - self._last_report >= self.interval
+            ):
+                return
+            self._last_report = now
+            transfers = list(self._transfers.values())
+            if transfer.done:
+                del self._transfers[key]
+        self.report(transfers)
+
+    def remove(self, key):
+        """
+        Forget about the download *key* (e.g. because it was canceled).
+        """
+        with self._lock:
+            self._transfers.pop(key, None)
+
+    def transfers(self):
+        """
+        Returns the list of the running transfers.
+        """
+        with self._lock:
+            return list(self._transfers.values())
+
+
+def format_size(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return "%.1f %s" % (size, unit)
+        size /= 1024.0
+    return "%.1f GB" % size
+
+
+def format_transfer(transfer):
+    """
+    Returns a short text describing the progress of a transfer.
+    """
+    text = "%d%%" % transfer.percent
+    details = []
+    if transfer.rate is not None:
+        details.append("%s/s" % format_size(transfer.rate))
+    if transfer.eta is not None and not transfer.done:
+        details.append("%d:%02d left" % divmod(int(transfer.eta), 60))
+    if details:
+        text += " (%s)" % ", ".join(details)
+    return text
@@ -0,0 +1,361 @@
+"""
+Record and replay of the HTTP traffic of mozregression.
+
+In record mode, every response obtained through a session is stored in a
+session archive, a directory containing:
+
+ - ``index.jsonl``: one JSON entry per response (method, url, status,
+   headers, latencies and body reference);
+ - ``blobs/``: the response bodies bigger than :data:`INLINE_BODY_SIZE`
+   (e.g. the builds), stored by sha256 so identical bodies are stored once.
+
+In replay mode, the responses are served from the archive without any
+network access, after the recorded latencies (possibly scaled). A request
+that was not recorded fails with a ConnectionError.
+
+Use :func:`install` to set up a requests session in one of these modes.
+"""
+
+from __future__ import absolute_import
+
+import base64
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+import requests
+from mozlog import get_proxy_logger
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from mozregression.errors import MozRegressionError
+
+LOG = get_proxy_logger("Replay")
+
+# bodies bigger than this are stored as blobs
+INLINE_BODY_SIZE = 64 * 1024
+
+# these headers describe the body as sent on the wire; bodies are stored
+# decoded, so they are not kept.
+DROPPED_HEADERS = ("content-encoding", "transfer-encoding", "content-length")
+
+
+class SessionArchive(object):
+    """
+    A directory storing recorded HTTP responses.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = os.path.join(path, "index.jsonl")
+        self.blobs_dir = os.path.join(path, "blobs")
+        self._lock = threading.Lock()
+        self._entries = defaultdict(list)
+        self._served = defaultdict(int)
+
+    @staticmethod
+    def key(method, url):
+        return "%s %s" % (method.upper(), url)
+
+    def load(self):
+        """
+        Load the recorded entries.
+        """
+        if not os.path.isfile(self.index_path):
+            raise MozRegressionError("No HTTP session archive found in %s" % self.path)
+        with open(self.index_path) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entry = json.loads(line)
+                    self._entries[self.key(entry["method"], entry["url"])].append(entry)
+
+    def _blob_path(self, digest):
+        return os.path.join(self.blobs_dir, digest[:2], digest)
+
+    def store_body(self, chunks):
+        """
+        Store a body given as an iterable of bytes, and returns a dict
+        describing it, to be stored in an entry.
+        """
+        writer = BodyWriter(self)
+        try:
+            for chunk in chunks:
+                writer.write(chunk)
+        except BaseException:
+            writer.discard()
+            raise
+        return writer.finish()
+
+    def open_body(self, entry):
+        """
+        Returns a file object reading the body of a recorded entry.
+        """
+        if "blob" in entry:
+            return open(self._blob_path(entry["blob"]), "rb")
+        return io.BytesIO(base64.b64decode(entry["body"]))
+
+    def add(self, entry):
+        with self._lock:
+            with open(self.index_path, "a") as f:
+                f.write(json.dumps(entry, sort_keys=True) + "\n")
+            self._entries[self.key(entry["method"], entry["url"])].append(entry)
+
+    def lookup(self, method, url):
+        """
+        Returns the next recorded entry for a request, or None.
+
+        Entries recorded for the same request are returned in order; once
+        they have all been served, the last one is returned again.
+        """
+        key = self.key(method, url)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                return None
+            index = min(self._served[key], len(entries) - 1)
+            self._served[key] += 1
+            return entries[index]
+
+
+class BodyWriter(object):
+    """
+    Store a body written by chunks in a :class:`SessionArchive`.
+    """
+
+    def __init__(self, archive):
+        self.archive = archive
+        os.makedirs(archive.blobs_dir, exist_ok=True)
+        self._sha = hashlib.sha256()
+        self._size = 0
+        self._head = io.BytesIO()
+        self._tmp = tempfile.NamedTemporaryFile(dir=archive.blobs_dir, delete=False)
+
+    def write(self, chunk):
+        self._sha.update(chunk)
+        self._size += len(chunk)
+        self._tmp.write(chunk)
+        if self._size <= INLINE_BODY_SIZE:
+            self._head.write(chunk)
+
+    def finish(self):
+        """
+        Returns a dict describing the body, to be stored in an entry.
+        """
+        self._tmp.close()
+        if self._size <= INLINE_BODY_SIZE:
+            os.remove(self._tmp.name)
+            return {
+                "size": self._size,
+                "body": base64.b64encode(self._head.getvalue()).decode("ascii"),
+            }
+        digest = self._sha.hexdigest()
+        path = self.archive._blob_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(self._tmp.name, path)
+        return {"size": self._size, "blob": digest}
+
+    def discard(self):
+        self._tmp.close()
+        os.remove(self._tmp.name)
+
+
+class RecordingReader(object):
+    """
+    A file-like object reading a response body from the network, that
+    stores it in the archive as the caller reads it.
+
+    *on_end* is called with the description of the body and the time spent
+    reading it once the whole body was read. A body that is not read to the
+    end (e.g. a cancelled download) is not recorded.
+    """
+
+    def __init__(self, raw, writer, on_end):
+        self.raw = raw
+        self._writer = writer
+        self._on_end = on_end
+        self._duration = 0.0
+
+    def read(self, amt=None, decode_content=True):
+        # the body is always decoded, as it is stored
+        if self._writer is None:
+            return self.raw.read(amt, decode_content=True)
+        start = time.perf_counter()
+        try:
+            data = self.raw.read(amt, decode_content=True)
+        except BaseException:
+            self.close()
+            raise
+        self._duration += time.perf_counter() - start
+        if data:
+            self._writer.write(data)
+        if not data or amt is None:
+            writer, self._writer = self._writer, None
+            self.raw.release_conn()
+            self._on_end(writer.finish(), self._duration)
+        return data
+
+    def close(self):
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.discard()
+        self.raw.close()
+        self.raw.release_conn()
+
+    def release_conn(self):
+        self.raw.release_conn()
+
+
+class ThrottledReader(object):
+    """
+    A file-like object that spreads the read of *size* bytes from *fileobj*
+    over *duration* seconds.
+    """
+
+    def __init__(self, fileobj, size, duration):
+        self.fileobj = fileobj
+        self.size = size
+        self.duration = duration
+        self._read = 0
+        self._start = None
+
+    def read(self, amt=None):
+        if self._start is None:
+            self._start = time.perf_counter()
+        data = self.fileobj.read(amt) if amt is not None else self.fileobj.read()
+        self._read += len(data)
+        if self.duration > 0 and self.size:
+            expected = self._start + self.duration * min(1.0, float(self._read) / self.size)
+            delay = expected - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        return data
+
+    def close(self):
+        self.fileobj.close()
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    A transport adapter that does real requests, and stores the responses
+    in a :class:`SessionArchive`.
+    """
+
+    def __init__(self, archive, **kwargs):
+        HTTPAdapter.__init__(self, **kwargs)
+        self.archive = archive
+
+    def send(self, request, stream=False, **kwargs):
+        start = time.perf_counter()
+        response = HTTPAdapter.send(self, request, stream=True, **kwargs)
+        elapsed = time.perf_counter() - start
+        original_headers = response.headers
+        headers = [(k, v) for k, v in original_headers.items() if k.lower() not in DROPPED_HEADERS]
+        if "content-length" in original_headers and (
+            request.method == "HEAD" or "content-encoding" not in original_headers
+        ):
+            # still valid for the decoded body
+            response.headers = CaseInsensitiveDict(
+                headers + [("Content-Length", original_headers["content-length"])]
+            )
+        else:
+            response.headers = CaseInsensitiveDict(headers)
+
+        def on_end(body, duration):
+            entry_headers = list(headers)
+            if request.method == "HEAD":
+                if "content-length" in original_headers:
+                    entry_headers.append(("Content-Length", original_headers["content-length"]))
+            else:
+                entry_headers.append(("Content-Length", str(body["size"])))
+            entry = {
+                "method": request.method,
+                "url": request.url,
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": entry_headers,
+                "elapsed": round(elapsed, 6),
+                "duration": round(duration, 6),
+            }
+            entry.update(body)
+            self.archive.add(entry)
+
+        # the body is stored as the caller reads it, so that downloads can
+        # still be followed and cancelled.
+        response.raw = RecordingReader(response.raw, BodyWriter(self.archive), on_end)
+        if not stream:
+            response.content
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    A transport adapter serving responses from a :class:`SessionArchive`.
+
+    :param latency_scale: factor applied to the recorded latencies; 0 means
+                          that responses are served as fast as possible.
+    """
+
+    def __init__(self, archive, latency_scale=1.0):
+        BaseAdapter.__init__(self)
+        self.archive = archive
+        self.latency_scale = latency_scale
+
+    def send(self, request, stream=False, **kwargs):
+        entry = self.archive.lookup(request.method, request.url)
+        if entry is None:
+            raise requests.ConnectionError(
+                "No recorded response for %s %s" % (request.method, request.url),
+                request=request,
+            )
+        if self.latency_scale > 0:
+            time.sleep(entry["elapsed"] * self.latency_scale)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = ThrottledReader(
+            self.archive.open_body(entry), entry["size"], entry["duration"] * self.latency_scale
+        )
+        if not stream:
+            response.content
+        return response
+
+    def close(self):
+        pass
+
+
+def install(session, record=None, replay=None, latency_scale=1.0):
+    """
+    Set up a requests session to record its traffic in the *record*
+    directory, or to replay the traffic recorded in the *replay* directory.
+
+    Returns the session.
+    """
+    if record and replay:
+        raise MozRegressionError("HTTP record and replay modes can not be used together")
+    if record:
+        os.makedirs(record, exist_ok=True)
+        LOG.info("Recording the HTTP traffic in %s" % record)
+        adapter = RecordingAdapter(SessionArchive(record))
+    elif replay:
+        archive = SessionArchive(replay)
+        archive.load()
+        LOG.info("Replaying the HTTP traffic recorded in %s" % replay)
+        adapter = ReplayAdapter(archive, latency_scale=latency_scale)
+    else:
+        return session
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,228 @@
+"""
+Evaluate every build of a range, instead of bisecting it.
+
+This helps to find flaky or multi-step regressions. It is made for the
+jsshell with a test command: a run is small and CPU bound, so several
+builds are evaluated at the same time, while the next builds are found
+and downloaded. Results are written to a CSV or JSON lines table as soon
+as they are known.
+"""
+
+from __future__ import absolute_import
+
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from mozlog import get_proxy_logger
+
+from mozregression.errors import LauncherError
+
+LOG = get_proxy_logger("Sweep")
+
+FIELDS = ("index", "build", "changeset", "verdict", "duration", "error")
+
+# verdicts of the builds that could not be evaluated
+MISSING = "missing"
+ERROR = "error"
+
+
+class SweepResult(object):
+    """
+    The evaluation of one build of the range.
+
+    :param verdict: "g" or "b" (see :meth:`TestRunner.evaluate`),
+                    :data:`MISSING` or :data:`ERROR`.
+    :param duration: the evaluation time in seconds.
+    """
+
+    def __init__(self, index, build, changeset=None, verdict=None, duration=None, error=None):
+        self.index = index
+        self.build = build
+        self.changeset = changeset
+        self.verdict = verdict
+        self.duration = duration
+        self.error = error
+
+    def to_dict(self):
+        return dict((field, getattr(self, field)) for field in FIELDS)
+
+
+class CsvResultWriter(object):
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self._writer = csv.DictWriter(fileobj, FIELDS, lineterminator="\n")
+        self._writer.writeheader()
+
+    def write(self, result):
+        self._writer.writerow(result.to_dict())
+        self.fileobj.flush()
+
+
+class JsonResultWriter(object):
+    """
+    Write the results as JSON lines (one JSON object per line).
+    """
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+
+    def write(self, result):
+        self.fileobj.write(json.dumps(result.to_dict()) + "\n")
+        self.fileobj.flush()
+
+
+def open_result_writer(path):
+    """
+    Returns a result writer for *path*, "-" meaning stdout: a CSV writer if
+    the file name ends with .csv, else a JSON lines writer. The writer
+    should be closed with :func:`close_result_writer`.
+    """
+    fileobj = sys.stdout if path == "-" else open(path, "w")
+    if path.lower().endswith(".csv"):
+        return CsvResultWriter(fileobj)
+    return JsonResultWriter(fileobj)
+
+
+def close_result_writer(writer):
+    if writer.fileobj is not sys.stdout:
+        writer.fileobj.close()
+
+
+def transitions(results):
+    """
+    Returns the pairs of consecutive evaluated builds (by index) that do
+    not have the same verdict.
+    """
+    evaluated = sorted((r for r in results if r.verdict in ("g", "b")), key=lambda r: r.index)
+    return [(a, b) for a, b in zip(evaluated, evaluated[1:]) if a.verdict != b.verdict]
+
+
+class Sweep(object):
+    """
+    Evaluate all the builds of a :class:`mozregression.build_range.BuildRange`.
+
+    Build infos are found and builds downloaded by *download_jobs* threads,
+    then the builds are evaluated by the test runner in *jobs* threads
+    (each one waiting for its test command process).
+
+    :param test_runner: a :class:`mozregression.test_runner.TestRunner`,
+                        usually a CommandTestRunner.
+    :param download_manager: a
+        :class:`mozregression.download_manager.BuildDownloadManager`.
+    :param writer: a result writer (see :func:`open_result_writer`).
+    :param jobs: the number of builds evaluated at the same time. Defaults
+                 to the number of cores.
+    """
+
+    def __init__(
+        self, build_range, test_runner, download_manager, writer, jobs=None, download_jobs=4
+    ):
+        self.build_range = build_range
+        self.test_runner = test_runner
+        self.download_manager = download_manager
+        self.writer = writer
+        self.jobs = jobs or os.cpu_count() or 1
+        self.download_jobs = download_jobs
+        self.results = []
+
+    def _build_name(self, index):
+        return str(self.build_range.get_future(index).date_or_changeset())
+
+    def _download(self, index):
+        """
+        Find and download the build at *index*. Returns its build info, or
+        a SweepResult if that fails.
+        """
+        name = self._build_name(index)
+        try:
+            build_info = self.build_range.get_future(index).build_info
+            if build_info is False:
+                return SweepResult(index, name, verdict=MISSING)
+            dl = self.download_manager.download_in_background(build_info)
+            if dl is not None:
+                dl.wait()
+            build_info.build_file = self.download_manager.get_dest(build_info.persist_filename)
+            return build_info
+        except Exception as exc:
+            # a network error, or a build that could not be found
+            LOG.error("Unable to download build %s: %s" % (name, exc))
+            return SweepResult(index, name, verdict=ERROR, error=str(exc))
+
+    def _evaluate(self, index, build_info):
+        name = self._build_name(index)
+        start = time.time()
+        try:
+            verdict, error = self.test_runner.evaluate(build_info), None
+        except LauncherError as exc:
+            # an invalid build. A TestCommandError stops the sweep, since
+            # that would happen for every build.
+            LOG.error("Unable to evaluate build %s: %s" % (name, exc))
+            verdict, error = ERROR, str(exc)
+        return SweepResult(
+            index,
+            name,
+            changeset=build_info.changeset,
+            verdict=verdict,
+            duration=round(time.time() - start, 3),
+            error=error,
+        )
+
+    def _add_result(self, result):
+        self.results.append(result)
+        self.writer.write(result)
+        LOG.info("Build %s: %s" % (result.build, result.verdict))
+
+    def run(self):
+        """
+        Evaluate every build, and returns the list of
+        :class:`SweepResult` in the order they were completed.
+        """
+        LOG.info("Evaluating %d builds, %d at a time" % (len(self.build_range), self.jobs))
+        download_pool = ThreadPoolExecutor(self.download_jobs)
+        eval_pool = ThreadPoolExecutor(self.jobs)
+        downloads = {
+            download_pool.submit(self._download, i): i for i in range(len(self.build_range))
+        }
+        evaluations = set()
+        try:
+            while downloads or evaluations:
+                done, _ = wait(set(downloads) | evaluations, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if future in evaluations:
+                        evaluations.discard(future)
+                        self._add_result(result)
+                        continue
+                    index = downloads.pop(future)
+                    if isinstance(result, SweepResult):
+                        self._add_result(result)
+                    else:
+                        evaluations.add(eval_pool.submit(self._evaluate, index, result))
+        finally:
+            for future in list(downloads) + list(evaluations):
+                future.cancel()
+            self.download_manager.cancel()
+            download_pool.shutdown(wait=False)
+            eval_pool.shutdown(wait=False)
+        return self.results
+
+    def print_summary(self):
+        counts = {}
+        for result in self.results:
+            counts[result.verdict] = counts.get(result.verdict, 0) + 1
+        LOG.info(
+            "Swept %d builds: %s"
+            % (
+                len(self.results),
+                ", ".join("%d %s" % (n, verdict) for verdict, n in sorted(counts.items())),
+            )
+        )
+        for before, after in transitions(self.results):
+            LOG.info(
+                "Verdict changed from %s to %s between %s and %s"
+                % (before.verdict, after.verdict, before.build, after.build)
+            )
@@ -2,8 +2,6 @@ from __future__ import absolute_import
 
 import json
 
-from taskcluster import utils as tc_utils
-
 from mozregression.config import DEFAULT_CONF_FNAME, TC_CREDENTIALS_FNAME, get_config
 
 
@@ -11,6 +9,8 @@ def tc_authenticate(logger):
     """
     Returns valid credentials for use with Taskcluster private builds.
     """
+    from taskcluster import utils as tc_utils
+
     # first, try to load credentials from mozregression config file
     defaults = get_config(DEFAULT_CONF_FNAME)
     client_id = defaults.get("taskcluster-clientid")
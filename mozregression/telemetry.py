@@ -1,21 +1,51 @@
+import datetime
+import functools
+import json
+import os
 import platform
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
 from collections import namedtuple
-from multiprocessing import Process
 from pathlib import Path
 
-import distro
-import importlib_resources
 import mozinfo
-from glean import Configuration, Glean, load_metrics, load_pings
 from mozlog import get_proxy_logger
 
-from mozregression import __version__
+from mozregression import __version__, config
 from mozregression.dates import is_date_or_datetime, to_datetime
 
 LOG = get_proxy_logger("telemetry")
 
-PINGS = load_pings(importlib_resources.files(__name__) / "pings.yaml")
-METRICS = load_metrics(importlib_resources.files(__name__) / "metrics.yaml")
+# pings are spooled in config.TELEMETRY_SPOOL_DIR, one JSON file per ping,
+# until a flusher uploads them. The oldest are dropped past this number.
+MAX_SPOOLED_PINGS = 100
+# a flusher lock older than this (in seconds) is stale: its flusher died
+FLUSHER_LOCK_TIMEOUT = 600
+# a flusher is only started when this many pings are spooled, or when the
+# oldest one was spooled more than FLUSH_DELAY seconds ago
+FLUSH_PINGS = 10
+FLUSH_DELAY = 15 * 60
+# exists if pings were spooled since telemetry was last disabled
+ENABLED_MARKER = "upload-enabled"
+# exists once Glean was told that telemetry is disabled, until it is
+# initialized with telemetry enabled again
+DISABLED_MARKER = "upload-disabled"
+
+
+# glean is slow to import and to load the metrics: this is only done when a
+# ping is sent.
+@functools.lru_cache(maxsize=None)
+def _glean_definitions():
+    import importlib_resources
+    from glean import load_metrics, load_pings
+
+    pings = load_pings(importlib_resources.files(__name__) / "pings.yaml")
+    metrics = load_metrics(importlib_resources.files(__name__) / "metrics.yaml")
+    return pings, metrics
+
 
 UsageMetrics = namedtuple(
     "UsageMetrics",
@@ -61,6 +91,8 @@ def get_system_info():
         except (AttributeError, IndexError):
             info["windows_version"] = UNKNOWN
     elif mozinfo.os == "linux":
+        import distro
+
         distro_info = distro.info()
         try:
             info["linux_version"] = distro_info["version"]
@@ -73,55 +105,252 @@ def get_system_info():
 
 
 def initialize_telemetry(upload_enabled, allow_multiprocessing=False):
-    mozregression_path = Path.home() / ".mozilla" / "mozregression"
+    from glean import Configuration, Glean
+
+    if upload_enabled:
+        _remove(os.path.join(_spool_dir(), DISABLED_MARKER))
     Glean.initialize(
         application_id="org.mozilla.mozregression",
         application_version=__version__,
         upload_enabled=upload_enabled,
         configuration=Configuration(allow_multiprocessing=allow_multiprocessing),
-        data_dir=mozregression_path / "data",
+        data_dir=Path(config.GLEAN_DATA_DIR),
     )
 
 
-def _send_telemetry_ping(metrics):
-    METRICS.usage.variant.set(metrics.variant)
-    METRICS.usage.app.set(metrics.appname)
-    METRICS.usage.build_type.set(metrics.build_type)
-    if is_date_or_datetime(metrics.good):
-        METRICS.usage.good_date.set(to_datetime(metrics.good))
-    if is_date_or_datetime(metrics.bad):
-        METRICS.usage.bad_date.set(to_datetime(metrics.bad))
-    if is_date_or_datetime(metrics.launch):
-        METRICS.usage.launch_date.set(to_datetime(metrics.launch))
-
+def _ping_values(metrics):
+    """
+    Returns the values of the usage ping metrics, as a JSON-serializable dict.
+    """
+    values = {
+        "variant": metrics.variant,
+        "app": metrics.appname,
+        "build_type": metrics.build_type,
+    }
+    for name in ("good", "bad", "launch"):
+        value = getattr(metrics, name)
+        values[name + "_date"] = (
+            to_datetime(value).isoformat() if is_date_or_datetime(value) else None
+        )
     # System information metrics.
-    METRICS.usage.mac_version.set(metrics.mac_version)
-    METRICS.usage.linux_version.set(metrics.linux_version)
-    METRICS.usage.linux_distro.set(metrics.linux_distro)
-    METRICS.usage.windows_version.set(metrics.windows_version)
-    METRICS.usage.python_version.set(metrics.python_version)
-    PINGS.usage.submit()
+    for name in (
+        "mac_version",
+        "linux_version",
+        "linux_distro",
+        "windows_version",
+        "python_version",
+    ):
+        values[name] = getattr(metrics, name)
+    return values
+
+
+def _record_ping(values):
+    pings, glean_metrics = _glean_definitions()
+    usage = glean_metrics.usage
+    for name, value in values.items():
+        if name.endswith("_date"):
+            if value is not None:
+                getattr(usage, name).set(datetime.datetime.fromisoformat(value))
+        else:
+            getattr(usage, name).set(value)
+    pings.usage.submit()
 
 
 def send_telemetry_ping(metrics):
     LOG.debug("Sending usage ping")
-    _send_telemetry_ping(metrics)
+    _record_ping(_ping_values(metrics))
 
 
-def _send_telemetry_ping_oop(metrics, upload_enabled):
-    initialize_telemetry(upload_enabled, allow_multiprocessing=True)
-    if upload_enabled:
-        _send_telemetry_ping(metrics)
+def _spool_dir():
+    return config.TELEMETRY_SPOOL_DIR
+
+
+def _spooled_pings():
+    try:
+        names = os.listdir(_spool_dir())
+    except OSError:
+        return []
+    return [os.path.join(_spool_dir(), name) for name in sorted(names) if name.endswith(".json")]
+
+
+def spool_ping(metrics):
+    """
+    Store a usage ping in the spool, to be uploaded later by the flusher.
+    """
+    spool_dir = _spool_dir()
+    os.makedirs(spool_dir, exist_ok=True)
+    # names are sortable by creation time
+    name = "%020d-%s.json" % (time.time_ns(), uuid.uuid4().hex)
+    with tempfile.NamedTemporaryFile("w", dir=spool_dir, suffix=".tmp", delete=False) as f:
+        json.dump(_ping_values(metrics), f)
+    os.replace(f.name, os.path.join(spool_dir, name))
+    with open(os.path.join(spool_dir, ENABLED_MARKER), "w"):
+        pass
+    # do not let the spool grow forever if the pings can not be uploaded
+    for path in _spooled_pings()[:-MAX_SPOOLED_PINGS]:
+        _remove(path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _lock_path():
+    return os.path.join(_spool_dir(), "flusher.lock")
+
+
+def _flusher_running():
+    try:
+        return time.time() - os.path.getmtime(_lock_path()) < FLUSHER_LOCK_TIMEOUT
+    except OSError:
+        return False
+
+
+def _flush_due():
+    pings = _spooled_pings()
+    if len(pings) >= FLUSH_PINGS:
+        return True
+    if not pings:
+        return False
+    try:
+        spooled_at = int(os.path.basename(pings[0]).split("-")[0]) / 1e9
+    except ValueError:
+        return True
+    return time.time() - spooled_at >= FLUSH_DELAY
+
+
+def _acquire_flusher_lock():
+    os.makedirs(_spool_dir(), exist_ok=True)
+    for _ in range(2):
+        try:
+            os.close(os.open(_lock_path(), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            if _flusher_running():
+                return False
+            # the previous flusher died without removing its lock
+            _remove(_lock_path())
+    return False
+
+
+def flush_spool(upload_enabled=True):
+    """
+    Upload the spooled pings in one batch, using Glean.
+
+    Only one flusher runs at a time: this returns False if another one
+    is running. If *upload_enabled* is False, the spooled pings are
+    dropped and Glean is told that the upload is disabled (so it can send
+    its deletion request).
+    """
+    if not _acquire_flusher_lock():
+        return False
+    initialized, locked = False, True
+    try:
+        while locked:
+            try:
+                if not initialized:
+                    initialize_telemetry(upload_enabled)
+                    initialized = True
+                _drain_spool(upload_enabled)
+            finally:
+                _remove(_lock_path())
+            # a ping may have been spooled just before the lock was released
+            locked = bool(_spooled_pings()) and _acquire_flusher_lock()
+    finally:
+        if initialized:
+            _shutdown_telemetry()
+    return True
+
+
+def _drain_spool(upload_enabled):
+    for path in _spooled_pings():
+        if upload_enabled:
+            try:
+                with open(path) as f:
+                    values = json.load(f)
+            except (IOError, OSError, ValueError) as exc:
+                LOG.debug("Dropping invalid spooled ping %s: %s" % (path, exc))
+            else:
+                _record_ping(values)
+        _remove(path)
+    if not upload_enabled:
+        _remove(os.path.join(_spool_dir(), ENABLED_MARKER))
+        with open(os.path.join(_spool_dir(), DISABLED_MARKER), "w"):
+            pass
+
+
+def _shutdown_telemetry():
+    from glean import Glean
+
+    # wait for the uploads to finish
+    Glean.shutdown()
+
+
+def start_flusher(upload_enabled=True):
+    """
+    Start a flusher in a detached process, unless one is already running.
+
+    When *upload_enabled* is True, the pings are uploaded by batches: no
+    flusher is started unless enough pings are spooled, or the oldest one
+    waited long enough (see FLUSH_PINGS and FLUSH_DELAY).
+
+    This runs in another process because mozregression may run in a process
+    which is itself using Glean for other purposes (e.g. mach).
+    """
+    if _flusher_running() or (upload_enabled and not _flush_due()):
+        return
+    args = [sys.executable, "-m", "mozregression.telemetry"]
+    if not upload_enabled:
+        args.append("--upload-disabled")
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS
+    else:
+        kwargs["start_new_session"] = True
+    subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **kwargs,
+    )
+
+
+def _disable_pending():
+    """
+    Returns True if Glean must be told that telemetry is disabled.
+    """
+    if os.path.exists(os.path.join(_spool_dir(), ENABLED_MARKER)):
+        return True
+    # Glean may have been used without the spool (by the GUI, or by older
+    # versions of mozregression)
+    return os.path.isdir(config.GLEAN_DATA_DIR) and not os.path.exists(
+        os.path.join(_spool_dir(), DISABLED_MARKER)
+    )
 
 
 def send_telemetry_ping_oop(metrics, upload_enabled):
     """
-    This somewhat convoluted function forks off a process (using
-    Python's multiprocessing module) and sends a glean ping --
-    this is to get around the fact that we sometimes might
-    call mozregression inside a process which is itself using
-    Glean for other purposes (e.g. mach)
+    Send a usage ping from another process: the ping is spooled on disk,
+    and uploaded by a flusher process shared by all the mozregression runs.
+
+    When telemetry is disabled this does nothing, except telling Glean once
+    that it was disabled.
     """
-    LOG.debug("Sending usage ping (OOP)")
-    p = Process(target=_send_telemetry_ping_oop, args=(metrics, upload_enabled))
-    p.start()
+    try:
+        if upload_enabled:
+            LOG.debug("Spooling usage ping")
+            spool_ping(metrics)
+            start_flusher()
+        elif _disable_pending():
+            start_flusher(upload_enabled=False)
+    except (IOError, OSError) as exc:
+        LOG.debug("Unable to send the usage ping: %s" % exc)
+
+
+if __name__ == "__main__":
+    # the flusher process, see start_flusher()
+    flush_spool(upload_enabled="--upload-disabled" not in sys.argv[1:])
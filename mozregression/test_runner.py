@@ -7,23 +7,28 @@ from __future__ import absolute_import, print_function
 
 import datetime
 import os
+import pathlib
+import re
 import shlex
-import subprocess
 import sys
+import threading
+import time
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
 
 from mozlog import get_proxy_logger
 
+from mozregression.command import run_command
 from mozregression.errors import LauncherError, TestCommandError
+from mozregression.launchers import Launcher, MozRunnerLauncher
 from mozregression.launchers import create_launcher as mozlauncher
+from mozregression.tracing import span
 
 LOG = get_proxy_logger("Test Runner")
 
 
-def create_launcher(build_info):
-    """
-    Create and returns a :class:`mozregression.launchers.Launcher`.
-    """
+def _log_running_build(build_info):
     if build_info.build_type == "nightly":
         if isinstance(build_info.build_date, datetime.datetime):
             desc = "for buildid %s" % build_info.build_date.strftime("%Y%m%d%H%M%S")
@@ -36,16 +41,113 @@ def create_launcher(build_info):
         )
     LOG.info("Running %s build %s" % (build_info.repo_name, desc))
 
+
+def create_launcher(build_info):
+    """
+    Create and returns a :class:`mozregression.launchers.Launcher`.
+    """
+    _log_running_build(build_info)
     return mozlauncher(build_info)
 
 
+class InstallCache(object):
+    """
+    Keeps the installs of the last desktop builds that were run, so that
+    running the same build file again does not install it again (e.g. in
+    successive jobs of the daemon, see :mod:`mozregression.daemon`).
+
+    The cache is bounded: the least recently used installs are removed.
+    """
+
+    def __init__(self, maxsize=4):
+        self.maxsize = maxsize
+        self._launchers = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(build_file):
+        stat = os.stat(build_file)
+        return (os.path.abspath(build_file), stat.st_size, stat.st_mtime_ns)
+
+    @contextmanager
+    def launcher(self, build_info):
+        """
+        Context manager that gives a launcher for the build, reusing its
+        install if possible. On exit the application is stopped, and the
+        install is kept for the next time.
+        """
+        try:
+            key = self._key(build_info.build_file)
+        except OSError:
+            key = None
+        with self._lock:
+            launcher = self._launchers.pop(key, None)
+        if launcher is None:
+            launcher = create_launcher(build_info)
+        else:
+            LOG.debug("Reusing the install of %s" % build_info.build_file)
+            _log_running_build(build_info)
+        if key is None or not isinstance(launcher, MozRunnerLauncher):
+            with launcher:
+                yield launcher
+            return
+        try:
+            yield launcher
+            # stop the application, but do not remove the install
+            Launcher.cleanup(launcher)
+        except BaseException:
+            launcher.cleanup()
+            raise
+        with self._lock:
+            self._launchers[key] = launcher
+            evicted = []
+            while len(self._launchers) > self.maxsize:
+                evicted.append(self._launchers.popitem(last=False)[1])
+        for old_launcher in evicted:
+            old_launcher.cleanup()
+
+    def clear(self):
+        """
+        Remove every install.
+        """
+        with self._lock:
+            launchers = list(self._launchers.values())
+            self._launchers.clear()
+        for launcher in launchers:
+            launcher.cleanup()
+
+
 class TestRunner(metaclass=ABCMeta):
     """
     Abstract class that allows to test a build.
 
     :meth:`evaluate` must be implemented by subclasses.
+
+    If the **preinstaller** attribute is set to a
+    :class:`mozregression.preinstall.PreInstaller` instance, launchers of
+    builds that were installed in background are reused.
     """
 
+    preinstaller = None
+    install_cache = None
+
+    def _create_launcher(self, build_info):
+        """
+        Returns a pre-installed launcher for the build if any, else create
+        and returns a new one (through the **install_cache** if it is set
+        to an :class:`InstallCache`).
+
+        The result must be used as a context manager.
+        """
+        if self.preinstaller is not None:
+            launcher = self.preinstaller.take(build_info)
+            if launcher is not None:
+                _log_running_build(build_info)
+                return launcher
+        if self.install_cache is not None:
+            return self.install_cache.launcher(build_info)
+        return create_launcher(build_info)
+
     @abstractmethod
     def evaluate(self, build_info, allow_back=False):
         """
@@ -117,21 +219,22 @@ class ManualTestRunner(TestRunner):
         return verdict[0]
 
     def evaluate(self, build_info, allow_back=False):
-        with create_launcher(build_info) as launcher:
+        with self._create_launcher(build_info) as launcher:
             launcher.start(**self.launcher_kwargs)
             build_info.update_from_app_info(launcher.get_app_info())
-            verdict = self.get_verdict(build_info, allow_back)
+            with span("test_runner.verdict", "test"):
+                verdict = self.get_verdict(build_info, allow_back)
             try:
                 launcher.stop()
             except LauncherError:
                 # we got an error on process termination, but user
                 # already gave the verdict, so pass this "silently"
                 # (it would be logged from the launcher anyway)
-                launcher._running = False
+                pass
         return verdict
 
     def run_once(self, build_info):
-        with create_launcher(build_info) as launcher:
+        with self._create_launcher(build_info) as launcher:
             launcher.start(**self.launcher_kwargs)
             build_info.update_from_app_info(launcher.get_app_info())
             return launcher.wait()
@@ -183,14 +286,31 @@ class CommandTestRunner(TestRunner):
     2. as placeholders in the command line. variables names must be enclosed
        with curly brackets. Example:
        `mozmill -app firefox -b {binary} -t path/to/test.js`
+
+    The command may be given a **timeout** (in seconds): on timeout, the
+    command and all the processes it started are killed, and the build
+    verdict is **timeout_verdict** ('s', 'b' or 'r'). When **log_dir** is
+    given, the command output is written in a log file per build in this
+    directory instead of the terminal.
     """
 
-    def __init__(self, command):
+    def __init__(self, command, timeout=None, timeout_verdict="s", log_dir=None):
         TestRunner.__init__(self)
         self.command = command
+        self.timeout = timeout
+        self.timeout_verdict = timeout_verdict
+        self.log_dir = log_dir
+
+    def _log_file(self, build_info):
+        if self.log_dir is None:
+            return None
+        os.makedirs(self.log_dir, exist_ok=True)
+        log_file = os.path.join(self.log_dir, build_info.persist_filename + ".log")
+        LOG.info("Writing the test command output to %s" % log_file)
+        return log_file
 
     def evaluate(self, build_info, allow_back=False):
-        with create_launcher(build_info) as launcher:
+        with self._create_launcher(build_info) as launcher:
             build_info.update_from_app_info(launcher.get_app_info())
             variables = {k: v for k, v in build_info.to_dict().items()}
             if hasattr(launcher, "binary"):
@@ -213,7 +333,14 @@ class CommandTestRunner(TestRunner):
                 cmdlist = shlex.split(command)
 
             try:
-                retcode = subprocess.call(cmdlist, env=env)
+                with span("test_runner.command", "test", command=command) as sp:
+                    result = run_command(
+                        cmdlist,
+                        env=env,
+                        timeout=self.timeout,
+                        log_file=self._log_file(build_info),
+                    )
+                    sp.set(cpu_time=result.cpu_time, max_rss=result.max_rss)
             except IndexError:
                 _raise_command_error("Empty command")
             except OSError as exc:
@@ -222,6 +349,14 @@ class CommandTestRunner(TestRunner):
                     " (%s not found or not executable)"
                     % (command if sys.platform == "win32" else cmdlist[0]),
                 )
+        LOG.info("Test command resource usage: %s" % result.format_usage())
+        if result.timed_out:
+            LOG.info(
+                "Test command timed out (build is %s)"
+                % {"s": "skipped", "b": "bad", "r": "retried"}[self.timeout_verdict]
+            )
+            return self.timeout_verdict
+        retcode = result.returncode
         LOG.info(
             "Test command result: %d (build is %s)" % (retcode, "good" if retcode == 0 else "bad")
         )
@@ -229,3 +364,154 @@ class CommandTestRunner(TestRunner):
 
     def run_once(self, build_info):
         return 0 if self.evaluate(build_info) == "g" else 1
+
+
+# environment of the headless runs: no window, and no crash reporter dialog
+# (minidumps are still written in the profile).
+HEADLESS_ENV = {
+    "MOZ_HEADLESS": "1",
+    "MOZ_CRASHREPORTER": "1",
+    "MOZ_CRASHREPORTER_NO_REPORT": "1",
+    "MOZ_CRASHREPORTER_SHUTDOWN": "1",
+}
+
+# preferences of the headless runs: let the tested page write on stdout
+# with dump() or console.log().
+HEADLESS_PREFERENCES = {
+    "browser.dom.window.dump.enabled": True,
+    "devtools.console.stdout.content": True,
+}
+
+
+def headless_url(url):
+    """
+    Returns the URL to load for *url*, which may also be the path of a
+    local file.
+    """
+    if os.path.exists(url):
+        return pathlib.Path(url).resolve().as_uri()
+    return url
+
+
+class HeadlessRun(object):
+    """
+    Watch the output of a headless run for the good and bad patterns.
+    """
+
+    def __init__(self, good_pattern=None, bad_pattern=None):
+        self.good_pattern = re.compile(good_pattern) if good_pattern else None
+        self.bad_pattern = re.compile(bad_pattern) if bad_pattern else None
+        self.verdict = None
+        self.matched = threading.Event()
+
+    def feed(self, line):
+        if self.verdict is not None:
+            return
+        if self.bad_pattern and self.bad_pattern.search(line):
+            self.verdict = "b"
+        elif self.good_pattern and self.good_pattern.search(line):
+            self.verdict = "g"
+        else:
+            return
+        LOG.info("Output line matched the %s pattern: %s" % (self.verdict, line.strip()))
+        self.matched.set()
+
+    def wait(self, runner, timeout, poll_interval=0.05):
+        """
+        Wait until a pattern matched, the process exited or *timeout*
+        seconds elapsed. Returns the exit code of the process, or None if
+        it is still running.
+        """
+        deadline = time.monotonic() + timeout
+        while not self.matched.wait(poll_interval):
+            if runner.returncode is not None:
+                # wait for the remaining output to be read
+                return runner.wait()
+            if time.monotonic() >= deadline:
+                LOG.warning("The application did not finish within %s seconds" % timeout)
+                break
+        return runner.returncode
+
+
+def find_minidumps(profile_dir):
+    path = os.path.join(profile_dir, "minidumps")
+    try:
+        return sorted(f for f in os.listdir(path) if f.endswith(".dmp"))
+    except OSError:
+        return []
+
+
+class HeadlessTestRunner(TestRunner):
+    """
+    A TestRunner subclass that evaluate desktop builds by loading an url
+    headlessly, without any external command.
+
+    The application is started with MOZ_HEADLESS set, and stopped as soon
+    as its output matches **good_pattern** or **bad_pattern**, when it
+    exits by itself or after **timeout** seconds. The build is then:
+     - bad if the application crashed (killed by a signal, or a minidump
+       was written in the profile), or if its output matched the bad
+       pattern;
+     - good if its output matched the good pattern;
+     - bad if it exited with a non-zero code, or if a good pattern was
+       given and never matched;
+     - good otherwise.
+
+    Builds are installed by the preinstaller when it is set, and the
+    profile is cloned from a template prepared once (see
+    :mod:`mozregression.profile_cache`), so that each evaluation only
+    costs the application run.
+    """
+
+    def __init__(self, url, launcher_kwargs=None, timeout=60, good_pattern=None, bad_pattern=None):
+        TestRunner.__init__(self)
+        self.url = headless_url(url)
+        self.launcher_kwargs = launcher_kwargs or {}
+        self.timeout = timeout
+        self.good_pattern = good_pattern
+        self.bad_pattern = bad_pattern
+
+    def _get_verdict(self, run, returncode, minidumps):
+        if minidumps:
+            LOG.info("The application crashed (minidumps: %s)" % ", ".join(minidumps))
+            return "b"
+        if returncode is not None and returncode < 0:
+            LOG.info("The application was killed by signal %d" % -returncode)
+            return "b"
+        if run.verdict is not None:
+            return run.verdict
+        if returncode:
+            LOG.info("The application exited with code %d" % returncode)
+            return "b"
+        if run.good_pattern is not None:
+            LOG.info("The output never matched the good pattern")
+            return "b"
+        return "g"
+
+    def evaluate(self, build_info, allow_back=False):
+        with self._create_launcher(build_info) as launcher:
+            if not isinstance(launcher, MozRunnerLauncher):
+                raise TestCommandError(
+                    "Headless evaluation is not supported for %s" % build_info.app_name
+                )
+            run = HeadlessRun(self.good_pattern, self.bad_pattern)
+            kwargs = dict(self.launcher_kwargs)
+            kwargs["cmdargs"] = list(kwargs.get("cmdargs", ())) + [self.url]
+            launcher.start(env=HEADLESS_ENV, output=[run.feed], **kwargs)
+            build_info.update_from_app_info(launcher.get_app_info())
+            LOG.info("Loading %s headlessly" % self.url)
+            with span("test_runner.headless", "test", url=self.url):
+                returncode = run.wait(launcher.runner, self.timeout)
+            # stopping the application releases its profile
+            minidumps = find_minidumps(launcher.runner.profile.profile)
+            verdict = self._get_verdict(run, returncode, minidumps)
+            try:
+                launcher.stop()
+            except LauncherError:
+                # already logged, and the verdict is known
+                pass
+        LOG.info("Headless evaluation: build is %s" % ("good" if verdict == "g" else "bad"))
+        return verdict
+
+    def run_once(self, build_info):
+        return 0 if self.evaluate(build_info) == "g" else 1
@@ -0,0 +1,230 @@
+"""
+Lightweight timing instrumentation of a bisection.
+
+Code paths that may take time are wrapped in spans::
+
+  from mozregression.tracing import span
+
+  with span("download", url=url) as sp:
+      ...
+      sp.set(size=size)
+
+Tracing is disabled by default, in which case :func:`span` returns a shared
+no-op object. Once enabled (see :meth:`Tracer.enable`), the spans are
+recorded and can be exported as Chrome trace-event JSON (loadable in
+chrome://tracing or https://ui.perfetto.dev) or summarized in a table.
+"""
+
+from __future__ import absolute_import
+
+import functools
+import json
+import os
+import threading
+import time
+
+from mozlog import get_proxy_logger
+
+LOG = get_proxy_logger("Tracing")
+
+
+class _NoopSpan(object):
+    """
+    The span returned when tracing is disabled.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def start(self):
+        return self
+
+    def finish(self):
+        pass
+
+    def set(self, **args):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span(object):
+    """
+    A timed section of code, recorded by a :class:`Tracer` when finished.
+
+    It can be used as a context manager, or with explicit calls to
+    :meth:`start` and :meth:`finish` when the section spans several
+    callbacks (e.g. in the GUI).
+    """
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.begin = None
+        self.end = None
+        self.thread_id = None
+
+    def start(self):
+        self.thread_id = threading.current_thread().ident
+        self.begin = time.perf_counter()
+        return self
+
+    def finish(self):
+        if self.begin is None or self.end is not None:
+            return
+        self.end = time.perf_counter()
+        self.tracer._record(self)
+
+    def set(self, **args):
+        """
+        Add arguments to the span, e.g. a size or a result.
+        """
+        self.args.update(args)
+
+    @property
+    def duration(self):
+        return self.end - self.begin
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.finish()
+
+
+class Tracer(object):
+    """
+    Collect finished spans.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._spans = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+
+    def reset(self):
+        with self._lock:
+            self._spans = []
+            self._origin = time.perf_counter()
+
+    def span(self, name, category="mozregression", **args):
+        """
+        Returns a new :class:`Span`, or a no-op span if tracing is disabled.
+        """
+        if not self.enabled:
+            return NOOP_SPAN
+        return Span(self, name, category, args)
+
+    def _record(self, span):
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self):
+        with self._lock:
+            return list(self._spans)
+
+    def to_chrome_trace(self):
+        """
+        Returns the recorded spans as a Chrome trace-event JSON object.
+        """
+        pid = os.getpid()
+        events = []
+        for sp in self.spans:
+            events.append(
+                {
+                    "name": sp.name,
+                    "cat": sp.category,
+                    "ph": "X",
+                    "ts": round((sp.begin - self._origin) * 1e6, 3),
+                    "dur": round(sp.duration * 1e6, 3),
+                    "pid": pid,
+                    "tid": sp.thread_id,
+                    "args": {k: _jsonable(v) for k, v in sp.args.items()},
+                }
+            )
+        events.sort(key=lambda e: e["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+        LOG.info("Trace written to %s" % path)
+
+    def summary(self):
+        """
+        Returns a list of (name, count, total, mean, max) tuples, durations
+        being in seconds, sorted by decreasing total time.
+        """
+        stats = {}
+        for sp in self.spans:
+            count, total, max_ = stats.get(sp.name, (0, 0.0, 0.0))
+            stats[sp.name] = (count + 1, total + sp.duration, max(max_, sp.duration))
+        rows = [
+            (name, count, total, total / count, max_)
+            for name, (count, total, max_) in stats.items()
+        ]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    def format_summary(self):
+        """
+        Returns the :meth:`summary` as a text table.
+        """
+        rows = self.summary()
+        width = max([len("span")] + [len(row[0]) for row in rows])
+        lines = ["%-*s %6s %10s %10s %10s" % (width, "span", "count", "total", "mean", "max")]
+        for name, count, total, mean, max_ in rows:
+            lines.append("%-*s %6d %9.3fs %9.3fs %9.3fs" % (width, name, count, total, mean, max_))
+        return "\n".join(lines)
+
+
+def _jsonable(value):
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    return str(value)
+
+
+TRACER = Tracer()
+
+
+def span(name, category="mozregression", **args):
+    """
+    Shortcut for :meth:`Tracer.span` on the global tracer.
+    """
+    return TRACER.span(name, category, **args)
+
+
+def traced(name, category="mozregression", describe=None):
+    """
+    Decorator that records each call of the decorated function in a span.
+
+    :param describe: if given, a callable taking the arguments of the
+                     decorated function and returning a dict of span
+                     arguments.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            span_args = describe(*args, **kwargs) if describe else {}
+            with TRACER.span(name, category, **span_args):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
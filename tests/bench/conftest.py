@@ -0,0 +1,27 @@
+import pytest
+
+from mozregression import config
+from mozregression.missing_builds import MISSING_BUILDS
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """
+    Do not use the persistent caches (or the telemetry spool) of the user
+    in benchmarks.
+    """
+    path = str(tmp_path / "cache")
+    monkeypatch.setattr(config, "CACHE_DIR", path)
+    monkeypatch.setattr(config, "TELEMETRY_SPOOL_DIR", str(tmp_path / "telemetry-spool"))
+    monkeypatch.setattr(config, "GLEAN_DATA_DIR", str(tmp_path / "glean-data"))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def missing_builds(cache_dir):
+    """
+    Do not share the builds known to be missing between tests.
+    """
+    MISSING_BUILDS.clear()
+    yield MISSING_BUILDS
+    MISSING_BUILDS.clear()
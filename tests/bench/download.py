@@ -0,0 +1,104 @@
+"""
+Download throughput benchmark.
+
+This downloads a synthetic build from a local HTTP server (see
+:class:`tests.bench.simulator.BuildServer`) with
+:class:`mozregression.download_manager.Download`, using the default large
+chunks and the former 16 KiB chunks, and reports the throughput of each
+one. Example::
+
+  python -m tests.bench.download --size 512 --repeat 5
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import requests
+
+from mozregression.download_manager import CHUNK_SIZE, Download
+from tests.bench.simulator import BuildServer, Scenario
+
+# name: chunk size
+MODES = {
+    "chunk-16k": 16 * 1024,
+    "chunk-1m": CHUNK_SIZE,
+}
+
+
+class Measure(object):
+    def __init__(self, mode, size, elapsed):
+        self.mode = mode
+        self.size = size
+        self.elapsed = elapsed
+
+    @property
+    def throughput(self):
+        return self.size / self.elapsed / (1024 * 1024)  # MB/s
+
+
+def measure(mode, url, size, destdir, session):
+    """
+    Download *url* (of *size* bytes) in *destdir* with the given *mode*
+    (see :data:`MODES`), and returns a :class:`Measure`.
+    """
+    dest = os.path.join(destdir, mode)
+    dl = Download(url, dest, chunk_size=MODES[mode], session=session)
+    start = time.perf_counter()
+    dl.start()
+    dl.wait()
+    elapsed = time.perf_counter() - start
+    assert os.path.getsize(dest) == size
+    os.remove(dest)
+    return Measure(mode, size, elapsed)
+
+
+def run(modes, size, repeat=1):
+    """
+    Returns the best :class:`Measure` of each mode.
+    """
+    destdir = tempfile.mkdtemp()
+    session = requests.Session()
+    try:
+        with BuildServer(Scenario(build_size=size)) as server:
+            url = server.url + "/build"
+            return [
+                min(
+                    (measure(mode, url, size, destdir, session) for _ in range(repeat)),
+                    key=lambda m: m.elapsed,
+                )
+                for mode in modes
+            ]
+    finally:
+        session.close()
+        shutil.rmtree(destdir)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "modes", nargs="*", help="download modes to compare, among %s" % ", ".join(MODES)
+    )
+    parser.add_argument("--size", type=int, default=256, help="size of the build (MB)")
+    parser.add_argument("--repeat", type=int, default=3, help="the best time is kept")
+    options = parser.parse_args(argv)
+    for mode in options.modes:
+        if mode not in MODES:
+            parser.error("unknown mode %r" % mode)
+    return options
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    for result in run(options.modes or sorted(MODES), options.size * 1024 * 1024, options.repeat):
+        print("%-18s %8.1f MB/s  (%.2f s)" % (result.mode, result.throughput, result.elapsed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+Import time benchmark of the mozregression command line.
+
+mach imports :mod:`mozregression.mach_interface` and calls its ``parser()``
+function on every ``./mach`` invocation, so this has to stay cheap. This
+runs the startup statements in fresh interpreters with
+``python -X importtime``, reports the slowest imports and fails if the
+startup takes more than a budget, or if a module that is only needed to
+actually run a bisection (see :data:`HEAVY_MODULES`) was imported. Example::
+
+  python -m tests.bench.importtime --budget 300 --repeat 5
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import json
+import subprocess
+import sys
+
+STATEMENTS = {
+    "mach": "import mozregression.mach_interface as m; m.parser()",
+    "main": "import mozregression.main",
+}
+
+# these must only be imported when they are used
+HEAVY_MODULES = (
+    "bs4",
+    "colorama",
+    "glean",
+    "mozdevice",
+    "mozinstall",
+    "mozprofile",
+    "mozrunner",
+    "mozversion",
+    "redo",
+    "requests",
+    "taskcluster",
+)
+
+DEFAULT_BUDGET = 300  # ms
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def parse_importtime(output):
+    """
+    Parse the output of ``python -X importtime``, and returns a list of
+    (module, self time, cumulative time) tuples, times in ms.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except (IndexError, ValueError):
+            continue  # the header line
+        imports.append((fields[2].strip(), self_us / 1000.0, cumulative_us / 1000.0))
+    return imports
+
+
+class Measure(object):
+    def __init__(self, name, elapsed, modules, imports):
+        self.name = name
+        self.elapsed = elapsed  # ms
+        self.modules = modules
+        self.imports = imports
+
+    @property
+    def heavy_modules(self):
+        return [mod for mod in HEAVY_MODULES if mod in self.modules]
+
+    def slowest(self, count):
+        return sorted(self.imports, key=lambda imp: imp[1], reverse=True)[:count]
+
+
+def measure(name):
+    """
+    Run the startup statement *name* (see :data:`STATEMENTS`) in a new
+    interpreter and returns a :class:`Measure`.
+    """
+    script = _SCRIPT.format(statement=STATEMENTS[name])
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        universal_newlines=True,
+        check=True,
+    )
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    return Measure(
+        name, result["elapsed"] * 1000.0, result["modules"], parse_importtime(proc.stderr)
+    )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "statements", nargs="*", help="statements to measure, among %s" % ", ".join(STATEMENTS)
+    )
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="startup budget (ms)")
+    parser.add_argument("--repeat", type=int, default=3, help="the best time is kept")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest imports shown")
+    options = parser.parse_args(argv)
+    for name in options.statements:
+        if name not in STATEMENTS:
+            parser.error("unknown statement %r" % name)
+    return options
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    failed = False
+    for name in options.statements or sorted(STATEMENTS):
+        best = min((measure(name) for _ in range(options.repeat)), key=lambda m: m.elapsed)
+        print("%s: %.1f ms (budget: %.0f ms)" % (name, best.elapsed, options.budget))
+        print("  %8s     %8s     %s" % ("self", "cumul.", "slowest imports"))
+        for module, self_ms, cumulative_ms in best.slowest(options.top):
+            print("  %8.1f ms  %8.1f ms  %s" % (self_ms, cumulative_ms, module))
+        if best.elapsed > options.budget:
+            print("  over budget!")
+            failed = True
+        if best.heavy_modules:
+            print("  heavy modules imported: %s" % ", ".join(best.heavy_modules))
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
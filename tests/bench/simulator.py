@@ -0,0 +1,444 @@
+"""
+Offline bisection simulator.
+
+This drives the real :class:`mozregression.bisector.Bisector` (and so the
+real Bisection, BuildRange and BuildDownloadManager code) against a
+synthetic range of builds:
+
+ - build infos are given by in-process fake fetchers, that answer after a
+   configurable latency and may report some builds as missing;
+ - builds are downloaded from a local HTTP server, with a configurable
+   time to first byte and bandwidth;
+ - verdicts are given by an oracle that knows where the regression is.
+
+It reports the number of steps, the bytes served, the prefetched builds
+that were never tested and the wall time, so scheduling changes can be
+compared without the network. Example::
+
+  python -m tests.bench.simulator --size 200 --missing-rate 0.1 \\
+      --latency-profile broadband --repeat 3
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import contextlib
+import datetime
+import hashlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from mozregression import config
+from mozregression.bisector import Bisection, Bisector, IntegrationHandler, NightlyHandler
+from mozregression.build_info import IntegrationBuildInfo, NightlyBuildInfo
+from mozregression.build_range import BuildRange, FutureBuildInfo
+from mozregression.download_manager import BuildDownloadManager
+from mozregression.errors import BuildInfoNotFound
+from mozregression.fetch_configs import create_config
+from mozregression.missing_builds import MISSING_BUILDS
+from mozregression.test_runner import TestRunner
+from mozregression.tracing import TRACER
+
+REPO_URL = "https://hg.mozilla.org/mozilla-central"
+
+# name: (build info latency in s, time to first byte in s, bandwidth in B/s)
+LATENCY_PROFILES = {
+    "none": (0.0, 0.0, None),
+    "lan": (0.005, 0.002, 100 * 1024 * 1024),
+    "broadband": (0.1, 0.05, 10 * 1024 * 1024),
+    "slow": (0.3, 0.15, 1024 * 1024),
+}
+
+
+class Scenario(object):
+    """
+    Parameters of a simulated bisection.
+
+    :param build_type: 'nightly' or 'integration'.
+    :param size: number of builds in the initial range.
+    :param regression: index of the first bad build; defaults to a random
+                       index.
+    :param missing_rate: probability for a build (other than the first and
+                         last) to have no build info.
+    :param latency_profile: one of :data:`LATENCY_PROFILES`; the
+                            info_latency, ttfb and bandwidth parameters
+                            override its values when given.
+    :param jitter: the latencies are randomly scaled by a factor between
+                   1 - jitter and 1 + jitter.
+    :param build_size: size in bytes of each build file.
+    :param eval_time: time spent to evaluate each build.
+    :param background_dl: download the next builds in background.
+    :param background_dl_policy: 'cancel' or 'keep'.
+    :param seed: seed of the random generator.
+    """
+
+    def __init__(
+        self,
+        build_type="nightly",
+        size=100,
+        regression=None,
+        missing_rate=0.0,
+        latency_profile="none",
+        info_latency=None,
+        ttfb=None,
+        bandwidth=None,
+        jitter=0.0,
+        build_size=256 * 1024,
+        eval_time=0.0,
+        background_dl=True,
+        background_dl_policy="cancel",
+        seed=0,
+    ):
+        assert build_type in ("nightly", "integration")
+        assert size >= 3
+        profile = LATENCY_PROFILES[latency_profile]
+        self.build_type = build_type
+        self.size = size
+        self.rng = random.Random(seed)
+        if regression is None:
+            regression = self.rng.randint(1, size - 1)
+        assert 0 < regression < size
+        self.regression = regression
+        self.missing = set(
+            i
+            for i in range(1, size - 1)
+            if i != regression and i != regression - 1 and self.rng.random() < missing_rate
+        )
+        self.info_latency = profile[0] if info_latency is None else info_latency
+        self.ttfb = profile[1] if ttfb is None else ttfb
+        self.bandwidth = profile[2] if bandwidth is None else bandwidth
+        self.jitter = jitter
+        self.build_size = build_size
+        self.eval_time = eval_time
+        self.background_dl = background_dl
+        self.background_dl_policy = background_dl_policy
+        self._rng_lock = threading.Lock()
+
+    def sleep(self, delay):
+        if delay <= 0:
+            return
+        if self.jitter:
+            with self._rng_lock:
+                delay *= self.rng.uniform(1 - self.jitter, 1 + self.jitter)
+        time.sleep(delay)
+
+    def data(self, index):
+        """
+        Returns the date or changeset of the build at *index*.
+        """
+        if self.build_type == "nightly":
+            return datetime.date(2020, 1, 1) + datetime.timedelta(days=index)
+        return hashlib.sha1(str(index).encode()).hexdigest()
+
+
+class BuildServer(object):
+    """
+    A local HTTP server serving synthetic build files.
+    """
+
+    def __init__(self, scenario):
+        self.scenario = scenario
+        self.bytes_sent = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._serve(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever)
+        self.thread.daemon = True
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:%d" % self.httpd.server_address[1]
+
+    def _serve(self, handler):
+        scenario = self.scenario
+        with self._lock:
+            self.requests += 1
+        scenario.sleep(scenario.ttfb)
+        handler.send_response(200)
+        handler.send_header("Content-Length", str(scenario.build_size))
+        handler.end_headers()
+        chunk = b"\0" * 64 * 1024
+        remaining = scenario.build_size
+        try:
+            while remaining > 0:
+                data = chunk[:remaining]
+                handler.wfile.write(data)
+                with self._lock:
+                    self.bytes_sent += len(data)
+                remaining -= len(data)
+                if scenario.bandwidth:
+                    time.sleep(len(data) / float(scenario.bandwidth))
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # download canceled
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeInfoFetcher(object):
+    """
+    Stands for a Nightly or Integration InfoFetcher.
+    """
+
+    def __init__(self, fetch_config, scenario, base_url):
+        self.fetch_config = fetch_config
+        self.scenario = scenario
+        self.base_url = base_url
+        self.indexes = {scenario.data(i): i for i in range(scenario.size)}
+        self.lookups = 0
+        self._lock = threading.Lock()
+
+    def find_build_info(self, data, **kwargs):
+        with self._lock:
+            self.lookups += 1
+        self.scenario.sleep(self.scenario.info_latency)
+        index = self.indexes[data]
+        if index in self.scenario.missing:
+            raise BuildInfoNotFound("build %d is missing" % index)
+        build_url = "%s/builds/%d/firefox-%d.tar.bz2" % (self.base_url, index, index)
+        if self.scenario.build_type == "nightly":
+            changeset = hashlib.sha1(str(index).encode()).hexdigest()
+            return NightlyBuildInfo(self.fetch_config, build_url, data, changeset, REPO_URL)
+        return IntegrationBuildInfo(
+            self.fetch_config,
+            build_url,
+            datetime.datetime(2020, 1, 1) + datetime.timedelta(hours=index),
+            data,
+            REPO_URL,
+        )
+
+
+class OracleTestRunner(TestRunner):
+    """
+    Give the verdicts of a scenario: builds before the regression are good,
+    the others are bad.
+    """
+
+    def __init__(self, scenario, fetcher):
+        TestRunner.__init__(self)
+        self.scenario = scenario
+        self.fetcher = fetcher
+        self.evaluated = []
+
+    def index_of(self, build_info):
+        if build_info.build_type == "nightly":
+            return self.fetcher.indexes[build_info.build_date]
+        return self.fetcher.indexes[build_info.changeset]
+
+    def evaluate(self, build_info, allow_back=False):
+        assert os.path.isfile(build_info.build_file)
+        self.evaluated.append(os.path.basename(build_info.build_file))
+        self.scenario.sleep(self.scenario.eval_time)
+        return "g" if self.index_of(build_info) < self.scenario.regression else "b"
+
+    def run_once(self, build_info):
+        return 0
+
+
+class Result(object):
+    FIELDS = (
+        "steps",
+        "info_lookups",
+        "downloads",
+        "bytes_downloaded",
+        "wasted_prefetches",
+        "wall_time",
+        "found",
+    )
+
+    def __init__(self, **kwargs):
+        for field in self.FIELDS:
+            setattr(self, field, kwargs[field])
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+
+class SimDownloadManager(BuildDownloadManager):
+    def __init__(self, *args, **kwargs):
+        BuildDownloadManager.__init__(self, *args, **kwargs)
+        self.started = 0
+
+    def _download_started(self, dl):
+        self.started += 1
+        BuildDownloadManager._download_started(self, dl)
+
+
+def simulate(scenario, quiet=True):
+    """
+    Run a bisection for the given :class:`Scenario`, and returns a
+    :class:`Result`.
+    """
+    fetch_config = create_config("firefox", "linux", 64, "x86_64")
+    destdir = tempfile.mkdtemp(prefix="mozregression-sim-")
+    session = requests.Session()
+    # the persistent caches of the user (e.g. the missing builds) must not
+    # change the results
+    cache_dir, config.CACHE_DIR = config.CACHE_DIR, os.path.join(destdir, "cache")
+    MISSING_BUILDS.clear()
+    try:
+        with BuildServer(scenario) as server:
+            fetcher = FakeInfoFetcher(fetch_config, scenario, server.url)
+            build_range = BuildRange(
+                fetcher,
+                [FutureBuildInfo(fetcher, scenario.data(i)) for i in range(scenario.size)],
+            )
+            download_manager = SimDownloadManager(
+                destdir, session=session, background_dl_policy=scenario.background_dl_policy
+            )
+            test_runner = OracleTestRunner(scenario, fetcher)
+            bisector = Bisector(
+                fetch_config,
+                test_runner,
+                download_manager,
+                dl_in_background=scenario.background_dl,
+            )
+            if scenario.build_type == "nightly":
+                handler = NightlyHandler()
+            else:
+                handler = IntegrationHandler()
+
+            output = io.StringIO() if quiet else sys.stdout
+            start = time.time()
+            with contextlib.redirect_stdout(output):
+                result = bisector._bisect(handler, build_range)
+            wall_time = time.time() - start
+            download_manager.cancel()
+            download_manager.wait(raise_if_error=False)
+
+            found = False
+            if result == Bisection.FINISHED:
+                good, bad = handler.build_range[0], handler.build_range[-1]
+                found = (
+                    test_runner.index_of(bad) == scenario.regression
+                    and test_runner.index_of(good) == scenario.regression - 1
+                )
+            evaluated = set(test_runner.evaluated)
+            return Result(
+                steps=len(test_runner.evaluated),
+                info_lookups=fetcher.lookups,
+                downloads=download_manager.started,
+                bytes_downloaded=server.bytes_sent,
+                wasted_prefetches=len(download_manager._downloads_bg - evaluated),
+                wall_time=wall_time,
+                found=found,
+            )
+    finally:
+        MISSING_BUILDS.clear()
+        config.CACHE_DIR = cache_dir
+        session.close()
+        shutil.rmtree(destdir, ignore_errors=True)
+
+
+def format_results(results):
+    lines = [
+        "%-4s %6s %8s %10s %14s %8s %10s %6s"
+        % ("run", "steps", "lookups", "downloads", "bytes", "wasted", "time", "found")
+    ]
+    for i, res in enumerate(results):
+        lines.append(
+            "%-4d %6d %8d %10d %14d %8d %9.3fs %6s"
+            % (
+                i,
+                res.steps,
+                res.info_lookups,
+                res.downloads,
+                res.bytes_downloaded,
+                res.wasted_prefetches,
+                res.wall_time,
+                res.found,
+            )
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--build-type", choices=("nightly", "integration"), default="nightly")
+    parser.add_argument("--size", type=int, default=100, help="number of builds in the range")
+    parser.add_argument("--regression", type=int, help="index of the first bad build")
+    parser.add_argument("--missing-rate", type=float, default=0.0)
+    parser.add_argument("--latency-profile", choices=sorted(LATENCY_PROFILES), default="none")
+    parser.add_argument("--info-latency", type=float, help="build info lookup latency (s)")
+    parser.add_argument("--ttfb", type=float, help="build download time to first byte (s)")
+    parser.add_argument("--bandwidth", type=int, help="download bandwidth (bytes/s)")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--build-size", type=int, default=256 * 1024)
+    parser.add_argument("--eval-time", type=float, default=0.0, help="time to give a verdict (s)")
+    parser.add_argument("--no-background-dl", action="store_true")
+    parser.add_argument("--background-dl-policy", choices=("cancel", "keep"), default="cancel")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="number of runs (seed is incremented)"
+    )
+    parser.add_argument("--json", action="store_true", help="print results as JSON lines")
+    parser.add_argument("--trace-out", help="write a Chrome trace of the runs")
+    parser.add_argument("--verbose", action="store_true", help="show the bisection output")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    if options.trace_out:
+        TRACER.enable()
+    if options.verbose:
+        from mozregression.log import init_logger
+
+        init_logger(debug=False)
+    results = []
+    for i in range(options.repeat):
+        scenario = Scenario(
+            build_type=options.build_type,
+            size=options.size,
+            regression=options.regression,
+            missing_rate=options.missing_rate,
+            latency_profile=options.latency_profile,
+            info_latency=options.info_latency,
+            ttfb=options.ttfb,
+            bandwidth=options.bandwidth,
+            jitter=options.jitter,
+            build_size=options.build_size,
+            eval_time=options.eval_time,
+            background_dl=not options.no_background_dl,
+            background_dl_policy=options.background_dl_policy,
+            seed=options.seed + i,
+        )
+        result = simulate(scenario, quiet=not options.verbose)
+        results.append(result)
+        if options.json:
+            print(json.dumps(result.to_dict()))
+    if not options.json:
+        print(format_results(results))
+    if options.trace_out:
+        TRACER.write_chrome_trace(options.trace_out)
+        print(TRACER.format_summary())
+    return 0 if all(res.found for res in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+from __future__ import absolute_import
+
+from tests.bench import download
+
+
+def test_download_modes():
+    results = download.run(sorted(download.MODES), 3 * 1024 * 1024 + 5)
+    assert [r.mode for r in results] == sorted(download.MODES)
+    for result in results:
+        assert result.throughput > 0
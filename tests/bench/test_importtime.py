@@ -0,0 +1,32 @@
+from __future__ import absolute_import
+
+import pytest
+
+from tests.bench import importtime
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2163 |      49763 | site
+import time:       332 |      50296 |     mozinfo
+"""
+
+
+def test_parse_importtime():
+    assert importtime.parse_importtime(OUTPUT) == [
+        ("_io", 0.12, 0.12),
+        ("site", 2.163, 49.763),
+        ("mozinfo", 0.332, 50.296),
+    ]
+
+
+@pytest.mark.parametrize("name", sorted(importtime.STATEMENTS))
+def test_startup_does_not_import_heavy_modules(name):
+    result = importtime.measure(name)
+    assert "mozregression.cli" in result.modules
+    assert result.heavy_modules == []
+
+
+def test_measure_heavy_modules():
+    result = importtime.Measure("test", 1.0, ["os", "requests", "requests.adapters"], [])
+    assert result.heavy_modules == ["requests"]
@@ -0,0 +1,53 @@
+from __future__ import absolute_import
+
+import pytest
+
+from mozregression.fetch_configs import create_config
+from mozregression.missing_builds import MISSING_BUILDS
+from tests.bench import simulator
+
+
+@pytest.mark.parametrize("build_type", ["nightly", "integration"])
+@pytest.mark.parametrize("background_dl", [True, False])
+def test_simulate_finds_regression(build_type, background_dl):
+    scenario = simulator.Scenario(
+        build_type=build_type,
+        size=40,
+        regression=27,
+        missing_rate=0.2,
+        build_size=1024,
+        background_dl=background_dl,
+    )
+    result = simulator.simulate(scenario)
+    assert result.found
+    assert 0 < result.steps <= 8
+    assert result.bytes_downloaded >= result.steps * 1024
+    if not background_dl:
+        assert result.wasted_prefetches == 0
+        assert result.downloads == result.steps
+
+
+def test_simulate_ignores_the_caches_of_the_user():
+    scenario = simulator.Scenario(size=40, regression=29, missing_rate=0.0, build_size=1024)
+    fetch_config = create_config("firefox", "linux", 64, "x86_64")
+    MISSING_BUILDS.add(fetch_config, scenario.data(28), "build 28 is missing")
+
+    assert simulator.simulate(scenario).found
+    # and the caches are left untouched
+    assert MISSING_BUILDS.reason(fetch_config, scenario.data(28)) == "build 28 is missing"
+
+
+def test_scenario_missing_builds_are_reproducible():
+    scenario1 = simulator.Scenario(size=50, missing_rate=0.3, seed=4)
+    scenario2 = simulator.Scenario(size=50, missing_rate=0.3, seed=4)
+    assert scenario1.missing == scenario2.missing
+    assert scenario1.regression == scenario2.regression
+    assert scenario1.regression not in scenario1.missing
+    assert 0 not in scenario1.missing and 49 not in scenario1.missing
+
+
+def test_main(capsys):
+    assert simulator.main(["--size", "10", "--build-size", "100", "--repeat", "2"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3
+    assert lines[0].split()[0] == "run"
@@ -1,7 +1,9 @@
 import pytest
 
-from mozregression import build_range
+from mozregression import build_range, config
 from mozregression.fetch_build_info import InfoFetcher
+from mozregression.json_pushes import PUSH_CACHE
+from mozregression.missing_builds import MISSING_BUILDS
 
 
 class RangeCreator(object):
@@ -18,3 +20,36 @@ class RangeCreator(object):
 @pytest.fixture
 def range_creator(mocker):
     return RangeCreator(mocker)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """
+    Do not use the persistent caches (or the telemetry spool) of the user
+    in tests.
+    """
+    path = str(tmp_path / "cache")
+    monkeypatch.setattr(config, "CACHE_DIR", path)
+    monkeypatch.setattr(config, "TELEMETRY_SPOOL_DIR", str(tmp_path / "telemetry-spool"))
+    monkeypatch.setattr(config, "GLEAN_DATA_DIR", str(tmp_path / "glean-data"))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def push_cache():
+    """
+    Do not share the cached pushes between tests.
+    """
+    PUSH_CACHE.clear()
+    yield PUSH_CACHE
+    PUSH_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def missing_builds(cache_dir):
+    """
+    Do not share the builds known to be missing between tests.
+    """
+    MISSING_BUILDS.clear()
+    yield MISSING_BUILDS
+    MISSING_BUILDS.clear()
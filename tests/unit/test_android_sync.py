@@ -0,0 +1,222 @@
+from __future__ import absolute_import
+
+import hashlib
+import os
+import posixpath
+import shlex
+
+import pytest
+from mock import Mock, patch
+from mozdevice import ADBError
+
+from mozregression import android_sync, launchers
+
+
+class FakeADBDevice(object):
+    """
+    A stand-in for mozdevice.ADBDevice, with an in-memory file system and
+    package manager.
+    """
+
+    test_root = "/data/local/tmp/test_root"
+
+    def __init__(self, md5sum=True):
+        self.md5sum = md5sum
+        self.files = {}
+        self.packages = {}
+        self.installs = []
+        self.pushes = []
+        self.cleared = []
+        self._updates = 0
+
+    def _under(self, path):
+        return [f for f in self.files if f.startswith(path.rstrip("/") + "/")]
+
+    def exists(self, path):
+        return path in self.files or self.is_dir(path)
+
+    def is_dir(self, path):
+        return bool(self._under(path))
+
+    def rm(self, path, recursive=False, force=False):
+        for f in [path] + (self._under(path) if recursive else []):
+            self.files.pop(f, None)
+
+    def push(self, local, remote):
+        self.pushes.append(remote)
+        if os.path.isfile(local):
+            with open(local, "rb") as f:
+                self.files[remote] = f.read()
+            return
+        for root, _, files in os.walk(local):
+            for fname in files:
+                relpath = os.path.relpath(os.path.join(root, fname), local)
+                with open(os.path.join(root, fname), "rb") as f:
+                    self.files[posixpath.join(remote, *relpath.split(os.sep))] = f.read()
+
+    def install_app(self, apk):
+        with open(apk, "rb") as f:
+            content = f.read()
+        self._updates += 1
+        self.installs.append(apk)
+        self.packages["org.mozilla.fenix"] = {
+            "content": content,
+            "versionCode": len(content),
+            "lastUpdateTime": "2020-01-01 00:00:%02d" % self._updates,
+        }
+        return "org.mozilla.fenix"
+
+    def uninstall_app(self, name):
+        if self.packages.pop(name, None) is None:
+            raise ADBError("not installed")
+
+    def shell_output(self, cmd):
+        args = shlex.split(cmd)
+        if args[:2] == ["dumpsys", "package"]:
+            package = self.packages.get(args[2])
+            if package is None:
+                return "Unable to find package: %s" % args[2]
+            return (
+                "Packages:\n  versionCode=%(versionCode)d\n  lastUpdateTime=%(lastUpdateTime)s"
+                % (package)
+            )
+        if args[:2] == ["pm", "clear"]:
+            self.cleared.append(args[2])
+            return "Success"
+        if args[0] == "find" and self.md5sum:
+            return "\n".join(
+                "%s  %s" % (hashlib.md5(self.files[f]).hexdigest(), f)
+                for f in sorted(self._under(args[1]))
+            )
+        if args[:2] == ["rm", "-f"]:
+            for path in args[2:]:
+                self.files.pop(path, None)
+            return ""
+        raise ADBError("%s: not found" % args[0])
+
+
+@pytest.fixture
+def adb():
+    return FakeADBDevice()
+
+
+@pytest.fixture
+def apk(tmp_path):
+    def create(content=b"apk"):
+        path = tmp_path / "fenix.apk"
+        path.write_bytes(content)
+        return str(path)
+
+    return create
+
+
+@pytest.fixture
+def profile(tmp_path):
+    path = tmp_path / "profile"
+    path.mkdir()
+    (path / "prefs.js").write_text("prefs")
+    (path / "extensions").mkdir()
+    for i in range(5):
+        (path / "extensions" / ("%d.xpi" % i)).write_text("xpi %d" % i)
+    return str(path)
+
+
+def remote_content(adb, remote):
+    return {posixpath.relpath(f, remote): content for f, content in adb.files.items()}
+
+
+def local_content(path):
+    content = {}
+    for relpath in android_sync.local_checksums(path):
+        with open(os.path.join(path, relpath), "rb") as f:
+            content[relpath] = f.read()
+    return content
+
+
+def test_install_same_apk_is_skipped(adb, apk):
+    assert android_sync.install(adb, apk(), "org.mozilla.fenix") == "org.mozilla.fenix"
+    assert len(adb.installs) == 1
+    assert adb.cleared == []
+
+    assert android_sync.install(adb, apk(), "org.mozilla.fenix") == "org.mozilla.fenix"
+    assert len(adb.installs) == 1
+    # the application data is reset instead
+    assert adb.cleared == ["org.mozilla.fenix"]
+
+
+def test_install_other_apk(adb, apk):
+    android_sync.install(adb, apk(), "org.mozilla.fenix")
+    android_sync.install(adb, apk(b"other apk"), "org.mozilla.fenix")
+    assert len(adb.installs) == 2
+    assert adb.packages["org.mozilla.fenix"]["content"] == b"other apk"
+
+
+def test_install_package_updated_in_the_meantime(adb, apk):
+    android_sync.install(adb, apk(), "org.mozilla.fenix")
+    # e.g. installed by hand with the same content
+    adb.packages["org.mozilla.fenix"]["lastUpdateTime"] = "2021-01-01 00:00:00"
+    android_sync.install(adb, apk(), "org.mozilla.fenix")
+    assert len(adb.installs) == 2
+
+
+def test_installed_version_unknown(adb):
+    assert android_sync.installed_version(adb, "org.mozilla.fenix") is None
+
+
+def test_sync_profile_pushes_changed_files_only(adb, profile, tmp_path):
+    remote = adb.test_root + "/profile"
+    assert android_sync.sync_profile(adb, profile, remote) is None
+    assert remote_content(adb, remote) == local_content(profile)
+
+    # the application writes in the profile
+    adb.files[remote + "/sessionstore.js"] = b"session"
+    adb.files[remote + "/prefs.js"] = b"modified prefs"
+    # and the next profile has a new file
+    (tmp_path / "profile" / "user.js").write_text("user")
+    adb.pushes = []
+
+    assert android_sync.sync_profile(adb, profile, remote) == 2
+    assert sorted(adb.pushes) == [remote + "/prefs.js", remote + "/user.js"]
+    assert remote_content(adb, remote) == local_content(profile)
+
+
+def test_sync_profile_without_md5sum(profile):
+    adb = FakeADBDevice(md5sum=False)
+    remote = adb.test_root + "/profile"
+    android_sync.sync_profile(adb, profile, remote)
+    adb.files[remote + "/sessionstore.js"] = b"session"
+    adb.pushes = []
+
+    assert android_sync.sync_profile(adb, profile, remote) is None
+    assert adb.pushes == [remote]
+    assert remote_content(adb, remote) == local_content(profile)
+
+
+def test_sync_profile_many_changes(adb, profile, tmp_path):
+    remote = adb.test_root + "/profile"
+    android_sync.sync_profile(adb, profile, remote)
+    for i in range(4):
+        (tmp_path / "profile" / "extensions" / ("%d.xpi" % i)).write_text("new")
+    adb.pushes = []
+
+    assert android_sync.sync_profile(adb, profile, remote) is None
+    assert adb.pushes == [remote]
+    assert remote_content(adb, remote) == local_content(profile)
+
+
+@patch("mozregression.launchers.mozversion.get_version")
+@patch("mozregression.launchers.ADBDeviceFactory")
+def test_launcher_reuses_install_and_profile(ADBDeviceFactory, get_version, adb, apk, profile):
+    ADBDeviceFactory.return_value = adb
+    get_version.return_value = {}
+    adb.launch_application = Mock()
+    adb.stop_application = Mock()
+    for _ in range(2):
+        with launchers.FenixLauncher(apk()) as launcher:
+            launcher.start(profile=profile)
+            launcher.stop()
+    assert len(adb.installs) == 1
+    remote = adb.test_root + "/mozregression-org.mozilla.fenix"
+    # the profile was pushed once, then only the preferences that are
+    # written again in each new profile
+    assert adb.pushes == [remote, remote + "/user.js"]
@@ -61,3 +61,71 @@ def test_approx_index(bdata, mid, around, fnames, result):
     approx = approx_persist.ApproxPersistChooser(around)
 
     assert approx.index(brange, binfo, fnames) == result
+
+
+def test_approx_index_with_persist_index():
+    binfo = create_build_info(build_info.IntegrationBuildInfo)
+    brange = create_build_range("0123456789abcd")
+    brange.index = lambda _: 7
+    approx = approx_persist.ApproxPersistChooser(7)
+    index = approx_persist.PersistIndex(build_firefox_names("8") + ["unrelated-file"])
+
+    assert approx.index(brange, binfo, index) == 8
+    index.discard(build_firefox_name("8"))
+    assert approx.index(brange, binfo, index) is None
+
+
+def test_persist_index():
+    index = approx_persist.PersistIndex(["2015-01-11--mozilla-central--firefox.tar.bz2"])
+    index.add("2015-01-11--mozilla-central--firefox.zip")
+    index.add("abc123-debug--autoland--firefox.zip")
+    assert len(index) == 3
+    assert "abc123-debug--autoland--firefox.zip" in index
+    assert sorted(index.files_for("2015-01-11")) == [
+        "2015-01-11--mozilla-central--firefox.tar.bz2",
+        "2015-01-11--mozilla-central--firefox.zip",
+    ]
+    assert index.files_for("abc123") == []
+
+    index.discard("abc123-debug--autoland--firefox.zip")
+    index.discard("not-indexed")
+    assert len(index) == 2
+    assert "abc123-debug--autoland--firefox.zip" not in index
+
+
+def test_persist_index_from_dir(tmpdir):
+    tmpdir.join("2015-01-11--mozilla-central--firefox.zip").write("")
+    index = approx_persist.PersistIndex.from_dir(str(tmpdir))
+    assert index.files_for("2015-01-11") == ["2015-01-11--mozilla-central--firefox.zip"]
+    assert len(approx_persist.PersistIndex.from_dir(str(tmpdir.join("nope")))) == 0
+
+
+def test_persist_index_cache(tmpdir, mocker):
+    from_dir = mocker.spy(approx_persist.PersistIndex, "from_dir")
+    cache = approx_persist.PersistIndexCache()
+    tmpdir.join("2015-01-11--mozilla-central--firefox.zip").write("")
+    # a directory modified just now is listed again
+    assert cache.get(str(tmpdir)).files_for("2015-01-11")
+    assert cache.get(str(tmpdir)) is not cache.get(str(tmpdir))
+
+    tmpdir.setmtime(1000000)
+    index = cache.get(str(tmpdir))
+    assert cache.get(str(tmpdir)) is index
+    from_dir.reset_mock()
+
+    tmpdir.join("2015-01-12--mozilla-central--firefox.zip").write("")
+    tmpdir.setmtime(2000000)
+    index = cache.get(str(tmpdir))
+    assert index.files_for("2015-01-12")
+    assert from_dir.call_count == 1
+    assert len(cache.get(str(tmpdir.join("nope")))) == 0
+
+
+def test_persist_index_cache_is_bounded(tmpdir):
+    cache = approx_persist.PersistIndexCache(maxsize=1)
+    dirs = [tmpdir.mkdir("a"), tmpdir.mkdir("b")]
+    for directory in dirs:
+        directory.setmtime(1000000)
+    index = cache.get(str(dirs[0]))
+    cache.get(str(dirs[1]))
+    assert cache.get(str(dirs[0])) is not index
@@ -3,6 +3,7 @@ from __future__ import absolute_import
 import datetime
 import unittest
 
+import pytest
 from mock import MagicMock, Mock, call, patch
 
 from mozregression import build_range
@@ -12,8 +13,10 @@ from mozregression.bisector import (
     BisectorHandler,
     IntegrationHandler,
     NightlyHandler,
+    call_in_threads,
 )
-from mozregression.errors import LauncherError, MozRegressionError
+from mozregression.errors import EmptyPushlogError, LauncherError, MozRegressionError
+from mozregression.json_pushes import Push
 
 
 class MockBisectorHandler(BisectorHandler):
@@ -439,6 +442,16 @@ class TestBisector(unittest.TestCase):
         # bisection is finished
         self.assertEqual(test_result["result"], Bisection.FINISHED)
 
+    def test__bisect_with_preinstaller(self):
+        self.bisector.dl_in_background = True
+        self.bisector.preinstaller = Mock()
+        test_result = self.do__bisect(MyBuildData([1, 2, 3, 4, 5]), ["g", "b"])
+        # next builds were scheduled for pre-installation
+        self.assertTrue(self.bisector.preinstaller.schedule.called)
+        # and pre-installs out of the range were thrown away at each step
+        self.assertEqual(self.bisector.preinstaller.discard.call_count, 2)
+        self.assertEqual(test_result["result"], Bisection.FINISHED)
+
     @patch("mozregression.bisector.Bisector._bisect")
     def test_bisect(self, _bisect):
         _bisect.return_value = 1
@@ -462,5 +475,111 @@ class TestBisector(unittest.TestCase):
         _bisect.assert_called_with(self.handler, build_range)
 
 
+class MergePushes(object):
+    """
+    Fake json pushes of a merge of autoland into mozilla-central.
+    """
+
+    def __init__(self, desc="Merge autoland to mozilla-central a=merge"):
+        self.calls = []
+        self.desc = desc
+
+    def __call__(self, branch):
+        jp = Mock(branch=branch)
+        jp.push.side_effect = lambda *a, **kw: self.push(branch, *a, **kw)
+        jp.pushes.side_effect = lambda **kw: self.pushes(branch, **kw)
+        return jp
+
+    def push(self, branch, changeset, full=None):
+        self.calls.append(("push", branch, changeset))
+        if branch == "mozilla-central":
+            nodes = [{"node": "c1", "desc": "x"}, {"node": "c2", "desc": "y"}]
+            return Push(100, {"changesets": nodes + [{"node": "merge", "desc": self.desc}]})
+        return Push({"c1": 10, "c2": 12, "merge": 20}[changeset], {"changesets": [changeset]})
+
+    def pushes(self, branch, startID, endID):
+        self.calls.append(("pushes", branch, startID, endID))
+        return [Push(startID, {"changesets": ["good"]}), Push(endID, {"changesets": ["bad"]})]
+
+
+def merge_handler(mocker, find_fix=False, changesets=("a", "b")):
+    handler = IntegrationHandler(find_fix=find_fix)
+    mc_push = mocker.Mock(repo_name="mozilla-central", changeset="merge", short_changeset="merge")
+    handler.build_range = mocker.Mock(
+        future_build_infos=[None, mocker.Mock(data=Push(100, {"changesets": list(changesets)}))]
+    )
+    handler.build_range.__getitem__ = mocker.Mock(return_value=mc_push)
+    return handler
+
+
+@pytest.mark.parametrize("find_fix, expected", [(False, ("good", "bad")), (True, ("bad", "good"))])
+def test_handle_merge(mocker, find_fix, expected):
+    pushes = MergePushes()
+    mocker.patch("mozregression.bisector.JsonPushes", side_effect=pushes)
+    handler = merge_handler(mocker, find_fix=find_fix)
+    assert handler.handle_merge() == ("autoland",) + expected
+    assert ("pushes", "autoland", "8", "12") in pushes.calls
+
+    # the resolution of the merge is cached
+    count = len(pushes.calls)
+    assert handler.handle_merge() == ("autoland",) + expected
+    assert len(pushes.calls) == count
+
+
+def test_handle_merge_nothing_to_bisect(mocker):
+    # a merge of only one changeset
+    pushes = MergePushes()
+    merge = {"node": "merge", "desc": pushes.desc}
+    pushes.push = mocker.Mock(
+        return_value=Push(100, {"changesets": [{"node": "c1", "desc": "x"}, merge]})
+    )
+    mocker.patch("mozregression.bisector.JsonPushes", side_effect=pushes)
+    handler = merge_handler(mocker)
+    assert handler.handle_merge() is None
+    assert handler.handle_merge() is None
+    assert pushes.push.call_count == 1
+
+
+def test_handle_merge_single_changeset_push(mocker):
+    jpushes = mocker.patch("mozregression.bisector.JsonPushes")
+    assert merge_handler(mocker, changesets=["a"]).handle_merge() is None
+    assert not jpushes.called
+
+
+def test_handle_merge_by_elimination(mocker):
+    pushes = MergePushes(desc="no merge here")
+    mocker.patch("mozregression.bisector.JsonPushes", side_effect=pushes)
+    landing = mocker.patch(
+        "mozregression.bisector.IntegrationHandler._choose_integration_branch",
+        return_value="autoland",
+    )
+    assert merge_handler(mocker).handle_merge() == ("autoland", "good", "bad")
+    landing.assert_called_once_with("merge")
+    assert ("pushes", "autoland", "8", "20") in pushes.calls
+
+
+def test_choose_integration_branch(mocker):
+    def create(branch):
+        jp = mocker.Mock()
+        if branch == "mozilla-inbound":
+            jp.push.side_effect = EmptyPushlogError("not found")
+        else:
+            jp.push.return_value = Push(1, {"changesets": ["abc"], "date": 12})
+        return jp
+
+    mocker.patch("mozregression.bisector.JsonPushes", side_effect=create)
+    assert IntegrationHandler()._choose_integration_branch("abc") == "autoland"
+
+
+def test_call_in_threads():
+    assert call_in_threads(lambda: 1, lambda: 2) == [1, 2]
+
+    def fail():
+        raise MozRegressionError("failed")
+
+    with pytest.raises(MozRegressionError):
+        call_in_threads(lambda: 1, fail)
+
+
 if __name__ == "__main__":
     unittest.main()
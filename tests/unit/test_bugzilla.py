@@ -0,0 +1,28 @@
+from __future__ import absolute_import
+
+from mock import Mock
+
+from mozregression import bugzilla
+
+
+def test_find_bugids_in_push(mocker):
+    pushlog = {
+        "1": {
+            "changesets": [
+                {"node": "abc", "desc": "Bug 1234 - fix something"},
+                {"node": "def", "desc": "Merge autoland to mozilla-central"},
+            ],
+            "date": 123456,
+        }
+    }
+    retry_get = mocker.patch("mozregression.json_pushes.retry_get")
+    retry_get.return_value = Mock(json=Mock(return_value=pushlog))
+
+    assert bugzilla.find_bugids_in_push("mozilla-central", "abc") == ["1234"]
+    # the push was cached
+    assert bugzilla.find_bugids_in_push("mozilla-central", "def") == ["1234"]
+    assert retry_get.call_count == 1
+
+
+def test_bug_url():
+    assert bugzilla.bug_url(1234) == "https://bugzilla.mozilla.org/show_bug.cgi?id=1234"
@@ -119,6 +119,9 @@ def test_persist_filename(klass, extra, result):
         # fake that the fetch config should return the persist_part
         binfo._fetch_config.integration_persist_part = lambda: persist_part
     assert binfo.persist_filename == result
+    # the persist key is the first part of the persist filename
+    data = binfo.build_date if klass is build_info.NightlyBuildInfo else binfo.changeset
+    assert binfo.persist_key_for(data) == result.split("--")[0]
 
 
 @pytest.mark.parametrize(
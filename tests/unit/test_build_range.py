@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 
 import pytest
@@ -50,10 +52,10 @@ def test_deleted(range_creator):
     assert build_range2[1] == 2
 
 
-def fetch_unless(br, func):
+def fetch_unless(br, func, permanent=True):
     def fetch(index):
         if func(index):
-            raise BuildInfoNotFound("")
+            raise BuildInfoNotFound("", permanent=permanent)
         return index
 
     br.build_info_fetcher.find_build_info.side_effect = fetch
@@ -71,6 +73,34 @@ def test_mid_point(range_creator):
     assert build_range[:2].mid_point() == 0
 
 
+def test_missing_builds_are_remembered(range_creator, missing_builds):
+    dates = [date(2019, 10, 1) + timedelta(days=i) for i in range(10)]
+    build_range = range_creator.create(dates)
+    build_range.build_info_fetcher.fetch_config = create_config("firefox", "linux", 64, "x86_64")
+    fetch_unless(build_range, lambda d: d in (dates[4], dates[5], dates[6]))
+    assert build_range.mid_point() == 3
+    assert missing_builds.reason(build_range.build_info_fetcher.fetch_config, dates[5]) == ""
+
+    # a new range does not probe the known missing builds again
+    build_range = range_creator.create(dates)
+    build_range.build_info_fetcher.fetch_config = create_config("firefox", "linux", 64, "x86_64")
+    build_range.build_info_fetcher.find_build_info.side_effect = lambda d: d
+    assert build_range.mid_point() == 3
+    assert len(build_range) == 7
+    assert dates[5] not in [
+        c[0][0] for c in build_range.build_info_fetcher.find_build_info.call_args_list
+    ]
+
+
+def test_temporary_errors_are_not_remembered(range_creator, missing_builds):
+    dates = [date(2019, 10, 1) + timedelta(days=i) for i in range(10)]
+    build_range = range_creator.create(dates)
+    build_range.build_info_fetcher.fetch_config = create_config("firefox", "linux", 64, "x86_64")
+    fetch_unless(build_range, lambda d: d == dates[5], permanent=False)
+    assert build_range.mid_point() == 4
+    assert missing_builds.reason(build_range.build_info_fetcher.fetch_config, dates[5]) is None
+
+
 def test_mid_point_interrupt(range_creator):
     build_range = range_creator.create(list(range(10)))
     assert build_range.mid_point(interrupt=lambda: False) == 5
@@ -202,6 +232,32 @@ def test_get_integration_range(mocker):
     b_range.future_build_infos[0].date_or_changeset() == "b"
 
 
+def test_get_integration_range_with_pushes_and_executor(mocker):
+    fetch_config = create_config("firefox", "linux", 64, "x86_64")
+    jpush_class = mocker.patch("mozregression.fetch_build_info.JsonPushes")
+    pushes = [create_push("b", 1), create_push("d", 2), create_push("f", 3)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        b_range = build_range.get_integration_range(
+            fetch_config, "a", "e", pushes=pushes, executor=executor
+        )
+        # the given pushes are used
+        assert not jpush_class.return_value.pushes_within_changes.called
+        assert len(b_range) == 3
+
+        threads = set()
+
+        def find_build_info(push):
+            threads.add(threading.current_thread().name)
+            return push
+
+        b_range.build_info_fetcher.find_build_info = find_build_info
+        assert b_range[1:].mid_point() == 0
+        assert b_range.future_build_infos[1].is_available()
+        assert b_range.future_build_infos[2].is_available()
+        assert all(name.startswith("ThreadPoolExecutor") for name in threads)
+
+
 def test_get_integration_range_with_expand(mocker):
     fetch_config = create_config("firefox", "linux", 64, "x86_64")
     jpush_class = mocker.patch("mozregression.fetch_build_info.JsonPushes")
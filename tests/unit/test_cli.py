@@ -261,6 +261,33 @@ def test_basic_integration():
     assert config.options.bad == "c5"
 
 
+@pytest.mark.parametrize(
+    "args,action",
+    [
+        (["--good=2019-01-01", "--bad=2019-02-01"], "sweep_nightlies"),
+        (["--good=c1", "--bad=c5"], "sweep_integration"),
+    ],
+)
+def test_sweep(args, action):
+    config = do_cli("--app=jsshell", "--command=true", "--sweep=out.csv", "-j4", *args)
+    assert config.action == action
+    assert config.options.jobs == 4
+    assert config.options.download_jobs == 4
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--app=jsshell"],
+        ["--command=true"],
+        ["--app=jsshell", "--command=true", "--launch=2019-01-01"],
+    ],
+)
+def test_sweep_invalid(args):
+    with pytest.raises(errors.MozRegressionError):
+        do_cli("--sweep=-", "--good=2019-01-01", "--bad=2019-02-01", *args)
+
+
 def test_list_releases(mocker):
     out = []
     stdout = mocker.patch("sys.stdout")
@@ -341,3 +368,87 @@ def test_telemetry(enable_telemetry):
         config = do_cli(conf_file=f.name)
         assert config.enable_telemetry is enable_telemetry
         os.unlink(f.name)
+
+
+def test_headless():
+    config = do_cli("--headless=test.html", "--good-pattern=PASS", "--headless-timeout=10")
+    assert config.options.headless == "test.html"
+    assert config.options.good_pattern == "PASS"
+    assert config.options.headless_timeout == 10
+
+
+def test_headless_default_timeout():
+    config = do_cli("--headless=test.html", "--bad-pattern=FAIL")
+    assert config.options.headless_timeout == 60
+    # the application does not exit by itself
+    config = do_cli("--headless=test.html", "--headless-timeout=5")
+    assert config.options.headless_timeout == 5
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--headless=test.html", "--command=true"],
+        ["--headless=test.html", "--app=fenix"],
+        ["--bad-pattern=FAIL"],
+        ["--headless=test.html", "--good-pattern=("],
+        ["--headless=test.html"],
+        ["--headless=test.html", "--bad-pattern=FAIL", "--headless-timeout=0"],
+    ],
+)
+def test_headless_invalid(args):
+    with pytest.raises(errors.MozRegressionError):
+        do_cli(*args)
+
+
+def test_command_timeout():
+    config = do_cli("--command=true", "--command-timeout=30", "--timeout-verdict=retry")
+    assert config.options.command_timeout == 30
+    assert config.options.timeout_verdict == "retry"
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--command-timeout=30"],
+        ["--command-log-dir=logs"],
+        ["--command=true", "--command-timeout=0"],
+    ],
+)
+def test_command_timeout_invalid(args):
+    with pytest.raises(errors.MozRegressionError):
+        do_cli(*args)
+
+
+def test_variants():
+    config = do_cli(
+        "--command=true",
+        "--good=c1",
+        "--bad=c5",
+        "--bits=64",
+        "--variant=bits=32",
+        "--variant=build-type=debug",
+    )
+    assert config.action == "multi_bisect"
+    assert [(fc.bits, fc.build_type) for fc in config.fetch_configs] == [
+        (64, "shippable"),
+        (32, "shippable"),
+        (64, "debug"),
+    ]
+    assert config.options.background_dl_policy == "keep"
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        # no automatic evaluation
+        ["--good=c1", "--bad=c5", "--variant=bits=32"],
+        ["--command=true", "--good=c1", "--bad=c5", "--variant=os=win"],
+        ["--command=true", "--good=c1", "--bad=c5", "--variant=build-type=unknown"],
+        ["--command=true", "--good=c1", "--bad=c5", "--variant=arch=arm"],
+        ["--command=true", "--launch=c1", "--variant=bits=32"],
+    ],
+)
+def test_variants_invalid(args):
+    with pytest.raises(errors.MozRegressionError):
+        do_cli(*args)
@@ -0,0 +1,83 @@
+from __future__ import absolute_import
+
+import os
+import sys
+import time
+
+import pytest
+from mock import patch
+
+from mozregression import command
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell commands")
+
+
+def is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def test_run_command():
+    result = command.run_command(["sh", "-c", "exit 3"])
+    assert result.returncode == 3
+    assert not result.timed_out
+    assert result.wall_time > 0
+    assert result.cpu_time is not None
+    assert result.max_rss > 0
+    assert "max rss" in result.format_usage()
+
+
+def test_run_command_log_file(tmp_path):
+    log_file = str(tmp_path / "build.log")
+    for i in range(2):
+        command.run_command(
+            ["sh", "-c", "echo out %d; echo err %d >&2" % (i, i)], log_file=log_file
+        )
+    with open(log_file) as f:
+        lines = f.read().splitlines()
+    assert lines[0].startswith("$ sh -c")
+    assert lines[1:3] == ["out 0", "err 0"]
+    assert lines[4:] == ["out 1", "err 1"]
+
+
+def test_run_command_timeout_kills_the_process_tree(tmp_path):
+    pidfile = tmp_path / "pid"
+    start = time.monotonic()
+    with patch("mozregression.command.LOG"):
+        result = command.run_command(
+            ["sh", "-c", "sleep 30 & echo $! > %s; wait" % pidfile], timeout=0.5
+        )
+    assert result.timed_out
+    assert result.returncode < 0
+    assert time.monotonic() - start < 10
+    # the child of the shell was killed too
+    pid = int(pidfile.read_text())
+    for _ in range(50):
+        if not is_alive(pid):
+            break
+        time.sleep(0.1)
+    assert not is_alive(pid)
+
+
+def test_run_command_killed_on_interrupt():
+    real_wait = command._wait
+    procs = []
+
+    def wait(proc, timeout=None):
+        if not procs:
+            procs.append(proc)
+            raise KeyboardInterrupt
+        return real_wait(proc, timeout)
+
+    with patch("mozregression.command._wait", side_effect=wait):
+        with pytest.raises(KeyboardInterrupt):
+            command.run_command(["sleep", "30"])
+    assert procs[0].returncode < 0
+
+
+def test_run_command_not_found():
+    with pytest.raises(OSError):
+        command.run_command(["this-command-does-not-exist"])
@@ -0,0 +1,167 @@
+from __future__ import absolute_import
+
+import atexit
+import os
+import signal
+import socket
+import sys
+import threading
+
+import pytest
+
+from mozregression import daemon, download_manager, test_runner
+from mozregression.errors import MozRegressionError
+
+pytestmark = pytest.mark.skipif(not daemon.SUPPORTED, reason="requires Unix sockets")
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "daemon.sock")
+    monkeypatch.setenv("MOZREGRESSION_DAEMON_SOCKET", path)
+    monkeypatch.delenv("MOZREGRESSION_NO_DAEMON", raising=False)
+    return path
+
+
+@pytest.fixture
+def server(socket_path):
+    server = daemon.Daemon(socket_path)
+    server.start()
+
+    def serve_one():
+        conn, _ = server._server.accept()
+        with conn:
+            server.handle(conn)
+
+    def run_in_thread():
+        thread = threading.Thread(target=serve_one)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    server.run_in_thread = run_in_thread
+    yield server
+    server.close()
+
+
+def test_forward_without_daemon(socket_path):
+    assert daemon.forward_to_daemon(["mozregression", "--version"]) is None
+
+
+def test_forward_disabled(server, monkeypatch):
+    monkeypatch.setenv("MOZREGRESSION_NO_DAEMON", "1")
+    assert daemon.forward_to_daemon(["mozregression", "--version"]) is None
+
+
+def test_start_and_close(server, socket_path):
+    # only the user can connect
+    assert os.stat(socket_path).st_mode & 0o077 == 0
+    assert isinstance(test_runner.TestRunner.install_cache, test_runner.InstallCache)
+    assert download_manager.PERSIST_INDEXES is not None
+    with pytest.raises(MozRegressionError):
+        daemon.Daemon(socket_path).start()
+
+    server.close()
+    assert not os.path.exists(socket_path)
+    assert test_runner.TestRunner.install_cache is None
+    assert download_manager.PERSIST_INDEXES is None
+
+
+def test_start_removes_stale_socket(socket_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+    server = daemon.Daemon(socket_path)
+    server.start()
+    server.close()
+
+
+def test_run_job(server, mocker, tmp_path, capfd):
+    calls = []
+    exit_callback = mocker.Mock()
+
+    def main(argv, check_new_version, http_session):
+        calls.append((argv, sys.argv, os.getcwd(), os.environ.get("JOB_VAR")))
+        print("job output")
+        os.write(2, b"command output\n")
+        atexit.register(exit_callback, 1)
+        sys.exit(3)
+
+    mocker.patch("mozregression.main.main", side_effect=main)
+    os.environ["JOB_VAR"] = "1"
+    cwd = os.getcwd()
+    try:
+        os.chdir(str(tmp_path))
+        thread = server.run_in_thread()
+        assert daemon.forward_to_daemon(["mozregression", "--launch", "1"]) == 3
+    finally:
+        os.chdir(cwd)
+        del os.environ["JOB_VAR"]
+    thread.join()
+
+    assert calls == [(["--launch", "1"], ["mozregression", "--launch", "1"], str(tmp_path), "1")]
+    exit_callback.assert_called_once_with(1)
+    # the daemon state is restored
+    assert atexit.register is not exit_callback
+    assert "JOB_VAR" not in os.environ
+    assert sys.argv != ["mozregression", "--launch", "1"]
+
+    out, err = capfd.readouterr()
+    assert "job output\n" in out
+    assert "command output\n" in err
+
+
+def test_run_job_error_message(server, mocker, capfd):
+    mocker.patch("mozregression.main.main", side_effect=SystemExit("no good build"))
+    thread = server.run_in_thread()
+    assert daemon.forward_to_daemon(["mozregression"]) == 1
+    thread.join()
+    assert "no good build\n" in capfd.readouterr().err
+
+
+def test_version_mismatch(server, mocker, socket_path):
+    main = mocker.patch("mozregression.main.main")
+    thread = server.run_in_thread()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        socket.send_fds(client, [b"\0"], [0, 1, 2])
+        daemon._send_message(client, {"version": "0.0", "argv": ["mozregression"]})
+        reply = daemon._read_message(client.makefile("rb"))
+    thread.join()
+    # the client runs the command itself
+    assert "refused" in reply
+    assert not main.called
+
+
+def test_job_interrupted_after_its_end(server, mocker):
+    mocker.patch.object(server, "run_job", side_effect=daemon.JobInterrupted)
+    thread = server.run_in_thread()
+    assert daemon.forward_to_daemon(["mozregression"]) == 1
+    thread.join()
+
+
+def test_serve_forever_survives_late_interrupt(server, mocker):
+    handlers = signal.getsignal(signal.SIGINT), signal.getsignal(signal.SIGTERM)
+    conn = mocker.MagicMock()
+    listener = mocker.patch.object(server, "_server")
+    # the daemon itself is interrupted at the second accept
+    listener.accept.side_effect = [(conn, None), KeyboardInterrupt]
+    handle = mocker.patch.object(server, "handle", side_effect=daemon.JobInterrupted)
+    try:
+        server.serve_forever()
+    finally:
+        signal.signal(signal.SIGINT, handlers[0])
+        signal.signal(signal.SIGTERM, handlers[1])
+    handle.assert_called_once_with(conn)
+    assert listener.accept.call_count == 2
+
+
+def test_sigint_of_client(server):
+    job = daemon.Job({})
+    server._interrupted_job = job
+    with pytest.raises(daemon.JobInterrupted):
+        server._on_sigint(signal.SIGINT, None)
+    # the daemon itself is interrupted
+    with pytest.raises(KeyboardInterrupt) as ctx:
+        server._on_sigint(signal.SIGINT, None)
+    assert not isinstance(ctx.value, daemon.JobInterrupted)
@@ -0,0 +1,77 @@
+from __future__ import absolute_import
+
+import json
+import os
+
+from mock import patch
+
+from mozregression.disk_cache import JsonCache
+
+
+def test_get_set(cache_dir):
+    cache = JsonCache("test.json")
+    assert cache.get("key") is None
+    assert cache.get("key", 1) == 1
+    cache.set("key", {"a": [1, 2]})
+    assert cache.get("key") == {"a": [1, 2]}
+    # another instance reads the same file
+    assert JsonCache("test.json").get("key") == {"a": [1, 2]}
+    assert os.path.isfile(os.path.join(cache_dir, "test.json"))
+
+
+def test_update_and_clear():
+    cache = JsonCache("test.json")
+    cache.update({"a": 1, "b": 2})
+    assert (cache.get("a"), cache.get("b")) == (1, 2)
+    cache.clear()
+    assert cache.get("a") is None
+    cache.clear()  # no error if there is no file
+
+
+def test_ttl():
+    cache = JsonCache("test.json", ttl=10)
+    with patch("mozregression.disk_cache.time.time", return_value=1000):
+        cache.set("old", 1)
+    with patch("mozregression.disk_cache.time.time", return_value=1005):
+        cache.set("new", 2)
+        assert cache.get("old") == 1
+    with patch("mozregression.disk_cache.time.time", return_value=1011):
+        assert cache.get("old") is None
+        assert cache.get("new") == 2
+        # expired entries are dropped on write
+        cache.set("other", 3)
+    with open(cache.path) as f:
+        assert sorted(json.load(f)) == ["new", "other"]
+
+
+def test_invalid_cache_file(cache_dir):
+    cache = JsonCache("test.json")
+    os.makedirs(cache_dir)
+    with open(cache.path, "w") as f:
+        f.write("{not json")
+    assert cache.get("key") is None
+    cache.set("key", 1)
+    assert cache.get("key") == 1
+
+    with open(cache.path, "w") as f:
+        json.dump({"key": "not an entry"}, f)
+    assert cache.get("key") is None
+
+
+def test_unwritable_cache(cache_dir):
+    with open(cache_dir, "w"):
+        pass  # a file where the cache dir should be
+    cache = JsonCache("test.json")
+    cache.set("key", 1)
+    assert cache.get("key") is None
+
+
+def test_items():
+    cache = JsonCache("test.json", ttl=10)
+    assert cache.items() == {}
+    with patch("mozregression.disk_cache.time.time", return_value=1000):
+        cache.set("old", 1)
+    with patch("mozregression.disk_cache.time.time", return_value=1005):
+        cache.set("new", 2)
+    with patch("mozregression.disk_cache.time.time", return_value=1011):
+        assert cache.items() == {"new": 2}
@@ -1,5 +1,6 @@
 from __future__ import absolute_import
 
+import errno
 import os
 import shutil
 import tempfile
@@ -9,6 +10,8 @@ import unittest
 from mock import ANY, Mock, patch
 
 from mozregression import download_manager
+from mozregression.errors import MozRegressionError
+from mozregression.progress import Transfer
 
 
 def mock_session():
@@ -189,6 +192,39 @@ class TestDownload(unittest.TestCase):
         # finished callback was called
         self.finished.assert_called_with(self.dl)
 
+    @unittest.skipUnless(hasattr(os, "posix_fallocate"), "posix_fallocate is required")
+    def test_download_preallocates_file(self):
+        # less data than announced: the preallocated space is given back
+        self.create_response(b"1234" * 4)
+        self.session_response.headers = {"content-length": "100"}
+
+        with patch("os.posix_fallocate", wraps=os.posix_fallocate) as fallocate:
+            self.dl.start()
+            self.dl.wait()
+
+        self.assertEqual(fallocate.call_args[0][1:], (0, 100))
+        self.assertEqual(os.path.getsize(self.tempfile), 16)
+
+    def test_download_disk_full(self):
+        self.create_response(b"1234" * 4)
+        with patch(
+            "os.posix_fallocate", side_effect=OSError(errno.ENOSPC, "No space left"), create=True
+        ):
+            self.dl.start()
+            with self.assertRaisesRegex(MozRegressionError, "Not enough disk space"):
+                self.dl.wait()
+
+        self.assertEqual(os.listdir(self.tempdir), [])
+
+    def test_download_preallocate_not_supported(self):
+        self.create_response(b"1234" * 4)
+        with patch("os.posix_fallocate", side_effect=OSError(errno.EOPNOTSUPP, "No"), create=True):
+            self.dl.start()
+            self.dl.wait()
+
+        with open(self.tempfile) as f:
+            self.assertEqual(f.read(), "1234" * 4)
+
     def test_wait_does_not_block_on_exception(self):
         # this test the case when a user may hit CTRL-C for example
         # during a dl.wait() call.
@@ -268,6 +304,10 @@ class TestDownloadManager(unittest.TestCase):
         self.assertEqual(content("foo"), "hello" * 4)
         self.assertEqual(content("foo2"), "hello you" * 4)
 
+        # and they are indexed
+        self.assertIn("foo", self.dl_manager.persist_index)
+        self.assertIn("foo2", self.dl_manager.persist_index)
+
         # download instances are removed from the manager (internal test)
         self.assertEqual(self.dl_manager._downloads, {})
 
@@ -304,6 +344,7 @@ class TestDownloadManager(unittest.TestCase):
 
         # at the end, only dl3 has been downloaded
         self.assertEqual(os.listdir(self.tempdir), ["foobar"])
+        self.assertEqual(len(self.dl_manager.persist_index), 1)
 
         with open(os.path.join(self.tempdir, "foobar")) as f:
             self.assertEqual(f.read(), "foobar" * 4)
@@ -311,14 +352,39 @@ class TestDownloadManager(unittest.TestCase):
         # download instances are removed from the manager (internal test)
         self.assertEqual(self.dl_manager._downloads, {})
 
+    def test_persist_index(self):
+        with open(os.path.join(self.tempdir, "old"), "w") as f:
+            f.write("old" * 10)
+        os.utime(os.path.join(self.tempdir, "old"), (0, 0))
+        self.dl_manager = download_manager.DownloadManager(
+            self.tempdir, persist_limit=download_manager.PersistLimit(40, 1)
+        )
+        self.assertIn("old", self.dl_manager.persist_index)
+
+        self.do_download("http://foo", "new", b"new" * 10).wait()
+        # the old file was removed to respect the persist limit
+        self.assertEqual(os.listdir(self.tempdir), ["new"])
+        self.assertNotIn("old", self.dl_manager.persist_index)
+        self.assertIn("new", self.dl_manager.persist_index)
+
 
 class TestDownloadProgress(unittest.TestCase):
     @patch("sys.stdout")
     def test_basic(self, stdout):
-        download_manager.download_progress(None, 50, 100)
-        stdout.write.assert_called_with("===== Downloaded 50% =====\r")
+        transfer = Transfer("dl", 100, 0)
+        transfer.current, transfer.updated = 50, 5
+        download_manager.download_progress([transfer])
+        line = stdout.write.call_args[0][0]
+        self.assertEqual(line.rstrip(), "===== Downloaded 50% (10.0 B/s, 0:05 left) =====")
+        self.assertTrue(line.endswith("\r"))
         stdout.flush.assert_called_with()
 
+    @patch("sys.stdout")
+    def test_several_downloads(self, stdout):
+        download_manager.download_progress([Transfer("dl1", 100, 0), Transfer("dl2", 100, 0)])
+        line = stdout.write.call_args[0][0]
+        self.assertEqual(line.rstrip(), "===== Downloaded 0%, 0% =====")
+
 
 class TestBuildDownloadManager(unittest.TestCase):
     def setUp(self):
@@ -5,6 +5,7 @@ import re
 import unittest
 
 from mock import Mock, patch
+from taskcluster.exceptions import TaskclusterFailure, TaskclusterRestFailure
 
 from mozregression import errors, fetch_build_info, fetch_configs
 
@@ -127,8 +128,19 @@ bar/nightly/2014/11/2014-11-15-01-02-05-mozilla-central/",
 
     def test_find_build_info_no_data(self):
         self.info_fetcher._get_urls = Mock(return_value=[])
-        with self.assertRaises(errors.BuildInfoNotFound):
+        with self.assertRaises(errors.BuildInfoNotFound) as ctx:
+            self.info_fetcher.find_build_info(datetime.date(2014, 11, 15))
+        self.assertTrue(ctx.exception.permanent)
+
+    def test_find_build_info_network_error(self):
+        self.info_fetcher._get_urls = Mock(return_value=["http://foo/1/", "http://foo/2/"])
+        self.info_fetcher._fetch_build_info_from_url = Mock(
+            side_effect=[None, errors.MozRegressionError("timeout")]
+        )
+        with self.assertRaises(errors.BuildInfoNotFound) as ctx:
             self.info_fetcher.find_build_info(datetime.date(2014, 11, 15))
+        # the build may exist
+        self.assertFalse(ctx.exception.permanent)
 
 
 class TestNightlyInfoFetcher2(unittest.TestCase):
@@ -189,10 +201,21 @@ class TestIntegrationInfoFetcher(unittest.TestCase):
 
     @patch("taskcluster.Index")
     def test_find_build_info_no_task(self, Index):
-        Index.findTask = Mock(side_effect=fetch_build_info.TaskclusterFailure)
+        Index.findTask = Mock(side_effect=TaskclusterFailure)
         self.info_fetcher = fetch_build_info.IntegrationInfoFetcher(self.fetch_config)
-        with self.assertRaises(errors.BuildInfoNotFound):
+        with self.assertRaises(errors.BuildInfoNotFound) as ctx:
             self.info_fetcher.find_build_info(create_push("123456789", 1))
+        self.assertFalse(ctx.exception.permanent)
+
+    @patch("taskcluster.Index")
+    def test_find_build_info_task_not_found(self, Index):
+        Index.return_value.findTask.side_effect = TaskclusterRestFailure(
+            "not found", superExc=None, status_code=404
+        )
+        self.info_fetcher = fetch_build_info.IntegrationInfoFetcher(self.fetch_config)
+        with self.assertRaises(errors.BuildInfoNotFound) as ctx:
+            self.info_fetcher.find_build_info(create_push("123456789", 1))
+        self.assertTrue(ctx.exception.permanent)
 
     @patch("taskcluster.Index")
     @patch("taskcluster.Queue")
@@ -217,8 +240,9 @@ class TestIntegrationInfoFetcher(unittest.TestCase):
         Queue.listArtifacts = list_artifacts
 
         self.info_fetcher = fetch_build_info.IntegrationInfoFetcher(self.fetch_config)
-        with self.assertRaises(errors.BuildInfoNotFound):
+        with self.assertRaises(errors.BuildInfoNotFound) as ctx:
             self.info_fetcher.find_build_info(create_push("123456789", 1))
+        self.assertTrue(ctx.exception.permanent)
 
     @patch("mozregression.json_pushes.JsonPushes.push")
     def test_find_build_info_check_changeset_error(self, push):
@@ -235,7 +259,7 @@ class TestIntegrationInfoFetcherGVE(unittest.TestCase):
     def setUp(self):
         self.fetch_config = fetch_configs.create_config("gve", "linux", 64, None)
 
-    @patch("mozregression.fetch_build_info.requests.head")
+    @patch("requests.head")
     @patch("taskcluster.Index")
     @patch("taskcluster.Queue")
     def test_find_build_info(self, Queue, Index, requests_head):
@@ -262,7 +286,7 @@ class TestIntegrationInfoFetcherGVE(unittest.TestCase):
         self.assertEqual(result.changeset, "123456789")
         self.assertEqual(result.build_type, "integration")
 
-    @patch("mozregression.fetch_build_info.requests.head")
+    @patch("requests.head")
     @patch("taskcluster.Index")
     @patch("taskcluster.Queue")
     def test_find_build_info_artifact_unavailable(self, Queue, Index, requests_head):
@@ -279,10 +303,12 @@ class TestIntegrationInfoFetcherGVE(unittest.TestCase):
         }
         Queue.return_value.buildUrl.return_value = "http://geckoview_example.apk"
 
-        requests_head().status_code = 403
+        for status_code, permanent in ((404, True), (410, True), (429, False), (503, False)):
+            requests_head().status_code = status_code
 
-        self.info_fetcher = fetch_build_info.IntegrationInfoFetcher(self.fetch_config)
-        self.info_fetcher._fetch_txt_info = Mock(return_value={"changeset": "123456789"})
+            self.info_fetcher = fetch_build_info.IntegrationInfoFetcher(self.fetch_config)
+            self.info_fetcher._fetch_txt_info = Mock(return_value={"changeset": "123456789"})
 
-        with self.assertRaises(errors.BuildInfoNotFound):
-            self.info_fetcher.find_build_info(create_push("123456789", 1))
+            with self.assertRaises(errors.BuildInfoNotFound) as ctx:
+                self.info_fetcher.find_build_info(create_push("123456789", 1))
+            self.assertEqual(ctx.exception.permanent, permanent)
@@ -6,7 +6,7 @@ import pytest
 from mock import Mock, call
 
 from mozregression.errors import EmptyPushlogError, MozRegressionError
-from mozregression.json_pushes import JsonPushes, Push
+from mozregression.json_pushes import JsonPushes, Push, PushCache
 
 
 def test_push(mocker):
@@ -106,3 +106,48 @@ def test_push_with_date_raise_appropriate_error():
         jpushes.push(date(2015, 1, 1))
 
     assert str(ctx.value) == "No pushes available for the date 2015-01-01 on inbound."
+
+
+def test_push_is_cached(mocker):
+    pushlog = {"1": {"changesets": ["abc", "def"], "date": 123456}}
+    retry_get = mocker.patch("mozregression.json_pushes.retry_get")
+    retry_get.return_value = Mock(json=Mock(return_value=pushlog))
+
+    push = JsonPushes().push("abc")
+    assert JsonPushes().push("abc") is push
+    # every changeset of the push can be found
+    assert JsonPushes(branch="m-c").push("def") is push
+    assert retry_get.call_count == 1
+
+    # other variants and branches are not shared
+    JsonPushes().push("abc", full="1")
+    JsonPushes(branch="autoland").push("abc")
+    assert retry_get.call_count == 3
+
+
+def test_push_cache_is_bounded():
+    cache = PushCache(maxsize=3)
+    pushes = [Push(str(i), {"changesets": [str(i)]}) for i in range(4)]
+    for push in pushes[:3]:
+        cache.add("repo", push.changeset, {}, push)
+    assert cache.get("repo", "0", {}) is pushes[0]
+    cache.add("repo", "3", {}, pushes[3])
+    # the least recently used one was dropped
+    assert cache.get("repo", "1", {}) is None
+    assert cache.get("repo", "0", {}) is pushes[0]
+    assert cache.get("repo", "3", {}) is pushes[3]
+
+
+def test_push_bug_ids():
+    push = Push(
+        "1",
+        {
+            "changesets": [
+                {"node": "a", "desc": "Bug 123 - fix it; bug 456"},
+                {"node": "b", "desc": "no bug here"},
+                {"node": "c", "desc": "Backed out changeset a (bug 123)"},
+                {"node": "d", "desc": "bug  789: part 2"},
+            ]
+        },
+    )
+    assert push.bug_ids == ["123", "789"]
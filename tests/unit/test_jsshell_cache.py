@@ -0,0 +1,108 @@
+from __future__ import absolute_import
+
+import os
+import zipfile
+
+import pytest
+
+from mozregression import jsshell_cache
+from mozregression.jsshell_cache import JsShellCache
+
+
+@pytest.fixture
+def cache():
+    return JsShellCache(max_entries=2)
+
+
+@pytest.fixture
+def archive(tmp_path):
+    def create(name="jsshell.zip", content="1", extra=()):
+        path = str(tmp_path / name)
+        with zipfile.ZipFile(path, "w") as z:
+            z.writestr("js", content)
+            for fname in ("libnspr4.so", "libmozglue.dylib", "mozglue.dll", "js-gdb.py") + extra:
+                z.writestr(fname, fname)
+        return path
+
+    return create
+
+
+@pytest.mark.parametrize("os_name, expected", [("win", "js.exe"), ("linux", "js"), ("mac", "js")])
+def test_binary_name(os_name, expected):
+    assert jsshell_cache.binary_name(os_name) == expected
+
+
+def test_needed_members():
+    names = ["js", "js-gdb.py", "libnspr4.so", "libplc4.so.1", "mozglue.dll", "README"]
+    assert jsshell_cache.needed_members(names, "js") == [
+        "js",
+        "libnspr4.so",
+        "libplc4.so.1",
+        "mozglue.dll",
+    ]
+
+
+def test_needed_members_no_binary():
+    with pytest.raises(ValueError):
+        jsshell_cache.needed_members(["js.exe", "mozglue.dll"], "js")
+
+
+def test_install_extracts_only_needed_files(cache, archive, cache_dir):
+    binary = cache.install(archive(), "js")
+    entry = os.path.dirname(binary)
+    assert os.path.dirname(entry) == os.path.join(cache_dir, "jsshell")
+    assert sorted(os.listdir(entry)) == ["js", "libmozglue.dylib", "libnspr4.so", "mozglue.dll"]
+    assert os.access(binary, os.X_OK)
+
+
+def test_install_reuses_cached_build(mocker, cache, archive):
+    path = archive()
+    binary = cache.install(path, "js")
+
+    extract = mocker.patch("mozregression.jsshell_cache.extract_shell")
+    digest = mocker.patch("mozregression.jsshell_cache.file_digest")
+    assert cache.install(path, "js") == binary
+    # the archive is not even read again
+    assert not digest.called
+    assert not extract.called
+
+
+def test_install_is_content_addressed(cache, archive):
+    binary = cache.install(archive("a.zip"), "js")
+    assert cache.install(archive("b.zip"), "js") == binary
+    assert cache.install(archive("c.zip", content="2"), "js") != binary
+
+
+def test_install_replaces_broken_entry(cache, archive):
+    binary = cache.install(archive(), "js")
+    os.remove(binary)
+    assert cache.install(archive(), "js") == binary
+    assert os.path.isfile(binary)
+
+
+def test_least_recently_used_builds_are_removed(cache, archive):
+    first = os.path.dirname(cache.install(archive("1.zip", content="1"), "js"))
+    second = os.path.dirname(cache.install(archive("2.zip", content="2"), "js"))
+    os.utime(first, (0, 0))
+    os.utime(second, (1, 1))
+    # using the first build marks it as recently used
+    cache.install(archive("1.zip", content="1"), "js")
+    third = os.path.dirname(cache.install(archive("3.zip", content="3"), "js"))
+    assert cache.entries() == [third, first]
+
+
+def test_install_error_leaves_no_entry(cache, tmp_path):
+    path = str(tmp_path / "bad.zip")
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("README", "no shell here")
+    with pytest.raises(ValueError):
+        cache.install(path, "js")
+    assert cache.entries() == []
+    assert os.listdir(cache.path) == []
+
+
+def test_clear(cache, archive):
+    cache.install(archive(), "js")
+    cache.clear()
+    assert not os.path.exists(cache.path)
+    assert cache.digests.items() == {}
@@ -4,6 +4,7 @@ import os
 import sys
 import tempfile
 import unittest
+import zipfile
 from subprocess import CalledProcessError
 
 import mozfile
@@ -52,6 +53,17 @@ class TestLauncher(unittest.TestCase):
         launcher.start()
         self.assertTrue(launcher.started)
 
+    @patch("mozregression.launchers.Launcher.create_profile")
+    def test_prepare_profile(self, create_profile):
+        launcher = MyLauncher("/foo/persist.zip")
+        launcher.prepare_profile(profile="/profile", cmdargs=["--foo"])
+        create_profile.assert_called_once_with(profile="/profile", addons=(), preferences=None)
+        # the prepared profile is used only once
+        self.assertEqual(launcher._create_profile(), create_profile.return_value)
+        create_profile.reset_mock()
+        launcher._create_profile()
+        self.assertTrue(create_profile.called)
+
     def test_wait(self):
         launcher = MyLauncher("/foo/persist.zip")
         self.assertFalse(launcher.started)
@@ -84,6 +96,10 @@ class TestLauncher(unittest.TestCase):
         launcher.start()
         with self.assertRaises(LauncherError):
             launcher.stop()
+        # not stopped again
+        launcher.stop()
+        launcher.cleanup()
+        launcher._stop.assert_called_once_with()
 
 
 class TestMozRunnerLauncher(unittest.TestCase):
@@ -138,7 +154,18 @@ profile_class",
             self.launcher.stop()
 
     @patch("mozregression.launchers.Runner")
-    def test_start_with_profile_and_addons(self, Runner):
+    def test_start_with_env_and_output(self, Runner):
+        Runner.return_value.env = {}
+        callback = Mock()
+        with self.launcher:
+            self.launcher_start(env={"MOZ_HEADLESS": "1"}, output=[callback])
+            self.assertEqual(self.launcher.runner.env["MOZ_HEADLESS"], "1")
+            self.assertIn(callback, self.launcher.runner.process_args["processOutputLine"])
+            self.launcher.stop()
+
+    @patch("mozregression.launchers.PROFILE_TEMPLATES")
+    @patch("mozregression.launchers.Runner")
+    def test_start_with_profile_and_addons(self, Runner, templates):
         temp_dir_profile = tempfile.mkdtemp()
         self.addCleanup(mozfile.remove, temp_dir_profile)
 
@@ -146,8 +173,8 @@ profile_class",
             self.launcher_start(
                 profile=temp_dir_profile, addons=["my-addon"], preferences="my-prefs"
             )
-            self.profile_class.clone.assert_called_once_with(
-                temp_dir_profile, addons=["my-addon"], preferences="my-prefs"
+            templates.clone.assert_called_once_with(
+                self.profile_class, temp_dir_profile, addons=["my-addon"], preferences="my-prefs"
             )
             # runner is started
             self.launcher.runner.start.assert_called_once_with()
@@ -354,10 +381,14 @@ class TestExtendedAndroidLauncher:
 
     def setup_method(self):
         self.profile = Profile()
-        self.remote_profile_path = self.test_root + "/" + os.path.basename(self.profile.profile)
+        self.apk = tempfile.NamedTemporaryFile(suffix=".apk", delete=False)
+        self.apk.write(b"apk")
+        self.apk.close()
 
     def teardown_method(self):
         self.profile.cleanup()
+        os.remove(self.apk.name)
+        launchers.AndroidLauncher._remote_profiles.clear()
 
     @patch("mozregression.launchers.mozversion.get_version")
     @patch("mozregression.launchers.ADBDeviceFactory")
@@ -367,12 +398,16 @@ class TestExtendedAndroidLauncher:
             self.adb.uninstall_app.side_effect = launchers.ADBError
         ADBDeviceFactory.return_value = self.adb
         get_version.return_value = kwargs.get("version_value", {})
-        return launcher_class("/binary")
+        package_name = get_version.return_value.get("package_name")
+        if package_name is None:
+            package_name = launcher_class._get_package_name(None)
+        self.remote_profile_path = self.test_root + "/mozregression-" + package_name
+        return launcher_class(self.apk.name)
 
     def test_install(self, launcher_class, package_name, intended_activity):
         self.create_launcher(launcher_class=launcher_class)
         self.adb.uninstall_app.assert_called_with(package_name)
-        self.adb.install_app.assert_called_with("/binary")
+        self.adb.install_app.assert_called_with(self.apk.name)
 
     def test_start_stop(self, launcher_class, package_name, intended_activity, **kwargs):
         with patch(
@@ -399,6 +434,16 @@ class TestExtendedAndroidLauncher:
             assert launcher.get_app_info() is not None
             launcher.stop()
             self.adb.stop_application.assert_called_once_with(package_name)
+            # the profile is kept for the next launches
+            launcher.cleanup()
+            self.adb.rm.assert_called_once_with(self.remote_profile_path, recursive=True)
+
+            launchers.AndroidLauncher.remove_remote_profiles()
+            assert self.adb.rm.call_count == 2
+            self.adb.rm.assert_called_with(self.remote_profile_path, recursive=True)
+            # only once
+            launchers.AndroidLauncher.remove_remote_profiles()
+            assert self.adb.rm.call_count == 2
 
     def test_adb_calls_with_custom_package_name(
         self, launcher_class, package_name, intended_activity
@@ -427,7 +472,7 @@ class TestExtendedAndroidLauncher:
             launcher.stop()
             self.adb.stop_application.assert_called_once_with(pkg_name)
 
-    @patch("mozregression.launchers.LOG")
+    @patch("mozregression.android_sync.LOG")
     def test_adb_first_uninstall_fail(self, log, launcher_class, package_name, intended_activity):
         self.create_launcher(uninstall_error=True, launcher_class=launcher_class)
         log.warning.assert_called_once_with(ANY)
@@ -492,56 +537,62 @@ class TestExtendedAndroidLauncher:
             )
 
 
-class Zipfile(object):
-    def __init__(self, *a):
-        pass
+@pytest.fixture
+def jsshell_zip(tmp_path):
+    def create(binary_name="js"):
+        path = str(tmp_path / "jsshell.zip")
+        with zipfile.ZipFile(path, "w") as z:
+            z.writestr(binary_name, "1")
+        return path
 
-    def __enter__(self):
-        return self
+    return create
 
-    def __exit__(self, *a):
-        pass
 
-    def extractall(self, dirname):
-        fname = "js" if launchers.mozinfo.os != "win" else "js.exe"
-        with open(os.path.join(dirname, fname), "w") as f:
-            f.write("1")
+@pytest.mark.parametrize("mos,binary_name", [("win", "js.exe"), ("linux", "js"), ("mac", "js")])
+def test_jsshell_install(mocker, jsshell_zip, mos, binary_name):
+    mocker.patch("mozregression.launchers.mozinfo").os = mos
 
+    with launchers.JsShellLauncher(jsshell_zip(binary_name)) as js:
+        assert os.path.basename(js.binary) == binary_name
+        assert os.access(js.binary, os.X_OK)
+        # the shell is installed in the cache, not in a temporary dir
+        assert js.tempdir is None
+    # and kept for the next time
+    assert os.path.isfile(js.binary)
 
-@pytest.mark.parametrize("mos,binary_name", [("win", "js.exe"), ("linux", "js"), ("mac", "js")])
-def test_jsshell_install(mocker, mos, binary_name):
-    zipfile = mocker.patch("mozregression.launchers.zipfile")
-    zipfile.ZipFile = Zipfile
 
-    mocker.patch("mozregression.launchers.mozinfo").os = mos
+def test_jsshell_install_without_cache(mocker, jsshell_zip):
+    mocker.patch("mozregression.launchers.mozinfo").os = "linux"
+    mocker.patch.object(launchers.jsshell_cache.JSSHELL_CACHE, "install", side_effect=OSError)
 
-    with launchers.JsShellLauncher("/path/to") as js:
+    with launchers.JsShellLauncher(jsshell_zip()) as js:
         assert os.path.isdir(js.tempdir)
-        assert os.path.basename(js.binary) == binary_name
+        assert js.binary == os.path.join(js.tempdir, "js")
     assert not os.path.isdir(js.tempdir)
 
 
 def test_jsshell_install_except(mocker):
-    mocker.patch("mozregression.launchers.zipfile").ZipFile.side_effect = Exception
+    mocker.patch("mozregression.jsshell_cache.zipfile").ZipFile.side_effect = Exception
 
     with pytest.raises(Exception):
-        launchers.JsShellLauncher("/path/to")
+        launchers.JsShellLauncher(__file__)
 
 
 @pytest.mark.parametrize("return_code", [0, 1])
-def test_jsshell_start(mocker, return_code):
-    zipfile = mocker.patch("mozregression.launchers.zipfile")
-    zipfile.ZipFile = Zipfile
-
+def test_jsshell_start(mocker, jsshell_zip, return_code):
+    mocker.patch("mozregression.launchers.mozinfo").os = "linux"
     call = mocker.patch("mozregression.launchers.call")
     call.return_code = return_code
 
     logger = Mock()
 
-    with launchers.JsShellLauncher("/path/to") as js:
+    with launchers.JsShellLauncher(jsshell_zip()) as js:
         js._logger = logger
         js.start()
         assert js.get_app_info() == {}
+        # the shell does not run in the cache dir
+        assert os.path.isdir(js.tempdir)
 
     call.assert_called_once_with([js.binary], cwd=js.tempdir)
+    assert not os.path.isdir(js.tempdir)
     logger.warning.calls == 0 if return_code else 1
@@ -1,8 +1,11 @@
 from __future__ import absolute_import, print_function
 
+import os
 import tempfile
+import threading
 import unittest
 from datetime import date
+from types import SimpleNamespace
 
 import pytest
 import requests
@@ -12,7 +15,7 @@ from mozregression import __version__, config, errors, main
 from mozregression.bisector import Bisection, Bisector, IntegrationHandler, NightlyHandler
 from mozregression.download_manager import BuildDownloadManager
 from mozregression.telemetry import UsageMetrics, get_system_info
-from mozregression.test_runner import CommandTestRunner, ManualTestRunner
+from mozregression.test_runner import CommandTestRunner, HeadlessTestRunner, ManualTestRunner
 
 
 class AppCreator(object):
@@ -25,7 +28,7 @@ class AppCreator(object):
     def __call__(self, argv):
         config = main.cli(argv, conf_file=None)
         config.validate()
-        self.app = main.Application(config.fetch_config, config.options)
+        self.app = main.Application(config.fetch_config, config.options, config.fetch_configs)
         return self.app
 
     def find_in_log(self, msg, exact=True):
@@ -66,6 +69,29 @@ def test_app_get_command_test_runner(create_app):
     assert app.test_runner.command == "echo {binary}"
 
 
+def test_app_get_command_test_runner_with_timeout(create_app):
+    app = create_app(
+        ["--command=true", "--command-timeout=30", "--timeout-verdict=bad", "--command-log-dir=l"]
+    )
+    assert app.test_runner.timeout == 30
+    assert app.test_runner.timeout_verdict == "b"
+    assert app.test_runner.log_dir == "l"
+
+
+def test_app_get_headless_test_runner(create_app):
+    app = create_app(["--headless=http://test", "--bad-pattern=FAIL", "--pref=a:1"])
+    assert isinstance(app.test_runner, HeadlessTestRunner)
+    assert app.test_runner.url == "http://test"
+    assert app.test_runner.bad_pattern == "FAIL"
+    kwargs = app.test_runner.launcher_kwargs
+    # an empty template profile, to install the addons once
+    assert os.path.isdir(kwargs["profile"])
+    assert ("browser.dom.window.dump.enabled", True) in kwargs["preferences"]
+    assert ("a", 1) in kwargs["preferences"]
+    # the builds are pre-installed with the same profile
+    assert app.preinstaller.launcher_kwargs == kwargs
+
+
 @pytest.mark.parametrize(
     "argv,background_dl_policy,size_limit",
     [
@@ -85,6 +111,13 @@ def test_app_get_download_manager(create_app, argv, background_dl_policy, size_l
     assert app.build_download_manager.persist_limit.file_limit == 5
 
 
+def test_app_clear_removes_remote_profiles(create_app, mocker):
+    remove = mocker.patch("mozregression.launchers.AndroidLauncher.remove_remote_profiles")
+    app = create_app([])
+    app.clear()
+    remove.assert_called_once_with()
+
+
 def test_app_get_bisector(create_app):
     app = create_app([])
     assert isinstance(app.bisector, Bisector)
@@ -176,6 +209,97 @@ def test_app_bisect_integration_no_data(create_app):
     assert create_app.find_in_log("There are no build artifacts for these changesets", False)
 
 
+@pytest.mark.parametrize(
+    "argv,method,range_factory",
+    [
+        (["--good=2019-02-01", "--bad=2019-01-01", "--find-fix"], "sweep_nightlies", "nightly"),
+        (["--good=c1", "--bad=c2"], "sweep_integration", "integration"),
+    ],
+)
+def test_app_sweep(create_app, mocker, tmp_path, argv, method, range_factory):
+    output = str(tmp_path / "results.json")
+    app = create_app(["--app=jsshell", "--command=true", "--sweep=%s" % output] + argv)
+    get_range = mocker.patch("mozregression.main.get_%s_range" % range_factory)
+    Sweep = mocker.patch("mozregression.main.Sweep")
+    assert getattr(app, method)() == 0
+    if range_factory == "nightly":
+        # the range goes forward in time, even when looking for a fix
+        get_range.assert_called_once_with(app.fetch_config, date(2019, 1, 1), date(2019, 2, 1))
+    else:
+        get_range.assert_called_once_with(app.fetch_config, "c1", "c2")
+    Sweep.assert_called_once_with(
+        get_range.return_value,
+        app.test_runner,
+        app.build_download_manager,
+        ANY,
+        jobs=None,
+        download_jobs=4,
+    )
+    Sweep.return_value.run.assert_called_once_with()
+    Sweep.return_value.print_summary.assert_called_once_with()
+
+
+@pytest.mark.parametrize("result, exit_code", [(Bisection.FINISHED, 0), (Bisection.NO_DATA, 1)])
+def test_app_multi_bisect(create_app, mocker, result, exit_code):
+    app = create_app(["--command=true", "--good=c1", "--bad=c2", "--variant=build-type=debug"])
+    MultiBisector = mocker.patch("mozregression.main.MultiBisector")
+    print_report = mocker.patch("mozregression.main.print_report")
+    bisections = [Mock(result=Bisection.FINISHED), Mock(result=result)]
+    MultiBisector.return_value.bisect.return_value = bisections
+    assert app.multi_bisect() == exit_code
+    assert MultiBisector.call_args[0][:3] == (
+        app.fetch_configs,
+        app.test_runner,
+        app.build_download_manager,
+    )
+    assert [fc.build_type for fc in app.fetch_configs] == ["shippable", "debug"]
+    MultiBisector.return_value.bisect.assert_called_once_with("c1", "c2")
+    print_report.assert_called_once_with(bisections)
+
+
+def test_app_multi_bisect_keeps_downloads(create_app, mocker):
+    first_started, release_first = threading.Event(), threading.Event()
+
+    def get(url, **kwargs):
+        def iter_content(chunk_size):
+            if url.endswith("first"):
+                first_started.set()
+                release_first.wait(5)
+            yield b"build"
+
+        return Mock(headers={}, raw=None, iter_content=iter_content)
+
+    mocker.patch("mozregression.main.get_http_session").return_value.get.side_effect = get
+    # no --persist
+    app = create_app(["--command=true", "--good=c1", "--bad=c2", "--variant=build-type=debug"])
+    manager = app.build_download_manager
+    assert manager.background_dl_policy == "keep"
+    mocker.patch.object(
+        manager, "_extract_download_info", side_effect=lambda b: ("http://foo/" + b.name, b.name)
+    )
+    builds = [SimpleNamespace(name="first"), SimpleNamespace(name="second")]
+    errors_by_build = []
+
+    def focus_first():
+        try:
+            manager.focus_download(builds[0])
+        except Exception as exc:
+            errors_by_build.append(exc)
+
+    # the bisections of two platforms download their builds at the same time
+    thread = threading.Thread(target=focus_first)
+    thread.start()
+    assert first_started.wait(5)
+    manager.focus_download(builds[1])
+    release_first.set()
+    thread.join()
+
+    assert errors_by_build == []
+    for build in builds:
+        with open(build.build_file, "rb") as f:
+            assert f.read() == b"build"
+
+
 def test_app_bisect_ctrl_c_exit(create_app, mocker):
     app = create_app([])
     app.bisector.bisect = Mock(side_effect=KeyboardInterrupt)
@@ -217,6 +341,16 @@ class TestCheckMozregresionVersion(unittest.TestCase):
         main.check_mozregression_version()
         self.assertEqual(log.warning.call_count, 2)
 
+    @patch("requests.get")
+    def test_latest_version_is_cached(self, get):
+        get.return_value = Mock(json=lambda: {"info": {"version": "1.2.3"}})
+        self.assertEqual(main.pypi_latest_version(), "1.2.3")
+        self.assertEqual(main.pypi_latest_version(), "1.2.3")
+        self.assertEqual(get.call_count, 1)
+        main.PYPI_CACHE.clear()
+        self.assertEqual(main.pypi_latest_version(), "1.2.3")
+        self.assertEqual(get.call_count, 2)
+
 
 class TestMain(unittest.TestCase):
     def setUp(self):
@@ -242,7 +376,7 @@ class TestMain(unittest.TestCase):
     ):
         self.logger = log
 
-        def create_app(fetch_config, options):
+        def create_app(fetch_config, options, fetch_configs=None):
             self.app.fetch_config = fetch_config
             self.app.options = options
             return self.app
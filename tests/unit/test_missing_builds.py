@@ -0,0 +1,57 @@
+from __future__ import absolute_import
+
+import datetime
+
+import pytest
+
+from mozregression.fetch_configs import create_config
+from mozregression.missing_builds import MissingBuilds
+
+from .test_fetch_configs import create_push
+
+OLD_DATE = datetime.date(2019, 10, 1)
+
+
+@pytest.fixture
+def fetch_config():
+    return create_config("firefox", "linux", 64, "x86_64")
+
+
+def test_add_and_reason(fetch_config):
+    missing = MissingBuilds()
+    assert missing.reason(fetch_config, OLD_DATE) is None
+    missing.add(fetch_config, OLD_DATE, "no build info")
+    assert missing.reason(fetch_config, OLD_DATE) == "no build info"
+    # other builds or configs are not affected
+    assert missing.reason(fetch_config, OLD_DATE + datetime.timedelta(days=1)) is None
+    assert missing.reason(create_config("firefox", "win", 64, "x86_64"), OLD_DATE) is None
+    fetch_config.set_build_type("debug")
+    assert missing.reason(fetch_config, OLD_DATE) is None
+
+
+def test_persistence(fetch_config):
+    push = create_push("abc123", 1570000000)
+    MissingBuilds().add(fetch_config, push, "expired")
+    assert MissingBuilds().reason(fetch_config, push) == "expired"
+    assert MissingBuilds().reason(fetch_config, create_push("def456", 1570000000)) is None
+
+
+def test_expiration(fetch_config, mocker):
+    MissingBuilds(ttl=10).add(fetch_config, OLD_DATE, "not found")
+    mocker.patch("mozregression.disk_cache.time.time", return_value=2e10)
+    assert MissingBuilds(ttl=10).reason(fetch_config, OLD_DATE) is None
+
+
+def test_recent_builds_are_not_recorded(fetch_config):
+    missing = MissingBuilds()
+    today = datetime.date.today()
+    missing.add(fetch_config, today, "not built yet")
+    assert missing.reason(fetch_config, today) is None
+    assert MissingBuilds().reason(fetch_config, today) is None
+
+
+def test_clear(fetch_config):
+    missing = MissingBuilds()
+    missing.add(fetch_config, OLD_DATE, "not found")
+    missing.clear()
+    assert missing.reason(fetch_config, OLD_DATE) is None
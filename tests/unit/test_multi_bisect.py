@@ -0,0 +1,150 @@
+from __future__ import absolute_import
+
+import threading
+
+import pytest
+from mock import Mock
+
+from mozregression import errors, multi_bisect
+from mozregression.bisector import Bisection
+from mozregression.fetch_configs import create_config
+from mozregression.json_pushes import Push
+
+PUSHES = [Push(i, {"changesets": ["c%d" % i], "date": i}) for i in range(20)]
+
+
+class FakeInfoFetcher(object):
+    def __init__(self, fetch_config):
+        self.fetch_config = fetch_config
+        self.threads = set()
+
+    def find_build_info(self, push):
+        self.threads.add(threading.current_thread().name)
+        return Mock(
+            changeset=push.changeset,
+            short_changeset=push.changeset,
+            repo_url="https://hg.mozilla.org/integration/autoland",
+            repo_name="autoland",
+            persist_filename=push.changeset,
+            fetch_config=self.fetch_config,
+        )
+
+
+class FakeTestRunner(object):
+    """
+    Builds are bad from the push *first_bad*, by platform name.
+    """
+
+    def __init__(self, first_bad, error=None):
+        self.first_bad = first_bad
+        self.error = error
+
+    def evaluate(self, build_info, allow_back=False):
+        name = multi_bisect.platform_name(build_info.fetch_config)
+        if name == self.error:
+            raise errors.TestCommandError("command not found")
+        return "b" if int(build_info.changeset[1:]) >= self.first_bad[name] else "g"
+
+
+@pytest.fixture
+def fetch_configs():
+    debug = create_config("firefox", "linux", 64, "x86_64")
+    debug.set_build_type("debug")
+    return [
+        create_config("firefox", "linux", 64, "x86_64"),
+        create_config("firefox", "linux", 32, "x86"),
+        debug,
+    ]
+
+
+@pytest.fixture
+def integration_pushes(mocker):
+    mocker.patch("mozregression.build_range.IntegrationInfoFetcher", FakeInfoFetcher)
+    return mocker.patch("mozregression.multi_bisect.integration_pushes", return_value=PUSHES)
+
+
+def create_bisector(fetch_configs, test_runner):
+    return multi_bisect.MultiBisector(
+        fetch_configs, test_runner, Mock(), dl_in_background=False, info_workers=2
+    )
+
+
+def test_platform_name(fetch_configs):
+    assert [multi_bisect.platform_name(fc) for fc in fetch_configs] == [
+        "linux64 shippable",
+        "linux32 shippable",
+        "linux64 debug",
+    ]
+    gve = create_config("gve", "linux", 64, "x86_64", "aarch64")
+    assert multi_bisect.platform_name(gve) == "linux-aarch64 opt"
+
+
+def test_bisect_platforms_in_parallel(fetch_configs, integration_pushes):
+    runner = FakeTestRunner({"linux64 shippable": 12, "linux32 shippable": 12, "linux64 debug": 5})
+    bisections = create_bisector(fetch_configs, runner).bisect("c0", "c19")
+
+    assert [b.result for b in bisections] == [Bisection.FINISHED] * 3
+    assert [(b.handler.good_revision, b.handler.bad_revision) for b in bisections] == [
+        ("c11", "c12"),
+        ("c11", "c12"),
+        ("c4", "c5"),
+    ]
+    # the pushlog was only queried once
+    integration_pushes.assert_called_once()
+    # and the build infos were fetched by the shared pool
+    for bisection in bisections:
+        fetcher = bisection.handler.build_range.build_info_fetcher
+        assert all(name.startswith("ThreadPoolExecutor") for name in fetcher.threads)
+
+
+def test_bisect_find_fix(fetch_configs, integration_pushes):
+    runner = Mock()
+    # fixed in c12
+    runner.evaluate.side_effect = lambda build_info, allow_back=False: (
+        "b" if int(build_info.changeset[1:]) < 12 else "g"
+    )
+    bisector = create_bisector(fetch_configs[:2], runner)
+    bisector.find_fix = True
+    bisections = bisector.bisect("c19", "c0")
+    # the pushes are always queried from the oldest
+    assert integration_pushes.call_args[0][1:] == ("c0", "c19")
+    assert [(b.handler.good_revision, b.handler.bad_revision) for b in bisections] == [
+        ("c12", "c11"),
+        ("c12", "c11"),
+    ]
+
+
+def test_persist_platform(fetch_configs):
+    create_bisector(fetch_configs, None)
+    assert [fc.extra_persist_part() for fc in fetch_configs] == ["64bit", "32bit", "64bit"]
+    # no need to change the file names when only the build type differs
+    same_platform = [create_config("firefox", "linux", 64, "x86_64") for _ in range(2)]
+    same_platform[1].set_build_type("debug")
+    create_bisector(same_platform, None)
+    assert [fc.extra_persist_part() for fc in same_platform] == ["", ""]
+
+
+def test_bisection_error_is_reported(fetch_configs, integration_pushes, mocker):
+    log = mocker.patch("mozregression.multi_bisect.LOG")
+    runner = FakeTestRunner(
+        {"linux64 shippable": 12, "linux32 shippable": 12, "linux64 debug": 5},
+        error="linux32 shippable",
+    )
+    bisections = create_bisector(fetch_configs, runner).bisect("c0", "c19")
+    assert [b.status for b in bisections] == ["found", "error: command not found", "found"]
+
+    multi_bisect.print_report(bisections)
+    lines = [c[0][0] for c in log.info.call_args_list]
+    assert lines[0].split() == ["Platform", "Result", "Good", "Bad", "Pushlog"]
+    assert lines[1].split()[:5] == ["linux64", "shippable", "found", "c11", "c12"]
+    assert lines[1].endswith("pushloghtml?fromchange=c11&tochange=c12")
+    assert "error: command not found" in lines[2]
+    # the columns are aligned
+    assert len(set(line.index("  c") for line in (lines[1], lines[3]))) == 1
+
+
+def test_print_report_same_range(fetch_configs, integration_pushes, mocker):
+    log = mocker.patch("mozregression.multi_bisect.LOG")
+    runner = FakeTestRunner({multi_bisect.platform_name(fc): 7 for fc in fetch_configs})
+    multi_bisect.print_report(create_bisector(fetch_configs, runner).bisect("c0", "c19"))
+    log.info.assert_called_with("The same range was found on every platform.")
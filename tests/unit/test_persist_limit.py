@@ -56,6 +56,7 @@ def test_persist_limit(temp, size_limit, file_limit, files):
 
     persist_limit = PersistLimit(size_limit, file_limit)
     persist_limit.register_dir_content(temp.tempdir)
-    persist_limit.remove_old_files()
+    removed = persist_limit.remove_old_files()
 
     assert "".join(sorted(temp.list())) == "".join(sorted(files))
+    assert sorted(os.path.basename(p) for p in removed) == sorted(set("abcdef") - set(files))
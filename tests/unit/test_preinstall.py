@@ -0,0 +1,113 @@
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from mock import Mock, patch
+
+from mozregression.errors import LauncherError
+from mozregression.preinstall import PreInstaller
+
+
+def mock_build_info(**kwargs):
+    kwargs.setdefault("app_name", "firefox")
+    return Mock(**kwargs)
+
+
+class TestPreInstaller(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tempdir)
+        patcher = patch("mozregression.preinstall.create_launcher")
+        self.create_launcher = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.preinstaller = PreInstaller(launcher_kwargs={"profile": "/profile"})
+        self.addCleanup(self.preinstaller.cleanup)
+
+    def wait_installed(self, dest):
+        self.preinstaller._installs[dest].finished.wait()
+
+    def build_file(self, name):
+        dest = os.path.join(self.tempdir, name)
+        with open(dest, "w") as f:
+            f.write("build")
+        return dest
+
+    def test_take_installed_build(self):
+        dest = self.build_file("1.zip")
+        build_info = mock_build_info(build_file=None)
+        self.preinstaller.schedule(build_info, dest)
+        self.wait_installed(dest)
+        build_info.build_file = dest
+        launcher = self.preinstaller.take(build_info)
+        self.assertEqual(launcher, self.create_launcher.return_value)
+        self.create_launcher.assert_called_once_with(build_info)
+        launcher.prepare_profile.assert_called_once_with(profile="/profile")
+        # it is given only once
+        self.assertIsNone(self.preinstaller.take(build_info))
+
+    def test_take_pending_build(self):
+        dest = self.build_file("1.zip")
+        downloaded = threading.Event()
+        self.addCleanup(downloaded.set)
+        download = Mock()
+        download.wait.side_effect = lambda **kwargs: downloaded.wait(5)
+        self.preinstaller.schedule(mock_build_info(), self.build_file("0.zip"), download)
+        # this one is pending, since the first one is waiting for its download
+        self.preinstaller.schedule(mock_build_info(), dest)
+        self.assertIsNone(self.preinstaller.take(Mock(build_file=dest)))
+
+    def test_take_unknown_build(self):
+        self.assertIsNone(self.preinstaller.take(Mock(build_file="/unknown")))
+
+    def test_wait_for_download(self):
+        dest = self.build_file("1.zip")
+        download = Mock()
+        download.is_canceled.return_value = False
+        download.error.return_value = None
+        build_info = mock_build_info(build_file=dest)
+        self.preinstaller.schedule(build_info, dest, download)
+        self.wait_installed(dest)
+        self.assertIsNotNone(self.preinstaller.take(build_info))
+        download.wait.assert_called_once_with(raise_if_error=False)
+
+    def test_canceled_download(self):
+        dest = self.build_file("1.zip")
+        download = Mock()
+        download.is_canceled.return_value = True
+        build_info = mock_build_info(build_file=dest)
+        self.preinstaller.schedule(build_info, dest, download)
+        self.assertIsNone(self.preinstaller.take(build_info))
+        self.assertFalse(self.create_launcher.called)
+
+    def test_install_error(self):
+        dest = self.build_file("1.zip")
+        self.create_launcher.side_effect = LauncherError("oops")
+        build_info = mock_build_info(build_file=dest)
+        self.preinstaller.schedule(build_info, dest)
+        self.assertIsNone(self.preinstaller.take(build_info))
+
+    def test_discard(self):
+        dest1, dest2 = self.build_file("1.zip"), self.build_file("2.zip")
+        launcher1, launcher2 = Mock(), Mock()
+        self.create_launcher.side_effect = [launcher1, launcher2]
+        info1, info2 = mock_build_info(build_file=dest1), mock_build_info(build_file=dest2)
+        self.preinstaller.schedule(info1, dest1)
+        self.preinstaller.schedule(info2, dest2)
+        self.wait_installed(dest1)
+        self.wait_installed(dest2)
+        self.preinstaller.discard(keep=[dest2])
+        launcher1.cleanup.assert_called_once_with()
+        self.assertFalse(launcher2.cleanup.called)
+        self.assertIsNone(self.preinstaller.take(info1))
+        self.assertEqual(self.preinstaller.take(info2), launcher2)
+
+    def test_no_preinstall_on_android(self):
+        dest = self.build_file("fenix.apk")
+        info = mock_build_info(build_file=dest, app_name="fenix")
+        self.preinstaller.schedule(info, dest)
+        self.assertIsNone(self.preinstaller.take(info))
+        self.assertFalse(self.create_launcher.called)
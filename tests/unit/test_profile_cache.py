@@ -0,0 +1,110 @@
+from __future__ import absolute_import
+
+import errno
+import os
+
+import pytest
+from mock import patch
+from mozprofile import Profile
+
+from mozregression import profile_cache
+
+
+def write(path, content):
+    dirname = os.path.dirname(path)
+    if not os.path.isdir(dirname):
+        os.makedirs(dirname)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+@pytest.mark.parametrize(
+    "relpath, expected",
+    [
+        ("extensions/addon@id.xpi", True),
+        (os.path.join("extensions", "addon@id.xpi"), True),
+        ("features/something/file.js", True),
+        ("prefs.js", False),
+        ("cache2/entries/abc", False),
+    ],
+)
+def test_is_read_only(relpath, expected):
+    assert profile_cache.is_read_only(relpath) == expected
+
+
+@pytest.fixture
+def src_tree(tmpdir):
+    src = str(tmpdir.join("src"))
+    write(os.path.join(src, "prefs.js"), "prefs")
+    write(os.path.join(src, "extensions", "addon.xpi"), "addon")
+    write(os.path.join(src, "sub", "dir", "file"), "content")
+    return src
+
+
+def test_clone_tree_without_reflink(tmpdir, src_tree):
+    cloner = profile_cache.TreeCloner()
+    dst = str(tmpdir.join("dst"))
+    with patch(
+        "mozregression.profile_cache._reflink",
+        side_effect=OSError(errno.EOPNOTSUPP, "not supported"),
+    ) as reflink:
+        cloner.clone_tree(src_tree, dst)
+        cloner.clone_tree(src_tree, str(tmpdir.join("dst2")))
+
+    assert read(os.path.join(dst, "prefs.js")) == "prefs"
+    assert read(os.path.join(dst, "sub", "dir", "file")) == "content"
+    # read-only files are hardlinked, others are copied
+    assert os.path.samefile(
+        os.path.join(dst, "extensions", "addon.xpi"),
+        os.path.join(src_tree, "extensions", "addon.xpi"),
+    )
+    assert not os.path.samefile(os.path.join(dst, "prefs.js"), os.path.join(src_tree, "prefs.js"))
+    # reflinks are not tried anymore after the first failure
+    assert reflink.call_count <= 1
+    assert not cloner.use_reflink
+
+
+def test_clone_tree_with_reflink(tmpdir, src_tree):
+    def reflink(src, dst):
+        with open(src) as fsrc, open(dst, "w") as fdst:
+            fdst.write(fsrc.read())
+
+    cloner = profile_cache.TreeCloner()
+    cloner.use_reflink = True
+    dst = str(tmpdir.join("dst"))
+    with patch("mozregression.profile_cache._reflink", side_effect=reflink) as _reflink:
+        cloner.clone_tree(src_tree, dst)
+    assert _reflink.call_count == 3
+    assert cloner.use_reflink
+    assert read(os.path.join(dst, "extensions", "addon.xpi")) == "addon"
+
+
+def test_profile_templates(tmpdir, src_tree):
+    templates = profile_cache.ProfileTemplates()
+    with patch.object(Profile, "clone", wraps=Profile.clone) as clone:
+        profile1 = templates.clone(Profile, src_tree, preferences={"a.b": 1})
+        profile2 = templates.clone(Profile, src_tree, preferences={"a.b": 2})
+    # the user profile is only cloned once, to create the template
+    clone.assert_called_once_with(src_tree, addons=(), restore=False)
+    assert len(templates._templates) == 1
+    template = list(templates._templates.values())[0]
+
+    for profile, value in ((profile1, "1"), (profile2, "2")):
+        assert profile.profile not in (src_tree, template.profile)
+        assert read(os.path.join(profile.profile, "sub", "dir", "file")) == "content"
+        assert "a.b" in read(os.path.join(profile.profile, "user.js"))
+        assert value in read(os.path.join(profile.profile, "user.js"))
+        profile.cleanup()
+        assert not os.path.exists(profile.profile)
+
+    # the user profile is left untouched
+    assert not os.path.exists(os.path.join(src_tree, "user.js"))
+
+    templates.clear()
+    assert not os.path.exists(template.profile)
+    assert templates._templates == {}
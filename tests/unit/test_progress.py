@@ -0,0 +1,89 @@
+from __future__ import absolute_import
+
+import pytest
+
+from mozregression.progress import ProgressAggregator, Transfer, format_size, format_transfer
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def reports():
+    return []
+
+
+@pytest.fixture
+def aggregator(clock, reports):
+    return ProgressAggregator(
+        lambda transfers: reports.append([(t.key, t.current) for t in transfers]),
+        interval=0.1,
+        clock=clock,
+    )
+
+
+def test_reports_are_throttled(aggregator, clock, reports):
+    aggregator.update("dl", 0, 100)
+    for current in range(1, 100):
+        clock.now += 0.01
+        aggregator.update("dl", current, 100)
+    clock.now += 0.01
+    aggregator.update("dl", 100, 100)
+    # the first update, then every 0.1 second, and the last one
+    assert reports[0] == [("dl", 0)]
+    assert reports[-1] == [("dl", 100)]
+    assert 10 <= len(reports) <= 12
+    # the finished download is forgotten
+    assert aggregator.transfers() == []
+
+
+def test_several_downloads(aggregator, clock, reports):
+    aggregator.update("dl1", 0, 100)
+    aggregator.update("dl2", 0, 50)
+    assert reports == [[("dl1", 0)], [("dl1", 0), ("dl2", 0)]]
+    clock.now += 0.05
+    aggregator.update("dl1", 10, 100)
+    assert len(reports) == 2
+    clock.now += 0.05
+    aggregator.update("dl2", 10, 50)
+    assert reports[-1] == [("dl1", 10), ("dl2", 10)]
+    aggregator.remove("dl1")
+    assert [t.key for t in aggregator.transfers()] == ["dl2"]
+
+
+def test_transfer():
+    transfer = Transfer("dl", 1000, 10)
+    assert transfer.rate is None
+    assert transfer.eta is None
+    transfer.current, transfer.updated = 250, 15
+    assert transfer.percent == 25
+    assert transfer.rate == 50
+    assert transfer.eta == 15
+    assert not transfer.done
+    transfer.current = 1000
+    assert transfer.done
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [(10, "10.0 B"), (2048, "2.0 KB"), (3 * 1024**2, "3.0 MB"), (5 * 1024**3, "5.0 GB")],
+)
+def test_format_size(size, expected):
+    assert format_size(size) == expected
+
+
+def test_format_transfer():
+    transfer = Transfer("dl", 10 * 1024**2, 0)
+    assert format_transfer(transfer) == "0%"
+    transfer.current, transfer.updated = 1024**2, 2
+    assert format_transfer(transfer) == "10% (512.0 KB/s, 0:18 left)"
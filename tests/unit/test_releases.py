@@ -1,9 +1,16 @@
 from __future__ import absolute_import
 
+import datetime
+import time
 import unittest
 
+import pytest
+import requests
+
 from mozregression import errors
 from mozregression.releases import (
+    RELEASES_CACHE,
+    clear_releases,
     date_of_release,
     formatted_valid_release_dates,
     releases,
@@ -77,3 +84,81 @@ class TestRelease(unittest.TestCase):
             tag_of_beta("57.0.1")
         with self.assertRaises(errors.UnavailableRelease):
             tag_of_beta("xyz")
+
+
+TAGS = {
+    "tags": [
+        {"tag": "FIREFOX_NIGHTLY_58_END", "date": [1510617600, 0]},
+        {"tag": "FIREFOX_58_0b1_RELEASE", "date": [1510700000, 0]},
+        {"tag": "FIREFOX_NIGHTLY_57_END", "date": [1506297600, 0]},
+        {"tag": "FIREFOX_NIGHTLY_56_END", "date": [1501632000, 0]},
+    ]
+}
+
+
+@pytest.fixture
+def tags_request(mocker):
+    clear_releases()
+    retry_get = mocker.patch("mozregression.releases.retry_get")
+    retry_get.return_value.json.return_value = TAGS
+    yield retry_get
+    clear_releases()
+
+
+def test_releases_from_tags(tags_request):
+    found = releases()
+    assert found[56] == "2017-08-02"
+    assert found[57] == datetime.date.fromtimestamp(1506297600).isoformat()
+    assert found[58] == datetime.date.fromtimestamp(1510617600).isoformat()
+    assert max(found) == 58
+
+
+def test_releases_are_memoized_and_cached(tags_request):
+    found = releases()
+    releases()
+    date_of_release(57)
+    assert tags_request.call_count == 1
+
+    # a new process uses the disk cache
+    clear_releases()
+    assert releases() == found
+    assert tags_request.call_count == 1
+
+
+def test_releases_cache_refresh(tags_request, mocker):
+    releases()
+    clear_releases()
+    mocker.patch("mozregression.releases.REFRESH_INTERVAL", -1)
+    new_tags = {"tags": [{"tag": "FIREFOX_NIGHTLY_59_END", "date": [1516000000, 0]}]}
+    tags_request.return_value.json.return_value = new_tags
+    found = releases()
+    assert tags_request.call_count == 2
+    assert set([57, 58, 59]) <= set(found)
+
+
+def test_releases_are_reloaded_in_long_running_processes(tags_request, mocker):
+    releases()
+    new_tags = {"tags": [{"tag": "FIREFOX_NIGHTLY_59_END", "date": [1516000000, 0]}]}
+    tags_request.return_value.json.return_value = new_tags
+    assert 59 not in releases()
+    assert tags_request.call_count == 1
+
+    # a day later, without clear_releases()
+    now = time.time()
+    mocker.patch("mozregression.releases.time.time", return_value=now + 24 * 3600)
+    assert 59 in releases()
+    assert tags_request.call_count == 2
+
+
+def test_releases_offline(tags_request, mocker):
+    releases()
+    clear_releases()
+    mocker.patch("mozregression.releases.REFRESH_INTERVAL", -1)
+    tags_request.side_effect = requests.ConnectionError("offline")
+    found = releases()
+    assert 58 in found
+
+    # no cache at all: only the built-in releases
+    RELEASES_CACHE.clear()
+    clear_releases()
+    assert max(releases()) == 56
@@ -0,0 +1,172 @@
+from __future__ import absolute_import
+
+import gzip
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+from mozregression import replay
+from mozregression.errors import MozRegressionError
+
+BIG_BODY = os.urandom(replay.INLINE_BODY_SIZE + 100)
+
+
+class Handler(BaseHTTPRequestHandler):
+    count = 0
+
+    def do_GET(self):
+        Handler.count += 1
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/small")
+            self.end_headers()
+            return
+        if self.path == "/big":
+            body = BIG_BODY
+            headers = {}
+        elif self.path == "/gzip":
+            body = gzip.compress(b"compressed content")
+            headers = {"Content-Encoding": "gzip"}
+        elif self.path == "/small":
+            body = b'{"key": "value"}'
+            headers = {"Content-Type": "application/json"}
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield "http://127.0.0.1:%d" % httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def record(tmpdir, server):
+    archive_dir = str(tmpdir.join("archive"))
+    session = replay.install(requests.Session(), record=archive_dir)
+    responses = {}
+    for path in ("/small", "/big", "/gzip", "/redirect", "/notfound"):
+        responses[path] = session.get(server + path)
+    with session.get(server + "/big", stream=True) as response:
+        assert b"".join(response.iter_content(1000)) == BIG_BODY
+    return archive_dir, responses
+
+
+def test_record(tmpdir, server):
+    archive_dir, responses = record(tmpdir, server)
+    assert responses["/small"].json() == {"key": "value"}
+    assert responses["/big"].content == BIG_BODY
+    assert responses["/gzip"].content == b"compressed content"
+    assert responses["/redirect"].json() == {"key": "value"}
+    assert responses["/notfound"].status_code == 404
+
+    # the big body is stored once as a blob
+    blobs = [f for _, _, files in os.walk(os.path.join(archive_dir, "blobs")) for f in files]
+    assert len(blobs) == 1
+    with open(os.path.join(archive_dir, "index.jsonl")) as f:
+        assert len(f.readlines()) == 7
+
+
+def test_record_streamed_body(tmpdir, server):
+    archive_dir = str(tmpdir.join("archive"))
+    index = os.path.join(archive_dir, "index.jsonl")
+    session = replay.install(requests.Session(), record=archive_dir)
+    with session.get(server + "/big", stream=True) as response:
+        assert response.headers["Content-Length"] == str(len(BIG_BODY))
+        chunks = response.iter_content(1000)
+        assert next(chunks) == BIG_BODY[:1000]
+        # recorded once the body is read entirely
+        assert not os.path.exists(index)
+        assert b"".join(chunks) == BIG_BODY[1000:]
+        with open(index) as f:
+            assert len(f.readlines()) == 1
+
+    # a download that is cancelled is not recorded
+    with session.get(server + "/big", stream=True) as response:
+        next(response.iter_content(1000))
+    with open(index) as f:
+        assert len(f.readlines()) == 1
+    # no temporary file is left next to the blob directories
+    assert all(len(name) == 2 for name in os.listdir(os.path.join(archive_dir, "blobs")))
+
+
+def test_replay(tmpdir, server):
+    archive_dir, _ = record(tmpdir, server)
+    session = replay.install(requests.Session(), replay=archive_dir, latency_scale=0)
+    count = Handler.count
+
+    assert session.get(server + "/small").json() == {"key": "value"}
+    assert session.get(server + "/big").content == BIG_BODY
+    response = session.get(server + "/gzip")
+    assert response.content == b"compressed content"
+    assert "content-encoding" not in response.headers
+    response = session.get(server + "/redirect")
+    assert response.json() == {"key": "value"}
+    assert response.history[0].status_code == 302
+    assert session.get(server + "/notfound").status_code == 404
+    with session.get(server + "/big", stream=True) as response:
+        assert b"".join(response.iter_content(1000)) == BIG_BODY
+
+    with pytest.raises(requests.ConnectionError):
+        session.get(server + "/not-recorded")
+    # nothing went through the network
+    assert Handler.count == count
+
+
+def test_replay_latencies(tmpdir):
+    archive = replay.SessionArchive(str(tmpdir))
+    entry = {
+        "method": "GET",
+        "url": "http://foo/",
+        "status": 200,
+        "reason": "OK",
+        "headers": [["Content-Length", "3"]],
+        "elapsed": 0.1,
+        "duration": 0.1,
+    }
+    entry.update(archive.store_body([b"abc"]))
+    archive.add(entry)
+
+    session = replay.install(requests.Session(), replay=str(tmpdir), latency_scale=0.5)
+    start = time.time()
+    assert session.get("http://foo/").content == b"abc"
+    assert time.time() - start >= 0.1
+
+
+def test_replay_repeated_requests(tmpdir):
+    archive = replay.SessionArchive(str(tmpdir))
+    for body in (b"first", b"second"):
+        entry = {"method": "GET", "url": "http://foo/", "status": 200, "reason": "OK"}
+        entry.update(archive.store_body([body]))
+        archive.add(entry)
+    assert archive.open_body(archive.lookup("GET", "http://foo/")).read() == b"first"
+    assert archive.open_body(archive.lookup("GET", "http://foo/")).read() == b"second"
+    assert archive.open_body(archive.lookup("GET", "http://foo/")).read() == b"second"
+    assert archive.lookup("POST", "http://foo/") is None
+
+
+def test_install_errors(tmpdir):
+    with pytest.raises(MozRegressionError):
+        replay.install(requests.Session(), replay=str(tmpdir))
+    with pytest.raises(MozRegressionError):
+        replay.install(requests.Session(), record=str(tmpdir), replay=str(tmpdir))
+    session = requests.Session()
+    assert replay.install(session) is session
@@ -0,0 +1,159 @@
+from __future__ import absolute_import
+
+import io
+import json
+import threading
+
+import pytest
+from mock import Mock
+
+from mozregression import errors, sweep
+
+
+class FakeTestRunner(object):
+    """
+    Evaluate builds by their changeset: builds >= *first_bad* are bad.
+    """
+
+    def __init__(self, first_bad, errors=()):
+        self.first_bad = first_bad
+        self.errors = errors
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+        self.barrier = None
+
+    def evaluate(self, build_info):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            if self.barrier is not None:
+                self.barrier.wait(5)
+            if build_info.changeset in self.errors:
+                raise errors.LauncherError("unable to install")
+            return "b" if build_info.changeset >= self.first_bad else "g"
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+@pytest.fixture
+def build_range(range_creator):
+    br = range_creator.create(list(range(10)))
+    br.build_info_fetcher.find_build_info.side_effect = lambda i: Mock(
+        changeset=i, build_url="http://build/%d" % i, persist_filename="build-%d" % i
+    )
+    return br
+
+
+@pytest.fixture
+def download_manager(tmp_path):
+    dm = Mock()
+    dm.download_in_background.return_value = None
+    dm.get_dest.side_effect = lambda fname: str(tmp_path / fname)
+    return dm
+
+
+def create_sweep(build_range, test_runner, download_manager, jobs=2):
+    output = io.StringIO()
+    writer = sweep.JsonResultWriter(output)
+    return sweep.Sweep(build_range, test_runner, download_manager, writer, jobs=jobs), output
+
+
+def test_sweep_evaluates_every_build(build_range, download_manager):
+    runner = FakeTestRunner(first_bad=6)
+    s, output = create_sweep(build_range, runner, download_manager)
+    results = s.run()
+
+    by_index = {r.index: r.verdict for r in results}
+    assert by_index == {i: "g" if i < 6 else "b" for i in range(10)}
+    # results are streamed, one JSON object per line
+    rows = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert sorted(row["index"] for row in rows) == list(range(10))
+    assert set(rows[0]) == set(sweep.FIELDS)
+    assert build_range.get_future(3).build_info.build_file.endswith("build-3")
+
+
+def test_sweep_evaluates_builds_in_parallel(build_range, download_manager):
+    runner = FakeTestRunner(first_bad=6)
+    # each evaluation waits for another one
+    runner.barrier = threading.Barrier(2)
+    s, _ = create_sweep(build_range, runner, download_manager, jobs=2)
+    s.run()
+    assert runner.max_running == 2
+
+
+def test_sweep_waits_for_downloads(build_range, download_manager):
+    dl = Mock()
+    download_manager.download_in_background.return_value = dl
+    s, _ = create_sweep(build_range, FakeTestRunner(first_bad=6), download_manager)
+    s.run()
+    assert dl.wait.call_count == 10
+
+
+def test_sweep_records_missing_and_invalid_builds(build_range, download_manager):
+    build_range.get_future(2)._build_info = False
+    runner = FakeTestRunner(first_bad=6, errors=(4,))
+    download_manager.download_in_background.side_effect = lambda b: (
+        Mock(**{"wait.side_effect": IOError("network down")}) if b.changeset == 8 else None
+    )
+    s, _ = create_sweep(build_range, runner, download_manager)
+    results = {r.index: r for r in s.run()}
+
+    assert results[2].verdict == sweep.MISSING
+    assert results[4].verdict == sweep.ERROR
+    assert results[4].error == "unable to install"
+    assert results[8].verdict == sweep.ERROR
+    assert results[8].error == "network down"
+    assert results[9].verdict == "b"
+
+
+def test_sweep_stops_on_test_command_error(build_range, download_manager):
+    runner = Mock()
+    runner.evaluate.side_effect = errors.TestCommandError("command not found")
+    s, _ = create_sweep(build_range, runner, download_manager)
+    with pytest.raises(errors.TestCommandError):
+        s.run()
+    download_manager.cancel.assert_called_once_with()
+
+
+def test_csv_result_writer():
+    output = io.StringIO()
+    writer = sweep.CsvResultWriter(output)
+    writer.write(sweep.SweepResult(0, "2019-01-01", changeset="abc", verdict="g", duration=1.5))
+    assert output.getvalue().splitlines() == [
+        "index,build,changeset,verdict,duration,error",
+        "0,2019-01-01,abc,g,1.5,",
+    ]
+
+
+@pytest.mark.parametrize(
+    "fname, writer_class",
+    [
+        ("results.csv", sweep.CsvResultWriter),
+        ("results.json", sweep.JsonResultWriter),
+    ],
+)
+def test_open_result_writer(tmp_path, fname, writer_class):
+    path = str(tmp_path / fname)
+    writer = sweep.open_result_writer(path)
+    assert isinstance(writer, writer_class)
+    writer.write(sweep.SweepResult(0, "c1", verdict="b"))
+    sweep.close_result_writer(writer)
+    with open(path) as f:
+        assert "c1" in f.read()
+
+
+def test_transitions():
+    results = [
+        sweep.SweepResult(3, "c3", verdict="b"),
+        sweep.SweepResult(0, "c0", verdict="g"),
+        sweep.SweepResult(1, "c1", verdict=sweep.MISSING),
+        sweep.SweepResult(2, "c2", verdict="g"),
+        sweep.SweepResult(4, "c4", verdict="g"),
+    ]
+    assert [(a.build, b.build) for a, b in sweep.transitions(results)] == [
+        ("c2", "c3"),
+        ("c3", "c4"),
+    ]
@@ -0,0 +1,187 @@
+from __future__ import absolute_import
+
+import datetime
+import json
+import os
+import sys
+import time
+
+import pytest
+
+from mozregression import config, telemetry
+
+
+@pytest.fixture
+def metrics():
+    return telemetry.UsageMetrics(
+        variant="console",
+        appname="firefox",
+        build_type="shippable",
+        good=datetime.date(2019, 10, 1),
+        bad="abc123",
+        launch=None,
+        windows_version=None,
+        mac_version=None,
+        linux_version="11",
+        linux_distro="debian",
+        python_version="3.11.0",
+    )
+
+
+@pytest.fixture
+def glean(mocker):
+    """
+    Mocks the Glean calls of the flusher, and returns the recorded pings.
+    """
+    recorded = []
+    mocker.patch("mozregression.telemetry.initialize_telemetry")
+    mocker.patch("mozregression.telemetry._shutdown_telemetry")
+    mocker.patch("mozregression.telemetry._record_ping", side_effect=recorded.append)
+    return recorded
+
+
+def spooled():
+    return telemetry._spooled_pings()
+
+
+def test_ping_values(metrics):
+    values = telemetry._ping_values(metrics)
+    assert values["good_date"] == "2019-10-01T00:00:00"
+    assert values["bad_date"] is None
+    assert values["launch_date"] is None
+    assert values["app"] == "firefox"
+    assert values["linux_distro"] == "debian"
+    json.dumps(values)
+
+
+def test_spool_ping(metrics):
+    telemetry.spool_ping(metrics)
+    telemetry.spool_ping(metrics)
+    paths = spooled()
+    assert len(paths) == 2
+    with open(paths[0]) as f:
+        assert json.load(f) == telemetry._ping_values(metrics)
+    assert os.path.exists(os.path.join(config.TELEMETRY_SPOOL_DIR, telemetry.ENABLED_MARKER))
+
+
+def test_spool_is_bounded(metrics, mocker):
+    mocker.patch("mozregression.telemetry.MAX_SPOOLED_PINGS", 3)
+    for _ in range(5):
+        telemetry.spool_ping(metrics)
+    assert len(spooled()) == 3
+
+
+def test_flush_spool(metrics, glean):
+    for _ in range(3):
+        telemetry.spool_ping(metrics)
+    assert telemetry.flush_spool()
+    assert glean == [telemetry._ping_values(metrics)] * 3
+    assert telemetry.initialize_telemetry.call_count == 1
+    assert spooled() == []
+    assert not os.path.exists(telemetry._lock_path())
+
+
+def test_flush_spool_drops_invalid_pings(metrics, glean):
+    telemetry.spool_ping(metrics)
+    with open(os.path.join(config.TELEMETRY_SPOOL_DIR, "0-invalid.json"), "w") as f:
+        f.write("{")
+    assert telemetry.flush_spool()
+    assert len(glean) == 1
+    assert spooled() == []
+
+
+def test_only_one_flusher(metrics, glean):
+    telemetry.spool_ping(metrics)
+    assert telemetry._acquire_flusher_lock()
+    assert not telemetry.flush_spool()
+    assert glean == []
+    assert telemetry.initialize_telemetry.call_count == 0
+
+
+def test_stale_flusher_lock(metrics, glean):
+    telemetry.spool_ping(metrics)
+    assert telemetry._acquire_flusher_lock()
+    stale = time.time() - telemetry.FLUSHER_LOCK_TIMEOUT - 1
+    os.utime(telemetry._lock_path(), (stale, stale))
+    assert telemetry.flush_spool()
+    assert len(glean) == 1
+
+
+def test_flush_spool_disabled(metrics, glean):
+    telemetry.spool_ping(metrics)
+    assert telemetry.flush_spool(upload_enabled=False)
+    telemetry.initialize_telemetry.assert_called_once_with(False)
+    assert glean == []
+    assert spooled() == []
+    assert not os.path.exists(os.path.join(config.TELEMETRY_SPOOL_DIR, telemetry.ENABLED_MARKER))
+
+
+def test_send_telemetry_ping_oop(metrics, mocker):
+    popen = mocker.patch("mozregression.telemetry.subprocess.Popen")
+    mocker.patch("mozregression.telemetry.FLUSH_PINGS", 3)
+    for _ in range(2):
+        telemetry.send_telemetry_ping_oop(metrics, True)
+    # not enough pings to start a flusher
+    assert len(spooled()) == 2
+    assert popen.call_count == 0
+
+    telemetry.send_telemetry_ping_oop(metrics, True)
+    assert len(spooled()) == 3
+    assert popen.call_count == 1
+    assert popen.call_args[0][0] == [sys.executable, "-m", "mozregression.telemetry"]
+
+    # no other flusher is started while one is running
+    assert telemetry._acquire_flusher_lock()
+    telemetry.send_telemetry_ping_oop(metrics, True)
+    assert len(spooled()) == 4
+    assert popen.call_count == 1
+
+
+def test_send_telemetry_ping_oop_old_ping(metrics, mocker):
+    popen = mocker.patch("mozregression.telemetry.subprocess.Popen")
+    telemetry.send_telemetry_ping_oop(metrics, True)
+    assert popen.call_count == 0
+
+    # the first ping waited long enough
+    now = time.time()
+    mocker.patch("mozregression.telemetry.time.time", return_value=now + telemetry.FLUSH_DELAY)
+    telemetry.send_telemetry_ping_oop(metrics, True)
+    assert popen.call_count == 1
+
+
+def test_send_telemetry_ping_oop_disabled(metrics, mocker):
+    popen = mocker.patch("mozregression.telemetry.subprocess.Popen")
+    telemetry.send_telemetry_ping_oop(metrics, False)
+    assert popen.call_count == 0
+    assert not os.path.exists(config.TELEMETRY_SPOOL_DIR)
+
+    # telemetry was enabled before: glean is told it is now disabled
+    telemetry.spool_ping(metrics)
+    telemetry.send_telemetry_ping_oop(metrics, False)
+    assert popen.call_args[0][0][-1] == "--upload-disabled"
+
+
+def test_send_telemetry_ping_oop_disabled_after_upgrade(metrics, mocker, glean):
+    popen = mocker.patch("mozregression.telemetry.subprocess.Popen")
+    # Glean was used, but the spool was not
+    os.makedirs(config.GLEAN_DATA_DIR)
+    telemetry.send_telemetry_ping_oop(metrics, False)
+    assert popen.call_args[0][0][-1] == "--upload-disabled"
+
+    # the flusher tells Glean, only once
+    assert telemetry.flush_spool(upload_enabled=False)
+    telemetry.initialize_telemetry.assert_called_once_with(False)
+    telemetry.send_telemetry_ping_oop(metrics, False)
+    assert popen.call_count == 1
+
+
+def test_enabling_telemetry_again(mocker):
+    initialize = mocker.patch("glean.Glean.initialize")
+    os.makedirs(config.TELEMETRY_SPOOL_DIR)
+    marker = os.path.join(config.TELEMETRY_SPOOL_DIR, telemetry.DISABLED_MARKER)
+    with open(marker, "w"):
+        pass
+    telemetry.initialize_telemetry(True)
+    assert str(initialize.call_args[1]["data_dir"]) == config.GLEAN_DATA_DIR
+    # Glean must be told again if telemetry is disabled later
+    assert not os.path.exists(marker)
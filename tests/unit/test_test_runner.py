@@ -1,13 +1,17 @@
 from __future__ import absolute_import
 
 import datetime
+import os
 import sys
+import tempfile
 import unittest
 
+import mozfile
 import pytest
-from mock import Mock, patch
+from mock import ANY, Mock, patch
 
-from mozregression import build_info, errors, test_runner
+from mozregression import build_info, errors, launchers, test_runner
+from mozregression.command import CommandResult
 
 
 def mockinfo(**kwargs):
@@ -155,7 +159,7 @@ class TestCommandTestRunner(unittest.TestCase):
         self.assertEqual(self.runner.command, "my command")
 
     @patch("mozregression.test_runner.create_launcher")
-    @patch("subprocess.call")
+    @patch("mozregression.test_runner.run_command")
     def evaluate(
         self,
         call,
@@ -163,14 +167,16 @@ class TestCommandTestRunner(unittest.TestCase):
         build_info={},
         retcode=0,
         subprocess_call_effect=None,
+        timed_out=False,
     ):
         build_info["app_name"] = "myapp"
-        call.return_value = retcode
+        call.return_value = CommandResult(retcode, timed_out=timed_out)
         if subprocess_call_effect:
             call.side_effect = subprocess_call_effect
         self.subprocess_call = call
         create_launcher.return_value = Launcher(self.launcher)
-        return self.runner.evaluate(mockinfo(to_dict=lambda: build_info))[0]
+        info = mockinfo(to_dict=lambda: build_info, persist_filename="build.tar.bz2")
+        return self.runner.evaluate(info)[0]
 
     def test_evaluate_retcode(self):
         self.assertEqual("g", self.evaluate(retcode=0))
@@ -235,6 +241,23 @@ class TestCommandTestRunner(unittest.TestCase):
         command = self.subprocess_call.mock_calls[0][1][0]
         self.assertEqual(command, "run 'mybinary' \"12\"")
 
+    def test_evaluate_timeout(self):
+        self.assertEqual("s", self.evaluate(retcode=-15, timed_out=True))
+        self.runner.timeout_verdict = "r"
+        self.assertEqual("r", self.evaluate(retcode=-15, timed_out=True))
+
+    def test_timeout_and_log_file(self):
+        log_dir = tempfile.mkdtemp()
+        self.addCleanup(mozfile.remove, log_dir)
+        self.runner = test_runner.CommandTestRunner(
+            "my command", timeout=10, log_dir=os.path.join(log_dir, "logs")
+        )
+        self.evaluate()
+        kwargs = self.subprocess_call.mock_calls[0][2]
+        self.assertEqual(kwargs["timeout"], 10)
+        self.assertEqual(kwargs["log_file"], os.path.join(log_dir, "logs", "build.tar.bz2.log"))
+        self.assertTrue(os.path.isdir(os.path.join(log_dir, "logs")))
+
     def test_command_placeholder_error(self):
         self.runner.command = 'run {app_nam} "1"'
         self.assertRaisesRegex(errors.TestCommandError, "formatting", self.evaluate)
@@ -293,3 +316,165 @@ def test_index_to_try_after_skip(mocker, range_creator, brange, input, allowed_r
         assert ("You can choose a build index between %s:" % allowed_range) in [
             o.strip() for o in output
         ]
+
+
+class FakeRunner(object):
+    """
+    A stand-in for the mozrunner Runner of a headless run, that writes
+    *lines* on the output when started.
+    """
+
+    def __init__(self, profile_dir, lines=(), returncode=None):
+        self.profile = Mock(profile=str(profile_dir))
+        self.lines = lines
+        self.returncode = returncode
+
+    def wait(self):
+        return self.returncode
+
+
+@pytest.fixture
+def headless(mocker, tmp_path):
+    mocker.patch("mozregression.test_runner.LOG")
+    launcher = Mock(spec=launchers.MozRunnerLauncher)
+    mocker.patch("mozregression.test_runner.mozlauncher", return_value=Launcher(launcher))
+
+    def evaluate(lines=(), returncode=None, minidumps=(), **kwargs):
+        kwargs.setdefault("timeout", 0.1)
+        launcher.runner = FakeRunner(tmp_path, lines, returncode)
+        if minidumps:
+            (tmp_path / "minidumps").mkdir()
+            for fname in minidumps:
+                (tmp_path / "minidumps" / fname).write_text("")
+
+        def start(output, **kwargs):
+            for line in launcher.runner.lines:
+                for callback in output:
+                    callback(line)
+
+        launcher.start.side_effect = start
+        runner = test_runner.HeadlessTestRunner("http://test", {"cmdargs": ["-a"]}, **kwargs)
+        return runner.evaluate(mockinfo())
+
+    evaluate.launcher = launcher
+    return evaluate
+
+
+def test_headless_start(headless):
+    assert headless(returncode=0) == "g"
+    launcher = headless.launcher
+    launcher.start.assert_called_once_with(
+        cmdargs=["-a", "http://test"], env=test_runner.HEADLESS_ENV, output=ANY
+    )
+    assert test_runner.HEADLESS_ENV["MOZ_HEADLESS"] == "1"
+    launcher.stop.assert_called_once_with()
+
+
+@pytest.mark.parametrize(
+    "lines, returncode, minidumps, patterns, verdict",
+    [
+        # exited by itself
+        ((), 0, (), {}, "g"),
+        ((), 1, (), {}, "b"),
+        # crashed
+        ((), -11, (), {}, "b"),
+        ((), 0, ("abc.dmp",), {}, "b"),
+        (("PASS",), None, ("abc.dmp",), {"good_pattern": "PASS"}, "b"),
+        # patterns matched, the application is still running
+        (("loading", "TEST-PASS 1"), None, (), {"good_pattern": r"PASS \d"}, "g"),
+        (("TEST-FAIL", "PASS"), None, (), {"good_pattern": "PASS", "bad_pattern": "FAIL"}, "b"),
+        # good pattern never matched
+        (("loading",), 0, (), {"good_pattern": "PASS"}, "b"),
+        (("loading",), None, (), {"good_pattern": "PASS"}, "b"),
+        # timeout without crash
+        (("loading",), None, (), {"bad_pattern": "FAIL"}, "g"),
+    ],
+)
+def test_headless_verdict(headless, lines, returncode, minidumps, patterns, verdict):
+    assert headless(lines, returncode, minidumps, **patterns) == verdict
+
+
+def test_headless_unsupported_launcher(mocker):
+    mocker.patch("mozregression.test_runner.mozlauncher", return_value=Launcher(Mock()))
+    runner = test_runner.HeadlessTestRunner("http://test")
+    with pytest.raises(errors.TestCommandError):
+        runner.evaluate(mockinfo(app_name="fenix"))
+
+
+def test_headless_url(tmp_path):
+    page = tmp_path / "test.html"
+    page.write_text("")
+    assert test_runner.headless_url(str(page)) == page.resolve().as_uri()
+    assert test_runner.headless_url("http://test/") == "http://test/"
+
+
+@pytest.fixture
+def install_cache(mocker, tmp_path):
+    launchers_created = []
+
+    def create_launcher(build_info):
+        launcher = Mock(spec=launchers.MozRunnerLauncher)
+        launchers_created.append(launcher)
+        return launcher
+
+    mocker.patch("mozregression.test_runner.mozlauncher", side_effect=create_launcher)
+
+    def build(name):
+        path = tmp_path / name
+        path.write_text(name)
+        return mockinfo(build_file=str(path), build_type="nightly", build_date="2024-01-01")
+
+    cache = test_runner.InstallCache(maxsize=2)
+    yield cache, build, launchers_created
+    cache.clear()
+
+
+def test_install_cache_reuses_installs(install_cache):
+    cache, build, launchers_created = install_cache
+    build_info = build("firefox.tar.bz2")
+    for _ in range(2):
+        with cache.launcher(build_info) as launcher:
+            launcher.start()
+    assert launchers_created == [launcher]
+    # the application was stopped, but the install is kept
+    assert launcher.stop.call_count == 2
+    assert not launcher.cleanup.called
+    cache.clear()
+    launcher.cleanup.assert_called_once_with()
+
+
+def test_install_cache_is_bounded(install_cache):
+    cache, build, launchers_created = install_cache
+    builds = [build(name) for name in ("1.tar.bz2", "2.tar.bz2", "3.tar.bz2")]
+    for info in builds + builds[1:]:
+        with cache.launcher(info):
+            pass
+    assert len(launchers_created) == 3
+    assert [launcher.cleanup.called for launcher in launchers_created] == [True, False, False]
+
+
+def test_install_cache_error(install_cache):
+    cache, build, launchers_created = install_cache
+    build_info = build("firefox.tar.bz2")
+    with pytest.raises(errors.LauncherError):
+        with cache.launcher(build_info) as launcher:
+            raise errors.LauncherError("failed")
+    launcher.cleanup.assert_called_once_with()
+    with cache.launcher(build_info):
+        pass
+    assert len(launchers_created) == 2
+
+
+def test_test_runner_uses_install_cache(install_cache, mocker):
+    cache, build, launchers_created = install_cache
+    run_command = mocker.patch(
+        "mozregression.test_runner.run_command", return_value=CommandResult(0)
+    )
+    runner = test_runner.CommandTestRunner("run {binary}")
+    runner.install_cache = cache
+    build_info = build("firefox.tar.bz2")
+    build_info.to_dict.return_value = {}
+    for _ in range(2):
+        assert runner.evaluate(build_info) == "g"
+    assert len(launchers_created) == 1
+    assert run_command.call_count == 2
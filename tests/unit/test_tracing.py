@@ -0,0 +1,107 @@
+from __future__ import absolute_import
+
+import json
+
+import pytest
+
+from mozregression import tracing
+
+
+@pytest.fixture
+def tracer():
+    tracer = tracing.Tracer()
+    tracer.enable()
+    return tracer
+
+
+def test_disabled_tracer_returns_noop_span():
+    tracer = tracing.Tracer()
+    with tracer.span("something", size=3) as sp:
+        sp.set(other=1)
+    assert sp is tracing.NOOP_SPAN
+    assert tracer.spans == []
+
+
+def test_span_is_recorded(tracer):
+    with tracer.span("download", "dl", url="http://foo") as sp:
+        sp.set(size=12)
+    (recorded,) = tracer.spans
+    assert recorded.name == "download"
+    assert recorded.category == "dl"
+    assert recorded.args == {"url": "http://foo", "size": 12}
+    assert recorded.duration >= 0
+
+
+def test_span_records_errors(tracer):
+    with pytest.raises(ValueError):
+        with tracer.span("fail"):
+            raise ValueError()
+    assert tracer.spans[0].args == {"error": "ValueError"}
+
+
+def test_span_start_finish(tracer):
+    sp = tracer.span("verdict").start()
+    assert tracer.spans == []
+    sp.finish()
+    sp.finish()  # only recorded once
+    assert tracer.spans == [sp]
+
+
+def test_chrome_trace(tracer, tmpdir):
+    with tracer.span("outer", obj=object()):
+        with tracer.span("inner", n=1):
+            pass
+    trace = tracer.to_chrome_trace()
+    outer, inner = trace["traceEvents"]
+    assert outer["name"] == "outer"
+    assert outer["ph"] == "X"
+    assert inner["ts"] >= outer["ts"]
+    assert inner["dur"] <= outer["dur"]
+    assert inner["args"] == {"n": 1}
+    assert isinstance(outer["args"]["obj"], str)
+
+    path = str(tmpdir.join("trace.json"))
+    tracer.write_chrome_trace(path)
+    with open(path) as f:
+        assert json.load(f) == trace
+
+
+def test_summary(tracer):
+    for _ in range(3):
+        with tracer.span("a"):
+            pass
+    with tracer.span("b"):
+        pass
+    rows = {row[0]: row for row in tracer.summary()}
+    assert rows["a"][1] == 3
+    assert rows["b"][1] == 1
+    assert rows["a"][3] == pytest.approx(rows["a"][2] / 3)
+
+    lines = tracer.format_summary().splitlines()
+    assert lines[0].split() == ["span", "count", "total", "mean", "max"]
+    assert len(lines) == 3
+
+
+def test_reset(tracer):
+    with tracer.span("a"):
+        pass
+    tracer.reset()
+    assert tracer.spans == []
+
+
+def test_traced(mocker):
+    tracer = tracing.Tracer()
+    mocker.patch("mozregression.tracing.TRACER", tracer)
+
+    @tracing.traced("func", describe=lambda x: {"x": x})
+    def func(x):
+        return x * 2
+
+    assert func(2) == 4
+    assert tracer.spans == []
+
+    tracer.enable()
+    assert func(3) == 6
+    (recorded,) = tracer.spans
+    assert recorded.name == "func"
+    assert recorded.args == {"x": 3}